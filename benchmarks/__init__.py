@@ -0,0 +1,5 @@
+"""
+性能基准脚本
+
+在仓库根目录运行，例如: python -m benchmarks.bench_tray_icons
+"""
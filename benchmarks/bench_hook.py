@@ -0,0 +1,100 @@
+"""
+键盘钩子基准：模拟按键流下 kb_callback 的单次耗时
+
+用只返回 0 的 windll 替身构造 SystemLocker 并安装钩子回调（不需要 Windows），
+按真实调用方式经 ctypes 回调入口传入 KBDLLHOOKSTRUCT 指针。
+按键流混合数字、字母与按键抬起；分别在 4 位与 16 位解锁码下测量，耗时应与码长无关
+
+运行: python -m benchmarks.bench_hook [--events 100000]
+"""
+
+import argparse
+import ctypes
+import random
+import time
+
+WM_KEYDOWN = 0x0100
+WM_KEYUP = 0x0101
+
+
+class _NullWinDLL:
+    """任意 DLL 的任意函数都返回 0"""
+    
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self
+    
+    def __call__(self, *args):
+        return 0
+
+
+def key_stream(count: int, seed: int = 1):
+    """
+    模拟按键流：(wParam, vkCode)，约 60% 为数字（含小键盘）
+    
+    流中不含 0，解锁码用全 0，测量期间不会因匹配而提前解锁
+    """
+    rng = random.Random(seed)
+    digits = list(range(0x31, 0x3A)) + list(range(0x61, 0x6A))
+    others = list(range(0x41, 0x5B)) + [0x0D, 0x20, 0x1B, 0x10, 0x11, 0x12]
+    stream = []
+    for _ in range(count):
+        vk = rng.choice(digits) if rng.random() < 0.6 else rng.choice(others)
+        stream.append((WM_KEYDOWN if rng.random() < 0.5 else WM_KEYUP, vk))
+    return stream
+
+
+def percentile(samples, p: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def bench(code: str, stream):
+    from src.core.locker import KBDLLHOOKSTRUCT, SystemLocker
+    from src.core.verifier import UnlockVerifier
+    
+    locker = SystemLocker()
+    locker._verifier = UnlockVerifier.from_code(code)
+    locker.is_locked = True
+    locker._install_hooks()
+    callback = locker.kb_proc_ref
+    
+    # 预先构造事件结构，计时只包含回调本身
+    events = []
+    for message, vk in stream:
+        event = KBDLLHOOKSTRUCT(vkCode=vk)
+        events.append((message, event, ctypes.addressof(event)))
+    
+    clock = time.perf_counter
+    samples = []
+    blocked = 0
+    for message, _, address in events:
+        start = clock()
+        blocked += callback(0, message, address)
+        samples.append(clock() - start)
+    
+    assert locker.is_locked
+    samples.sort()
+    internal = locker.latency.percentiles(50, 99)
+    print(
+        f"解锁码 {len(code):>2} 位  调用 p50={percentile(samples, 0.5) * 1e6:5.2f}us "
+        f"p99={percentile(samples, 0.99) * 1e6:5.2f}us  "
+        f"回调内记录 p50={internal['p50'] * 1000:5.2f}us p99={internal['p99'] * 1000:5.2f}us  "
+        f"屏蔽={blocked} 事件={locker.hook_events}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=100000)
+    args = parser.parse_args()
+    
+    ctypes.windll = _NullWinDLL()
+    stream = key_stream(args.events)
+    print(f"键盘钩子回调：{args.events} 个模拟事件（约一半为按键抬起，直接放行）")
+    for code in ("0000", "0" * 16):
+        bench(code, stream)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+按钮悬浮基准：100 个按钮上反复移入移出时的 Tcl 调用数与 Python 侧耗时
+
+不需要显示器：在 stubtk 替身上创建真实的 ModernButton，用 event_generate 发出 <Enter>/<Leave>，
+每次离开后推进虚拟时钟并执行到期的 after，使对照组的延迟离开检查也计入。
+对照组按改造前的写法：每个按钮各自绑定事件，离开时 after(30) 再查询指针与按钮位置
+
+运行: python -m benchmarks.bench_hover [--buttons 100] [--sweeps 20]
+"""
+
+import argparse
+import time
+
+from benchmarks import stubtk
+
+tk = stubtk.install()
+
+from src.ui.components.base import ModernButton
+from src.ui.theme import Theme
+
+
+class LegacyHoverButton(ModernButton):
+    """改造前的悬浮处理：逐个按钮绑定，延迟检查指针是否真的离开"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._leave_after_id = None
+        self.bindtags(tuple(tag for tag in self.bindtags() if tag != self.BINDTAG))
+        self.bind("<Enter>", self._legacy_enter)
+        self.bind("<Leave>", self._legacy_leave)
+        self.bind("<Button-1>", self._on_click)
+    
+    def _legacy_enter(self, event):
+        if not self._enabled:
+            return
+        if self._leave_after_id:
+            self.after_cancel(self._leave_after_id)
+            self._leave_after_id = None
+        if not self._hover:
+            self._hover = True
+            self._paint(self.hover_color)
+    
+    def _legacy_leave(self, event):
+        if not self._enabled:
+            return
+        if self._leave_after_id:
+            self.after_cancel(self._leave_after_id)
+        self._leave_after_id = self.after(30, self._check_leave)
+    
+    def _check_leave(self):
+        self._leave_after_id = None
+        x, y = self.winfo_pointerxy()
+        bx, by = self.winfo_rootx(), self.winfo_rooty()
+        bw, bh = self.winfo_width(), self.winfo_height()
+        if bx <= x < bx + bw and by <= y < by + bh:
+            return
+        if self._hover:
+            self._hover = False
+            self._paint(self.bg_color)
+
+
+def run(name: str, button_class, buttons: int, sweeps: int):
+    root = tk.Tk()
+    now = [0.0]
+    root.clock = lambda: now[0]
+    theme = Theme("light")
+    
+    stubtk.stats.clear()
+    grid = [button_class(root, theme, text=f"B{i}", variant="outline") for i in range(buttons)]
+    bindings = stubtk.stats["bind"]
+    
+    stubtk.stats.clear()
+    start = time.perf_counter()
+    for _ in range(sweeps):
+        for button in grid:
+            button.event_generate("<Enter>")
+            button.event_generate("<Leave>")
+            now[0] += 0.05
+            root.update()
+    elapsed = time.perf_counter() - start
+    
+    stats = stubtk.stats
+    pairs = buttons * sweeps
+    tcl = stats["configure"] + stats["winfo"] + stats["after"] + stats["after_cancel"]
+    assert not any(button._hover for button in grid)
+    print(
+        f"{name:10s} 绑定 {bindings:4d}  每次移入+移出: Tcl 调用 {tcl / pairs:5.1f}  "
+        f"configure {stats['configure'] / pairs:4.1f}  指针/位置查询 {stats['winfo'] / pairs:4.1f}  "
+        f"after {stats['after'] / pairs:4.1f}  Python {elapsed / pairs * 1e6:6.1f} us"
+    )
+    root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="按钮悬浮切换开销")
+    parser.add_argument("--buttons", type=int, default=100)
+    parser.add_argument("--sweeps", type=int, default=20, help="指针扫过全部按钮的次数")
+    args = parser.parse_args()
+    
+    print(f"{args.buttons} 个按钮，扫过 {args.sweeps} 次")
+    run("逐个绑定", LegacyHoverButton, args.buttons, args.sweeps)
+    run("共用 bindtag", ModernButton, args.buttons, args.sweeps)
+
+
+if __name__ == "__main__":
+    main()
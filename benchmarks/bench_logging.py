@@ -0,0 +1,143 @@
+"""
+日志基准：10k 条/秒日志风暴下调用线程的耗时与吞吐
+
+对比直接挂 RotatingFileHandler（旧方案）与有界队列 + 监听线程（当前方案），
+以及热路径 logger 在级别以下的空调用
+
+运行: python -m benchmarks.bench_logging [--rate 10000] [--seconds 2]
+"""
+
+import argparse
+import logging
+import queue
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from src.utils.logger import (
+    LOG_QUEUE_SIZE, DroppingQueueHandler, DroppingQueueListener, HotPathLogger
+)
+
+FORMAT = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+
+
+def file_handler(path: Path) -> RotatingFileHandler:
+    handler = RotatingFileHandler(path, maxBytes=5 * 1024 * 1024, backupCount=3, encoding='utf-8')
+    handler.setFormatter(logging.Formatter(FORMAT))
+    return handler
+
+
+def isolated_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(f"bench.{name}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def storm(log, rate: int, seconds: float):
+    """按固定速率调用 log，返回每次调用的耗时（秒）与实际速率"""
+    interval = 1.0 / rate
+    count = int(rate * seconds)
+    samples = [0.0] * count
+    clock = time.perf_counter
+    start = clock()
+    for i in range(count):
+        # 忙等到下一个时间槽，保持恒定速率
+        slot = start + i * interval
+        while clock() < slot:
+            pass
+        t = clock()
+        log("钩子事件 %d", i)
+        samples[i] = clock() - t
+    return samples, count / (clock() - start)
+
+
+def summarize(name: str, samples, achieved: float, extra: str = ""):
+    ordered = sorted(samples)
+    n = len(ordered)
+    
+    def pct(p):
+        return ordered[min(n - 1, int(n * p / 100))] * 1e6
+    
+    print(
+        f"{name:<22} p50={pct(50):7.1f}us p99={pct(99):8.1f}us max={ordered[-1] * 1e6:9.1f}us "
+        f"rate={achieved:8.0f}/s {extra}"
+    )
+
+
+def bench_direct(tmp: Path, rate: int, seconds: float):
+    handler = file_handler(tmp / "direct.log")
+    logger = isolated_logger("direct", handler)
+    samples, achieved = storm(logger.info, rate, seconds)
+    handler.close()
+    summarize("直接写文件", samples, achieved)
+
+
+def bench_queue(tmp: Path, rate: int, seconds: float, queue_size: int = LOG_QUEUE_SIZE):
+    log_queue = queue.Queue(maxsize=queue_size)
+    handler = DroppingQueueHandler(log_queue)
+    listener = DroppingQueueListener(log_queue, handler, file_handler(tmp / "queue.log"))
+    logger = isolated_logger(f"queue{queue_size}", handler)
+    listener.start()
+    samples, achieved = storm(logger.info, rate, seconds)
+    
+    drain_start = time.perf_counter()
+    listener.stop()
+    drain = time.perf_counter() - drain_start
+    summarize(
+        f"队列(容量 {queue_size})", samples, achieved,
+        f"enqueued={handler.enqueued} dropped={handler.dropped} drain={drain * 1000:.0f}ms"
+    )
+
+
+def bench_burst(tmp: Path, count: int = 50000, queue_size: int = 256):
+    """不限速的突发：队列写满后按丢弃策略处理，调用线程不阻塞"""
+    log_queue = queue.Queue(maxsize=queue_size)
+    handler = DroppingQueueHandler(log_queue)
+    listener = DroppingQueueListener(log_queue, handler, file_handler(tmp / "burst.log"))
+    logger = isolated_logger("burst", handler)
+    listener.start()
+    
+    samples = [0.0] * count
+    clock = time.perf_counter
+    start = clock()
+    for i in range(count):
+        t = clock()
+        logger.info("钩子事件 %d", i)
+        samples[i] = clock() - t
+    achieved = count / (clock() - start)
+    listener.stop()
+    summarize(
+        f"突发(容量 {queue_size})", samples, achieved,
+        f"enqueued={handler.enqueued} dropped={handler.dropped}"
+    )
+
+
+def bench_hot_path(rate: int, seconds: float):
+    logger = isolated_logger("hot", logging.NullHandler())
+    logger.setLevel(logging.WARNING)
+    hot = HotPathLogger(logger)
+    samples, achieved = storm(hot.info, rate, seconds)
+    summarize("热路径(级别以下)", samples, achieved)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rate", type=int, default=10000, help="每秒日志条数")
+    parser.add_argument("--seconds", type=float, default=2.0, help="持续时间")
+    args = parser.parse_args()
+    
+    print(f"日志风暴: {args.rate} 条/秒，持续 {args.seconds} 秒")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        bench_direct(tmp, args.rate, args.seconds)
+        bench_queue(tmp, args.rate, args.seconds)
+        bench_queue(tmp, args.rate, args.seconds, queue_size=256)
+        bench_burst(tmp)
+        bench_hot_path(args.rate, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+页面构建基准：每个页面的控件数、布局调用数与构建/布局耗时
+
+默认在 stubtk 替身上构建（不需要显示器）：控件数与 pack/grid/place 调用数与真实 Tk 相同，
+耗时只包含 Python 侧。有显示器时加 --real 使用真实 Tk，另外测量首次 update_idletasks()（几何计算）的耗时
+
+运行: python -m benchmarks.bench_pages [--repeat 20] [--apps 20] [--real]
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks import stubtk
+
+PAGES = (
+    ("settings", "src.ui.pages.settings_page", "SettingsPage"),
+    ("timer", "src.ui.pages.timer_page", "TimerPage"),
+    ("lock", "src.ui.pages.lock_page", "LockPage"),
+    ("about", "src.ui.pages.about_page", "AboutPage"),
+)
+
+
+def count_widgets(widget) -> int:
+    """控件树中的控件数（含自身）"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def build_page(root, theme, module_name: str, class_name: str, apps: int):
+    module = __import__(module_name, fromlist=[class_name])
+    page = getattr(module, class_name)(root, theme)
+    if apps and hasattr(page, "load_settings"):
+        page.load_settings(startup_apps=[
+            {"name": f"app{i}", "path": f"C:/apps/app{i}.exe", "enabled": i % 2 == 0}
+            for i in range(apps)
+        ])
+    page.pack(fill="both", expand=True)
+    return page
+
+
+def bench(tk, real: bool, repeat: int, apps: int):
+    from src.ui.theme import Theme
+    
+    root = tk.Tk()
+    if real:
+        root.geometry("900x640")
+    theme = Theme("light")
+    
+    print(f"{'页面':8s} {'控件':>6s} {'布局调用':>8s} {'构建 ms':>9s} {'布局 ms':>9s}")
+    for name, module_name, class_name in PAGES:
+        builds, layouts = [], []
+        widgets = geometry = 0
+        for _ in range(repeat):
+            stubtk.stats.clear()
+            start = time.perf_counter()
+            page = build_page(root, theme, module_name, class_name, apps)
+            built = time.perf_counter()
+            root.update_idletasks()
+            builds.append((built - start) * 1000)
+            layouts.append((time.perf_counter() - built) * 1000)
+            widgets = count_widgets(page)
+            geometry = stubtk.stats["geometry"]
+            page.destroy()
+        
+        layout = f"{statistics.median(layouts):9.2f}" if real else f"{'-':>9s}"
+        calls = f"{'-':>8s}" if real else f"{geometry:8d}"
+        print(f"{name:8s} {widgets:6d} {calls} {statistics.median(builds):9.2f} {layout}")
+    root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="页面控件数与构建耗时")
+    parser.add_argument("--repeat", type=int, default=20, help="每个页面构建次数（取中位数）")
+    parser.add_argument("--apps", type=int, default=20, help="设置页中的启动软件数")
+    parser.add_argument("--real", action="store_true", help="使用真实 Tk（需要显示器）")
+    args = parser.parse_args()
+    
+    if args.real:
+        import tkinter as tk
+    else:
+        tk = stubtk.install()
+    bench(tk, args.real, args.repeat, args.apps)
+
+
+if __name__ == "__main__":
+    main()
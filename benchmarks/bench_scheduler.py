@@ -0,0 +1,113 @@
+"""
+界面调度基准：每个任务各自 root.after vs FrameScheduler
+
+不需要显示器：在 stubtk 替身的事件循环上按真实时间运行一组与主窗口相当的周期任务
+（锁定强制、倒计时、动画、平滑滚动、指标导出），任务耗时用忙等模拟。
+统计高优先级任务相对到期时间的延迟、每秒唤醒数，以及每次连续执行回调（一批到期定时器或一批空闲回调）的耗时：
+这段时间越长，期间到达的输入事件等待越久
+
+运行: python -m benchmarks.bench_scheduler [--seconds 5]
+"""
+
+import argparse
+import time
+
+from benchmarks import stubtk
+
+tk = stubtk.install()
+
+from src.ui.components.scheduler import FrameScheduler, Priority
+
+# (名称, 间隔毫秒, 耗时毫秒, 优先级)
+WORKLOAD = (
+    ("enforcer", 200, 0.3, Priority.HIGH),
+    ("countdown", 500, 0.5, Priority.HIGH),
+    ("spinner", 50, 0.8, Priority.NORMAL),
+    ("spinner", 50, 0.8, Priority.NORMAL),
+    ("scroll", 16, 2.0, Priority.NORMAL),
+    ("journal", 1000, 4.0, Priority.LOW),
+    ("metrics", 2000, 12.0, Priority.LOW),
+)
+
+
+def busy(ms: float):
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def percentiles(samples):
+    samples = sorted(samples) or [0.0]
+    pick = lambda p: samples[min(len(samples) - 1, int(len(samples) * p))] * 1000
+    return f"p50 {pick(0.5):6.2f}  p99 {pick(0.99):6.2f}  max {samples[-1] * 1000:6.2f} ms"
+
+
+class TimedTk(tk.Tk):
+    """分别记录每次执行定时器与空闲回调的耗时（Tk 在两者之间处理输入事件）"""
+    
+    def __init__(self):
+        super().__init__()
+        self.passes = []
+    
+    def _timed(self, step) -> int:
+        start = time.perf_counter()
+        ran = step()
+        if ran:
+            self.passes.append(time.perf_counter() - start)
+        return ran
+    
+    def run_timers(self) -> int:
+        return self._timed(super().run_timers)
+    
+    def update_idletasks(self) -> int:
+        return self._timed(super().update_idletasks)
+
+
+def run(name: str, use_scheduler: bool, seconds: float):
+    root = TimedTk()
+    scheduler = FrameScheduler(root) if use_scheduler else None
+    lags = []
+    
+    def schedule(ms, func, priority):
+        if scheduler is not None:
+            scheduler.call_later(ms, func, priority=priority)
+        else:
+            root.after(ms, func)
+    
+    def periodic(interval, cost, priority):
+        due = [time.perf_counter() + interval / 1000]
+        
+        def task():
+            if priority == Priority.HIGH:
+                lags.append(max(0.0, time.perf_counter() - due[0]))
+            busy(cost)
+            due[0] = time.perf_counter() + interval / 1000
+            schedule(interval, task, priority)
+        schedule(interval, task, priority)
+    
+    for _, interval, cost, priority in WORKLOAD:
+        periodic(interval, cost, priority)
+    
+    stubtk.stats.clear()
+    root.run(seconds)
+    
+    print(f"{name}")
+    print(f"  唤醒/秒 {len(root.passes) / seconds:7.1f}  after 调用/秒 {(stubtk.stats['after'] + stubtk.stats['after_idle']) / seconds:7.1f}")
+    print(f"  高优先级延迟  {percentiles(lags)}")
+    print(f"  连续执行      {percentiles(root.passes)}")
+    if scheduler is not None:
+        print(f"  顺延 {scheduler.deferred}  空闲执行 {scheduler.idle_tasks}  超预算帧 {scheduler.overruns}  帧 {scheduler.frames}")
+    root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="界面调度延迟")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+    
+    run("各自 root.after", False, args.seconds)
+    run("FrameScheduler", True, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
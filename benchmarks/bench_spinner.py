@@ -0,0 +1,126 @@
+"""
+加载动画基准：共享动画时钟 vs 每个 Spinner 各自一条 after 链
+
+不需要显示器：在 stubtk 替身上运行真实的 Spinner、FrameClock 与 FrameScheduler，
+事件循环按真实时间运行。对照组按改造前的写法，每个控件各自 after(50) 并每帧 delete("all") + create_arc。
+唤醒数为登记的 after 数，画布调用为 create/delete/itemconfigure 之和，CPU 为事件循环期间的进程 CPU 时间
+
+运行: python -m benchmarks.bench_spinner [--spinners 5] [--hidden 5] [--seconds 2]
+"""
+
+import argparse
+import time
+
+from benchmarks import stubtk
+
+tk = stubtk.install()
+
+from src.ui.components.progress import Spinner
+from src.ui.theme import Theme
+
+
+class LegacySpinner(tk.Canvas):
+    """改造前的 Spinner：独立 after 链，每帧重建弧线，重复 start() 会叠加一条链"""
+    
+    def __init__(self, parent, theme: Theme, size: int = 24):
+        super().__init__(parent, width=size, height=size, bg=theme.bg, highlightthickness=0)
+        self.theme = theme
+        self._size = size
+        self._angle = 0
+        self._running = False
+        self.frames = 0
+        self._draw()
+    
+    def _draw(self):
+        self.delete("all")
+        self.create_arc(
+            3, 3,
+            self._size - 3, self._size - 3,
+            start=self._angle,
+            extent=270,
+            outline=self.theme.fg,
+            width=2,
+            style="arc"
+        )
+    
+    def start(self):
+        self._running = True
+        self._animate()
+    
+    def _animate(self):
+        if not self._running:
+            return
+        self._angle = (self._angle + 10) % 360
+        self._draw()
+        self.frames += 1
+        self.after(50, self._animate)
+
+
+class CountingSpinner(Spinner):
+    def __init__(self, *args, **kwargs):
+        self.frames = 0
+        super().__init__(*args, **kwargs)
+    
+    def _on_frame(self):
+        super()._on_frame()
+        self.frames += 1
+
+
+def run(name: str, spinner_class, visible: int, hidden: int, seconds: float):
+    """
+    :param visible: 可见的动画数（其中一个 start() 两次）
+    :param hidden: 已 start() 但所在页面未显示的动画数
+    """
+    root = tk.Tk()
+    theme = Theme("light")
+    page = tk.Frame(root)
+    page.pack()
+    spinners = []
+    for _ in range(visible):
+        spinner = spinner_class(page, theme)
+        spinner.pack()
+        spinners.append(spinner)
+    
+    # 未显示的页面：控件已布局但父控件未映射
+    hidden_page = tk.Frame(root)
+    for _ in range(hidden):
+        spinner = spinner_class(hidden_page, theme)
+        spinner.pack()
+        spinners.append(spinner)
+    
+    for spinner in spinners:
+        spinner.start()
+    if spinners:
+        spinners[0].start()
+    
+    stubtk.stats.clear()
+    cpu = time.process_time()
+    root.run(seconds)
+    cpu = time.process_time() - cpu
+    
+    stats = stubtk.stats
+    frames = sum(spinner.frames for spinner in spinners)
+    canvas = stats["canvas_items"] + stats["canvas_delete"] + stats["itemconfigure"]
+    print(
+        f"{name:8s} 唤醒/秒 {stats['after'] / seconds:7.1f}  "
+        f"画布调用/秒 {canvas / seconds:7.1f}  "
+        f"动画帧/秒 {frames / seconds:7.1f}  "
+        f"CPU {cpu / seconds * 1000:6.2f} ms/秒"
+    )
+    root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="加载动画唤醒数与帧耗时")
+    parser.add_argument("--spinners", type=int, default=5, help="可见的动画数")
+    parser.add_argument("--hidden", type=int, default=5, help="未显示页面上的动画数")
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+    
+    print(f"{args.spinners} 个可见动画（其中一个 start 两次）+ {args.hidden} 个在未显示的页面上，运行 {args.seconds}s")
+    run("改造前", LegacySpinner, args.spinners, args.hidden, args.seconds)
+    run("共享时钟", CountingSpinner, args.spinners, args.hidden, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
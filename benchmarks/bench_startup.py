@@ -0,0 +1,138 @@
+"""
+启动基准：界面模式与无界面模式从进程启动到就绪的耗时与内存占用
+
+每种模式启动若干次子进程，读取 main.log_startup 输出的就绪日志，
+同时记录从创建进程开始的墙钟时间（含解释器启动）与就绪时刻的常驻内存，随后结束子进程。
+需要在 Windows 上运行，且不能有其他 OfficeGuard 实例（否则子进程会转发参数后立即退出）
+
+运行: python -m benchmarks.bench_startup [--runs 5] [--modes gui headless]
+"""
+
+import argparse
+import ctypes
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# main.log_startup 的就绪日志
+READY = re.compile(r"\[(gui|headless)\] 启动耗时 (\d+)ms")
+
+
+def resident_memory(pid: int) -> int:
+    """进程当前的常驻内存（字节），读取失败时返回 0"""
+    if sys.platform == "win32":
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", ctypes.c_ulong),
+                ("PageFaultCount", ctypes.c_ulong),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+        
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return 0
+        try:
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            if kernel32.K32GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+        finally:
+            kernel32.CloseHandle(handle)
+        return 0
+    
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def start_once(mode: str, timeout: float) -> Optional[Tuple[float, float, int]]:
+    """
+    启动一次并等待就绪
+    
+    :return: (墙钟耗时秒, 自报耗时秒, 常驻内存字节)；未就绪时返回 None
+    """
+    argv = [sys.executable, str(ROOT / "main.py")]
+    if mode == "headless":
+        argv.append("--headless")
+    
+    env = dict(os.environ)
+    # 配置、日志与事件日志写入临时目录，不影响本机数据
+    env["LOCALAPPDATA"] = tempfile.mkdtemp(prefix="officeguard-bench-")
+    env["PYTHONIOENCODING"] = "utf-8"
+    
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        argv, cwd=ROOT, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, encoding="utf-8"
+    )
+    # 超时未就绪时结束子进程，读取循环随之结束
+    watchdog = threading.Timer(timeout, proc.kill)
+    watchdog.start()
+    try:
+        for line in proc.stdout:
+            match = READY.search(line)
+            if match:
+                wall = time.perf_counter() - started
+                return wall, int(match.group(2)) / 1000, resident_memory(proc.pid)
+        return None
+    finally:
+        watchdog.cancel()
+        proc.kill()
+        proc.wait()
+
+
+def bench(mode: str, runs: int, timeout: float):
+    results = []
+    for _ in range(runs):
+        result = start_once(mode, timeout)
+        if result is None:
+            print(f"{mode:<9} 未就绪（已有实例运行，或该模式在本机无法启动）")
+            return
+        results.append(result)
+    
+    wall = statistics.median(r[0] for r in results)
+    reported = statistics.median(r[1] for r in results)
+    memory = statistics.median(r[2] for r in results)
+    print(
+        f"{mode:<9} 就绪(含解释器)={wall * 1000:7.0f}ms  就绪(自报)={reported * 1000:7.0f}ms  "
+        f"内存={memory / (1024 * 1024):6.1f}MB  runs={runs}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--modes", nargs="+", choices=("gui", "headless"), default=["gui", "headless"])
+    args = parser.parse_args()
+    
+    print(f"启动基准：每种模式 {args.runs} 次，取中位数")
+    for mode in args.modes:
+        bench(mode, args.runs, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+主题切换基准：样式注册表原地切换 vs 销毁并重建整个界面
+
+不需要显示器：在 stubtk 替身上构建与主窗口相同的控件树（侧边栏 + 四个页面，设置页含启动软件列表），
+分别统计一次切换创建/销毁的控件数、configure 与画布调用数以及 Python 侧耗时（中位数）。
+原地切换后检查控件树中不再残留只属于旧主题的颜色
+
+运行: python -m benchmarks.bench_theme [--repeat 20] [--apps 20]
+"""
+
+import argparse
+import statistics
+import time
+from dataclasses import fields
+
+from benchmarks import stubtk
+
+tk = stubtk.install()
+
+from src.ui.components.sidebar import Sidebar, SidebarItem
+from src.ui.pages import AboutPage, LockPage, SettingsPage, TimerPage
+from src.ui.theme import DARK_THEME, LIGHT_THEME, Theme
+
+COLOR_OPTIONS = ("bg", "fg", "highlightbackground", "highlightcolor", "activebackground", "insertbackground")
+
+
+def build(root, theme: Theme, apps: int):
+    """与 ModernApp._create_ui 相同的控件树"""
+    main_frame = theme.create(tk.Frame, root, bg=theme.bg)
+    main_frame.pack(fill="both", expand=True)
+    items = [SidebarItem(id, id) for id in ("timer", "lock", "settings", "about")]
+    Sidebar(main_frame, theme, items=items).pack(side="left", fill="y")
+    content = theme.create(tk.Frame, main_frame, bg=theme.bg)
+    content.pack(side="right", fill="both", expand=True)
+    
+    pages = [page_class(content, theme) for page_class in (TimerPage, LockPage, SettingsPage, AboutPage)]
+    pages[2].load_settings(startup_apps=[
+        {"name": f"app{i}", "path": f"C:/apps/app{i}.exe", "enabled": True} for i in range(apps)
+    ])
+    pages[0].pack(fill="both", expand=True)
+    return main_frame
+
+
+def stale_colors(widget, stale: set) -> list:
+    """控件树中仍使用 stale 颜色的 (控件, 选项)"""
+    found = [
+        (widget, option) for option in COLOR_OPTIONS
+        if str(widget._options.get(option, "")) in stale
+    ]
+    for child in widget.winfo_children():
+        found += stale_colors(child, stale)
+    return found
+
+
+def measure(name: str, switch, repeat: int):
+    times = []
+    for _ in range(repeat):
+        stubtk.stats.clear()
+        start = time.perf_counter()
+        switch()
+        times.append((time.perf_counter() - start) * 1000)
+    stats = stubtk.stats
+    print(
+        f"{name:8s} 创建 {stats['widgets']:4d}  销毁 {stats['destroyed']:4d}  configure {stats['configure']:4d}  "
+        f"画布 {stats['canvas_items'] + stats['canvas_delete'] + stats['itemconfigure']:4d}  "
+        f"布局 {stats['geometry']:4d}  Python {statistics.median(times):6.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="主题切换开销")
+    parser.add_argument("--repeat", type=int, default=20, help="切换次数（耗时取中位数）")
+    parser.add_argument("--apps", type=int, default=20, help="设置页中的启动软件数")
+    args = parser.parse_args()
+    
+    root = tk.Tk()
+    state = {"theme": Theme("light")}
+    state["ui"] = build(root, state["theme"], args.apps)
+    print(f"登记的控件: {len(state['theme'].styles)}")
+    
+    measure("原地切换", state["theme"].toggle, args.repeat)
+    
+    def rebuild():
+        old = state["theme"]
+        state["ui"].destroy()
+        state["theme"] = Theme("dark" if old.mode == "light" else "light")
+        state["ui"] = build(root, state["theme"], args.apps)
+    
+    measure("重建界面", rebuild, args.repeat)
+    
+    # 原地切换到深色后不应残留只属于浅色主题的颜色
+    theme = Theme("light")
+    state["ui"].destroy()
+    ui = build(root, theme, args.apps)
+    theme.set_mode("dark")
+    light = {getattr(LIGHT_THEME, f.name) for f in fields(LIGHT_THEME)}
+    dark = {getattr(DARK_THEME, f.name) for f in fields(DARK_THEME)}
+    stale = stale_colors(ui, light - dark)
+    print(f"切换后残留的浅色: {len(stale)}", [f"{widget}:{option}" for widget, option in stale[:5]])
+
+
+if __name__ == "__main__":
+    main()
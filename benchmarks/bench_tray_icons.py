@@ -0,0 +1,78 @@
+"""
+托盘图标基准：绘制 vs 磁盘缓存命中 vs 内存缓存命中
+
+运行: python -m benchmarks.bench_tray_icons
+"""
+
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from src.core.tray_icons import IconAtlas, TrayState, render_badge_icon, render_icon
+
+
+def measure(func, repeat: int) -> float:
+    """平均单次耗时（微秒）"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def bench_render(sizes=(16, 32, 64), supersamples=(1, 4), repeat: int = 50):
+    print("直接绘制 render_icon（每次调用都重新光栅化）")
+    for size in sizes:
+        for supersample in supersamples:
+            us = measure(lambda: render_icon(size, "#3498db", TrayState.LOCKED, supersample), repeat)
+            print(f"  size={size:<3} x{supersample}: {us:9.1f} us")
+
+
+def bench_atlas(size: int = 64, repeat: int = 10000):
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp)
+        
+        cold = IconAtlas(size=size, cache_dir=cache_dir)
+        start = time.perf_counter()
+        cold.warm()
+        cold_us = (time.perf_counter() - start) / len(TrayState.ALL) * 1e6
+        
+        # 新进程启动：内存为空，磁盘缓存已存在
+        warm = IconAtlas(size=size, cache_dir=cache_dir)
+        start = time.perf_counter()
+        warm.warm()
+        disk_us = (time.perf_counter() - start) / len(TrayState.ALL) * 1e6
+        
+        states = TrayState.ALL
+        index = [0]
+        
+        def switch():
+            index[0] += 1
+            warm.get(states[index[0] % len(states)])
+        
+        hit_us = measure(switch, repeat)
+    
+    print(f"图集 size={size} x{cold.supersample}（每个状态的平均耗时）")
+    print(f"  首次（绘制 + 写磁盘）: {cold_us:9.1f} us  renders={cold.renders}")
+    print(f"  磁盘缓存命中:         {disk_us:9.1f} us  disk_hits={warm.disk_hits} renders={warm.renders}")
+    print(f"  内存缓存命中:         {hit_us:9.3f} us  hits={warm.hits}")
+
+
+def bench_badges(size: int = 64, repeat: int = 20):
+    atlas = IconAtlas(size=size, use_disk=False)
+    render_us = measure(lambda: render_badge_icon(size, "#f59e0b", TrayState.TIMER, "42"), repeat)
+    atlas.get_badge(TrayState.TIMER, "42")
+    hit_us = measure(lambda: atlas.get_badge(TrayState.TIMER, "42"), repeat * 500)
+    print(f"倒计时角标 size={size}")
+    print(f"  绘制: {render_us:9.1f} us   内存命中: {hit_us:6.3f} us")
+
+
+def main():
+    logging.getLogger("PIL").setLevel(logging.WARNING)
+    bench_render()
+    bench_atlas()
+    bench_badges()
+
+
+if __name__ == "__main__":
+    main()
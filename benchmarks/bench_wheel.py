@@ -0,0 +1,110 @@
+"""
+滚轮基准：事件进入 WheelRouter 到滚动区域开始滚动的延迟
+
+不需要显示器：用只实现 bind_all 与 winfo containing 的替身充当根窗口，
+处理函数即真实滚动前的最后一步。延迟取自处理函数被调用的时刻，
+路由自身的开销取自 WheelRouter.events / dispatch_seconds
+
+运行: python -m benchmarks.bench_wheel [--events 20000] [--depth 12]
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+from src.ui.components.wheel import WHEEL_DELTA, WheelRouter
+
+
+class _PointerTk:
+    """winfo containing 返回指针下的控件路径"""
+    
+    def __init__(self):
+        self.under = "."
+    
+    def call(self, *args):
+        return self.under
+
+
+class _Root:
+    def __init__(self):
+        self.tk = _PointerTk()
+    
+    def bind_all(self, *args, **kwargs):
+        pass
+
+
+class _ScrollArea:
+    """滚动区域：到边界后不再处理，交给外层"""
+    
+    def __init__(self, path: str, rows: int, stamps: list):
+        self.path = path
+        self.rows = rows
+        self.first = 0
+        self._stamps = stamps
+    
+    def __str__(self):
+        return self.path
+    
+    def on_wheel(self, delta: int) -> bool:
+        first = max(0, min(self.first - delta // WHEEL_DELTA, self.rows))
+        if first == self.first:
+            return False
+        self._stamps.append(time.perf_counter())
+        self.first = first
+        return True
+
+
+def percentile(samples, p: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def run(name: str, events: int, depth: int, inner_rows: int, churn: bool = False):
+    """
+    :param depth: 指针下控件相对外层滚动区域的嵌套深度
+    :param inner_rows: 内层列表可滚动的行数，0 表示内层始终在边界（事件落到外层）
+    :param churn: 每次事件前都注册一次（解析缓存失效，对比未缓存的路径解析）
+    """
+    root = _Root()
+    router = WheelRouter(root)
+    stamps = []
+    
+    outer = _ScrollArea(".page", events + 1, stamps)
+    inner = _ScrollArea(".page.card.list", inner_rows, stamps)
+    router.register(outer, outer.on_wheel)
+    router.register(inner, inner.on_wheel)
+    root.tk.under = inner.path + "".join(f".w{i}" for i in range(depth))
+    
+    event = SimpleNamespace(delta=-WHEEL_DELTA, x_root=10, y_root=10, widget=None)
+    latencies = []
+    for _ in range(events):
+        if churn:
+            router.register(outer, outer.on_wheel)
+        if inner.first == inner.rows:
+            inner.first = 0
+        start = time.perf_counter()
+        router._on_wheel(event)
+        latencies.append(stamps[-1] - start)
+    
+    latencies.sort()
+    print(
+        f"{name:<24} p50={percentile(latencies, 0.5) * 1e6:6.2f}us "
+        f"p99={percentile(latencies, 0.99) * 1e6:6.2f}us "
+        f"dispatch={router.dispatch_seconds / router.events * 1e6:6.2f}us/event "
+        f"events={router.events}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--depth", type=int, default=12)
+    args = parser.parse_args()
+    
+    print(f"滚轮事件 -> 滚动: {args.events} 次，指针下控件嵌套 {args.depth} 层")
+    run("内层列表处理", args.events, args.depth, inner_rows=args.events + 1)
+    run("内层到边界，外层处理", args.events, args.depth, inner_rows=0)
+    run("每次重新解析路径", args.events, args.depth, inner_rows=args.events + 1, churn=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,965 @@
+"""
+无显示器的 Tk 替身
+
+install() 用纯 Python 实现替换 sys.modules 中的 tkinter（及 font、ttk、filedialog、messagebox），
+之后导入的 src.ui 模块在其上构建完整的控件树：选项、布局、绑定、画布图元与 after 队列只在 Python 中记账，
+stats 按类别统计调用次数（真实 Tk 下每次都是一条发往 Tcl 的命令），供基准比较不同实现的调用量。
+
+事件按 bindtags 顺序分发（控件、类、顶层窗口、all），<Map>/<Unmap>/<Destroy> 随布局与销毁发出；
+after 队列按 Tk.clock 计时，update() 执行一轮到期定时器与空闲回调，run() 在真实时间上运行事件循环。
+未实现的公开方法按空操作处理并计入 stats["other:<方法名>"]
+
+必须在导入 src.ui 之前调用；测试用 installed() 在结束后恢复原来的模块
+"""
+
+import heapq
+import itertools
+import math
+import sys
+import time
+import types
+from collections import Counter
+from contextlib import contextmanager
+from functools import partialmethod
+from types import SimpleNamespace
+from typing import Iterator
+
+stats: Counter = Counter()
+
+_default_root = None
+_font_names = {}
+
+
+class TclError(Exception):
+    pass
+
+
+# ==================== 常量 ====================
+
+CONSTANTS = {
+    "END": "end", "INSERT": "insert", "ALL": "all",
+    "LEFT": "left", "RIGHT": "right", "TOP": "top", "BOTTOM": "bottom",
+    "X": "x", "Y": "y", "BOTH": "both", "NONE": "none",
+    "N": "n", "S": "s", "E": "e", "W": "w", "NW": "nw", "NE": "ne", "SW": "sw", "SE": "se", "CENTER": "center",
+    "HORIZONTAL": "horizontal", "VERTICAL": "vertical",
+    "NORMAL": "normal", "DISABLED": "disabled", "ACTIVE": "active", "HIDDEN": "hidden",
+    "FLAT": "flat", "RAISED": "raised", "SUNKEN": "sunken", "GROOVE": "groove", "RIDGE": "ridge", "SOLID": "solid",
+    "YES": True, "NO": False, "TRUE": True, "FALSE": False,
+}
+
+
+def _noop(*args, **kwargs):
+    return ""
+
+
+def _bind(table: dict, sequence, func, add) -> str:
+    """登记绑定；add 为空时替换同一序列上已有的处理函数"""
+    if func is None:
+        return table.get(sequence, []) if sequence else list(table)
+    stats["bind"] += 1
+    handlers = table.setdefault(sequence, [])
+    if not add:
+        handlers.clear()
+    handlers.append(func)
+    return f"{id(func)}{getattr(func, '__name__', 'lambda')}"
+
+
+class _TkApp:
+    """root.tk：Tcl 命令统一返回空值"""
+    
+    def call(self, *args):
+        stats["tcl_call"] += 1
+        return ""
+    
+    eval = call
+    
+    def splitlist(self, value):
+        return tuple(value) if isinstance(value, (tuple, list)) else tuple(str(value).split())
+    
+    def getboolean(self, value) -> bool:
+        return str(value).lower() in ("1", "true", "yes", "on")
+    
+    def createcommand(self, name, func):
+        pass
+    
+    def deletecommand(self, name):
+        pass
+
+
+# ==================== 控件 ====================
+
+class Misc:
+    """控件共用部分：选项、布局、绑定、事件与 after"""
+    
+    _tk_class = "Misc"
+    
+    def _setup(self, master, options: dict, path: str):
+        self.master = master
+        self.tk = master.tk if master is not None else _TkApp()
+        self._w = path
+        self.children = {}
+        self._options = options
+        self._bindings = {}
+        self._tags = None
+        self._managed = master is None
+        self._destroyed = False
+        self._child_counts = Counter()
+    
+    def _check(self):
+        if self._destroyed:
+            raise TclError(f'invalid command name "{self._w}"')
+    
+    def __str__(self):
+        return self._w
+    
+    def __repr__(self):
+        return f"<{type(self).__name__} {self._w}>"
+    
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        
+        def call(*args, **kwargs):
+            stats["other:" + name] += 1
+            return ""
+        return call
+    
+    # ---------- 选项 ----------
+    
+    def configure(self, cnf=None, **kw):
+        self._check()
+        if cnf is None and not kw:
+            return dict(self._options)
+        stats["configure"] += 1
+        self._options.update(cnf or {}, **kw)
+    
+    config = configure
+    
+    def cget(self, key):
+        self._check()
+        return self._options.get(key, "")
+    
+    __getitem__ = cget
+    
+    def __setitem__(self, key, value):
+        self.configure(**{key: value})
+    
+    def keys(self):
+        return list(self._options)
+    
+    # ---------- 布局 ----------
+    
+    def _manage(self, cnf=None, **kw):
+        self._check()
+        stats["geometry"] += 1
+        if not self._managed:
+            self._managed = True
+            if self.winfo_ismapped():
+                self._map("<Map>")
+    
+    pack = pack_configure = grid = grid_configure = place = place_configure = _manage
+    
+    def _forget(self):
+        self._check()
+        stats["geometry"] += 1
+        if self._managed:
+            mapped = self.winfo_ismapped()
+            self._managed = False
+            if mapped:
+                self._map("<Unmap>")
+    
+    pack_forget = grid_forget = place_forget = grid_remove = _forget
+    
+    def _map(self, sequence: str):
+        """映射状态变化：向自身与已布局的子控件发出 <Map>/<Unmap>"""
+        self._dispatch(sequence, self._event(sequence))
+        for child in list(self.children.values()):
+            if child._managed and not isinstance(child, Toplevel):
+                child._map(sequence)
+    
+    def pack_propagate(self, flag=None):
+        pass
+    
+    grid_propagate = pack_propagate
+    
+    # ---------- 绑定与事件 ----------
+    
+    def bind(self, sequence=None, func=None, add=None):
+        self._check()
+        return _bind(self._bindings, sequence, func, add)
+    
+    def unbind(self, sequence, funcid=None):
+        self._bindings.pop(sequence, None)
+    
+    def bind_all(self, sequence=None, func=None, add=None):
+        return _bind(self._root()._all_bindings, sequence, func, add)
+    
+    def unbind_all(self, sequence):
+        self._root()._all_bindings.pop(sequence, None)
+    
+    def bind_class(self, className, sequence=None, func=None, add=None):
+        return _bind(self._root()._class_bindings.setdefault(className, {}), sequence, func, add)
+    
+    def unbind_class(self, className, sequence):
+        self._root()._class_bindings.get(className, {}).pop(sequence, None)
+    
+    def bindtags(self, tagList=None):
+        if tagList is not None:
+            self._tags = tuple(tagList)
+            return None
+        if self._tags is not None:
+            return self._tags
+        toplevel = self.winfo_toplevel()
+        if toplevel is self:
+            return (self._w, self._tk_class, "all")
+        return (self._w, self._tk_class, toplevel._w, "all")
+    
+    def _event(self, sequence: str, **kw):
+        event = SimpleNamespace(
+            widget=self, type=sequence, x=0, y=0, x_root=0, y_root=0,
+            delta=0, num=0, state=0, keysym="", keycode=0, char="",
+            width=self._dimension("width"), height=self._dimension("height")
+        )
+        event.__dict__.update(kw)
+        return event
+    
+    def _dispatch(self, sequence: str, event):
+        """按 bindtags 顺序调用处理函数，返回 "break" 时停止"""
+        root = self._root()
+        toplevel = self.winfo_toplevel()
+        for tag in self.bindtags():
+            if tag == self._w:
+                table = self._bindings
+            elif tag == toplevel._w:
+                table = toplevel._bindings
+            elif tag == "all":
+                table = root._all_bindings
+            else:
+                table = root._class_bindings.get(tag, {})
+            for func in list(table.get(sequence, ())):
+                if func(event) == "break":
+                    return
+    
+    def event_generate(self, sequence: str, **kw):
+        """发出事件（替身中同步分发）"""
+        self._check()
+        stats["event_generate"] += 1
+        self._dispatch(sequence, self._event(sequence, **kw))
+    
+    # ---------- after ----------
+    
+    def after(self, ms, func=None, *args):
+        root = self._root()
+        root._check()
+        if func is None:
+            time.sleep(ms / 1000)
+            return None
+        stats["after"] += 1
+        return root._add_timer(root.clock() + ms / 1000, func, args)
+    
+    def after_idle(self, func, *args):
+        root = self._root()
+        root._check()
+        stats["after_idle"] += 1
+        return root._add_timer(None, func, args)
+    
+    def after_cancel(self, id):
+        root = self._root()
+        root._check()
+        stats["after_cancel"] += 1
+        root._callbacks.pop(id, None)
+    
+    # ---------- 窗口信息 ----------
+    
+    def _root(self):
+        widget = self
+        while widget.master is not None:
+            widget = widget.master
+        return widget
+    
+    def winfo_toplevel(self):
+        widget = self
+        while not isinstance(widget, (Tk, Toplevel)):
+            widget = widget.master
+        return widget
+    
+    def winfo_exists(self) -> int:
+        return 0 if self._destroyed else 1
+    
+    def winfo_ismapped(self) -> int:
+        if self._destroyed or not self._managed:
+            return 0
+        if self.master is None or isinstance(self, Toplevel):
+            return 1
+        return self.master.winfo_ismapped()
+    
+    def winfo_children(self) -> list:
+        return list(self.children.values())
+    
+    def winfo_class(self) -> str:
+        return self._tk_class
+    
+    def _dimension(self, option: str) -> int:
+        """尺寸取自 width/height 选项（未设置时与未布局的 Tk 控件一样为 1）"""
+        try:
+            return max(1, int(self._options.get(option, 1)))
+        except (TypeError, ValueError):
+            return 1
+    
+    def winfo_width(self) -> int:
+        stats["winfo"] += 1
+        return self._dimension("width")
+    
+    def winfo_height(self) -> int:
+        stats["winfo"] += 1
+        return self._dimension("height")
+    
+    winfo_reqwidth = winfo_width
+    winfo_reqheight = winfo_height
+    
+    def winfo_x(self) -> int:
+        stats["winfo"] += 1
+        return 0
+    
+    winfo_y = winfo_rootx = winfo_rooty = winfo_x
+    
+    def winfo_pointerxy(self):
+        stats["winfo"] += 1
+        return (-1, -1)
+    
+    def winfo_containing(self, rootX, rootY, displayof=0):
+        stats["winfo"] += 1
+        return None
+    
+    def winfo_fpixels(self, number) -> float:
+        return 96.0 if number == "1i" else float(number)
+    
+    def winfo_screenwidth(self) -> int:
+        return 1920
+    
+    def winfo_screenheight(self) -> int:
+        return 1080
+    
+    def winfo_id(self) -> int:
+        return id(self) & 0xFFFFFF
+    
+    def nametowidget(self, name):
+        name = str(name)
+        widget = self._root()
+        for part in name.split(".")[1:]:
+            widget = widget.children[part]
+        return widget
+    
+    # ---------- 销毁 ----------
+    
+    def destroy(self):
+        if self._destroyed:
+            return
+        for child in list(self.children.values()):
+            child.destroy()
+        self._dispatch("<Destroy>", self._event("<Destroy>"))
+        self._destroyed = True
+        stats["destroyed"] += 1
+        if self.master is not None:
+            self.master.children.pop(self._w.rsplit(".", 1)[-1], None)
+
+
+class Widget(Misc):
+    """普通控件：路径按 Tk 的规则命名（!frame、!frame2……）"""
+    
+    _tk_class = "Widget"
+    
+    def __init__(self, master=None, cnf=None, **kw):
+        if master is None:
+            master = _default_root
+            if master is None:
+                raise RuntimeError("Too early to create widget: no default root window")
+        master._check()
+        options = dict(cnf or {}, **kw)
+        name = options.pop("name", None)
+        options.pop("class_", None)
+        if name is None:
+            base = "!" + type(self).__name__.lower()
+            master._child_counts[base] += 1
+            count = master._child_counts[base]
+            name = base if count == 1 else f"{base}{count}"
+        self._setup(master, options, (master._w if master._w != "." else "") + "." + name)
+        master.children[name] = self
+        stats["widgets"] += 1
+        stats["widget:" + self._tk_class] += 1
+
+
+BaseWidget = Widget
+
+
+class _Wm:
+    """顶层窗口：由窗口管理器布局，创建后即映射"""
+    
+    def withdraw(self):
+        if self._managed:
+            self._managed = False
+            self._map("<Unmap>")
+    
+    def deiconify(self):
+        if not self._managed:
+            self._managed = True
+            self._map("<Map>")
+    
+    iconify = withdraw
+
+
+class Tk(_Wm, Misc):
+    """根窗口，持有 after 队列与类/全局绑定"""
+    
+    _tk_class = "Tk"
+    
+    def __init__(self, screenName=None, baseName=None, className="Tk", useTk=True, sync=False, use=None):
+        global _default_root
+        self._setup(None, {}, ".")
+        self.clock = time.perf_counter
+        self._timers = []
+        self._idle = []
+        self._callbacks = {}
+        self._ids = itertools.count(1)
+        self._class_bindings = {}
+        self._all_bindings = {}
+        self._quit = False
+        if _default_root is None:
+            _default_root = self
+    
+    def _add_timer(self, due, func, args) -> str:
+        id = f"after#{next(self._ids)}"
+        self._callbacks[id] = (func, args)
+        if due is None:
+            self._idle.append(id)
+        else:
+            heapq.heappush(self._timers, (due, id))
+        return id
+    
+    def _fire(self, id) -> int:
+        entry = self._callbacks.pop(id, None)
+        if entry is None:
+            return 0
+        func, args = entry
+        try:
+            func(*args)
+        except Exception:
+            self.report_callback_exception(*sys.exc_info())
+        return 1
+    
+    def report_callback_exception(self, exc, val, tb):
+        raise val
+    
+    def next_due(self) -> float:
+        """最早的未取消定时器的到期时间（没有时为 inf）"""
+        timers = self._timers
+        while timers and timers[0][1] not in self._callbacks:
+            heapq.heappop(timers)
+        return timers[0][0] if timers else math.inf
+    
+    @property
+    def pending(self) -> int:
+        """未执行的定时器与空闲回调数"""
+        return len(self._callbacks)
+    
+    def update_idletasks(self) -> int:
+        """执行当前排队的空闲回调（期间新登记的留到下一轮）"""
+        idle, self._idle = self._idle, []
+        return sum(self._fire(id) for id in idle)
+    
+    def run_timers(self) -> int:
+        """执行现在已到期的定时器（期间新登记的留到下一轮）"""
+        self._check()
+        now = self.clock()
+        ran = 0
+        timers = self._timers
+        while timers and timers[0][0] <= now:
+            _, id = heapq.heappop(timers)
+            ran += self._fire(id)
+        return ran
+    
+    def update(self) -> int:
+        """
+        一轮事件循环：执行已到期的定时器，再执行空闲回调
+        
+        :return: 执行的回调数
+        """
+        return self.run_timers() + self.update_idletasks()
+    
+    def run(self, seconds: float):
+        """在真实时间上运行事件循环 seconds 秒，没有到期回调时睡眠"""
+        end = self.clock() + seconds
+        while not self._destroyed:
+            self.update()
+            now = self.clock()
+            if now >= end:
+                break
+            if not self._idle:
+                time.sleep(max(0.0, min(end, self.next_due()) - now))
+    
+    def mainloop(self, n=0):
+        """运行到 quit() 或没有待执行的回调"""
+        self._quit = False
+        while not self._quit and not self._destroyed and self._callbacks:
+            self.update()
+            if not self._idle:
+                time.sleep(max(0.0, min(self.next_due() - self.clock(), 0.05)))
+    
+    def quit(self):
+        self._quit = True
+    
+    def destroy(self):
+        global _default_root
+        super().destroy()
+        self._callbacks.clear()
+        if _default_root is self:
+            _default_root = None
+
+
+class Toplevel(_Wm, Widget):
+    _tk_class = "Toplevel"
+    
+    def __init__(self, master=None, cnf=None, **kw):
+        super().__init__(master, cnf, **kw)
+        self._managed = True
+
+
+class Frame(Widget):
+    _tk_class = "Frame"
+
+
+class LabelFrame(Widget):
+    _tk_class = "Labelframe"
+
+
+class Label(Widget):
+    _tk_class = "Label"
+
+
+class Message(Widget):
+    _tk_class = "Message"
+
+
+class Button(Widget):
+    _tk_class = "Button"
+    
+    def invoke(self):
+        self._check()
+        command = self._options.get("command")
+        return command() if command else ""
+
+
+class Checkbutton(Button):
+    _tk_class = "Checkbutton"
+    
+    def invoke(self):
+        """与点击相同：切换 variable 后执行 command"""
+        self._check()
+        variable = self._options.get("variable")
+        if variable is not None:
+            on, off = self._options.get("onvalue", True), self._options.get("offvalue", False)
+            variable.set(off if variable.get() == on else on)
+        return super().invoke()
+
+
+class Radiobutton(Widget):
+    _tk_class = "Radiobutton"
+
+
+class Scale(Widget):
+    _tk_class = "Scale"
+
+
+class Listbox(Widget):
+    _tk_class = "Listbox"
+
+
+class Text(Widget):
+    _tk_class = "Text"
+
+
+class Menu(Widget):
+    _tk_class = "Menu"
+
+
+class Scrollbar(Widget):
+    _tk_class = "Scrollbar"
+    
+    def set(self, first, last):
+        self._check()
+        stats["scrollbar_set"] += 1
+        self._range = (float(first), float(last))
+    
+    def get(self):
+        return getattr(self, "_range", (0.0, 1.0))
+
+
+def _index(text: str, index) -> int:
+    if index in ("end", "insert"):
+        return len(text)
+    return min(len(text), int(index))
+
+
+class Entry(Widget):
+    _tk_class = "Entry"
+    
+    def __init__(self, master=None, cnf=None, **kw):
+        super().__init__(master, cnf, **kw)
+        self._text = ""
+    
+    def get(self) -> str:
+        self._check()
+        return self._text
+    
+    def insert(self, index, string):
+        self._check()
+        stats["entry_edit"] += 1
+        i = _index(self._text, index)
+        self._text = self._text[:i] + str(string) + self._text[i:]
+    
+    def delete(self, first, last=None):
+        self._check()
+        stats["entry_edit"] += 1
+        i = _index(self._text, first)
+        j = i + 1 if last is None else _index(self._text, last)
+        self._text = self._text[:i] + self._text[j:]
+
+
+class Canvas(Widget):
+    """画布：图元保存为 id -> [类型, 坐标, 选项]"""
+    
+    _tk_class = "Canvas"
+    
+    def __init__(self, master=None, cnf=None, **kw):
+        super().__init__(master, cnf, **kw)
+        self._items = {}
+        self._item_ids = itertools.count(1)
+    
+    def _create(self, kind, *coords, **options):
+        self._check()
+        stats["canvas_items"] += 1
+        item = next(self._item_ids)
+        self._items[item] = [kind, coords, options]
+        return item
+    
+    create_arc = partialmethod(_create, "arc")
+    create_line = partialmethod(_create, "line")
+    create_oval = partialmethod(_create, "oval")
+    create_rectangle = partialmethod(_create, "rectangle")
+    create_polygon = partialmethod(_create, "polygon")
+    create_text = partialmethod(_create, "text")
+    create_image = partialmethod(_create, "image")
+    
+    def create_window(self, *coords, **options):
+        """嵌入的窗口由画布管理，与 pack/place 一样随画布映射"""
+        item = self._create("window", *coords, **options)
+        window = options.get("window")
+        if window is not None and not window._managed:
+            window._managed = True
+            if window.winfo_ismapped():
+                window._map("<Map>")
+        return item
+    
+    def _find(self, tagOrId) -> list:
+        if isinstance(tagOrId, int):
+            return [tagOrId] if tagOrId in self._items else []
+        if tagOrId == "all":
+            return list(self._items)
+        found = []
+        for item, (_, _, options) in self._items.items():
+            tags = options.get("tags", ())
+            if isinstance(tags, str):
+                tags = tags.split()
+            if tagOrId in tags:
+                found.append(item)
+        return found
+    
+    def itemconfigure(self, tagOrId, cnf=None, **kw):
+        self._check()
+        stats["itemconfigure"] += 1
+        for item in self._find(tagOrId):
+            self._items[item][2].update(cnf or {}, **kw)
+    
+    itemconfig = itemconfigure
+    
+    def itemcget(self, tagOrId, option):
+        for item in self._find(tagOrId):
+            return self._items[item][2].get(option, "")
+        return ""
+    
+    def coords(self, tagOrId, *args):
+        self._check()
+        stats["coords"] += 1
+        items = self._find(tagOrId)
+        if not args:
+            return list(self._items[items[0]][1]) if items else []
+        if len(args) == 1 and isinstance(args[0], (list, tuple)):
+            args = tuple(args[0])
+        for item in items:
+            self._items[item][1] = args
+    
+    def move(self, tagOrId, dx, dy):
+        self._check()
+        stats["coords"] += 1
+    
+    def delete(self, *args):
+        self._check()
+        stats["canvas_delete"] += 1
+        for tagOrId in args:
+            for item in self._find(tagOrId):
+                del self._items[item]
+    
+    def find_withtag(self, tagOrId):
+        return tuple(self._find(tagOrId))
+    
+    def find_all(self):
+        return tuple(self._items)
+    
+    def tag_bind(self, tagOrId, sequence=None, func=None, add=None):
+        stats["bind"] += 1
+        return ""
+    
+    def bbox(self, *args):
+        return (0, 0, self.winfo_width(), self.winfo_height())
+    
+    def canvasx(self, screenx, gridspacing=None) -> float:
+        return float(screenx)
+    
+    def canvasy(self, screeny, gridspacing=None) -> float:
+        return float(screeny)
+    
+    def _view(self, *args):
+        self._check()
+        stats["scroll"] += 1
+        return (0.0, 1.0) if not args else None
+    
+    xview = yview = xview_moveto = yview_moveto = xview_scroll = yview_scroll = _view
+
+
+# ==================== 变量与图片 ====================
+
+class Variable:
+    _default = ""
+    
+    def __init__(self, master=None, value=None, name=None):
+        self._value = self._default if value is None else value
+        self._traces = {}
+    
+    def get(self):
+        return self._value
+    
+    def set(self, value):
+        self._value = value
+        for callback in list(self._traces.values()):
+            callback("", "", "write")
+    
+    def trace_add(self, mode, callback) -> str:
+        name = f"trace{id(callback)}"
+        self._traces[name] = callback
+        return name
+    
+    def trace_remove(self, mode, cbname):
+        self._traces.pop(cbname, None)
+
+
+class StringVar(Variable):
+    _default = ""
+
+
+class IntVar(Variable):
+    _default = 0
+
+
+class DoubleVar(Variable):
+    _default = 0.0
+
+
+class BooleanVar(Variable):
+    _default = False
+
+
+class PhotoImage:
+    _names = itertools.count(1)
+    
+    def __init__(self, name=None, cnf=None, master=None, **kw):
+        stats["images"] += 1
+        self.name = name or f"pyimage{next(PhotoImage._names)}"
+        self._options = dict(cnf or {}, **kw)
+    
+    def __str__(self):
+        return self.name
+    
+    def width(self) -> int:
+        return int(self._options.get("width", 0))
+    
+    def height(self) -> int:
+        return int(self._options.get("height", 0))
+    
+    def configure(self, **kw):
+        self._options.update(kw)
+    
+    config = configure
+    
+    def put(self, data, to=None):
+        stats["image_put"] += 1
+    
+    def blank(self):
+        pass
+    
+    def copy(self):
+        return PhotoImage(**self._options)
+
+
+# ==================== 子模块 ====================
+
+class Font:
+    """命名字体：同名重复创建时复用登记"""
+    
+    _names = itertools.count(1)
+    
+    def __init__(self, root=None, font=None, name=None, exists=False, **options):
+        stats["fonts"] += 1
+        self.name = name or f"font{next(Font._names)}"
+        self._options = {"family": "TkDefaultFont", "size": 12, "weight": "normal", "slant": "roman"}
+        self._options.update(options)
+        _font_names[self.name] = self
+    
+    def __str__(self):
+        return self.name
+    
+    def configure(self, **options):
+        if not options:
+            return dict(self._options)
+        stats["font_configure"] += 1
+        self._options.update(options)
+    
+    config = configure
+    
+    def cget(self, option):
+        return self._options.get(option)
+    
+    __getitem__ = cget
+    
+    def actual(self, option=None, displayof=None):
+        return self._options.get(option) if option else dict(self._options)
+    
+    def measure(self, text, displayof=None) -> int:
+        stats["font_measure"] += 1
+        return round(len(text) * abs(int(self._options["size"])) * 0.6)
+    
+    def metrics(self, *options, **kw):
+        size = abs(int(self._options["size"]))
+        values = {"ascent": size, "descent": size // 4, "linespace": size + size // 4, "fixed": 0}
+        return values[options[0]] if len(options) == 1 else values
+    
+    def copy(self):
+        return Font(**self._options)
+
+
+def _font_module() -> types.ModuleType:
+    module = types.ModuleType("tkinter.font")
+    module.Font = Font
+    module.NORMAL, module.BOLD, module.ITALIC, module.ROMAN = "normal", "bold", "italic", "roman"
+    module.families = lambda root=None, displayof=None: ()
+    module.names = lambda root=None: tuple(_font_names)
+    module.nametofont = lambda name, root=None: _font_names.get(name) or Font(name=name, exists=True)
+    return module
+
+
+def _dialog_module(name: str, result) -> types.ModuleType:
+    """对话框模块：任何函数都立即返回 result 并计数"""
+    module = types.ModuleType(name)
+    
+    def __getattr__(attr):
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        
+        def dialog(*args, **kwargs):
+            stats["dialog:" + attr] += 1
+            return result
+        return dialog
+    
+    module.__getattr__ = __getattr__
+    return module
+
+
+def _ttk_module() -> types.ModuleType:
+    module = types.ModuleType("tkinter.ttk")
+    for name in ("Frame", "Label", "Button", "Entry", "Checkbutton", "Scrollbar"):
+        setattr(module, name, type(name, (globals()[name],), {"_tk_class": "T" + name}))
+    module.Style = type("Style", (), {"__init__": _noop, "configure": _noop, "map": _noop, "theme_use": _noop})
+    return module
+
+
+# ==================== 安装 ====================
+
+_EXPORTS = (
+    "TclError", "Misc", "Widget", "BaseWidget", "Tk", "Toplevel", "Frame", "LabelFrame", "Label", "Message",
+    "Button", "Checkbutton", "Radiobutton", "Scale", "Listbox", "Text", "Menu", "Scrollbar", "Entry", "Canvas",
+    "Variable", "StringVar", "IntVar", "DoubleVar", "BooleanVar", "PhotoImage",
+)
+
+
+def install() -> types.ModuleType:
+    """
+    用替身替换 sys.modules 中的 tkinter 并清空统计
+    
+    :return: 替身 tkinter 模块
+    """
+    global _default_root
+    _default_root = None
+    _font_names.clear()
+    stats.clear()
+    
+    module = types.ModuleType("tkinter", __doc__)
+    module.__path__ = []
+    for name in _EXPORTS:
+        setattr(module, name, globals()[name])
+    for name, value in CONSTANTS.items():
+        setattr(module, name, value)
+    
+    constants = types.ModuleType("tkinter.constants")
+    constants.__dict__.update(CONSTANTS)
+    submodules = {
+        "constants": constants,
+        "font": _font_module(),
+        "ttk": _ttk_module(),
+        "filedialog": _dialog_module("tkinter.filedialog", ""),
+        "messagebox": _dialog_module("tkinter.messagebox", None),
+    }
+    
+    sys.modules["tkinter"] = module
+    for name, submodule in submodules.items():
+        setattr(module, name, submodule)
+        sys.modules["tkinter." + name] = submodule
+    return module
+
+
+def _uses_tk(name: str) -> bool:
+    return name.split(".")[0] == "tkinter" or name == "src.ui" or name.startswith("src.ui.")
+
+
+@contextmanager
+def installed() -> Iterator[types.ModuleType]:
+    """
+    临时安装替身
+    
+    已导入的 tkinter 与 src.ui 模块先移出 sys.modules，期间重新导入的版本建立在替身之上；
+    退出时丢弃这些模块并恢复原来的
+    """
+    saved = {name: module for name, module in sys.modules.items() if _uses_tk(name)}
+    for name in saved:
+        del sys.modules[name]
+    try:
+        yield install()
+    finally:
+        global _default_root
+        _default_root = None
+        for name in [name for name in sys.modules if _uses_tk(name)]:
+            del sys.modules[name]
+        sys.modules.update(saved)
+        # 父包的属性仍指向替身期间导入的子模块
+        for name, module in saved.items():
+            parent, _, child = name.rpartition(".")
+            if parent in sys.modules:
+                setattr(sys.modules[parent], child, module)
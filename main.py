@@ -4,16 +4,56 @@ OfficeGuard - 系统优化助手
 """
 
 import sys
+import time
 import ctypes
-import tkinter as tk
+
+# 启动计时起点（在导入其余模块之前）
+_STARTED_AT = time.perf_counter()
 
 # 添加项目路径
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.utils.logger import setup_logging
-from src.ui.app import ModernApp
-from src.core.version import VERSION
+# 命令行快速路径只需要参数解析，其余模块按需导入
+from src.cli import parse_args, run_command
+
+
+def get_memory_usage() -> int:
+    """当前进程工作集大小（字节），非 Windows 或失败时返回 0"""
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", ctypes.c_ulong),
+            ("PageFaultCount", ctypes.c_ulong),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+    
+    try:
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+    except Exception:
+        pass
+    return 0
+
+
+def log_startup(logger, mode: str):
+    """记录启动耗时与内存占用，便于比较界面模式与无界面模式"""
+    from src.core import metrics
+    
+    elapsed = (time.perf_counter() - _STARTED_AT) * 1000
+    memory = get_memory_usage()
+    metrics.gauge("startup_seconds", "从进程启动到就绪的耗时").set(elapsed / 1000)
+    metrics.gauge("startup_memory_bytes", "就绪时的工作集大小").set(memory)
+    logger.info(f"[{mode}] 启动耗时 {elapsed:.0f}ms，内存占用 {memory / (1024 * 1024):.1f}MB")
 
 
 def setup_dpi():
@@ -27,23 +67,64 @@ def setup_dpi():
     pass
 
 
+def run_headless(logger, args):
+    """无界面后台服务模式"""
+    from src.core.service import HeadlessService
+    
+    try:
+        service = HeadlessService(launch_args=args)
+        service.run(on_ready=lambda: log_startup(logger, "headless"))
+    except Exception as e:
+        logger.error(f"后台服务运行出错: {e}", exc_info=True)
+    finally:
+        logger.info("后台服务已关闭")
+
+
 def main():
     """主函数"""
-    # 设置 DPI 感知 (必须在创建 Tk 窗口前)
-    setup_dpi()
+    args = parse_args()
+    
+    # 子命令：交给已运行的实例执行后退出
+    if args.command:
+        code = run_command(args)
+        if code is not None:
+            sys.exit(code)
+        # 没有实例运行：以无界面模式启动并执行该命令
+        args.headless = True
+    
+    from src.core.instance import InstanceLock, forward_to_running
+    from src.utils.logger import setup_logging
+    from src.core.version import VERSION
+    
+    # 单实例：已有实例运行时转发参数后立即退出，不做任何初始化
+    instance_lock = InstanceLock()
+    if not instance_lock.acquire():
+        forwarded = forward_to_running(sys.argv[1:])
+        sys.exit(0 if forwarded else 1)
     
     # 初始化日志
     logger = setup_logging()
     logger.info("=" * 50)
-    logger.info(f"OfficeGuard v{VERSION} - 启动")
+    logger.info(f"OfficeGuard v{VERSION} - 启动{'（无界面模式）' if args.headless else ''}")
     logger.info("=" * 50)
     
+    if args.headless:
+        run_headless(logger, args)
+        return
+    
+    # 设置 DPI 感知 (必须在创建 Tk 窗口前)
+    setup_dpi()
+    
+    import tkinter as tk
+    from src.ui.app import ModernApp
+    
     try:
         # 创建主窗口
         root = tk.Tk()
         
         # 创建应用
-        app = ModernApp(root)
+        app = ModernApp(root, launch_args=args)
+        root.after_idle(log_startup, logger, "gui")
         
         # 运行
         app.run()
@@ -0,0 +1,211 @@
+"""
+命令行参数模块
+主程序与转发给已运行实例的参数共用同一套解析
+
+子命令（timer/cancel/lock/status/reload/metrics/history）走快速路径：只通过控制接口与已运行的实例通信，
+不导入界面模块与 pynput/pystray/PIL；history 直接读取事件日志，不需要实例运行
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Optional
+
+# 需要常驻进程的子命令：没有实例运行时以无界面模式启动并执行
+SERVICE_COMMANDS = ("timer", "lock")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """创建参数解析器"""
+    parser = argparse.ArgumentParser(prog="OfficeGuard", description="系统优化助手")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="无界面后台服务模式：仅运行定时、锁定、快捷键与托盘，不加载 Tk"
+    )
+    parser.add_argument(
+        "--timer",
+        type=float,
+        metavar="MINUTES",
+        help="启动定时任务（已有实例运行时转发给该实例）"
+    )
+    parser.add_argument(
+        "--action",
+        choices=("sleep", "shutdown"),
+        default="sleep",
+        help="定时任务动作，默认睡眠"
+    )
+    # 开机自启动任务添加的标志
+    parser.add_argument("--boot-startup", action="store_true", help=argparse.SUPPRESS)
+
+    commands = parser.add_subparsers(dest="command", metavar="命令")
+
+    timer = commands.add_parser("timer", help="定时睡眠/关机，如 timer 30 --sleep")
+    timer.add_argument("minutes", type=float, help="倒计时分钟数")
+    action = timer.add_mutually_exclusive_group()
+    action.add_argument("--sleep", dest="timer_action", action="store_const", const="sleep", help="睡眠（默认）")
+    action.add_argument("--shutdown", dest="timer_action", action="store_const", const="shutdown", help="关机")
+    timer.add_argument("--grace", type=int, metavar="SECONDS", help="缓冲期秒数，默认使用配置")
+
+    commands.add_parser("cancel", help="取消定时任务")
+
+    lock = commands.add_parser("lock", help="立即锁定")
+    lock.add_argument("--password", help="新的解锁密码，默认沿用已保存的密码")
+
+    status = commands.add_parser("status", help="查看运行状态")
+    status.add_argument("--json", action="store_true", help="以 JSON 输出")
+
+    commands.add_parser("reload", help="重新加载配置文件")
+
+    metrics = commands.add_parser("metrics", help="导出运行指标（Prometheus 文本格式）")
+    metrics.add_argument("-o", "--output", metavar="FILE", help="写入文件而不是输出到终端")
+
+    history = commands.add_parser("history", help="查看锁定、解锁、睡眠、关机等历史事件")
+    history.add_argument("--days", type=float, default=7, help="最近多少天，默认 7")
+    history.add_argument(
+        "--type",
+        dest="event_types",
+        action="append",
+        choices=("start", "exit", "lock", "unlock", "timer", "cancel", "sleep", "shutdown"),
+        help="只显示指定类型（可重复）"
+    )
+    history.add_argument("--limit", type=int, help="最多显示的条数（取最新的）")
+    history.add_argument("--json", action="store_true", help="以 JSON 输出")
+    return parser
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """解析命令行参数（忽略未知参数）"""
+    args, _ = build_parser().parse_known_args(argv)
+
+    # timer 子命令等价于 --timer
+    if args.command == "timer":
+        args.timer = args.minutes
+        args.action = args.timer_action or "sleep"
+    return args
+
+
+def parse_forwarded(argv: List[str]) -> argparse.Namespace:
+    """解析其他实例转发来的参数（出错时抛出 ValueError，而不是退出当前进程）"""
+    try:
+        return parse_args(argv)
+    except SystemExit:
+        raise ValueError(f"无效参数: {argv}")
+
+
+def run_command(args: argparse.Namespace) -> Optional[int]:
+    """
+    通过控制接口执行子命令
+
+    :return: 进程退出码；None 表示没有实例运行且该命令需要常驻进程，由调用方启动服务
+    """
+    if args.command == "history":
+        return _print_history(args)
+
+    from .core.ipc_client import send_command
+
+    if args.command == "timer":
+        request = {"cmd": "start_timer", "action": args.action, "minutes": args.timer}
+        if args.grace is not None:
+            request["grace"] = args.grace
+    elif args.command == "lock":
+        request = {"cmd": "lock", "password": args.password}
+    elif args.command == "cancel":
+        request = {"cmd": "cancel_timer"}
+    elif args.command == "reload":
+        request = {"cmd": "reload_config"}
+    elif args.command == "metrics":
+        request = {"cmd": "metrics"}
+    else:
+        request = {"cmd": "status"}
+
+    try:
+        response = send_command(**request)
+    except (OSError, ValueError):
+        if args.command in SERVICE_COMMANDS:
+            return None
+        print("OfficeGuard 未运行", file=sys.stderr)
+        return 1
+
+    if not response.get("ok"):
+        print(f"失败: {response.get('error')}", file=sys.stderr)
+        return 1
+
+    data = response.get("data")
+    if args.command == "status":
+        _print_status(data, as_json=args.json)
+    elif args.command == "metrics":
+        return _write_metrics(data, args.output)
+    elif data is False:
+        print("未执行（当前状态不允许）", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _print_status(status: dict, as_json: bool = False):
+    """输出状态"""
+    if as_json:
+        print(json.dumps(status, ensure_ascii=False))
+        return
+
+    lines = [f"模式: {'无界面' if status.get('mode') == 'headless' else '界面'}"]
+    lines.append(f"锁定: {'是' if status.get('locked') else '否'}")
+    if status.get("in_grace_period"):
+        lines.append(f"定时: 缓冲期，剩余 {status.get('grace_remaining', 0)} 秒")
+    elif status.get("timer_running"):
+        action = "关机" if status.get("timer_action") == "shutdown" else "睡眠"
+        m, s = divmod(status.get("remaining_seconds", 0), 60)
+        h, m = divmod(m, 60)
+        lines.append(f"定时: {action}，剩余 {h:02d}:{m:02d}:{s:02d}")
+    else:
+        lines.append("定时: 无")
+    lines.append(f"快捷键: {'开启' if status.get('hotkey_enabled') else '关闭'}")
+    print("\n".join(lines))
+
+
+def _write_metrics(text: str, output: str = None) -> int:
+    """输出指标快照（写文件时先写临时文件再替换）"""
+    if not output:
+        sys.stdout.write(text)
+        return 0
+    tmp = f"{output}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, output)
+    except OSError as e:
+        print(f"写入失败: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _print_history(args: argparse.Namespace) -> int:
+    """输出事件日志"""
+    from .core.journal import EventJournal, EventType
+
+    types = [EventType.KEYS[key] for key in args.event_types] if args.event_types else None
+    # 只读打开：不截断、不重写索引，也不妨碍正在运行的实例写入或压缩
+    events = EventJournal(read_only=True).query(
+        start=time.time() - args.days * 86400,
+        types=types,
+        limit=args.limit
+    )
+
+    if args.json:
+        keys = {value: key for key, value in EventType.KEYS.items()}
+        print(json.dumps(
+            [{"time": e.timestamp, "type": keys.get(e.type, e.type), "value": e.value} for e in events],
+            ensure_ascii=False
+        ))
+        return 0
+
+    for event in events:
+        line = f"{event.datetime:%Y-%m-%d %H:%M:%S}  {event.name}"
+        if event.type == EventType.TIMER_START:
+            line += f"  {event.value // 60} 分钟"
+        print(line)
+    if not events:
+        print("没有记录")
+    return 0
@@ -1,7 +1,20 @@
 """核心模块"""
-from .config import ConfigManager
-from .timer import TimerManager
-from .locker import SystemLocker
-from .autostart import AutoStartManager
-from .hotkey import HotkeyManager
-from .tray import TrayManager
+import importlib
+
+# 按需导入：只用到 ipc/instance 等轻量模块的启动路径不加载 pynput、pystray 与 PIL
+_EXPORTS = {
+    "ConfigManager": ".config",
+    "TimerManager": ".timer",
+    "SystemLocker": ".locker",
+    "AutoStartManager": ".autostart",
+    "HotkeyManager": ".hotkey",
+    "TrayManager": ".tray",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,22 +5,36 @@
 
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, List, Optional, Tuple
 
+from . import metrics
+from .verifier import UnlockVerifier
 from ..utils.paths import get_config_dir
 from ..utils.crypto import encrypt_data, decrypt_data
 from ..utils.logger import get_logger
 
 logger = get_logger('config')
 
+# 托盘快捷定时（睡眠，分钟），不计入最近使用
+SLEEP_PRESETS = (15, 30, 60, 120)
+
+# 最近使用的自定义定时条数
+RECENT_TIMERS_LIMIT = 3
+
+_save_duration = metrics.histogram("config_save_seconds", "配置保存耗时（含加密）")
+_save_failures = metrics.counter("config_save_failures_total", "配置保存失败次数")
+
 
 class ConfigManager:
     """配置管理器"""
     
+    # 默认解锁密码
+    DEFAULT_PASSWORD = "000"
+    
     # 默认配置
     DEFAULTS = {
-        # 密码设置
-        "password": "000",
+        # 密码设置（仅保存加盐摘要，见 UnlockVerifier）
+        "password_hash": "",
         
         # 定时器设置
         "timer_minutes": 60,
@@ -55,9 +69,25 @@ class ConfigManager:
         # 启动软件列表
         "startup_apps": [],
         
-        # UI主题
-        "theme": "dark",
+        # 最近使用的自定义定时 [[action, minutes], ...]
+        "recent_timers": [],
+        
+        # UI主题（light / dark）
+        "theme": "light",
         "accent_color": "#3498db",
+        
+        # 托盘倒计时角标
+        "tray_countdown_badge": False,
+        
+        # 本地控制接口（命名管道）
+        "ipc_enabled": True,
+        
+        # 事件日志保留天数（0 表示不清理）
+        "journal_retention_days": 365,
+        
+        # 指标快照文件（Prometheus 文本格式，留空表示不写文件）与写入间隔（秒）
+        "metrics_file": "",
+        "metrics_interval": 60,
     }
     
     def __init__(self, filename: Path = None):
@@ -70,12 +100,17 @@ class ConfigManager:
             filename = get_config_dir() / 'guard_config.json'
         
         self.filename = Path(filename)
+        # 上一次加载的结果：文件是否存在、是否因解密/解析失败退回默认配置
+        self.file_existed = False
+        self.load_failed = False
         self.data = self._load()
         self.is_first_run = self.data.get("first_run", True)
     
     def _load(self) -> dict:
         """加载配置文件"""
-        if not self.filename.exists():
+        self.file_existed = self.filename.exists()
+        self.load_failed = False
+        if not self.file_existed:
             logger.info("配置文件不存在，使用默认配置")
             return self.DEFAULTS.copy()
         
@@ -93,6 +128,7 @@ class ConfigManager:
                         logger.debug(f"加密配置已从 {self.filename} 加载并解密")
                     else:
                         logger.error("配置文件解密失败，使用默认配置")
+                        self.load_failed = True
                         return self.DEFAULTS.copy()
                 else:
                     # 兼容旧的未加密配置文件
@@ -108,8 +144,14 @@ class ConfigManager:
                 return saved
         except Exception as e:
             logger.error(f"配置文件加载失败: {e}")
+            self.load_failed = True
             return self.DEFAULTS.copy()
     
+    def reload(self) -> None:
+        """重新读取配置文件（外部工具修改配置后调用）"""
+        self.data = self._load()
+        logger.info("配置已重新加载")
+    
     def save(self, encrypt: bool = True) -> bool:
         """
         保存配置文件
@@ -117,6 +159,13 @@ class ConfigManager:
         :param encrypt: 是否加密保存
         :return: 是否保存成功
         """
+        with _save_duration.time():
+            saved = self._save(encrypt)
+        if not saved:
+            _save_failures.inc()
+        return saved
+    
+    def _save(self, encrypt: bool) -> bool:
         try:
             # 确保目录存在
             self.filename.parent.mkdir(parents=True, exist_ok=True)
@@ -154,6 +203,53 @@ class ConfigManager:
         """设置配置项"""
         self.data[key] = value
     
+    def get_unlock_verifier(self) -> UnlockVerifier:
+        """
+        获取解锁码校验器
+        
+        兼容旧版明文 password 字段：首次读取时迁移为摘要并删除明文。
+        只在迁移了明文或配置文件尚不存在时保存；加载失败时绝不保存，
+        以免用默认配置覆盖用户原有的配置文件
+        """
+        record = self.get("password_hash")
+        if record:
+            try:
+                return UnlockVerifier.from_record(record)
+            except ValueError:
+                logger.error("解锁密码记录损坏，恢复为默认密码")
+        
+        legacy = self.data.pop("password", None)
+        try:
+            verifier = UnlockVerifier.from_code(legacy or self.DEFAULT_PASSWORD)
+        except ValueError:
+            verifier = UnlockVerifier.from_code(self.DEFAULT_PASSWORD)
+        
+        self.set("password_hash", verifier.to_record())
+        if self.load_failed:
+            logger.warning("配置文件加载失败，解锁密码记录暂不保存")
+        elif legacy or not self.file_existed:
+            self.save()
+            if legacy:
+                logger.info("明文解锁密码已迁移为加盐摘要")
+        return verifier
+    
+    def remember_timer(self, action: str, minutes: float) -> Optional[List[Tuple[str, float]]]:
+        """
+        记录最近使用的自定义定时（快捷定时除外），不保存文件
+        
+        :return: 新的最近使用列表；快捷定时返回 None
+        """
+        if action == "sleep" and minutes in SLEEP_PRESETS:
+            return None
+        
+        recent = [
+            (a, m) for a, m in self.get("recent_timers", [])
+            if (a, m) != (action, minutes)
+        ]
+        recent = [(action, minutes)] + recent[:RECENT_TIMERS_LIMIT - 1]
+        self.set("recent_timers", [list(item) for item in recent])
+        return recent
+    
     def mark_first_run_complete(self) -> None:
         """标记首次运行已完成"""
         self.set("first_run", False)
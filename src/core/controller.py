@@ -0,0 +1,522 @@
+"""
+核心控制器模块
+界面模式与无界面模式共用的状态与服务：定时、锁定、快捷键、托盘、控制接口、事件日志与指标，
+前端只负责线程切换、调度与各自的显示
+"""
+
+import argparse
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict
+from .config import ConfigManager
+from .timer import TimerManager
+from .locker import SystemLocker
+from .verifier import UnlockVerifier, is_valid_code
+from .enforcer import EnforcementBackend, LockEnforcer
+from .display import DisplayTopologyCache, DisplayChangeListener
+from .hotkey import HotkeyManager
+from .journal import EventJournal, EventType
+from . import metrics
+from .ipc import ControlServer, StatusCache, call_via, parse_timer_request
+from .tray import ACTION_NAMES, TrayManager
+from .tray_icons import TrayState
+from ..cli import parse_forwarded
+from ..utils.logger import get_logger
+
+logger = get_logger('controller')
+
+
+class ControllerFrontend(ABC):
+    """
+    控制器的前端接口
+    
+    由界面（Tk）与无界面服务（asyncio）实现：提供主线程投递与延迟调度，
+    并在状态变化时更新各自的显示；钩子默认不做任何事
+    """
+    
+    # 是否有主窗口（决定托盘菜单是否显示“显示主界面”）
+    has_window = False
+    
+    @abstractmethod
+    def post(self, func: Callable, *args):
+        """从任意线程把调用投递到主线程"""
+    
+    @abstractmethod
+    def call_later(self, delay_ms: int, func: Callable, background: bool = False) -> Any:
+        """
+        在主线程延迟执行
+        
+        :param background: 是否为后台任务（如指标导出），界面模式下在空闲时执行
+        :return: 句柄，用于 cancel_call
+        """
+    
+    @abstractmethod
+    def cancel_call(self, handle: Any):
+        """取消 call_later 的调度"""
+    
+    @abstractmethod
+    def create_enforcement_backend(self, controller: "GuardController") -> EnforcementBackend:
+        """创建锁定强制的平台接口"""
+    
+    @abstractmethod
+    def quit(self):
+        """退出程序（托盘菜单）"""
+    
+    def show_window(self):
+        """显示主窗口"""
+    
+    def on_timer_started(self, action: str):
+        """定时任务已启动"""
+    
+    def on_timer_tick(self, remaining: int, total: int):
+        """倒计时更新"""
+    
+    def on_grace_tick(self, remaining: int):
+        """缓冲期倒计时更新（在托盘状态切换为缓冲期之前调用）"""
+    
+    def on_timer_stopped(self):
+        """定时任务完成或取消"""
+    
+    def on_activity_cancel(self):
+        """缓冲期检测到用户活动，定时任务已取消"""
+    
+    def on_locked(self):
+        """系统已锁定（锁定强制启动之前）"""
+    
+    def on_unlocked(self):
+        """系统已解锁"""
+    
+    def on_display_change(self):
+        """锁定期间显示配置变化"""
+    
+    def on_hotkey_changed(self):
+        """快捷键配置变化"""
+    
+    def on_config_reloaded(self):
+        """配置文件已重新加载"""
+    
+    def on_second_launch(self):
+        """用户再次启动程序且没有要执行的参数"""
+
+
+class GuardController:
+    """
+    核心控制器
+    
+    所有状态只在前端主线程中修改；托盘、快捷键、锁定器、控制接口等线程的回调
+    通过 frontend.post 切回主线程
+    """
+    
+    def __init__(self, frontend: ControllerFrontend, mode: str, config: ConfigManager = None):
+        """
+        :param frontend: 前端
+        :param mode: 运行模式（'gui' 或 'headless'），用于状态查询与指标标签
+        :param config: 配置管理器
+        """
+        self.frontend = frontend
+        self.mode = mode
+        self.config = config or ConfigManager()
+        
+        self.timer = TimerManager()
+        self.display = DisplayTopologyCache()
+        self.display_listener = DisplayChangeListener(self._on_display_change_notify)
+        self.locker = SystemLocker(display=self.display)
+        self.unlock_verifier = self.config.get_unlock_verifier()
+        self.enforcer = LockEnforcer(
+            frontend.create_enforcement_backend(self), frontend.call_later, frontend.cancel_call
+        )
+        self.hotkey = HotkeyManager()
+        self.journal = EventJournal()
+        self.tray = TrayManager(
+            accent_color=self.config.get("accent_color"),
+            show_badge=self.config.get("tray_countdown_badge")
+        )
+        
+        # 本地控制接口（状态查询读取快照，不访问主线程）；
+        # 关闭时仍接收后启动实例的转发，只把已运行的实例调到前台，否则第二次启动会无响应地失败
+        self.status_cache = StatusCache(mode=mode)
+        if self.config.get("ipc_enabled"):
+            self.control = ControlServer(self._control_commands(), self.status_cache.get)
+        else:
+            self.control = ControlServer({"forward": self._forward_show_only}, None)
+        
+        self._timer_task = None
+        self._metrics_task = None
+        metrics.register_runtime_metrics(mode)
+        self._setup_callbacks()
+    
+    # ==================== 运行 ====================
+    
+    def _setup_callbacks(self):
+        """设置各模块回调"""
+        post = self.frontend.post
+        self.timer.set_callbacks(
+            on_tick=self._on_timer_tick,
+            on_grace_tick=self._on_grace_tick,
+            on_complete=self._on_timer_done,
+            on_cancel=self._on_timer_cancel,
+            on_execute=self._on_timer_execute
+        )
+        self.locker.set_callbacks(on_unlock=lambda: post(self._on_unlock))
+        self.hotkey.set_callback(on_trigger=lambda: post(self.lock))
+        self.tray.set_callbacks(
+            on_show=(lambda: post(self.frontend.show_window)) if self.frontend.has_window else None,
+            on_quit=lambda: post(self.frontend.quit),
+            on_toggle_hotkey=lambda: post(self.toggle_hotkey),
+            on_start_timer=lambda action, m: post(self.start_timer, action, m),
+            on_cancel_timer=lambda: post(self.cancel_timer),
+            on_lock=lambda: post(self.lock)
+        )
+    
+    def start(self):
+        """启动后台服务（托盘由前端调用 start_tray 启动）"""
+        # 事件日志（超出保留期时压缩）
+        self.journal.append(EventType.APP_START)
+        self.journal.apply_retention(self.config.get("journal_retention_days"))
+        
+        self._apply_hotkey_config()
+        self.hotkey.start()
+        
+        # 监听显示配置变化（使显示器拓扑缓存失效）
+        self.display_listener.start()
+        
+        self.control.start()
+        
+        self._export_metrics()
+        
+        # 开机启动相关模块只在 Windows 上可用，按需导入
+        from .autostart import is_system_boot, remove_boot_startup_args
+        if is_system_boot():
+            logger.info("检测到开机启动")
+            remove_boot_startup_args()
+            self.frontend.call_later(2000, self.run_boot_tasks)
+    
+    def start_tray(self):
+        """启动系统托盘"""
+        self._update_tray_state()
+        self.tray.set_recent_timers(self.config.get("recent_timers", []))
+        self.tray.start(hotkey_enabled=self.config.get("hotkey_enabled"))
+    
+    def shutdown(self):
+        """停止全部服务"""
+        logger.info("正在清理资源...")
+        if self.timer.running:
+            self.timer.cancel("程序退出")
+        if self.locker.is_locked:
+            self.locker.cleanup()
+        self.enforcer.stop()
+        if self._metrics_task is not None:
+            self.frontend.cancel_call(self._metrics_task)
+            self._metrics_task = None
+        self.hotkey.stop()
+        self.tray.stop()
+        self.display_listener.stop()
+        self.control.stop()
+        self.journal.append(EventType.APP_EXIT)
+    
+    def _apply_hotkey_config(self):
+        """按配置设置快捷键"""
+        self.hotkey.configure(
+            ctrl=self.config.get("hotkey_ctrl"),
+            alt=self.config.get("hotkey_alt"),
+            shift=self.config.get("hotkey_shift"),
+            key=self.config.get("hotkey_key")
+        )
+        self.hotkey.enabled = self.config.get("hotkey_enabled")
+    
+    def run_boot_tasks(self):
+        """执行开机启动任务"""
+        if not self.config.get("autostart_enabled"):
+            return
+        
+        startup_apps = self.config.get("startup_apps")
+        if startup_apps:
+            from .autostart import launch_startup_apps
+            launched, failed = launch_startup_apps(startup_apps)
+            logger.info(f"开机启动完成: 成功={launched}, 失败={failed}")
+    
+    # ==================== 定时器 ====================
+    
+    def start_timer(self, action: str, minutes: float, grace: int = None, save_defaults: bool = False) -> bool:
+        """
+        启动定时器
+        
+        :param action: 'shutdown' 或 'sleep'
+        :param minutes: 倒计时分钟数
+        :param grace: 缓冲期秒数，默认使用配置
+        :param save_defaults: 是否把分钟数与缓冲期保存为定时页面的默认值
+        :return: 是否启动成功
+        """
+        if self.timer.running or self.locker.is_locked:
+            return False
+        
+        if grace is None:
+            grace = self.config.get("grace_seconds")
+        if not self.timer.start(action, minutes, grace, self.config.get("mouse_threshold")):
+            return False
+        self.journal.append(EventType.TIMER_START, self.timer.total_seconds)
+        
+        self.frontend.on_timer_started(action)
+        self._update_tray_state()
+        self._timer_step()
+        
+        recent = self.config.remember_timer(action, minutes)
+        if recent is not None:
+            self.tray.set_recent_timers(recent)
+        if save_defaults:
+            self.config.set("timer_minutes", minutes)
+            self.config.set("grace_seconds", grace)
+        if recent is not None or save_defaults:
+            self.config.save()
+        return True
+    
+    def cancel_timer(self) -> bool:
+        """取消定时器"""
+        if not self.timer.running:
+            return False
+        self.timer.cancel("手动取消")
+        return True
+    
+    def _timer_step(self):
+        """定时器更新（倒计时每 0.5 秒，缓冲期每 1 秒）"""
+        self._timer_task = None
+        if not self.timer.running:
+            return
+        
+        running, in_grace = self.timer.update()
+        if not running:
+            return
+        
+        if in_grace:
+            if self.timer.update_grace():
+                self.timer.cancel("检测到用户活动")
+                self.frontend.on_activity_cancel()
+                return
+            delay = 1000
+        else:
+            delay = 500
+        
+        if self.timer.running:
+            self._timer_task = self.frontend.call_later(delay, self._timer_step)
+    
+    def _on_timer_tick(self, h: int, m: int, s: int):
+        remaining = self.timer.remaining_seconds
+        self.tray.update_countdown(remaining, label=ACTION_NAMES.get(self.timer.action, ""))
+        self.frontend.on_timer_tick(remaining, self.timer.total_seconds)
+    
+    def _on_grace_tick(self, remaining: int):
+        self.frontend.on_grace_tick(remaining)
+        self.tray.update_countdown(remaining, grace=True)
+        self._update_tray_state()
+    
+    def _on_timer_done(self):
+        if self._timer_task is not None:
+            self.frontend.cancel_call(self._timer_task)
+            self._timer_task = None
+        self.tray.clear_countdown()
+        self._update_tray_state()
+        self.frontend.on_timer_stopped()
+    
+    def _on_timer_cancel(self, msg: str):
+        self.journal.append(EventType.TIMER_CANCEL)
+        self._on_timer_done()
+    
+    def _on_timer_execute(self, action: str):
+        self.journal.append(EventType.SHUTDOWN if action == "shutdown" else EventType.SLEEP)
+    
+    # ==================== 锁定 ====================
+    
+    def lock(self, password: str = None) -> bool:
+        """
+        锁定系统
+        
+        :param password: 新的解锁密码；为 None 时沿用已保存的密码（快捷键、托盘锁定）
+        :return: 是否锁定成功
+        """
+        if self.locker.is_locked:
+            return False
+        
+        # 仅在密码变化时重新计算摘要并保存配置
+        if password is not None and not self.unlock_verifier.verify(password):
+            if not is_valid_code(password):
+                logger.error("密码无效")
+                return False
+            self.unlock_verifier = UnlockVerifier.from_code(password)
+            self.config.set("password_hash", self.unlock_verifier.to_record())
+            self.config.save()
+        
+        if not self.locker.lock(verifier=self.unlock_verifier):
+            return False
+        
+        # 停止热键监听，避免解锁后误触发
+        self.hotkey.stop()
+        self.frontend.on_locked()
+        self.enforcer.start()
+        self.journal.append(EventType.LOCK)
+        self._update_tray_state()
+        return True
+    
+    def _on_unlock(self):
+        """解锁（主线程）"""
+        self.journal.append(EventType.UNLOCK)
+        self.enforcer.stop()
+        self.frontend.on_unlocked()
+        
+        if self.config.get("hotkey_enabled"):
+            self.hotkey.start()
+        
+        self._update_tray_state()
+        logger.info("系统已解锁")
+    
+    def _on_display_change_notify(self):
+        """显示配置变化（监听线程）"""
+        self.display.invalidate()
+        self.frontend.post(self._on_display_change)
+    
+    def _on_display_change(self):
+        """显示配置变化：锁定期间由前端重新布置遮挡窗口，并重新困禁鼠标"""
+        logger.info("显示配置已变化")
+        if self.locker.is_locked:
+            self.frontend.on_display_change()
+        self.enforcer.notify_display_change()
+    
+    # ==================== 快捷键与配置 ====================
+    
+    def toggle_hotkey(self) -> bool:
+        """切换快捷键状态，返回切换后的状态"""
+        enabled = not self.config.get("hotkey_enabled")
+        self.config.set("hotkey_enabled", enabled)
+        self.config.save()
+        
+        self.hotkey.enabled = enabled
+        if enabled and not self.locker.is_locked:
+            self.hotkey.start()
+        else:
+            self.hotkey.stop()
+        
+        self.tray.update_hotkey_status(enabled)
+        self._update_tray_state()
+        self.frontend.on_hotkey_changed()
+        logger.info(f"快捷键已{'启用' if enabled else '禁用'}")
+        return enabled
+    
+    def set_hotkey(self, enabled: bool, ctrl: bool, alt: bool, shift: bool, key: str):
+        """保存并应用快捷键设置"""
+        self.config.set("hotkey_enabled", enabled)
+        self.config.set("hotkey_ctrl", ctrl)
+        self.config.set("hotkey_alt", alt)
+        self.config.set("hotkey_shift", shift)
+        self.config.set("hotkey_key", key)
+        self.config.save()
+        
+        self.hotkey.stop()
+        self._apply_hotkey_config()
+        if not self.locker.is_locked:
+            self.hotkey.start()
+        self.tray.update_hotkey_status(enabled)
+        self._update_tray_state()
+        self.frontend.on_hotkey_changed()
+    
+    def reload_config(self) -> bool:
+        """重新加载配置文件并应用"""
+        self.config.reload()
+        self.unlock_verifier = self.config.get_unlock_verifier()
+        
+        self.hotkey.stop()
+        self._apply_hotkey_config()
+        if not self.locker.is_locked:
+            self.hotkey.start()
+        
+        self.tray.show_badge = self.config.get("tray_countdown_badge")
+        self.tray.update_hotkey_status(self.config.get("hotkey_enabled"))
+        self.tray.set_recent_timers(self.config.get("recent_timers", []))
+        self._update_tray_state()
+        self.frontend.on_hotkey_changed()
+        self.frontend.on_config_reloaded()
+        
+        if self._metrics_task is not None:
+            self.frontend.cancel_call(self._metrics_task)
+        self._export_metrics()
+        return True
+    
+    # ==================== 控制接口 ====================
+    
+    def status(self) -> Dict[str, Any]:
+        """当前状态（快照，可在任意线程调用）"""
+        return self.status_cache.get()
+    
+    def _control_commands(self) -> dict:
+        """控制接口命令（在接口工作线程中调用，切回主线程执行）"""
+        def on_main(func, *args):
+            return call_via(self.frontend.post, func, *args)
+        
+        return {
+            "start_timer": lambda p: on_main(self.start_timer, *parse_timer_request(p)),
+            "cancel_timer": lambda p: on_main(self.cancel_timer),
+            "lock": lambda p: on_main(self.lock, p.get("password")),
+            "reload_config": lambda p: on_main(self.reload_config),
+            "forward": lambda p: on_main(self.apply_launch_args, parse_forwarded(p.get("argv", [])), True),
+        }
+    
+    def _forward_show_only(self, params: dict) -> bool:
+        """控制接口关闭时的转发处理：忽略参数，只显示已运行的实例"""
+        call_via(self.frontend.post, self.frontend.on_second_launch)
+        return True
+    
+    def apply_launch_args(self, args: argparse.Namespace, forwarded: bool = False) -> bool:
+        """
+        执行启动参数
+        
+        :param args: 解析后的参数
+        :param forwarded: 是否由后启动的实例转发而来
+        """
+        if args.command == "lock":
+            self.lock(args.password)
+        elif args.timer:
+            self.start_timer(args.action, args.timer, getattr(args, "grace", None))
+        elif forwarded and args.boot_startup:
+            self.run_boot_tasks()
+        elif forwarded:
+            self.frontend.on_second_launch()
+        return True
+    
+    # ==================== 状态与指标 ====================
+    
+    def _update_tray_state(self):
+        """按当前状态切换托盘图标（状态未变化时不做任何事）并更新状态快照"""
+        if self.locker.is_locked:
+            state = TrayState.LOCKED
+        elif self.timer.running:
+            state = TrayState.GRACE if self.timer.in_grace_period else TrayState.TIMER
+        elif not self.config.get("hotkey_enabled"):
+            state = TrayState.HOTKEY_OFF
+        else:
+            state = TrayState.IDLE
+        self.tray.set_state(state)
+        self._publish_status()
+    
+    def _publish_status(self):
+        """更新供控制接口读取的状态快照"""
+        self.status_cache.update(
+            locked=self.locker.is_locked,
+            timer_running=self.timer.running,
+            timer_action=self.timer.action if self.timer.running else "",
+            timer_deadline=self.timer.target_timestamp,
+            in_grace_period=self.timer.in_grace_period,
+            grace_remaining=self.timer.grace_remaining if self.timer.in_grace_period else 0,
+            hotkey_enabled=self.config.get("hotkey_enabled"),
+        )
+    
+    def _export_metrics(self):
+        """按配置定期把指标快照写入文件"""
+        self._metrics_task = None
+        path = self.config.get("metrics_file")
+        if not path:
+            return
+        try:
+            metrics.registry.write(Path(path))
+        except OSError as e:
+            logger.warning(f"指标文件写入失败: {e}")
+        self._metrics_task = self.frontend.call_later(
+            int(max(5, self.config.get("metrics_interval")) * 1000), self._export_metrics, background=True
+        )
@@ -0,0 +1,319 @@
+"""
+显示器拓扑模块
+缓存显示器列表、DPI 与虚拟屏幕范围，仅在显示配置变化时失效
+"""
+
+import ctypes
+import threading
+from abc import ABC, abstractmethod
+from ctypes import wintypes
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+from ..utils.logger import get_logger
+
+logger = get_logger('display')
+
+# Windows API 常量
+WM_QUIT = 0x0012
+WM_SETTINGCHANGE = 0x001A
+WM_DISPLAYCHANGE = 0x007E
+WM_DPICHANGED = 0x02E0
+SPI_SETWORKAREA = 0x002F
+MONITORINFOF_PRIMARY = 0x00000001
+MDT_EFFECTIVE_DPI = 0
+SM_XVIRTUALSCREEN = 76
+SM_YVIRTUALSCREEN = 77
+SM_CXVIRTUALSCREEN = 78
+SM_CYVIRTUALSCREEN = 79
+
+LRESULT = ctypes.c_ssize_t
+
+# 回调类型
+MONITORENUMPROC = ctypes.CFUNCTYPE(
+    wintypes.BOOL, wintypes.HMONITOR, wintypes.HDC, ctypes.POINTER(wintypes.RECT), wintypes.LPARAM
+)
+WNDPROC = ctypes.CFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+
+
+class MONITORINFO(ctypes.Structure):
+    """显示器信息结构"""
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("rcMonitor", wintypes.RECT),
+        ("rcWork", wintypes.RECT),
+        ("dwFlags", wintypes.DWORD)
+    ]
+
+
+class WNDCLASSW(ctypes.Structure):
+    """窗口类结构"""
+    _fields_ = [
+        ("style", wintypes.UINT),
+        ("lpfnWndProc", WNDPROC),
+        ("cbClsExtra", ctypes.c_int),
+        ("cbWndExtra", ctypes.c_int),
+        ("hInstance", wintypes.HINSTANCE),
+        ("hIcon", wintypes.HICON),
+        ("hCursor", wintypes.HANDLE),
+        ("hbrBackground", wintypes.HBRUSH),
+        ("lpszMenuName", wintypes.LPCWSTR),
+        ("lpszClassName", wintypes.LPCWSTR)
+    ]
+
+
+@dataclass(frozen=True)
+class MonitorInfo:
+    """单个显示器"""
+    left: int
+    top: int
+    right: int
+    bottom: int
+    dpi: int = 96
+    primary: bool = False
+    
+    @property
+    def width(self) -> int:
+        return self.right - self.left
+    
+    @property
+    def height(self) -> int:
+        return self.bottom - self.top
+    
+    @property
+    def center(self) -> Tuple[int, int]:
+        return (self.left + self.right) // 2, (self.top + self.bottom) // 2
+    
+    @property
+    def geometry(self) -> str:
+        """Tk geometry 字符串"""
+        return f"{self.width}x{self.height}{self.left:+d}{self.top:+d}"
+
+
+@dataclass(frozen=True)
+class DisplayTopology:
+    """显示器拓扑快照"""
+    monitors: Tuple[MonitorInfo, ...]
+    virtual: MonitorInfo
+    
+    # 显示器覆盖面积低于虚拟屏幕的该比例时，逐屏遮挡比一个大透明窗口更省
+    PER_MONITOR_COVERAGE = 0.75
+    
+    @property
+    def primary(self) -> MonitorInfo:
+        """主显示器"""
+        for monitor in self.monitors:
+            if monitor.primary:
+                return monitor
+        return self.monitors[0] if self.monitors else self.virtual
+    
+    @property
+    def coverage(self) -> float:
+        """显示器面积之和占虚拟屏幕面积的比例"""
+        virtual_area = self.virtual.width * self.virtual.height
+        if virtual_area <= 0:
+            return 1.0
+        return sum(m.width * m.height for m in self.monitors) / virtual_area
+    
+    def blocker_rects(self) -> List[MonitorInfo]:
+        """
+        遮挡窗口布局
+        
+        多显示器且虚拟屏幕中空白区域较多（错位/不同分辨率）时每屏一个窗口，
+        否则用一个覆盖虚拟屏幕的窗口
+        """
+        if len(self.monitors) > 1 and self.coverage < self.PER_MONITOR_COVERAGE:
+            return list(self.monitors)
+        return [self.virtual]
+
+
+class TopologyProvider(ABC):
+    """显示器拓扑数据源，测试时可替换为假实现"""
+    
+    @abstractmethod
+    def query(self) -> DisplayTopology:
+        """查询当前显示器拓扑"""
+
+
+class Win32TopologyProvider(TopologyProvider):
+    """通过 EnumDisplayMonitors 查询显示器拓扑"""
+    
+    def __init__(self):
+        self.user32 = ctypes.windll.user32
+        try:
+            self.shcore = ctypes.windll.shcore
+        except Exception:
+            self.shcore = None  # Windows 8.1 以下无按显示器 DPI
+    
+    def query(self) -> DisplayTopology:
+        monitors = []
+        
+        def enum_callback(hmonitor, hdc, lprect, lparam):
+            hmonitor = wintypes.HMONITOR(hmonitor)
+            info = MONITORINFO()
+            info.cbSize = ctypes.sizeof(MONITORINFO)
+            if self.user32.GetMonitorInfoW(hmonitor, ctypes.byref(info)):
+                rc = info.rcMonitor
+                monitors.append(MonitorInfo(
+                    rc.left, rc.top, rc.right, rc.bottom,
+                    dpi=self._get_dpi(hmonitor),
+                    primary=bool(info.dwFlags & MONITORINFOF_PRIMARY)
+                ))
+            return 1
+        
+        self.user32.EnumDisplayMonitors(None, None, MONITORENUMPROC(enum_callback), 0)
+        
+        vx = self.user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
+        vy = self.user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
+        vw = self.user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
+        vh = self.user32.GetSystemMetrics(SM_CYVIRTUALSCREEN)
+        
+        return DisplayTopology(tuple(monitors), MonitorInfo(vx, vy, vx + vw, vy + vh))
+    
+    def _get_dpi(self, hmonitor) -> int:
+        """获取显示器有效 DPI"""
+        if self.shcore is None:
+            return 96
+        dpi_x = wintypes.UINT()
+        dpi_y = wintypes.UINT()
+        try:
+            if self.shcore.GetDpiForMonitor(hmonitor, MDT_EFFECTIVE_DPI, ctypes.byref(dpi_x), ctypes.byref(dpi_y)) == 0:
+                return dpi_x.value
+        except Exception:
+            pass
+        return 96
+
+
+class DisplayTopologyCache:
+    """显示器拓扑缓存"""
+    
+    def __init__(self, provider: TopologyProvider = None):
+        self._provider = provider
+        self._topology: DisplayTopology = None
+        self._lock = threading.Lock()
+        self.version = 0
+        self.queries = 0
+    
+    @property
+    def provider(self) -> TopologyProvider:
+        if self._provider is None:
+            self._provider = Win32TopologyProvider()
+        return self._provider
+    
+    def get(self) -> DisplayTopology:
+        """获取拓扑（命中缓存时无系统调用）"""
+        topology = self._topology
+        if topology is not None:
+            return topology
+        
+        with self._lock:
+            if self._topology is None:
+                self._topology = self.provider.query()
+                self.queries += 1
+                logger.debug(f"显示器拓扑已刷新: {len(self._topology.monitors)} 个显示器")
+            return self._topology
+    
+    def invalidate(self):
+        """显示配置变化时调用"""
+        with self._lock:
+            self._topology = None
+            self.version += 1
+
+
+class DisplayChangeListener:
+    """
+    显示配置变化监听器
+    
+    在独立线程中创建一个隐藏的顶层窗口接收 WM_DISPLAYCHANGE 等广播，
+    该窗口只处理自身消息，不影响 Tk 的消息处理
+    """
+    
+    CLASS_NAME = "OfficeGuardDisplayListener"
+    
+    def __init__(self, on_change: Callable[[], None]):
+        """
+        :param on_change: 显示配置变化回调（在监听线程中调用）
+        """
+        self._on_change = on_change
+        self._thread: threading.Thread = None
+        self._thread_id = 0
+        self._wndproc_ref = None
+    
+    def start(self):
+        """启动监听"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """停止监听"""
+        if self._thread_id:
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+    
+    def handle_message(self, msg: int, wparam: int) -> bool:
+        """
+        处理监听窗口收到的消息
+        
+        :return: 是否为显示配置变化（已调用回调）
+        """
+        if msg in (WM_DISPLAYCHANGE, WM_DPICHANGED) or (
+            msg == WM_SETTINGCHANGE and wparam == SPI_SETWORKAREA
+        ):
+            try:
+                self._on_change()
+            except Exception as e:
+                logger.error(f"显示变化回调异常: {e}")
+            return True
+        return False
+    
+    def _run(self):
+        """监听线程：隐藏窗口 + 消息循环"""
+        # 使用独立的 DLL 实例设置函数原型，避免影响全局 windll.user32
+        user32 = ctypes.WinDLL('user32')
+        kernel32 = ctypes.WinDLL('kernel32')
+        user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        user32.DefWindowProcW.restype = LRESULT
+        user32.CreateWindowExW.argtypes = [
+            wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+            wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID
+        ]
+        user32.CreateWindowExW.restype = wintypes.HWND
+        user32.DestroyWindow.argtypes = [wintypes.HWND]
+        kernel32.GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+        
+        def wndproc(hwnd, msg, wparam, lparam):
+            self.handle_message(msg, wparam)
+            return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+        
+        try:
+            self._thread_id = kernel32.GetCurrentThreadId()
+            self._wndproc_ref = WNDPROC(wndproc)
+            hinstance = kernel32.GetModuleHandleW(None)
+            
+            wc = WNDCLASSW()
+            wc.lpfnWndProc = self._wndproc_ref
+            wc.hInstance = hinstance
+            wc.lpszClassName = self.CLASS_NAME
+            user32.RegisterClassW(ctypes.byref(wc))
+            
+            hwnd = user32.CreateWindowExW(
+                0, self.CLASS_NAME, self.CLASS_NAME, 0,
+                0, 0, 0, 0, None, None, hinstance, None
+            )
+            if not hwnd:
+                logger.error("显示变化监听窗口创建失败")
+                return
+            
+            logger.info("显示变化监听已启动")
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+            
+            user32.DestroyWindow(hwnd)
+        except Exception as e:
+            logger.error(f"显示变化监听异常: {e}")
+        finally:
+            self._thread_id = 0
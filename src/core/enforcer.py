@@ -0,0 +1,174 @@
+"""
+锁定强制模块
+锁定期间保持遮挡窗口焦点与鼠标困禁：优先响应焦点丢失/显示变化通知，
+轮询仅作兜底，且在状态稳定时逐步退避
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Hashable
+from . import metrics
+from ..utils.logger import get_logger
+
+logger = get_logger('enforcer')
+
+
+class EnforcementBackend(ABC):
+    """
+    强制执行的平台接口
+    
+    由 UI 层实现（Tk + Win32），测试时可替换为假实现以统计唤醒与系统调用次数
+    """
+    
+    @abstractmethod
+    def has_focus(self) -> bool:
+        """遮挡窗口是否持有焦点"""
+    
+    @abstractmethod
+    def restore_focus(self):
+        """把焦点抢回遮挡窗口"""
+    
+    @abstractmethod
+    def is_trapped(self) -> bool:
+        """鼠标是否仍被困禁在预期区域"""
+    
+    @abstractmethod
+    def trap(self):
+        """重新困禁鼠标"""
+    
+    @abstractmethod
+    def display_signature(self) -> Hashable:
+        """当前显示配置的签名，变化即表示显示器布局改变"""
+
+
+class LockEnforcer:
+    """锁定强制引擎"""
+    
+    def __init__(
+        self,
+        backend: EnforcementBackend,
+        schedule: Callable[[int, Callable], object],
+        cancel: Callable[[object], None],
+        min_interval: int = 200,
+        max_interval: int = 3000
+    ):
+        """
+        :param backend: 平台接口
+        :param schedule: 延迟调度函数 (ms, func) -> id，如 root.after
+        :param cancel: 取消调度函数，如 root.after_cancel
+        :param min_interval: 兜底轮询最短间隔（毫秒）
+        :param max_interval: 兜底轮询最长间隔（毫秒）
+        """
+        self.backend = backend
+        self._schedule = schedule
+        self._cancel = cancel
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        
+        self.running = False
+        self.interval = min_interval
+        self._after_id = None
+        self._display_sig = None
+        
+        # 统计
+        self.wakeups = 0
+        self.focus_restores = 0
+        self.retraps = 0
+        self.display_changes = 0
+        
+        metrics.counter("enforcer_wakeups_total", "锁定强制轮询唤醒次数", func=lambda: self.wakeups)
+        metrics.counter("enforcer_focus_restores_total", "遮挡窗口焦点恢复次数", func=lambda: self.focus_restores)
+        metrics.counter("enforcer_retraps_total", "鼠标重新困禁次数", func=lambda: self.retraps)
+    
+    def start(self):
+        """开始强制执行"""
+        if self.running:
+            return
+        
+        self.running = True
+        self._display_sig = self.backend.display_signature()
+        self.backend.restore_focus()
+        self.backend.trap()
+        self._reschedule(changed=True)
+    
+    def stop(self):
+        """停止强制执行"""
+        self.running = False
+        if self._after_id is not None:
+            try:
+                self._cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+    
+    def notify_focus_lost(self):
+        """焦点丢失通知（如遮挡窗口 <FocusOut>）"""
+        if not self.running:
+            return
+        
+        self.focus_restores += 1
+        self.backend.restore_focus()
+        self._reschedule(changed=True)
+    
+    def notify_display_change(self):
+        """显示配置变化通知"""
+        if not self.running:
+            return
+        
+        self.display_changes += 1
+        self._display_sig = self.backend.display_signature()
+        logger.info("显示配置已变化，重新困禁鼠标")
+        self.retraps += 1
+        self.backend.trap()
+        self._reschedule(changed=True)
+    
+    def _poll(self):
+        """兜底轮询：仅在状态偏离时纠正，状态稳定则加倍间隔"""
+        self._after_id = None
+        if not self.running:
+            return
+        
+        self.wakeups += 1
+        changed = False
+        
+        sig = self.backend.display_signature()
+        if sig != self._display_sig:
+            self._display_sig = sig
+            self.display_changes += 1
+            logger.info("显示配置已变化，重新困禁鼠标")
+            changed = True
+        
+        if not self.backend.has_focus():
+            self.focus_restores += 1
+            self.backend.restore_focus()
+            changed = True
+        
+        if changed or not self.backend.is_trapped():
+            self.retraps += 1
+            self.backend.trap()
+            changed = True
+        
+        self._reschedule(changed)
+    
+    def _reschedule(self, changed: bool):
+        """按退避策略安排下一次轮询"""
+        if not self.running:
+            return
+        
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * 2, self.max_interval)
+        
+        if self._after_id is not None:
+            self._cancel(self._after_id)
+        self._after_id = self._schedule(self.interval, self._poll)
+    
+    def metrics(self) -> Dict[str, int]:
+        """获取统计指标"""
+        return {
+            "enforcer_wakeups": self.wakeups,
+            "enforcer_focus_restores": self.focus_restores,
+            "enforcer_retraps": self.retraps,
+            "enforcer_display_changes": self.display_changes,
+            "enforcer_interval_ms": self.interval,
+        }
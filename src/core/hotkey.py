@@ -3,11 +3,18 @@
 使用 pynput 实现全局快捷键监听
 """
 
+import time
 from typing import Callable, Set
 from pynput import keyboard
-from ..utils.logger import get_logger
+from . import metrics
+from ..utils.logger import get_logger, get_hot_logger
 
 logger = get_logger('hotkey')
+# 按键回调运行在 pynput 的钩子线程中
+hot_logger = get_hot_logger('hotkey')
+
+_triggers = metrics.counter("hotkey_triggers_total", "快捷键触发次数")
+_press_latency = metrics.histogram("hotkey_callback_seconds", "快捷键按键回调耗时（不含触发后的锁定操作）")
 
 
 class HotkeyManager:
@@ -72,10 +79,17 @@ class HotkeyManager:
             self.stop()
             self.current_keys.clear()
             
+            clock = time.perf_counter
+            observe = _press_latency.observe
+            
             def on_press(key):
+                start = clock()
                 self.current_keys.add(key)
-                if self._check_hotkey():
-                    logger.info(f"快捷键 {self.get_display()} 被触发")
+                triggered = self._check_hotkey()
+                observe(clock() - start)
+                if triggered:
+                    _triggers.inc()
+                    hot_logger.info(f"快捷键 {self.get_display()} 被触发")
                     if self._on_trigger:
                         self._on_trigger()
             
@@ -88,7 +102,6 @@ class HotkeyManager:
             )
             self.listener.start()
             
-            import time
             time.sleep(0.1)
             
             if self.listener.is_alive():
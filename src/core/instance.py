@@ -0,0 +1,111 @@
+"""
+单实例模块
+保证每个用户只运行一个实例；后启动的实例把参数转发给已运行的实例后退出
+"""
+
+import ctypes
+import getpass
+import os
+import sys
+import tempfile
+import time
+from typing import List
+from .ipc_client import send_command
+
+# Windows API 常量
+ERROR_ALREADY_EXISTS = 183
+
+
+class InstanceLock:
+    """
+    单实例锁
+    
+    Windows 使用命名互斥体，其他平台使用文件锁（便于在 Linux 上测试）；
+    进程退出时由系统自动释放
+    """
+    
+    def __init__(self, name: str = None):
+        """
+        :param name: 锁名称，默认按用户区分
+        """
+        self.name = name or f"OfficeGuard-{getpass.getuser()}"
+        self._handle = None
+        self._fd = None
+    
+    def acquire(self) -> bool:
+        """
+        尝试获取锁（不阻塞）
+        
+        :return: 是否成功，False 表示已有实例在运行
+        """
+        if self.acquired:
+            return True
+        if sys.platform == "win32":
+            return self._acquire_mutex()
+        return self._acquire_file()
+    
+    @property
+    def acquired(self) -> bool:
+        return self._handle is not None or self._fd is not None
+    
+    def release(self):
+        """释放锁"""
+        if self._handle is not None:
+            ctypes.windll.kernel32.CloseHandle(self._handle)
+            self._handle = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+    
+    def _acquire_mutex(self) -> bool:
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.CreateMutexW.restype = ctypes.c_void_p
+        handle = kernel32.CreateMutexW(None, False, f"Local\\{self.name}")
+        if not handle:
+            return False
+        if ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+            kernel32.CloseHandle(ctypes.c_void_p(handle))
+            return False
+        self._handle = ctypes.c_void_p(handle)
+        return True
+    
+    def _acquire_file(self) -> bool:
+        import fcntl
+        
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+        path = os.path.join(runtime_dir, f"{self.name.lower()}.lock")
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+
+def forward_to_running(argv: List[str], address: str = None, timeout: float = 2.0) -> bool:
+    """
+    把启动参数转发给已运行的实例
+    
+    已运行的实例可能刚获得锁、控制接口尚未就绪，因此在 timeout 内重试连接
+    
+    :param argv: 启动参数（不含程序名）
+    :param address: 控制接口地址
+    :param timeout: 最长等待时间（秒）
+    :return: 是否转发成功
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    while True:
+        try:
+            response = send_command("forward", address=address, timeout=timeout, argv=list(argv))
+            return bool(response.get("ok"))
+        except (OSError, ValueError):
+            if time.monotonic() + delay > deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
@@ -0,0 +1,298 @@
+"""
+本地控制接口模块
+通过命名管道（Windows）或 Unix 域套接字（Linux，用于测试）接收控制命令
+
+协议：每行一个 JSON 请求，如 {"cmd": "start_timer", "action": "sleep", "minutes": 30}，
+服务端返回一行 JSON 响应 {"ok": true, "data": ...} 或 {"ok": false, "error": "..."}；
+{"cmd": "metrics"} 的 data 为 Prometheus 文本格式的指标快照
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import math
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from . import metrics
+from .ipc_client import MAX_REQUEST_SIZE, default_address
+from ..utils.logger import get_logger
+
+logger = get_logger('ipc')
+
+# 连接空闲超时（秒）
+IDLE_TIMEOUT = 10.0
+
+
+def call_via(post: Callable[[Callable[[], None]], Any], func: Callable, *args, timeout: float = 5.0) -> Any:
+    """
+    把调用投递到状态所在线程并等待结果（在工作线程中调用）
+    
+    :param post: 投递函数，如 lambda f: root.after(0, f) 或 loop.call_soon_threadsafe
+    :param func: 要执行的函数
+    :param timeout: 等待超时（秒）
+    """
+    future = concurrent.futures.Future()
+    
+    def run():
+        try:
+            future.set_result(func(*args))
+        except Exception as e:
+            future.set_exception(e)
+    
+    post(run)
+    return future.result(timeout=timeout)
+
+
+def parse_timer_request(params: dict) -> Tuple[str, float, Optional[int]]:
+    """
+    校验 start_timer 请求参数
+    
+    :return: (动作, 分钟数, 缓冲期秒数或 None)
+    :raises ValueError: 动作未知，或分钟数/缓冲期不是有限的正数
+    """
+    action = params.get("action", "sleep")
+    if action not in ("shutdown", "sleep"):
+        raise ValueError(f"未知动作: {action}")
+    
+    try:
+        minutes = float(params["minutes"])
+    except (KeyError, TypeError):
+        raise ValueError("缺少分钟数") from None
+    if not math.isfinite(minutes) or minutes <= 0:
+        raise ValueError(f"无效的分钟数: {params['minutes']}")
+    
+    grace = params.get("grace")
+    if grace is not None:
+        grace = float(grace)
+        if not math.isfinite(grace) or grace < 0:
+            raise ValueError(f"无效的缓冲期: {params['grace']}")
+        grace = int(grace)
+    return action, minutes, grace
+
+
+class StatusCache:
+    """
+    状态快照
+    
+    由持有状态的线程在状态变化时整体替换，IPC 线程无锁读取，不触碰 Tk
+    """
+    
+    def __init__(self, **fields):
+        self._snapshot: Dict[str, Any] = dict(fields)
+    
+    def update(self, **fields):
+        """更新部分字段（复制后整体替换）"""
+        snapshot = dict(self._snapshot)
+        snapshot.update(fields)
+        self._snapshot = snapshot
+    
+    def get(self) -> Dict[str, Any]:
+        """读取快照，倒计时剩余时间按截止时间实时计算"""
+        snapshot = dict(self._snapshot)
+        deadline = snapshot.pop("timer_deadline", 0.0)
+        if snapshot.get("timer_running") and not snapshot.get("in_grace_period"):
+            snapshot["remaining_seconds"] = max(0, int(deadline - time.time()))
+        else:
+            snapshot["remaining_seconds"] = 0
+        return snapshot
+
+
+class ControlServer:
+    """
+    控制服务端
+    
+    在独立线程的 asyncio 事件循环中接受连接；status 直接读取快照，
+    其余命令交给有界线程池执行，由命令自行切换到状态所在线程
+    """
+    
+    def __init__(
+        self,
+        commands: Dict[str, Callable[[dict], Any]],
+        status: Optional[Callable[[], dict]],
+        address: str = None,
+        max_workers: int = 2,
+        max_clients: int = 8
+    ):
+        """
+        :param commands: 命令名 -> 处理函数(请求参数)，返回值作为响应 data
+        :param status: 状态快照读取函数；为 None 时不提供 status 与 metrics，只接受 commands 中的命令
+        :param address: 管道名或套接字路径，默认 default_address()
+        :param max_workers: 命令执行线程数
+        :param max_clients: 最大同时连接数，超出时直接拒绝
+        """
+        self.commands = commands
+        self.status = status
+        self.address = address or default_address()
+        self.max_workers = max_workers
+        self.max_clients = max_clients
+        
+        self._loop: asyncio.AbstractEventLoop = None
+        self._thread: threading.Thread = None
+        self._executor: concurrent.futures.ThreadPoolExecutor = None
+        self._servers = []
+        self._clients = 0
+        
+        # 统计
+        self.requests = 0
+        self.rejected = 0
+        self.errors = 0
+        
+        metrics.counter("ipc_requests_total", "控制接口请求数", func=lambda: self.requests)
+        metrics.counter("ipc_rejected_total", "因连接数超限被拒绝的连接数", func=lambda: self.rejected)
+        metrics.counter("ipc_errors_total", "控制接口错误数", func=lambda: self.errors)
+    
+    def start(self):
+        """启动服务"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ipc"
+        )
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), daemon=True)
+        self._thread.start()
+        ready.wait(2.0)
+    
+    def stop(self):
+        """停止服务"""
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(loop.stop)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def _run(self, ready: threading.Event):
+        """服务线程"""
+        if sys.platform == "win32":
+            self._loop = asyncio.ProactorEventLoop()
+        else:
+            self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        
+        try:
+            self._loop.run_until_complete(self._listen())
+            logger.info(f"控制接口已启动: {self.address}")
+        except Exception as e:
+            logger.error(f"控制接口启动失败: {e}")
+            ready.set()
+            self._loop.close()
+            self._loop = None
+            return
+        
+        ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            for server in self._servers:
+                server.close()
+            self._servers = []
+            
+            # 取消仍在等待的连接
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            if sys.platform != "win32":
+                self._remove_socket_file()
+            self._loop.close()
+            self._loop = None
+            logger.info("控制接口已停止")
+    
+    async def _listen(self):
+        """开始监听"""
+        if sys.platform == "win32":
+            def factory():
+                reader = asyncio.StreamReader(limit=MAX_REQUEST_SIZE)
+                return asyncio.StreamReaderProtocol(reader, self._handle_client)
+            
+            self._servers = await self._loop.start_serving_pipe(factory, self.address)
+        else:
+            self._remove_socket_file()
+            # 绑定时即为 0600：在 /tmp 下也不会有其他用户可连接的窗口期
+            old_umask = os.umask(0o177)
+            try:
+                server = await asyncio.start_unix_server(
+                    self._handle_client, self.address, limit=MAX_REQUEST_SIZE
+                )
+            finally:
+                os.umask(old_umask)
+            self._servers = [server]
+    
+    def _remove_socket_file(self):
+        try:
+            os.unlink(self.address)
+        except OSError:
+            pass
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """处理一个连接（可连续发送多条请求）"""
+        if self._clients >= self.max_clients:
+            self.rejected += 1
+            writer.write(self._encode({"ok": False, "error": "busy"}))
+            await self._close(writer)
+            return
+        
+        self._clients += 1
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+                except (asyncio.TimeoutError, ValueError):
+                    break  # 空闲超时或请求过长
+                if not line:
+                    break
+                
+                response = await self._dispatch(line)
+                writer.write(self._encode(response))
+                await writer.drain()
+        except (ConnectionError, OSError, asyncio.CancelledError):
+            pass  # 客户端断开或服务停止
+        finally:
+            self._clients -= 1
+            await self._close(writer)
+    
+    async def _dispatch(self, line: bytes) -> dict:
+        """解析并执行一条请求"""
+        self.requests += 1
+        try:
+            request = json.loads(line)
+            cmd = request.pop("cmd")
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self.errors += 1
+            return {"ok": False, "error": "bad request"}
+        
+        if self.status is not None:
+            if cmd == "status":
+                return {"ok": True, "data": self.status()}
+            if cmd == "metrics":
+                return {"ok": True, "data": metrics.render_metrics()}
+        
+        handler = self.commands.get(cmd)
+        if handler is None:
+            self.errors += 1
+            return {"ok": False, "error": f"unknown command: {cmd}"}
+        
+        try:
+            data = await self._loop.run_in_executor(self._executor, handler, request)
+            return {"ok": True, "data": data}
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"控制命令 {cmd} 执行失败: {e}")
+            return {"ok": False, "error": str(e) or type(e).__name__}
+    
+    @staticmethod
+    def _encode(response: dict) -> bytes:
+        return json.dumps(response, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+    
+    @staticmethod
+    async def _close(writer: asyncio.StreamWriter):
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except Exception:
+            pass
@@ -0,0 +1,91 @@
+"""
+本地控制接口客户端
+同步实现且不依赖 asyncio，命令行与单实例转发路径只导入本模块
+"""
+
+import getpass
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+from typing import Callable
+
+# 单个请求/响应的最大长度
+MAX_REQUEST_SIZE = 64 * 1024
+
+
+def default_address() -> str:
+    """默认控制地址（按用户区分）"""
+    user = getpass.getuser()
+    if sys.platform == "win32":
+        return rf"\\.\pipe\OfficeGuard-{user}"
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"officeguard-{user}.sock")
+
+
+def send_command(cmd: str, address: str = None, timeout: float = 5.0, **params) -> dict:
+    """
+    向正在运行的实例发送一条命令（同步客户端）
+    
+    :param cmd: 命令名
+    :param address: 管道名或套接字路径，默认 default_address()
+    :param timeout: 超时（秒）
+    :return: 响应字典 {"ok": ..., "data"/"error": ...}
+    :raises OSError: 无法连接（实例未运行）
+    """
+    address = address or default_address()
+    payload = json.dumps(dict(params, cmd=cmd), separators=(",", ":")).encode("utf-8") + b"\n"
+    
+    if sys.platform == "win32":
+        line = _pipe_exchange(address, payload, timeout)
+    else:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(address)
+            sock.sendall(payload)
+            line = _read_line(lambda n: sock.recv(n))
+    
+    return json.loads(line)
+
+
+def _pipe_exchange(address: str, payload: bytes, timeout: float) -> bytes:
+    """
+    通过命名管道收发一条请求
+    
+    管道文件的阻塞读写没有超时，在守护线程中收发，超时后放弃等待（线程随进程退出）
+    
+    :raises TimeoutError: 超时未收到响应
+    """
+    result = {}
+    
+    def exchange():
+        try:
+            with open(address, "r+b", buffering=0) as pipe:
+                pipe.write(payload)
+                result["line"] = _read_line(pipe.read)
+        except OSError as e:
+            result["error"] = e
+    
+    thread = threading.Thread(target=exchange, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"控制接口 {timeout} 秒内未响应")
+    if "error" in result:
+        raise result["error"]
+    return result["line"]
+
+
+def _read_line(read: Callable[[int], bytes]) -> bytes:
+    """读取一行响应"""
+    buffer = b""
+    while not buffer.endswith(b"\n"):
+        chunk = read(4096)
+        if not chunk:
+            break
+        buffer += chunk
+        if len(buffer) > MAX_REQUEST_SIZE:
+            raise OSError("响应过长")
+    return buffer
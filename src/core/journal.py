@@ -0,0 +1,390 @@
+"""
+事件日志模块
+以定长二进制记录追加保存锁定、解锁、睡眠、关机等运行事件，按天建立索引，
+查询时内存映射读取，可按保留天数压缩
+"""
+
+import io
+import mmap
+import os
+import struct
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+from ..utils.paths import get_journal_dir
+from ..utils.logger import get_logger
+
+logger = get_logger('journal')
+
+# 记录格式：时间戳 float64 | 事件类型 uint16 | 保留 uint16 | 附加值 int32，共 16 字节
+RECORD = struct.Struct("<dHHi")
+# 索引格式：日期序号 int32 | 当天第一条记录的序号 uint32，共 8 字节
+INDEX_ENTRY = struct.Struct("<iI")
+
+EVENTS_FILE = "events.bin"
+INDEX_FILE = "events.idx"
+
+# 压缩时替换文件失败（如其他进程正映射着数据文件）后，至少间隔多久再重试（秒）
+COMPACT_RETRY_INTERVAL = 600
+
+
+class EventType:
+    """事件类型"""
+    APP_START = 1
+    APP_EXIT = 2
+    LOCK = 3
+    UNLOCK = 4
+    TIMER_START = 5      # 附加值：倒计时秒数
+    TIMER_CANCEL = 6
+    SLEEP = 7
+    SHUTDOWN = 8
+    
+    NAMES = {
+        APP_START: "启动",
+        APP_EXIT: "退出",
+        LOCK: "锁定",
+        UNLOCK: "解锁",
+        TIMER_START: "定时开始",
+        TIMER_CANCEL: "定时取消",
+        SLEEP: "睡眠",
+        SHUTDOWN: "关机",
+    }
+    
+    # 命令行使用的名称
+    KEYS = {
+        "start": APP_START,
+        "exit": APP_EXIT,
+        "lock": LOCK,
+        "unlock": UNLOCK,
+        "timer": TIMER_START,
+        "cancel": TIMER_CANCEL,
+        "sleep": SLEEP,
+        "shutdown": SHUTDOWN,
+    }
+
+
+@dataclass(frozen=True)
+class JournalEvent:
+    """一条事件记录"""
+    timestamp: float
+    type: int
+    value: int = 0
+    
+    @property
+    def name(self) -> str:
+        return EventType.NAMES.get(self.type, str(self.type))
+    
+    @property
+    def datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp)
+
+
+def _day_of(timestamp: float) -> int:
+    """时间戳所在的本地日期序号"""
+    return date.fromtimestamp(timestamp).toordinal()
+
+
+class EventJournal:
+    """
+    事件日志
+    
+    events.bin 只追加定长记录；events.idx 为按天的稀疏索引，
+    每天只在第一条记录写入时追加一项，查询时二分定位起始记录。
+    只读打开（如命令行查询历史）时不修改任何文件：忽略末尾的半条记录，索引不一致时只在内存中重建
+    """
+    
+    def __init__(self, directory: Path = None, read_only: bool = False):
+        """
+        :param directory: 日志目录，默认为用户数据目录下的 journal
+        :param read_only: 只读打开，append/compact 抛出 io.UnsupportedOperation
+        """
+        self.directory = Path(directory) if directory else get_journal_dir()
+        self.read_only = read_only
+        if not read_only:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.events_path = self.directory / EVENTS_FILE
+        self.index_path = self.directory / INDEX_FILE
+        
+        self._lock = threading.Lock()
+        self._days: List[int] = []
+        self._starts: List[int] = []
+        self._count = 0
+        # 替换失败待重试的压缩参数 (retain_days, drop_types) 与最早重试时间
+        self._pending_compact = None
+        self._retry_at = 0.0
+        self._open()
+    
+    # ==================== 写入 ====================
+    
+    def _open(self):
+        """加载索引；截掉异常退出时残留的半条记录，索引不一致时重建（只读时都只在内存中处理）"""
+        size = self.events_path.stat().st_size if self.events_path.exists() else 0
+        if size % RECORD.size:
+            size -= size % RECORD.size
+            if not self.read_only:
+                with open(self.events_path, "r+b") as f:
+                    f.truncate(size)
+                logger.warning("事件日志末尾存在不完整记录，已截断")
+        self._count = size // RECORD.size
+        
+        self._days, self._starts = [], []
+        if self.index_path.exists():
+            data = self.index_path.read_bytes()
+            data = data[:len(data) - len(data) % INDEX_ENTRY.size]
+            for day, start in INDEX_ENTRY.iter_unpack(data):
+                self._days.append(day)
+                self._starts.append(start)
+        
+        stale = self._starts[-1] >= max(self._count, 1) if self._starts else self._count > 0
+        if not stale and self._count:
+            # 写完数据、写索引前退出时，最后一天缺少索引项
+            stale = _day_of(self._read_timestamp(self._count - 1)) > self._days[-1]
+        if stale:
+            if not self.read_only:
+                logger.warning("事件日志索引与数据不一致，正在重建")
+            self._rebuild_index()
+    
+    def _rebuild_index(self):
+        """根据数据文件重建索引（只读时不写入索引文件）"""
+        days, starts = [], []
+        with self._map() as view:
+            if view is not None:
+                for i, (timestamp, _, _, _) in enumerate(RECORD.iter_unpack(view)):
+                    day = _day_of(timestamp)
+                    if not days or day > days[-1]:
+                        days.append(day)
+                        starts.append(i)
+        self._days, self._starts = days, starts
+        if not self.read_only:
+            self._write_index(self.index_path, days, starts)
+    
+    def _read_timestamp(self, i: int) -> float:
+        """第 i 条记录的时间戳"""
+        with open(self.events_path, "rb") as f:
+            f.seek(i * RECORD.size)
+            return RECORD.unpack(f.read(RECORD.size))[0]
+    
+    @staticmethod
+    def _write_index(path: Path, days: List[int], starts: List[int]):
+        with open(path, "wb") as f:
+            f.write(b"".join(INDEX_ENTRY.pack(d, s) for d, s in zip(days, starts)))
+    
+    def append(self, event_type: int, value: int = 0, timestamp: float = None):
+        """
+        追加一条事件
+        
+        :param event_type: EventType 中的类型
+        :param value: 附加值
+        :param timestamp: 时间戳，默认当前时间
+        """
+        self._check_writable()
+        timestamp = time.time() if timestamp is None else timestamp
+        record = RECORD.pack(timestamp, event_type, 0, int(value))
+        day = _day_of(timestamp)
+        
+        try:
+            with self._lock:
+                with open(self.events_path, "ab") as f:
+                    f.write(record)
+                
+                # 时钟回拨时不新增索引项，记录仍归入最近一天
+                if not self._days or day > self._days[-1]:
+                    with open(self.index_path, "ab") as f:
+                        f.write(INDEX_ENTRY.pack(day, self._count))
+                    self._days.append(day)
+                    self._starts.append(self._count)
+                self._count += 1
+        except OSError as e:
+            logger.error(f"事件日志写入失败: {e}")
+        
+        if self._pending_compact is not None and time.monotonic() >= self._retry_at:
+            self.compact(*self._pending_compact)
+    
+    def _check_writable(self):
+        if self.read_only:
+            raise io.UnsupportedOperation("事件日志以只读方式打开")
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    # ==================== 查询 ====================
+    
+    def _map(self):
+        """只读映射数据文件（文件为空时返回 None）"""
+        return _Mapping(self.events_path, self._count * RECORD.size)
+    
+    def query(
+        self,
+        start: float = None,
+        end: float = None,
+        types: Iterable[int] = None,
+        limit: int = None
+    ) -> List[JournalEvent]:
+        """
+        查询事件
+        
+        :param start: 起始时间戳（含），默认不限
+        :param end: 结束时间戳（不含），默认不限
+        :param types: 只返回这些类型
+        :param limit: 最多返回的条数（取最新的）
+        """
+        with self._lock:
+            count = self._count
+            first = self._first_record(start) if start is not None else 0
+            last = self._first_record(end, after=True) if end is not None else count
+        
+        wanted = set(types) if types is not None else None
+        events = []
+        with _Mapping(self.events_path, count * RECORD.size) as view:
+            if view is None or first >= last:
+                return events
+            chunk = view[first * RECORD.size:last * RECORD.size]
+            try:
+                for timestamp, event_type, _, value in RECORD.iter_unpack(chunk):
+                    if start is not None and timestamp < start:
+                        continue
+                    if end is not None and timestamp >= end:
+                        continue
+                    if wanted is None or event_type in wanted:
+                        events.append(JournalEvent(timestamp, event_type, value))
+            finally:
+                chunk.release()
+        
+        if limit is not None:
+            events = events[-limit:]
+        return events
+    
+    def _first_record(self, timestamp: float, after: bool = False) -> int:
+        """
+        通过天索引定位记录范围边界
+        
+        :param after: True 时返回该天之后第一条记录的序号（用于结束边界）
+        """
+        day = _day_of(timestamp)
+        pos = bisect_left(self._days, day + 1 if after else day)
+        return self._starts[pos] if pos < len(self._starts) else self._count
+    
+    # ==================== 压缩 ====================
+    
+    def compact(self, retain_days: int = None, drop_types: Iterable[int] = None) -> int:
+        """
+        压缩日志：丢弃超出保留期或指定类型的记录，重写数据与索引
+        
+        :param retain_days: 保留最近多少天，None 表示不按时间丢弃
+        :param drop_types: 要丢弃的事件类型
+        :return: 丢弃的记录数（替换文件失败时为 0，之后的 append 会间隔重试）
+        """
+        self._check_writable()
+        cutoff_day = date.today().toordinal() - retain_days if retain_days is not None else None
+        dropped_types = set(drop_types or ())
+        
+        with self._lock:
+            self._pending_compact = None
+            count = self._count
+            first = 0
+            if cutoff_day is not None:
+                pos = bisect_left(self._days, cutoff_day)
+                first = self._starts[pos] if pos < len(self._starts) else count
+            
+            kept = []
+            with _Mapping(self.events_path, count * RECORD.size) as view:
+                if view is not None:
+                    chunk = view[first * RECORD.size:]
+                    try:
+                        kept = [r for r in RECORD.iter_unpack(chunk) if r[1] not in dropped_types]
+                    finally:
+                        chunk.release()
+            
+            removed = count - len(kept)
+            if removed == 0:
+                return 0
+            
+            days, starts = [], []
+            for i, record in enumerate(kept):
+                day = _day_of(record[0])
+                if not days or day > days[-1]:
+                    days.append(day)
+                    starts.append(i)
+            
+            tmp_events = self.events_path.with_suffix(".bin.tmp")
+            tmp_index = self.index_path.with_suffix(".idx.tmp")
+            try:
+                with open(tmp_events, "wb") as f:
+                    f.write(b"".join(RECORD.pack(*record) for record in kept))
+                self._write_index(tmp_index, days, starts)
+                # Windows 上其他进程（如命令行查询历史）映射着数据文件时替换会失败
+                os.replace(tmp_events, self.events_path)
+            except OSError as e:
+                _remove_quietly(tmp_events, tmp_index)
+                self._pending_compact = (retain_days, tuple(dropped_types))
+                self._retry_at = time.monotonic() + COMPACT_RETRY_INTERVAL
+                logger.warning(f"事件日志压缩失败，稍后重试: {e}")
+                return 0
+            
+            self._days, self._starts, self._count = days, starts, len(kept)
+            try:
+                os.replace(tmp_index, self.index_path)
+            except OSError as e:
+                # 数据已替换，旧索引不再对应，改为原地重写
+                logger.warning(f"事件日志索引替换失败，原地重写: {e}")
+                _remove_quietly(tmp_index)
+                try:
+                    self._write_index(self.index_path, days, starts)
+                except OSError as e:
+                    logger.error(f"事件日志索引重写失败: {e}")
+        
+        logger.info(f"事件日志已压缩，丢弃 {removed} 条记录")
+        return removed
+    
+    def apply_retention(self, retain_days: int) -> int:
+        """最早的记录超出保留期时才压缩（启动时调用，平时无开销）"""
+        if not self._days or retain_days <= 0:
+            return 0
+        if self._days[0] >= date.today().toordinal() - retain_days:
+            return 0
+        return self.compact(retain_days=retain_days)
+
+
+def _remove_quietly(*paths: Path):
+    """删除临时文件，失败时忽略"""
+    for path in paths:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+class _Mapping:
+    """数据文件的只读内存映射（上下文管理器，退出时立即解除映射，便于压缩时替换文件）"""
+    
+    def __init__(self, path: Path, length: int):
+        self.path = path
+        self.length = length
+        self._file = None
+        self._mmap = None
+        self._view: Optional[memoryview] = None
+    
+    def __enter__(self) -> Optional[memoryview]:
+        if self.length <= 0:
+            return None
+        try:
+            self._file = open(self.path, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), self.length, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self.__exit__()
+            return None
+        self._view = memoryview(self._mmap)
+        return self._view
+    
+    def __exit__(self, *exc):
+        if self._view is not None:
+            self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        if self._file is not None:
+            self._file.close()
+        self._view = self._mmap = self._file = None
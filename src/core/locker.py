@@ -4,17 +4,31 @@
 """
 
 import ctypes
+import logging
+import queue
+import threading
+import time
 from ctypes import wintypes
-from typing import Callable
+from typing import Callable, Dict
+from .display import DisplayTopology, DisplayTopologyCache
+from .verifier import UnlockVerifier, is_valid_code
+from .watchdog import HookWatchdog, LatencyRecorder
+from . import metrics
 from ..utils.logger import get_logger
 
 logger = get_logger('locker')
 
+_locks = metrics.counter("locks_total", "锁定次数")
+_unlocks = metrics.counter("unlocks_total", "解锁次数")
+_hook_latency = metrics.histogram("hook_callback_seconds", "键盘钩子回调耗时")
+
 # Windows API 常量
 WH_KEYBOARD_LL = 13
 WH_MOUSE_LL = 14
 WM_KEYDOWN = 0x0100
 WM_SYSKEYDOWN = 0x0104
+WM_QUIT = 0x0012
+WM_APP_REINSTALL = 0x8000 + 1  # WM_APP + 1，通知钩子线程重装钩子
 ES_CONTINUOUS = 0x80000000
 ES_SYSTEM_REQUIRED = 0x00000001
 ES_DISPLAY_REQUIRED = 0x00000002
@@ -22,6 +36,21 @@ ES_DISPLAY_REQUIRED = 0x00000002
 # 钩子回调类型
 HOOKPROC = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
 
+# 虚拟键码 -> 数字查找表（主键盘 0-9 / 小键盘 0-9），非数字键为 -1
+_VK_TO_DIGIT = tuple(
+    vk - 48 if 48 <= vk <= 57 else vk - 96 if 96 <= vk <= 105 else -1
+    for vk in range(256)
+)
+
+# 预绑定的 vkCode 读取器（KBDLLHOOKSTRUCT 首字段），避免 cast(...).contents 构造整个结构体
+_read_vk = wintypes.DWORD.from_address
+
+# 钩子线程投递给分发线程的事件类型
+_EVT_KEY = 0
+_EVT_LOG = 1
+_EVT_UNLOCKED = 2
+_EVT_STOP = 3
+
 
 class KBDLLHOOKSTRUCT(ctypes.Structure):
     """键盘钩子结构"""
@@ -44,78 +73,128 @@ class RECT(ctypes.Structure):
     ]
 
 
+class LASTINPUTINFO(ctypes.Structure):
+    """最后输入信息结构"""
+    _fields_ = [
+        ("cbSize", ctypes.c_uint),
+        ("dwTime", ctypes.c_uint)
+    ]
+
+
 class SystemLocker:
     """系统锁定器"""
     
-    def __init__(self):
+    def __init__(self, display: DisplayTopologyCache = None):
+        """
+        :param display: 显示器拓扑缓存，与遮挡窗口共用
+        """
         self.is_locked = False
-        self.unlock_code = ""
-        self.input_buffer = ""
+        self.display = display or DisplayTopologyCache()
+        self._verifier: UnlockVerifier = None
         
         # Windows API
         self.user32 = ctypes.windll.user32
         self.kernel32 = ctypes.windll.kernel32
         
-        # 钩子句柄
+        # 钩子句柄（由专用钩子线程安装，该线程负责消息循环）
         self.h_kb_hook = None
         self.h_ms_hook = None
         self.kb_proc_ref = None
         self.ms_proc_ref = None
+        self._hook_thread: threading.Thread = None
+        self._hook_thread_id = 0
+        self._hooks_ready = threading.Event()
+        
+        # 看门狗：回调耗时与心跳（钩子收到的事件数 vs 系统最后输入时间）
+        self.hook_events = 0
+        self._last_input = LASTINPUTINFO()
+        self._last_input.cbSize = ctypes.sizeof(LASTINPUTINFO)
+        self.latency = LatencyRecorder()
+        self.watchdog = HookWatchdog(
+            get_event_count=lambda: self.hook_events,
+            get_last_input_tick=self._get_last_input_tick,
+            reinstall=self.request_reinstall,
+            latency=self.latency
+        )
+        self._register_metrics()
+        
+        # 鼠标困禁区域（按拓扑快照缓存，显示配置变化后才重新计算）
+        self._trap_rect: RECT = None
+        self._trap_topology: DisplayTopology = None
+        self._trapped = False
+        self._clip_rect = RECT()
         
         # 回调
         self._on_unlock: Callable[[], None] = None
         self._on_key_input: Callable[[str], None] = None
+        
+        # 钩子线程只投递事件，日志与回调由分发线程执行
+        self._events: queue.SimpleQueue = queue.SimpleQueue()
+        self._post = self._events.put
+        self._dispatch_thread: threading.Thread = None
     
     def set_callbacks(self, on_unlock: Callable = None, on_key_input: Callable = None):
-        """设置回调函数"""
+        """
+        设置回调函数
+        
+        注意：回调在锁定器的分发线程中执行，涉及 UI 的操作需自行切回主线程
+        """
         self._on_unlock = on_unlock
         self._on_key_input = on_key_input
     
-    def lock(self, password: str) -> bool:
+    def lock(self, password: str = None, verifier: UnlockVerifier = None) -> bool:
         """
         锁定系统
         
-        :param password: 解锁密码
+        :param password: 解锁密码（明文，仅用于生成校验器）
+        :param verifier: 已有的解锁码校验器，优先于 password
         :return: 是否锁定成功
         """
         if self.is_locked:
             logger.warning("系统已处于锁定状态")
             return False
         
-        if not password.isdigit() or len(password) < 3:
-            logger.error("密码无效")
-            return False
+        if verifier is None:
+            if not is_valid_code(password):
+                logger.error("密码无效")
+                return False
+            verifier = UnlockVerifier.from_code(password)
         
-        self.unlock_code = password
-        self.input_buffer = ""
+        self._verifier = verifier
+        self._verifier.reset()
         self.is_locked = True
         
-        self._prevent_sleep(True)
-        self._install_hooks()
+        self._start_dispatcher()
+        self._start_hook_thread()
+        self.watchdog.start()
+        _locks.inc()
         
         logger.info("系统已锁定")
         return True
     
     def unlock(self) -> bool:
-        """解锁系统"""
+        """
+        解锁系统
+        
+        可能在钩子回调中被调用：这里只释放鼠标并通知钩子线程退出，
+        钩子卸载和恢复睡眠由钩子线程完成，日志和解锁回调交给分发线程
+        """
         if not self.is_locked:
             return False
         
         self.is_locked = False
+        self.watchdog.stop()
+        _unlocks.inc()
         
         # 释放鼠标
         self.user32.ClipCursor(None)
+        self._trapped = False
         
-        # 卸载钩子
-        self._uninstall_hooks()
-        
-        # 允许睡眠
-        self._prevent_sleep(False)
+        # 结束钩子线程（卸载钩子、允许睡眠）
+        self._stop_hook_thread()
         
-        if self._on_unlock:
-            self._on_unlock()
-        
-        logger.info("系统已解锁")
+        self._post((_EVT_UNLOCKED, None))
+        self._post((_EVT_STOP, None))
         return True
     
     def process_key(self, char: str):
@@ -124,64 +203,182 @@ class SystemLocker:
         
         :param char: 输入的字符
         """
+        if char.isdigit() and len(char) == 1:
+            self._on_digit(int(char))
+    
+    def _on_digit(self, digit: int):
+        """数字键热路径：O(1) 滚动校验，回调延后到分发线程"""
         if not self.is_locked:
             return
         
-        self.input_buffer += char
-        self.input_buffer = self.input_buffer[-len(self.unlock_code):]
-        
         if self._on_key_input:
-            self._on_key_input(char)
+            self._post((_EVT_KEY, digit))
         
-        if self.input_buffer == self.unlock_code:
+        if self._verifier.feed(digit):
             self.unlock()
     
     def trap_mouse(self):
-        """困禁鼠标到屏幕中心"""
+        """困禁鼠标到主显示器中心"""
         if not self.is_locked:
             return
         
         try:
-            sw = self.user32.GetSystemMetrics(0)
-            sh = self.user32.GetSystemMetrics(1)
-            cx, cy = sw // 2, sh // 2
+            topology = self.display.get()
+            if topology is not self._trap_topology:
+                cx, cy = topology.primary.center
+                self._trap_rect = RECT(cx, cy, cx + 1, cy + 1)
+                self._trap_topology = topology
             
-            rect = RECT(cx, cy, cx + 1, cy + 1)
-            self.user32.ClipCursor(ctypes.byref(rect))
+            self.user32.ClipCursor(ctypes.byref(self._trap_rect))
+            self._trapped = True
         except Exception as e:
             logger.warning(f"鼠标困禁失败: {e}")
     
+    def is_mouse_trapped(self) -> bool:
+        """鼠标是否仍被困禁（一次 GetClipCursor，困禁可能被系统重置）"""
+        if not self.is_locked or not self._trapped:
+            return False
+        if self._trap_topology is not self.display.get():
+            return False
+        
+        try:
+            current = self._clip_rect
+            self.user32.GetClipCursor(ctypes.byref(current))
+            want = self._trap_rect
+            return (
+                current.left == want.left and current.top == want.top
+                and current.right == want.right and current.bottom == want.bottom
+            )
+        except Exception:
+            return False
+    
+    def _start_dispatcher(self):
+        """启动本次锁定的事件分发线程"""
+        self._events = queue.SimpleQueue()
+        self._post = self._events.put
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop,
+            args=(self._events,),
+            daemon=True
+        )
+        self._dispatch_thread.start()
+    
+    def _dispatch_loop(self, events: queue.SimpleQueue):
+        """在钩子线程之外执行日志和回调"""
+        while True:
+            kind, payload = events.get()
+            try:
+                if kind == _EVT_KEY:
+                    if self._on_key_input:
+                        self._on_key_input(str(payload))
+                elif kind == _EVT_LOG:
+                    level, msg = payload
+                    logger.log(level, msg)
+                elif kind == _EVT_UNLOCKED:
+                    if self._on_unlock:
+                        self._on_unlock()
+                    logger.info("系统已解锁")
+                elif kind == _EVT_STOP:
+                    return
+            except Exception as e:
+                logger.error(f"锁定事件处理异常: {e}")
+    
+    def request_reinstall(self):
+        """请求钩子线程重装钩子（可在任意线程调用）"""
+        if self._hook_thread_id:
+            self.user32.PostThreadMessageW(self._hook_thread_id, WM_APP_REINSTALL, 0, 0)
+    
+    def get_metrics(self) -> Dict[str, float]:
+        """获取钩子监控指标"""
+        metrics = self.watchdog.metrics()
+        metrics["locked"] = int(self.is_locked)
+        return metrics
+    
+    def _register_metrics(self):
+        """把看门狗统计注册为导出时读取的指标"""
+        watchdog = self.watchdog
+        metrics.gauge("locked", "是否处于锁定状态", func=lambda: int(self.is_locked))
+        metrics.counter("hook_events_total", "钩子收到的事件总数", func=lambda: self.hook_events)
+        metrics.counter("hook_losses_total", "检测到的钩子丢失次数", func=lambda: watchdog.hook_losses)
+        metrics.counter("hook_reinstalls_total", "钩子重装次数", func=lambda: watchdog.reinstalls)
+    
+    def _get_last_input_tick(self) -> int:
+        """获取系统最后输入时间"""
+        self.user32.GetLastInputInfo(ctypes.byref(self._last_input))
+        return self._last_input.dwTime
+    
+    def _start_hook_thread(self):
+        """启动钩子线程并等待钩子安装完成"""
+        # 上一次锁定的钩子线程可能仍在退出中，先等待其卸载完成
+        if self._hook_thread and self._hook_thread.is_alive():
+            self._hook_thread.join(timeout=1.0)
+        
+        self._hooks_ready.clear()
+        self._hook_thread = threading.Thread(target=self._hook_thread_main, daemon=True)
+        self._hook_thread.start()
+        
+        if not self._hooks_ready.wait(timeout=1.0):
+            logger.error("钩子线程启动超时")
+    
+    def _stop_hook_thread(self):
+        """通知钩子线程退出消息循环"""
+        if self._hook_thread_id:
+            self.user32.PostThreadMessageW(self._hook_thread_id, WM_QUIT, 0, 0)
+    
+    def _hook_thread_main(self):
+        """
+        钩子线程主函数
+        
+        低级钩子回调运行在安装钩子的线程上，且该线程必须持续处理消息；
+        使用独立线程可避免 Tk 主线程卡顿导致钩子超时被系统移除
+        """
+        self._hook_thread_id = self.kernel32.GetCurrentThreadId()
+        
+        # 执行状态按线程生效，由钩子线程持有
+        self._prevent_sleep(True)
+        self._install_hooks()
+        self._hooks_ready.set()
+        
+        msg = wintypes.MSG()
+        try:
+            while self.user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == WM_APP_REINSTALL and self.is_locked:
+                    self._uninstall_hooks()
+                    self._install_hooks()
+        finally:
+            self._hook_thread_id = 0
+            self._uninstall_hooks()
+            self._prevent_sleep(False)
+    
     def _install_hooks(self):
-        """安装全局钩子"""
+        """安装全局钩子（在钩子线程中调用）"""
+        vk_to_digit = _VK_TO_DIGIT
+        read_vk = _read_vk
+        on_digit = self._on_digit
+        record = self.latency.record
+        observe = _hook_latency.observe
+        clock = time.perf_counter
         
         def kb_callback(nCode, wParam, lParam):
-            try:
-                if nCode == 0 and (wParam == WM_KEYDOWN or wParam == WM_SYSKEYDOWN):
-                    kb = ctypes.cast(lParam, ctypes.POINTER(KBDLLHOOKSTRUCT)).contents
-                    vk = kb.vkCode
-                    
-                    # 数字键处理
-                    if 48 <= vk <= 57:  # 主键盘 0-9
-                        self.process_key(chr(vk))
-                        return 1
-                    elif 96 <= vk <= 105:  # 小键盘 0-9
-                        self.process_key(str(vk - 96))
-                        return 1
-                    
-                    return 1  # 屏蔽其他按键
+            start = clock()
+            self.hook_events += 1
+            if nCode != 0 or (wParam != WM_KEYDOWN and wParam != WM_SYSKEYDOWN):
                 return 0
+            try:
+                digit = vk_to_digit[read_vk(lParam).value & 0xFF]
+                if digit >= 0:
+                    on_digit(digit)
+                elapsed = clock() - start
+                record(elapsed)
+                observe(elapsed)
+                return 1  # 屏蔽所有按键
             except Exception as e:
-                logger.error(f"键盘钩子异常: {e}")
+                self._post((_EVT_LOG, (logging.ERROR, f"键盘钩子异常: {e}")))
                 return 0
         
         def ms_callback(nCode, wParam, lParam):
-            try:
-                if nCode >= 0:
-                    return 1  # 屏蔽鼠标
-                return 0
-            except Exception as e:
-                logger.error(f"鼠标钩子异常: {e}")
-                return 0
+            self.hook_events += 1
+            return 1 if nCode >= 0 else 0  # 屏蔽鼠标
         
         try:
             self.kb_proc_ref = HOOKPROC(kb_callback)
@@ -202,7 +399,7 @@ class SystemLocker:
             logger.error(f"钩子安装异常: {e}")
     
     def _uninstall_hooks(self):
-        """卸载全局钩子"""
+        """卸载全局钩子（在钩子线程中调用）"""
         try:
             if self.h_kb_hook:
                 self.user32.UnhookWindowsHookEx(self.h_kb_hook)
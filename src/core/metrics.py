@@ -0,0 +1,309 @@
+"""
+运行指标模块
+进程内的计数器、仪表与固定分桶直方图，导出为 Prometheus 文本格式
+
+热路径上的更新只是属性自增与一次二分查找，不加锁：
+每个指标通常只由一个线程写入，导出时读取的是近似一致的快照
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# 默认分桶（秒）：覆盖钩子回调的亚毫秒级到界面卡顿的秒级
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _format_labels(labels: Labels, extra: Tuple[str, str] = None) -> str:
+    pairs = list(labels)
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+class Counter:
+    """只增计数器：可直接累加，也可在导出时通过 func 读取"""
+    
+    type = "counter"
+    
+    def __init__(self, name: str, help: str = "", labels: Labels = (), func: Callable[[], float] = None):
+        """
+        :param func: 导出时调用以获取当前值（用于暴露模块已有的统计属性，不改动其热路径）
+        """
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.func = func
+        self.value = 0
+    
+    def inc(self, amount: float = 1):
+        self.value += amount
+    
+    def get(self) -> float:
+        if self.func is not None:
+            try:
+                return self.func()
+            except Exception:
+                return float("nan")
+        return self.value
+    
+    def samples(self) -> List[Tuple[str, str, float]]:
+        return [(self.name, _format_labels(self.labels), self.get())]
+
+
+class Gauge(Counter):
+    """仪表：可增可减"""
+    
+    type = "gauge"
+    
+    def set(self, value: float):
+        self.value = value
+    
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+
+class Histogram:
+    """固定分桶直方图"""
+    
+    type = "histogram"
+    
+    def __init__(self, name: str, help: str = "", labels: Labels = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        # 最后一格为 +Inf
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float):
+        """记录一次观测值"""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def time(self) -> "_Timing":
+        """计时上下文：with histogram.time(): ..."""
+        return _Timing(self)
+    
+    def samples(self) -> List[Tuple[str, str, float]]:
+        counts = list(self.counts)
+        result = []
+        cumulative = 0
+        for bound, n in zip(self.buckets + (float("inf"),), counts):
+            cumulative += n
+            result.append((
+                f"{self.name}_bucket",
+                _format_labels(self.labels, ("le", _format_value(bound))),
+                cumulative
+            ))
+        labels = _format_labels(self.labels)
+        result.append((f"{self.name}_sum", labels, self.sum))
+        result.append((f"{self.name}_count", labels, cumulative))
+        return result
+
+
+class _Timing:
+    __slots__ = ("_histogram", "_start")
+    
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+    
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class MetricsRegistry:
+    """
+    指标注册表
+    
+    同名同标签的指标只创建一次，模块可在导入时注册；
+    注册与导出加锁，更新指标不经过注册表
+    """
+    
+    def __init__(self, namespace: str = "officeguard"):
+        self.namespace = namespace
+        self._metrics: Dict[Tuple[str, Labels], Any] = {}
+        self._lock = threading.Lock()
+    
+    def _get(self, cls, name: str, help: str, labels: Dict[str, str], **kwargs):
+        full_name = f"{self.namespace}_{name}" if self.namespace else name
+        key = (full_name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = cls(full_name, help, key[1], **kwargs)
+                self._metrics[key] = metric
+            elif type(metric) is not cls:
+                raise ValueError(f"指标 {full_name} 已注册为 {metric.type}")
+            elif kwargs.get("func") is not None:
+                # 重新注册时指向新的对象
+                metric.func = kwargs["func"]
+            return metric
+    
+    def counter(self, name: str, help: str = "", labels: Dict[str, str] = None, func: Callable[[], float] = None) -> Counter:
+        return self._get(Counter, name, help, labels, func=func)
+    
+    def gauge(self, name: str, help: str = "", labels: Dict[str, str] = None, func: Callable[[], float] = None) -> Gauge:
+        return self._get(Gauge, name, help, labels, func=func)
+    
+    def histogram(
+        self,
+        name: str,
+        help: str = "",
+        labels: Dict[str, str] = None,
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get(Histogram, name, help, labels, buckets=buckets)
+    
+    def render(self) -> str:
+        """导出 Prometheus 文本格式"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        
+        # 同名指标（不同标签）归在同一组 HELP/TYPE 下
+        groups: Dict[str, list] = {}
+        for metric in metrics:
+            groups.setdefault(metric.name, []).append(metric)
+        
+        lines = []
+        for name, group in groups.items():
+            help_text = group[0].help.replace("\\", "\\\\").replace("\n", "\\n")
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {group[0].type}")
+            for metric in group:
+                for sample_name, labels, value in metric.samples():
+                    lines.append(f"{sample_name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+    
+    def write(self, path: Path):
+        """
+        写入文件（先写临时文件再替换，采集方不会读到写了一半的内容）
+        
+        :raises OSError: 写入失败
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+class LoopLagMonitor:
+    """
+    事件循环延迟探测
+    
+    按固定间隔调度自身，实际触发时间晚于预期的部分即为循环被阻塞的时长
+    """
+    
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], Any],
+        cancel: Callable[[Any], None],
+        histogram: Histogram,
+        interval_ms: int = 1000
+    ):
+        """
+        :param schedule: 延迟调度函数 (毫秒, 回调) -> 句柄，如 root.after
+        :param cancel: 取消调度，如 root.after_cancel
+        :param histogram: 记录延迟（秒）的直方图
+        :param interval_ms: 探测间隔（毫秒）
+        """
+        self._schedule = schedule
+        self._cancel = cancel
+        self.histogram = histogram
+        self.interval_ms = interval_ms
+        self.last_lag = 0.0
+        self._handle = None
+        self._expected = 0.0
+    
+    def start(self):
+        self.stop()
+        self._arm()
+    
+    def stop(self):
+        if self._handle is not None:
+            self._cancel(self._handle)
+            self._handle = None
+    
+    def _arm(self):
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._handle = self._schedule(self.interval_ms, self._tick)
+    
+    def _tick(self):
+        self.last_lag = max(0.0, time.perf_counter() - self._expected)
+        self.histogram.observe(self.last_lag)
+        self._arm()
+
+
+# 全局注册表
+registry = MetricsRegistry()
+
+
+def counter(name: str, help: str = "", labels: Dict[str, str] = None, func: Callable[[], float] = None) -> Counter:
+    """获取或注册计数器"""
+    return registry.counter(name, help, labels, func)
+
+
+def gauge(name: str, help: str = "", labels: Dict[str, str] = None, func: Callable[[], float] = None) -> Gauge:
+    """获取或注册仪表"""
+    return registry.gauge(name, help, labels, func)
+
+
+def histogram(
+    name: str,
+    help: str = "",
+    labels: Dict[str, str] = None,
+    buckets: Iterable[float] = DEFAULT_BUCKETS
+) -> Histogram:
+    """获取或注册直方图"""
+    return registry.histogram(name, help, labels, buckets)
+
+
+def register_runtime_metrics(mode: str):
+    """
+    注册进程级指标：运行模式与日志队列统计
+    
+    :param mode: 'gui' 或 'headless'
+    """
+    from ..utils.logger import get_logging_stats
+    
+    gauge("info", "运行模式", labels={"mode": mode}).set(1)
+    counter("log_records_total", "进入日志队列的记录数", func=lambda: get_logging_stats()["log_enqueued"])
+    counter("log_dropped_total", "日志队列满时丢弃的记录数", func=lambda: get_logging_stats()["log_dropped"])
+    gauge("log_queue_size", "日志队列当前长度", func=lambda: get_logging_stats()["log_queue_size"])
+
+
+def render_metrics() -> str:
+    """导出全部指标（Prometheus 文本格式）"""
+    return registry.render()
@@ -0,0 +1,144 @@
+"""
+后台服务模块
+无界面模式：在 asyncio 事件循环中运行定时、锁定、快捷键与托盘服务，不导入 Tk
+"""
+
+import argparse
+import asyncio
+import signal
+import sys
+from typing import Any, Callable, Dict
+from .config import ConfigManager
+from .controller import ControllerFrontend, GuardController
+from .enforcer import EnforcementBackend
+from . import metrics
+from .tray_icons import TrayState
+from ..utils.logger import get_logger
+
+logger = get_logger('service')
+
+
+class HeadlessBackend(EnforcementBackend):
+    """无界面模式的强制执行接口：没有遮挡窗口，只负责鼠标困禁"""
+    
+    def __init__(self, core: GuardController):
+        self.core = core
+    
+    def has_focus(self) -> bool:
+        return True
+    
+    def restore_focus(self):
+        pass
+    
+    def is_trapped(self) -> bool:
+        return self.core.locker.is_mouse_trapped()
+    
+    def trap(self):
+        self.core.locker.trap_mouse()
+    
+    def display_signature(self):
+        return self.core.display.version
+
+
+class HeadlessService(ControllerFrontend):
+    """
+    无界面后台服务
+    
+    在 asyncio 事件循环中运行核心控制器；托盘、快捷键、锁定器等线程的回调
+    通过 call_soon_threadsafe 切回事件循环
+    """
+    
+    def __init__(self, config: ConfigManager = None, launch_args: argparse.Namespace = None):
+        """
+        :param config: 配置管理器
+        :param launch_args: 启动参数
+        """
+        self.launch_args = launch_args
+        self.loop: asyncio.AbstractEventLoop = None
+        self.lag_monitor: metrics.LoopLagMonitor = None
+        self._stop_event: asyncio.Event = None
+        self.core = GuardController(self, "headless", config)
+    
+    # ==================== 运行 ====================
+    
+    def run(self, on_ready: Callable[[], None] = None):
+        """
+        运行服务（阻塞直到停止）
+        
+        :param on_ready: 服务启动完成后在事件循环中调用
+        """
+        asyncio.run(self._main(on_ready))
+    
+    async def _main(self, on_ready: Callable[[], None] = None):
+        self.loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self.lag_monitor = metrics.LoopLagMonitor(
+            self.call_later, self.cancel_call,
+            metrics.histogram("loop_lag_seconds", "事件循环调度延迟（循环被阻塞的时长）")
+        )
+        
+        self._setup_signals()
+        self.core.start()
+        self.core.start_tray()
+        self.lag_monitor.start()
+        logger.info("后台服务已启动")
+        if self.launch_args is not None:
+            self.core.apply_launch_args(self.launch_args)
+        if on_ready:
+            on_ready()
+        
+        try:
+            await self._stop_event.wait()
+        finally:
+            self._cleanup()
+    
+    def stop(self):
+        """停止服务（锁定期间忽略）"""
+        if self.core.locker.is_locked:
+            return
+        if self._stop_event is not None:
+            self._stop_event.set()
+    
+    def status(self) -> Dict[str, Any]:
+        """当前状态（快照，可在任意线程调用）"""
+        return self.core.status()
+    
+    def _setup_signals(self):
+        """Ctrl+C / 终止信号时退出"""
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            if sys.platform == "win32":
+                # Windows 事件循环不支持 add_signal_handler
+                signal.signal(sig, lambda *_: self.post(self.stop))
+            else:
+                self.loop.add_signal_handler(sig, self.stop)
+    
+    def _cleanup(self):
+        """清理资源"""
+        self.lag_monitor.stop()
+        self.core.shutdown()
+        logger.info("清理完成")
+    
+    # ==================== 前端接口 ====================
+    
+    def post(self, func: Callable, *args):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(func, *args)
+    
+    def call_later(self, delay_ms: int, func: Callable, background: bool = False) -> asyncio.TimerHandle:
+        return self.loop.call_later(delay_ms / 1000, func)
+    
+    def cancel_call(self, handle: asyncio.TimerHandle):
+        handle.cancel()
+    
+    def create_enforcement_backend(self, controller: GuardController) -> EnforcementBackend:
+        return HeadlessBackend(controller)
+    
+    def quit(self):
+        self.stop()
+    
+    def on_grace_tick(self, remaining: int):
+        if self.core.tray.state != TrayState.GRACE:
+            self.core.tray.notify("即将执行定时任务，移动鼠标可取消")
+    
+    def on_second_launch(self):
+        logger.info("已有实例在运行（无界面模式），忽略重复启动")
@@ -8,10 +8,23 @@ import time
 import math
 import ctypes
 from typing import Callable, Tuple
+from . import metrics
 from ..utils.logger import get_logger
 
 logger = get_logger('timer')
 
+_started = metrics.counter("timer_started_total", "已启动的定时任务数")
+_cancelled = metrics.counter("timer_cancelled_total", "已取消的定时任务数")
+_executed = metrics.counter("timer_executed_total", "已执行的定时任务数")
+_update_interval = metrics.histogram(
+    "timer_update_interval_seconds", "倒计时两次更新之间的实际间隔",
+    buckets=(0.25, 0.5, 0.6, 0.75, 1.0, 1.5, 2.0, 5.0, 10.0)
+)
+_execute_drift = metrics.histogram(
+    "timer_execute_drift_seconds", "定时任务实际执行时间相对计划时间（倒计时+缓冲期）的偏差",
+    buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+)
+
 
 class TimerManager:
     """定时器管理器"""
@@ -25,6 +38,7 @@ class TimerManager:
         self.grace_seconds = 0
         self.grace_remaining = 0
         self.action_executed = False
+        self._last_update = 0.0
         
         # 鼠标检测相关
         self.start_mouse_pos = (0, 0)
@@ -35,6 +49,7 @@ class TimerManager:
         self._on_tick: Callable[[int, int, int], None] = None  # (h, m, s)
         self._on_grace_tick: Callable[[int], None] = None  # remaining
         self._on_complete: Callable[[], None] = None
+        self._on_execute: Callable[[str], None] = None  # action，执行系统操作之前调用
         self._on_cancel: Callable[[str], None] = None
         
         # Windows API
@@ -46,13 +61,15 @@ class TimerManager:
         on_tick: Callable = None,
         on_grace_tick: Callable = None,
         on_complete: Callable = None,
-        on_cancel: Callable = None
+        on_cancel: Callable = None,
+        on_execute: Callable = None
     ):
         """设置回调函数"""
         self._on_tick = on_tick
         self._on_grace_tick = on_grace_tick
         self._on_complete = on_complete
         self._on_cancel = on_cancel
+        self._on_execute = on_execute
     
     def start(self, action: str, minutes: float, grace_seconds: int, mouse_threshold: int = 15) -> bool:
         """
@@ -84,6 +101,8 @@ class TimerManager:
         self.running = True
         self.in_grace_period = False
         self.action_executed = False
+        self._last_update = 0.0
+        _started.inc()
         
         logger.info(f"启动{action}倒计时，时长{minutes}分钟，缓冲{grace_seconds}秒")
         return True
@@ -100,6 +119,11 @@ class TimerManager:
         if self.in_grace_period:
             return True, True
         
+        now = time.monotonic()
+        if self._last_update:
+            _update_interval.observe(now - self._last_update)
+        self._last_update = now
+        
         remaining = self.target_timestamp - time.time()
         
         if remaining > 0:
@@ -166,6 +190,12 @@ class TimerManager:
         self.action_executed = True
         self.running = False
         self.in_grace_period = False
+        _executed.inc()
+        _execute_drift.observe(max(0.0, time.time() - self.target_timestamp - self.grace_seconds))
+        
+        # 关机后进程不再有机会记录，因此在执行之前通知
+        if self._on_execute:
+            self._on_execute(self.action)
         
         try:
             if self.action == "shutdown":
@@ -182,6 +212,8 @@ class TimerManager:
     
     def cancel(self, message: str = ""):
         """取消定时器"""
+        if self.running:
+            _cancelled.inc()
         self.running = False
         self.in_grace_period = False
         
@@ -3,85 +3,116 @@
 管理系统托盘图标和菜单
 """
 
+import math
 import threading
-from typing import Callable
-from PIL import Image, ImageDraw
+from typing import Callable, List, Tuple
 import pystray
+from . import metrics
+from .config import SLEEP_PRESETS
+from .tray_icons import IconAtlas, TrayState
 from ..utils.logger import get_logger
 
 logger = get_logger('tray')
 
+TRAY_TITLE = "系统优化助手"
+
+ACTION_NAMES = {"shutdown": "关机", "sleep": "睡眠"}
+
+
+def format_countdown(remaining: float, grace: bool = False) -> Tuple[str, str]:
+    """
+    生成倒计时的提示文字与角标文字
+    
+    文字粒度随剩余时间变化：10 分钟以上按分钟、最后 10 分钟按 10 秒、
+    最后 1 分钟按秒，调用方只在文字变化时刷新托盘，因此粒度即刷新频率
+    
+    :param remaining: 剩余秒数
+    :param grace: 是否处于缓冲期
+    :return: (提示文字, 角标文字)
+    """
+    remaining = max(0.0, remaining)
+    
+    if grace:
+        seconds = math.ceil(remaining)
+        return f"缓冲期剩余 {seconds} 秒，移动鼠标可取消", str(seconds)
+    
+    if remaining > 600:
+        minutes = math.ceil(remaining / 60)
+        badge = str(minutes) if minutes < 100 else f"{math.ceil(minutes / 60)}h"
+        return f"剩余约 {minutes} 分钟", badge
+    
+    if remaining > 60:
+        seconds = math.ceil(remaining / 10) * 10
+        m, s = divmod(seconds, 60)
+        return f"剩余 {m}:{s:02d}", str(math.ceil(remaining / 60))
+    
+    seconds = math.ceil(remaining)
+    return f"剩余 {seconds} 秒", str(seconds)
+
 
 class TrayManager:
     """系统托盘管理器"""
     
-    def __init__(self):
+    def __init__(self, accent_color: str = "#3498db", show_badge: bool = False):
+        """
+        :param accent_color: 空闲状态图标颜色
+        :param show_badge: 倒计时期间是否在图标上显示角标
+        """
         self.icon = None
         self.thread = None
         
+        # 图标图集（按状态缓存，切换时不重新绘制）
+        self.atlas = IconAtlas(accent_color=accent_color)
+        self.state = TrayState.IDLE
+        
+        # 倒计时显示（仅在文字变化时调用 pystray）
+        self.show_badge = show_badge
+        self._countdown_text: str = None
+        self._badge_text: str = None
+        self.countdown_updates = 0
+        
         # 回调
         self._on_show: Callable[[], None] = None
         self._on_quit: Callable[[], None] = None
         self._on_toggle_hotkey: Callable[[], None] = None
+        self._on_start_timer: Callable[[str, float], None] = None
+        self._on_cancel_timer: Callable[[], None] = None
+        self._on_lock: Callable[[], None] = None
         
         # 状态
         self.hotkey_enabled = True
+        self.recent_timers: List[Tuple[str, float]] = []
+        
+        # 菜单模型：仅在状态变化时重建（比较与重建在锁内进行，并发调用不会重复构建）
+        self._menu_key = None
+        self._menu_lock = threading.Lock()
+        self.menu_builds = 0
+        
+        metrics.counter("tray_countdown_updates_total", "托盘倒计时文字实际更新次数", func=lambda: self.countdown_updates)
+        metrics.counter("tray_menu_builds_total", "托盘菜单重建次数", func=lambda: self.menu_builds)
+        metrics.counter("tray_icon_renders_total", "托盘图标绘制次数", func=lambda: self.atlas.renders)
     
     def set_callbacks(
         self,
         on_show: Callable = None,
         on_quit: Callable = None,
-        on_toggle_hotkey: Callable = None
+        on_toggle_hotkey: Callable = None,
+        on_start_timer: Callable = None,
+        on_cancel_timer: Callable = None,
+        on_lock: Callable = None
     ):
-        """设置回调函数"""
-        self._on_show = on_show
-        self._on_quit = on_quit
-        self._on_toggle_hotkey = on_toggle_hotkey
-    
-    def _create_icon_image(self, size: int = 64, color: str = "#3498db") -> Image.Image:
         """
-        创建托盘图标
+        设置回调函数
         
-        :param size: 图标大小
-        :param color: 图标颜色
-        :return: PIL Image 对象
+        菜单回调在托盘线程中触发，需要操作 Tk 的调用方应自行切回主线程；
+        托盘只在 update_hotkey_status 等方法被调用时更新菜单状态
         """
-        # 解析颜色
-        if color.startswith('#'):
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-            fill_color = (r, g, b)
-        else:
-            fill_color = (52, 152, 219)  # 默认蓝色
-        
-        image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        # 绘制圆形背景
-        margin = size // 8
-        draw.ellipse(
-            [margin, margin, size - margin, size - margin],
-            fill=fill_color
-        )
-        
-        # 绘制盾牌图案
-        shield_color = (255, 255, 255)
-        center_x = size // 2
-        center_y = size // 2
-        
-        # 简单的盾牌形状
-        points = [
-            (center_x, center_y - size // 4),  # 顶部
-            (center_x + size // 5, center_y - size // 8),  # 右上
-            (center_x + size // 5, center_y + size // 8),  # 右中
-            (center_x, center_y + size // 4),  # 底部
-            (center_x - size // 5, center_y + size // 8),  # 左中
-            (center_x - size // 5, center_y - size // 8),  # 左上
-        ]
-        draw.polygon(points, fill=shield_color)
-        
-        return image
+        self._on_show = on_show
+        self._on_quit = on_quit
+        self._on_toggle_hotkey = on_toggle_hotkey
+        self._on_start_timer = on_start_timer
+        self._on_cancel_timer = on_cancel_timer
+        self._on_lock = on_lock
     
     def start(self, hotkey_enabled: bool = True):
         """
@@ -92,22 +123,15 @@ class TrayManager:
         self.hotkey_enabled = hotkey_enabled
         
         try:
-            icon_image = self._create_icon_image()
-            
-            def get_hotkey_text(item):
-                return f"快捷键: {'✓ 开启' if self.hotkey_enabled else '✗ 关闭'}"
-            
-            menu = pystray.Menu(
-                pystray.MenuItem("显示主界面", self._on_show_click),
-                pystray.MenuItem(get_hotkey_text, self._on_toggle_click),
-                pystray.Menu.SEPARATOR,
-                pystray.MenuItem("退出", self._on_quit_click)
-            )
+            icon_image = self.atlas.get(self.state)
+            with self._menu_lock:
+                self._menu_key = self._menu_state()
+                menu = self._build_menu()
             
             self.icon = pystray.Icon(
                 "office_guard",
                 icon_image,
-                "系统优化助手",
+                self._title(),
                 menu
             )
             
@@ -135,17 +159,189 @@ class TrayManager:
             self._on_show()
     
     def _on_toggle_click(self):
-        """切换快捷键"""
-        self.hotkey_enabled = not self.hotkey_enabled
+        """切换快捷键（状态由调用方切换后通过 update_hotkey_status 写回）"""
         if self._on_toggle_hotkey:
             self._on_toggle_hotkey()
     
+    def _on_cancel_click(self):
+        """取消定时"""
+        if self._on_cancel_timer:
+            self._on_cancel_timer()
+    
+    def _on_lock_click(self):
+        """立即锁定"""
+        if self._on_lock:
+            self._on_lock()
+    
+    def _timer_action(self, action: str, minutes: float) -> Callable[[], None]:
+        """生成定时菜单项的回调（无参数，pystray 按参数个数决定传参）"""
+        def on_click():
+            if self._on_start_timer:
+                self._on_start_timer(action, minutes)
+        return on_click
+    
     def _on_quit_click(self):
         """退出应用"""
         if self._on_quit:
             self._on_quit()
     
+    def set_state(self, state: str):
+        """
+        切换托盘图标状态
+        
+        :param state: TrayState 中的状态
+        """
+        if state == self.state:
+            return
+        
+        self.state = state
+        self._apply_icon()
+        self._refresh_menu()
+    
+    def notify(self, message: str):
+        """显示托盘通知"""
+        if self.icon:
+            try:
+                self.icon.notify(message, TRAY_TITLE)
+            except Exception as e:
+                logger.debug(f"托盘通知失败: {e}")
+    
+    def set_recent_timers(self, recent: List[Tuple[str, float]]):
+        """
+        设置最近使用的自定义定时
+        
+        :param recent: [(action, minutes), ...]，最近的在前
+        """
+        self.recent_timers = [(action, minutes) for action, minutes in recent]
+        self._refresh_menu()
+    
+    def _menu_state(self) -> tuple:
+        """决定菜单内容的全部状态"""
+        return self.state, self.hotkey_enabled, tuple(self.recent_timers)
+    
+    def _refresh_menu(self):
+        """状态变化时重建菜单，未变化时不做任何事"""
+        with self._menu_lock:
+            key = self._menu_state()
+            if key == self._menu_key:
+                return
+            
+            self._menu_key = key
+            if self.icon:
+                try:
+                    self.icon.menu = self._build_menu()
+                    self.icon.update_menu()
+                except Exception as e:
+                    logger.error(f"托盘菜单更新失败: {e}")
+    
+    def _build_menu(self) -> pystray.Menu:
+        """
+        按当前状态构建菜单
+        
+        所有文字与可用状态在构建时确定，打开菜单时不再回调计算
+        """
+        self.menu_builds += 1
+        timer_running = self.state in (TrayState.TIMER, TrayState.GRACE)
+        locked = self.state == TrayState.LOCKED
+        idle = not timer_running and not locked
+        
+        presets = pystray.Menu(*[
+            pystray.MenuItem(f"{minutes} 分钟", self._timer_action("sleep", minutes))
+            for minutes in SLEEP_PRESETS
+        ])
+        
+        items = []
+        if self._on_show:
+            # 无界面模式没有主窗口
+            items += [
+                pystray.MenuItem("显示主界面", self._on_show_click, default=True),
+                pystray.Menu.SEPARATOR,
+            ]
+        items.append(pystray.MenuItem("定时睡眠", presets, enabled=idle))
+        
+        if self.recent_timers:
+            recent = pystray.Menu(*[
+                pystray.MenuItem(
+                    f"{ACTION_NAMES.get(action, action)} · {minutes:g} 分钟",
+                    self._timer_action(action, minutes)
+                )
+                for action, minutes in self.recent_timers
+            ])
+            items.append(pystray.MenuItem("最近使用", recent, enabled=idle))
+        
+        items += [
+            pystray.MenuItem("取消定时", self._on_cancel_click, enabled=timer_running),
+            pystray.MenuItem("立即锁定", self._on_lock_click, enabled=not locked),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem(
+                f"快捷键: {'✓ 开启' if self.hotkey_enabled else '✗ 关闭'}",
+                self._on_toggle_click
+            ),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem("退出", self._on_quit_click),
+        ]
+        return pystray.Menu(*items)
+    
+    def update_countdown(self, remaining: float, label: str = "", grace: bool = False):
+        """
+        更新托盘倒计时（可高频调用，文字未变化时不触发任何系统调用）
+        
+        :param remaining: 剩余秒数
+        :param label: 提示文字前缀，如任务名称
+        :param grace: 是否处于缓冲期
+        """
+        text, badge = format_countdown(remaining, grace)
+        if label:
+            text = f"{label} {text}"
+        
+        if text != self._countdown_text:
+            self._countdown_text = text
+            self.countdown_updates += 1
+            if self.icon:
+                try:
+                    self.icon.title = self._title()
+                except Exception as e:
+                    logger.error(f"托盘提示更新失败: {e}")
+        
+        if self.show_badge and badge != self._badge_text:
+            self._badge_text = badge
+            self._apply_icon()
+    
+    def clear_countdown(self):
+        """清除倒计时显示"""
+        if self._countdown_text is None and self._badge_text is None:
+            return
+        
+        self._countdown_text = None
+        had_badge = self._badge_text is not None
+        self._badge_text = None
+        if self.icon:
+            try:
+                self.icon.title = self._title()
+            except Exception as e:
+                logger.error(f"托盘提示更新失败: {e}")
+        if had_badge:
+            self._apply_icon()
+    
+    def _title(self) -> str:
+        """托盘提示文字"""
+        if self._countdown_text:
+            return f"{TRAY_TITLE}\n{self._countdown_text}"
+        return TRAY_TITLE
+    
+    def _apply_icon(self):
+        """按当前状态与角标设置图标"""
+        if not self.icon:
+            return
+        try:
+            if self._badge_text is not None:
+                self.icon.icon = self.atlas.get_badge(self.state, self._badge_text)
+            else:
+                self.icon.icon = self.atlas.get(self.state)
+        except Exception as e:
+            logger.error(f"托盘图标更新失败: {e}")
+    
     def update_hotkey_status(self, enabled: bool):
         """更新快捷键状态"""
         self.hotkey_enabled = enabled
-        # pystray 会自动更新菜单文本
+        self._refresh_menu()
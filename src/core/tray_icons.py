@@ -0,0 +1,250 @@
+"""
+托盘图标模块
+按状态预渲染托盘图标（超采样后缩小），缓存在内存和磁盘中，状态切换时直接取用
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+from PIL import Image, ImageDraw, ImageFont
+from ..utils.paths import get_cache_dir
+from ..utils.logger import get_logger
+
+logger = get_logger('tray_icons')
+
+# 图标绘制逻辑变化时递增，使旧的磁盘缓存失效
+ICON_VERSION = 1
+
+
+class TrayState:
+    """托盘图标状态"""
+    IDLE = "idle"                # 空闲
+    TIMER = "timer"              # 定时任务运行中
+    GRACE = "grace"              # 缓冲期
+    LOCKED = "locked"            # 系统已锁定
+    HOTKEY_OFF = "hotkey_off"    # 快捷键已关闭
+    
+    ALL = (IDLE, TIMER, GRACE, LOCKED, HOTKEY_OFF)
+
+
+# 各状态的底色，None 表示使用强调色
+STATE_COLORS = {
+    TrayState.IDLE: None,
+    TrayState.TIMER: "#f59e0b",
+    TrayState.GRACE: "#ef4444",
+    TrayState.LOCKED: "#18181b",
+    TrayState.HOTKEY_OFF: "#71717a",
+}
+
+
+def parse_color(color: str) -> Tuple[int, int, int]:
+    """解析 #rrggbb 颜色"""
+    if color and color.startswith('#') and len(color) == 7:
+        return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+    return 52, 152, 219  # 默认蓝色
+
+
+def render_icon(size: int, color: str, state: str = TrayState.IDLE, supersample: int = 4) -> Image.Image:
+    """
+    绘制托盘图标
+    
+    :param size: 输出尺寸
+    :param color: 底色
+    :param state: 图标状态
+    :param supersample: 超采样倍数，先按 size * supersample 绘制再缩小，高 DPI 下边缘更平滑
+    :return: PIL Image 对象
+    """
+    scale = max(1, supersample)
+    big = size * scale
+    
+    image = Image.new('RGBA', (big, big), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    
+    # 绘制圆形背景
+    margin = big // 8
+    draw.ellipse([margin, margin, big - margin, big - margin], fill=parse_color(color))
+    
+    # 绘制盾牌图案
+    shield_color = (255, 255, 255)
+    cx = big // 2
+    cy = big // 2
+    points = [
+        (cx, cy - big // 4),            # 顶部
+        (cx + big // 5, cy - big // 8),  # 右上
+        (cx + big // 5, cy + big // 8),  # 右中
+        (cx, cy + big // 4),            # 底部
+        (cx - big // 5, cy + big // 8),  # 左中
+        (cx - big // 5, cy - big // 8),  # 左上
+    ]
+    draw.polygon(points, fill=shield_color)
+    
+    # 锁定状态在盾牌上加锁孔
+    if state == TrayState.LOCKED:
+        r = big // 16
+        draw.ellipse([cx - r, cy - r * 2, cx + r, cy], fill=parse_color(color))
+        draw.rectangle([cx - r // 2, cy - r, cx + r // 2, cy + r * 2], fill=parse_color(color))
+    
+    if scale > 1:
+        image = image.resize((size, size), Image.Resampling.LANCZOS)
+    return image
+
+
+def render_badge_icon(size: int, color: str, state: str, text: str, supersample: int = 4) -> Image.Image:
+    """
+    绘制带角标的托盘图标（倒计时数字）
+    
+    :param text: 角标文字，建议不超过 3 个字符
+    """
+    scale = max(1, supersample)
+    big = size * scale
+    image = render_icon(big, color, state, supersample=1)
+    draw = ImageDraw.Draw(image)
+    
+    font_size = big // 2 if len(text) <= 2 else big * 3 // 8
+    try:
+        font = ImageFont.load_default(size=font_size)
+    except TypeError:
+        font = ImageFont.load_default()  # Pillow < 10.1 不支持 size
+    
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    pad = big // 24
+    w = right - left + pad * 2
+    h = bottom - top + pad * 2
+    x0, y0 = big - w, big - h
+    draw.rounded_rectangle([x0, y0, big - 1, big - 1], radius=h // 3, fill=(239, 68, 68))
+    draw.text((x0 + pad - left, y0 + pad - top), text, font=font, fill=(255, 255, 255))
+    
+    if scale > 1:
+        image = image.resize((size, size), Image.Resampling.LANCZOS)
+    return image
+
+
+class IconAtlas:
+    """
+    托盘图标图集
+    
+    每个 (状态, 尺寸, 颜色) 只绘制一次：先查内存，再查磁盘缓存，最后才绘制并写回磁盘
+    """
+    
+    # 角标图标内存缓存上限
+    MAX_BADGES = 128
+    
+    def __init__(
+        self,
+        accent_color: str = "#3498db",
+        size: int = 64,
+        supersample: int = 4,
+        cache_dir: Path = None,
+        use_disk: bool = True
+    ):
+        """
+        :param accent_color: 空闲状态的强调色
+        :param size: 默认图标尺寸
+        :param supersample: 超采样倍数
+        :param cache_dir: 磁盘缓存目录，默认为用户数据目录下的 cache/icons
+        :param use_disk: 是否使用磁盘缓存
+        """
+        self.accent_color = accent_color
+        self.size = size
+        self.supersample = supersample
+        self.use_disk = use_disk
+        self._cache_dir = cache_dir
+        self._images: Dict[str, Image.Image] = {}
+        self._badges: Dict[str, Image.Image] = {}
+        
+        # 统计
+        self.hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+    
+    @property
+    def cache_dir(self) -> Path:
+        if self._cache_dir is None:
+            self._cache_dir = get_cache_dir() / 'icons'
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        return self._cache_dir
+    
+    def color_for(self, state: str) -> str:
+        """获取状态对应的底色"""
+        return STATE_COLORS.get(state) or self.accent_color
+    
+    def _key(self, state: str, size: int, color: str) -> str:
+        return f"{state}_{size}_{color.lstrip('#').lower()}_x{self.supersample}_v{ICON_VERSION}"
+    
+    def get(self, state: str = TrayState.IDLE, size: int = None) -> Image.Image:
+        """
+        获取图标
+        
+        :param state: 图标状态
+        :param size: 图标尺寸，默认使用图集尺寸
+        """
+        size = size or self.size
+        color = self.color_for(state)
+        key = self._key(state, size, color)
+        
+        image = self._images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+        
+        image = self._load_from_disk(key)
+        if image is None:
+            image = render_icon(size, color, state, self.supersample)
+            self.renders += 1
+            self._save_to_disk(key, image)
+        
+        self._images[key] = image
+        return image
+    
+    def get_badge(self, state: str, text: str, size: int = None) -> Image.Image:
+        """
+        获取带角标的图标
+        
+        角标随倒计时变化，只缓存在内存中，条目过多时整体清空
+        """
+        size = size or self.size
+        color = self.color_for(state)
+        key = f"{self._key(state, size, color)}_{text}"
+        
+        image = self._badges.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+        
+        if len(self._badges) >= self.MAX_BADGES:
+            self._badges.clear()
+        
+        image = render_badge_icon(size, color, state, text, self.supersample)
+        self.renders += 1
+        self._badges[key] = image
+        return image
+    
+    def warm(self, states: Iterable[str] = TrayState.ALL, sizes: Iterable[int] = None):
+        """预先准备一组图标"""
+        for size in sizes or (self.size,):
+            for state in states:
+                self.get(state, size)
+    
+    def _load_from_disk(self, key: str):
+        """从磁盘缓存加载"""
+        if not self.use_disk:
+            return None
+        try:
+            path = self.cache_dir / f"{key}.png"
+            if not path.exists():
+                return None
+            with Image.open(path) as image:
+                image.load()
+                self.disk_hits += 1
+                return image.copy()
+        except Exception as e:
+            logger.debug(f"图标缓存读取失败: {e}")
+            return None
+    
+    def _save_to_disk(self, key: str, image: Image.Image):
+        """写入磁盘缓存"""
+        if not self.use_disk:
+            return
+        try:
+            image.save(self.cache_dir / f"{key}.png", format="PNG")
+        except Exception as e:
+            logger.debug(f"图标缓存写入失败: {e}")
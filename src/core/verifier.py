@@ -0,0 +1,117 @@
+"""
+解锁码校验模块
+只保存加盐摘要，按键时通过滚动哈希窗口做 O(1)、常量时间的比对
+"""
+
+import hashlib
+import hmac
+import os
+
+# 滚动哈希模数（梅森素数 2^61 - 1）
+_MOD = (1 << 61) - 1
+
+
+def _derive_base(salt: bytes) -> int:
+    """由盐派生滚动哈希的基数，使窗口哈希同样依赖盐"""
+    seed = int.from_bytes(hashlib.sha256(b"officeguard-base" + salt).digest()[:8], "little")
+    return seed % (_MOD - 2) + 2
+
+
+def is_valid_code(code: str) -> bool:
+    """解锁密码是否有效（至少 3 位数字）"""
+    return bool(code) and code.isascii() and code.isdigit() and len(code) >= 3
+
+
+class UnlockVerifier:
+    """
+    解锁码校验器
+    
+    保存 (盐, 长度, 摘要)，摘要 = SHA-256(盐 + 窗口哈希)。
+    每次按键滚动更新最近 N 位数字的多项式哈希，再对定长输入求摘要并用
+    hmac.compare_digest 比较，耗时与解锁码长度无关
+    """
+    
+    def __init__(self, salt: bytes, length: int, digest: bytes):
+        self.salt = salt
+        self.length = length
+        self.digest = digest
+        
+        self._base = _derive_base(salt)
+        self._base_pow = pow(self._base, length, _MOD)  # 移出窗口的最高位权重
+        
+        self._ring = [0] * length
+        self._pos = 0
+        self._hash = 0
+    
+    @classmethod
+    def from_code(cls, code: str) -> "UnlockVerifier":
+        """
+        由明文解锁码创建（仅在设置密码时调用一次）
+        
+        :param code: 数字解锁码
+        """
+        if not (code.isascii() and code.isdigit()):
+            raise ValueError("解锁码必须为数字")
+        
+        salt = os.urandom(16)
+        window_hash = cls._hash_code(code, _derive_base(salt))
+        return cls(salt, len(code), cls._digest(salt, window_hash))
+    
+    @classmethod
+    def from_record(cls, record: str) -> "UnlockVerifier":
+        """
+        从配置记录恢复
+        
+        :param record: to_record() 生成的字符串
+        """
+        salt_hex, length, digest_hex = record.split(":")
+        return cls(bytes.fromhex(salt_hex), int(length), bytes.fromhex(digest_hex))
+    
+    def to_record(self) -> str:
+        """序列化为配置记录"""
+        return f"{self.salt.hex()}:{self.length}:{self.digest.hex()}"
+    
+    @staticmethod
+    def _hash_code(code: str, base: int) -> int:
+        """计算完整解锁码的窗口哈希（数字映射为 1-10，避免前导 0 与空位混淆）"""
+        value = 0
+        for c in code:
+            value = (value * base + ord(c) - 47) % _MOD
+        return value
+    
+    @staticmethod
+    def _digest(salt: bytes, window_hash: int) -> bytes:
+        """对定长输入求摘要"""
+        return hashlib.sha256(salt + window_hash.to_bytes(8, "little")).digest()
+    
+    def verify(self, code: str) -> bool:
+        """校验完整解锁码（用于判断密码是否变化）"""
+        if not (code.isascii() and code.isdigit()) or len(code) != self.length:
+            return False
+        window_hash = self._hash_code(code, self._base)
+        return hmac.compare_digest(self._digest(self.salt, window_hash), self.digest)
+    
+    def reset(self):
+        """清空按键窗口"""
+        self._ring = [0] * self.length
+        self._pos = 0
+        self._hash = 0
+    
+    def feed(self, digit: int) -> bool:
+        """
+        输入一位数字
+        
+        :param digit: 0-9
+        :return: 最近 N 位输入是否与解锁码匹配
+        """
+        value = digit + 1
+        pos = self._pos
+        self._hash = (self._hash * self._base + value - self._ring[pos] * self._base_pow) % _MOD
+        self._ring[pos] = value
+        pos += 1
+        self._pos = 0 if pos == self.length else pos
+        
+        return hmac.compare_digest(
+            hashlib.sha256(self.salt + self._hash.to_bytes(8, "little")).digest(),
+            self.digest
+        )
@@ -0,0 +1,188 @@
+"""
+钩子看门狗模块
+记录钩子回调耗时，并通过心跳检测钩子是否被系统静默移除
+"""
+
+import threading
+import time
+from typing import Callable, Dict
+from ..utils.logger import get_logger
+
+logger = get_logger('watchdog')
+
+
+class LatencyRecorder:
+    """
+    回调耗时记录器
+    
+    固定容量的环形缓冲，仅由钩子线程写入；读取方取快照后计算分位数
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        # 容量取 2 的幂，写入时用位与代替取模
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._mask = size - 1
+        self._samples = [0.0] * size
+        self.count = 0
+        self.max = 0.0
+    
+    def record(self, seconds: float):
+        """记录一次回调耗时（秒）"""
+        self._samples[self.count & self._mask] = seconds
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+    
+    def reset(self):
+        """清空记录"""
+        self.count = 0
+        self.max = 0.0
+    
+    def percentiles(self, *points: float) -> Dict[str, float]:
+        """
+        计算耗时分位数（毫秒）
+        
+        :param points: 分位点，如 50, 95, 99
+        :return: {"p50": ..., "p95": ...}
+        """
+        n = min(self.count, self._mask + 1)
+        if n == 0:
+            return {f"p{p:g}": 0.0 for p in points}
+        
+        samples = sorted(self._samples[:n])
+        return {
+            f"p{p:g}": samples[min(n - 1, int(n * p / 100))] * 1000
+            for p in points
+        }
+
+
+class HookWatchdog:
+    """
+    钩子看门狗
+    
+    每个检测周期比较「系统观察到的输入」与「钩子实际收到的事件」：
+    系统最后输入时间前进了、钩子事件计数却没有变化，说明钩子已被系统移除，
+    连续 miss_limit 次后请求重装，重装耗时上限为 interval * miss_limit
+    """
+    
+    def __init__(
+        self,
+        get_event_count: Callable[[], int],
+        get_last_input_tick: Callable[[], int],
+        reinstall: Callable[[], None],
+        latency: LatencyRecorder = None,
+        interval: float = 0.5,
+        miss_limit: int = 2,
+        slow_threshold_ms: float = 50.0
+    ):
+        """
+        :param get_event_count: 钩子已收到的事件总数
+        :param get_last_input_tick: 系统最后一次输入的时间戳
+        :param reinstall: 重装钩子
+        :param latency: 回调耗时记录器
+        :param interval: 检测周期（秒）
+        :param miss_limit: 连续几次心跳丢失后重装
+        :param slow_threshold_ms: 回调耗时告警阈值（毫秒）
+        """
+        self._get_event_count = get_event_count
+        self._get_last_input_tick = get_last_input_tick
+        self._reinstall = reinstall
+        self.latency = latency or LatencyRecorder()
+        self.interval = interval
+        self.miss_limit = miss_limit
+        self.slow_threshold_ms = slow_threshold_ms
+        
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread = None
+        
+        # 统计
+        self.checks = 0
+        self.misses = 0
+        self.hook_losses = 0
+        self.reinstalls = 0
+        self.last_reinstall_at = 0.0
+        self._slow_warned = False
+    
+    def start(self):
+        """启动看门狗"""
+        self.stop()
+        self.misses = 0
+        self._slow_warned = False
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop_event,), daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """停止看门狗（不等待线程退出，可在钩子回调中调用）"""
+        self._stop_event.set()
+        self._thread = None
+    
+    def _run(self, stop_event: threading.Event):
+        """检测循环"""
+        last_count = self._get_event_count()
+        last_tick = self._get_last_input_tick()
+        
+        while not stop_event.wait(self.interval):
+            last_count, last_tick = self.check(last_count, last_tick)
+    
+    def check(self, last_count: int, last_tick: int):
+        """
+        执行一次心跳检测
+        
+        :return: 本次的 (事件计数, 系统输入时间)，作为下一次检测的基准
+        """
+        self.checks += 1
+        count = self._get_event_count()
+        tick = self._get_last_input_tick()
+        
+        if tick != last_tick and count == last_count:
+            self.misses += 1
+            if self.misses >= self.miss_limit:
+                self.hook_losses += 1
+                self.misses = 0
+                logger.warning("检测到钩子丢失（系统有输入但钩子未收到事件），正在重装")
+                self._do_reinstall()
+                # 重装后重新取基准，避免把重装前的输入算作丢失
+                count = self._get_event_count()
+                tick = self._get_last_input_tick()
+        elif count != last_count:
+            self.misses = 0
+        
+        self._check_latency()
+        return count, tick
+    
+    def _do_reinstall(self):
+        """重装钩子"""
+        try:
+            self._reinstall()
+            self.reinstalls += 1
+            self.last_reinstall_at = time.time()
+        except Exception as e:
+            logger.error(f"钩子重装失败: {e}")
+    
+    def _check_latency(self):
+        """回调耗时过高时告警（每次锁定只告警一次）"""
+        if self._slow_warned or self.latency.count == 0:
+            return
+        
+        p99 = self.latency.percentiles(99)["p99"]
+        if p99 > self.slow_threshold_ms:
+            self._slow_warned = True
+            logger.warning(f"钩子回调耗时过高: p99={p99:.2f}ms，存在被系统移除的风险")
+    
+    def metrics(self) -> Dict[str, float]:
+        """获取监控指标"""
+        data = {
+            "hook_events": self._get_event_count(),
+            "callback_samples": self.latency.count,
+            "callback_max_ms": self.latency.max * 1000,
+            "watchdog_checks": self.checks,
+            "hook_losses": self.hook_losses,
+            "hook_reinstalls": self.reinstalls,
+            "last_reinstall_at": self.last_reinstall_at,
+        }
+        for name, value in self.latency.percentiles(50, 95, 99).items():
+            data[f"callback_{name}_ms"] = value
+        return data
@@ -3,74 +3,120 @@
 整合所有模块，构建完整的应用
 """
 
+import argparse
 import tkinter as tk
 from tkinter import messagebox
 import atexit
 import ctypes
+import time
 
-from .theme import Theme
+from .theme import Theme, Fonts
 from .components.sidebar import Sidebar, SidebarItem
+from .components.scheduler import Priority, get_scheduler
 from .pages.timer_page import TimerPage
 from .pages.lock_page import LockPage
 from .pages.settings_page import SettingsPage
 from .pages.about_page import AboutPage
 
 from ..core.config import ConfigManager
-from ..core.timer import TimerManager
-from ..core.locker import SystemLocker
-from ..core.hotkey import HotkeyManager
-from ..core.tray import TrayManager
-from ..core.autostart import (
-    AutoStartManager, AutoLogonManager, 
-    is_system_boot, remove_boot_startup_args, launch_startup_apps
-)
+from ..core.controller import ControllerFrontend, GuardController
+from ..core.enforcer import EnforcementBackend
+from ..core import metrics
+from ..core.autostart import AutoStartManager, AutoLogonManager
 from ..utils.logger import get_logger
 
 logger = get_logger('app')
 
 
-class ModernApp:
-    """现代化主应用"""
+def _record_phase(phase: str, started: float) -> float:
+    """记录一个启动阶段的耗时，返回当前时间作为下一阶段的起点"""
+    now = time.perf_counter()
+    metrics.gauge("startup_phase_seconds", "界面模式各启动阶段耗时", labels={"phase": phase}).set(now - started)
+    return now
+
+
+class BlockerBackend(EnforcementBackend):
+    """遮挡窗口的强制执行接口：焦点走 Tk 状态，鼠标困禁走 SystemLocker"""
+    
+    def __init__(self, app: "ModernApp"):
+        self.app = app
     
-    def __init__(self, root: tk.Tk):
+    def has_focus(self) -> bool:
+        blocker = self.app.blocker
+        if not blocker:
+            return True
+        try:
+            return blocker.focus_get() is not None
+        except Exception:
+            return False
+    
+    def restore_focus(self):
+        blocker = self.app.blocker
+        if blocker:
+            try:
+                blocker.focus_force()
+            except Exception:
+                pass
+    
+    def is_trapped(self) -> bool:
+        return self.app.core.locker.is_mouse_trapped()
+    
+    def trap(self):
+        self.app.core.locker.trap_mouse()
+    
+    def display_signature(self):
+        # 拓扑缓存版本号仅在显示配置变化时递增，读取不产生 Win32 调用
+        return self.app.core.display.version
+
+
+class ModernApp(ControllerFrontend):
+    """现代化主应用（核心控制器的界面前端）"""
+    
+    has_window = True
+    
+    def __init__(self, root: tk.Tk, launch_args: argparse.Namespace = None):
+        """
+        :param root: Tk 根窗口
+        :param launch_args: 启动参数
+        """
+        started = time.perf_counter()
         self.root = root
         self.root.title("OfficeGuard - 系统优化助手")
-        self.root.configure(bg="#ffffff")
         
         # 初始化管理器
         self.config = ConfigManager()
-        # 强制使用浅色主题
-        self.theme = Theme("light")
-        self.config.set("theme", "light")
-        self.timer = TimerManager()
-        self.locker = SystemLocker()
-        self.hotkey = HotkeyManager()
-        self.tray = TrayManager()
+        self.theme = Theme(self.config.get("theme"))
+        self.theme.configure(self.root, bg=self.theme.bg)
+        self.scheduler = get_scheduler(self.root)
+        self.blockers = []
+        self.blocker = None
+        self.core = GuardController(self, "gui", self.config)
         self.autostart = AutoStartManager()
         self.autologon = AutoLogonManager()
+        started = _record_phase("managers", started)
         
         # 窗口设置
         self._setup_window()
         
         # 创建UI
         self._create_ui()
-        
-        # 设置回调
-        self._setup_callbacks()
+        started = _record_phase("ui", started)
         
         # 启动服务
         self._start_services()
+        _record_phase("services", started)
         
         # 注册退出处理
         atexit.register(self._cleanup)
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
-        # 检查开机启动
-        self._check_boot_startup()
-        
         # 首次运行引导
         if self.config.is_first_run:
             self.root.after(1000, self._show_first_run_guide)
+        
+        # 启动参数中的定时任务
+        if launch_args is not None:
+            self.root.after(200, self.core.apply_launch_args, launch_args)
     
     def _setup_window(self):
         """设置窗口"""
@@ -80,6 +126,9 @@ class ModernApp:
         except:
             pass
         
+        # 命名字体按 DPI 缩放（须在创建控件之前）
+        Fonts.init_scale(self.root)
+        
         # 窗口大小和位置
         w = self.config.get("win_w")
         h = self.config.get("win_h")
@@ -102,7 +151,7 @@ class ModernApp:
     def _create_ui(self):
         """创建用户界面"""
         # 主容器
-        self.main_frame = tk.Frame(self.root, bg=self.theme.bg)
+        self.main_frame = self.theme.create(tk.Frame, self.root, bg=self.theme.bg)
         self.main_frame.pack(fill="both", expand=True)
         
         # 侧边栏
@@ -122,7 +171,7 @@ class ModernApp:
         self.sidebar.pack(side="left", fill="y")
         
         # 内容区域
-        self.content_frame = tk.Frame(self.main_frame, bg=self.theme.bg)
+        self.content_frame = self.theme.create(tk.Frame, self.main_frame, bg=self.theme.bg)
         self.content_frame.pack(side="right", fill="both", expand=True)
         
         # 创建页面
@@ -137,14 +186,14 @@ class ModernApp:
         # 定时任务页面
         self.pages["timer"] = TimerPage(self.content_frame, self.theme)
         self.pages["timer"].set_callbacks(
-            on_start_shutdown=lambda m, g: self._start_timer("shutdown", m, g),
-            on_start_sleep=lambda m, g: self._start_timer("sleep", m, g),
-            on_cancel=self._cancel_timer
+            on_start_shutdown=lambda m, g: self.core.start_timer("shutdown", m, g, save_defaults=True),
+            on_start_sleep=lambda m, g: self.core.start_timer("sleep", m, g, save_defaults=True),
+            on_cancel=self.core.cancel_timer
         )
         
         # 系统保护页面
         self.pages["lock"] = LockPage(self.content_frame, self.theme)
-        self.pages["lock"].set_callbacks(on_lock=self._lock_system)
+        self.pages["lock"].set_callbacks(on_lock=self.core.lock)
         self.pages["lock"].update_hotkey(self.config.get_hotkey_display())
         
         # 设置页面
@@ -153,7 +202,8 @@ class ModernApp:
             on_save_hotkey=self._save_hotkey_settings,
             on_app_autostart_change=self._on_app_autostart_change,
             on_save_autologon=self._save_autologon_settings,
-            on_startup_apps_change=self._save_startup_apps
+            on_startup_apps_change=self._save_startup_apps,
+            on_theme_change=self._on_theme_change
         )
         self._load_settings_page()
         
@@ -172,73 +222,26 @@ class ModernApp:
         """页面切换回调"""
         self._show_page(page_id)
     
-    def _setup_callbacks(self):
-        """设置各模块回调"""
-        # 定时器回调
-        self.timer.set_callbacks(
-            on_tick=self._on_timer_tick,
-            on_grace_tick=self._on_grace_tick,
-            on_complete=self._on_timer_complete,
-            on_cancel=self._on_timer_cancel
-        )
-        
-        # 锁定器回调
-        self.locker.set_callbacks(on_unlock=self._on_unlock)
-        
-        # 快捷键回调
-        self.hotkey.set_callback(on_trigger=self._on_hotkey_trigger)
-        
-        # 托盘回调
-        self.tray.set_callbacks(
-            on_show=self._show_window,
-            on_quit=self._quit_app,
-            on_toggle_hotkey=self._toggle_hotkey
-        )
-    
     def _start_services(self):
         """启动后台服务"""
-        # 配置并启动快捷键
-        self.hotkey.configure(
-            ctrl=self.config.get("hotkey_ctrl"),
-            alt=self.config.get("hotkey_alt"),
-            shift=self.config.get("hotkey_shift"),
-            key=self.config.get("hotkey_key")
-        )
-        self.hotkey.enabled = self.config.get("hotkey_enabled")
-        self.hotkey.start()
+        self.core.start()
         
         # 启动托盘
         self.root.after(100, self._start_tray)
+        
+        # 事件循环延迟探测（由帧调度器每秒至少唤醒一次）
+        self.scheduler.set_probe(1000)
     
     def _start_tray(self):
         """启动系统托盘"""
-        self.tray.start(hotkey_enabled=self.config.get("hotkey_enabled"))
+        self.core.start_tray()
         # 隐藏主窗口
         self.root.withdraw()
         logger.info("应用已最小化到托盘")
     
-    def _check_boot_startup(self):
-        """检查是否是开机启动"""
-        if is_system_boot():
-            logger.info("检测到开机启动")
-            remove_boot_startup_args()
-            
-            # 延迟执行开机任务
-            self.root.after(2000, self._run_boot_tasks)
-    
-    def _run_boot_tasks(self):
-        """执行开机启动任务"""
-        if not self.config.get("autostart_enabled"):
-            return
-        
-        startup_apps = self.config.get("startup_apps")
-        if startup_apps:
-            launched, failed = launch_startup_apps(startup_apps)
-            logger.info(f"开机启动完成: 成功={launched}, 失败={failed}")
-    
     def _show_first_run_guide(self):
         """显示首次运行引导"""
-        self._show_window()
+        self.show_window()
         
         hotkey = self.config.get_hotkey_display()
         msg = (
@@ -259,137 +262,84 @@ class ModernApp:
     
     # ==================== 定时器相关 ====================
     
-    def _start_timer(self, action: str, minutes: float, grace: int):
-        """启动定时器"""
-        if self.timer.start(action, minutes, grace, self.config.get("mouse_threshold")):
-            self.pages["timer"].update_state(True, task_type="关机" if action == "shutdown" else "睡眠")
-            self._timer_loop()
-            
-            # 保存设置
-            self.config.set("timer_minutes", minutes)
-            self.config.set("grace_seconds", grace)
-            self.config.save()
-    
-    def _timer_loop(self):
-        """定时器更新循环"""
-        if not self.timer.running:
-            return
-        
-        running, in_grace = self.timer.update()
-        
-        if running:
-            if in_grace:
-                # 缓冲期
-                if self.timer.update_grace():
-                    # 检测到活动，取消
-                    self._cancel_timer()
-                    messagebox.showinfo("提示", "检测到用户活动，任务已取消", parent=self.root)
-                else:
-                    self.root.after(1000, self._timer_loop)
-            else:
-                self.root.after(500, self._timer_loop)
-    
-    def _cancel_timer(self):
-        """取消定时器"""
-        self.timer.cancel("手动取消")
-        self.pages["timer"].update_state(False)
+    def on_timer_started(self, action: str):
+        """定时任务已启动"""
+        self.pages["timer"].update_state(True, task_type="关机" if action == "shutdown" else "睡眠")
     
-    def _on_timer_tick(self, h: int, m: int, s: int):
+    def on_timer_tick(self, remaining: int, total: int):
         """定时器计时回调"""
-        total = self.timer.total_seconds
-        remaining = self.timer.remaining_seconds
-        progress = remaining / total if total > 0 else 0
-        self.pages["timer"].update_progress(progress, remaining)
+        # 主窗口隐藏时不重绘页面，显示后下一次计时会补上
+        if self.root.state() != "withdrawn":
+            progress = remaining / total if total > 0 else 0
+            self.pages["timer"].update_progress(progress, remaining)
     
-    def _on_grace_tick(self, remaining: int):
+    def on_grace_tick(self, remaining: int):
         """缓冲期计时回调"""
         self.pages["timer"].update_grace(remaining)
         
         # 显示窗口
-        self._show_window()
+        self.show_window()
         self.root.attributes("-topmost", True)
     
-    def _on_timer_complete(self):
-        """定时器完成回调"""
+    def on_timer_stopped(self):
+        """定时器完成或取消回调"""
         self.pages["timer"].update_state(False)
         self.root.attributes("-topmost", False)
     
-    def _on_timer_cancel(self, msg: str):
-        """定时器取消回调"""
-        self.pages["timer"].update_state(False)
-        self.root.attributes("-topmost", False)
+    def on_activity_cancel(self):
+        """缓冲期检测到活动"""
+        messagebox.showinfo("提示", "检测到用户活动，任务已取消", parent=self.root)
     
     # ==================== 锁定相关 ====================
     
-    def _lock_system(self, password: str):
-        """锁定系统"""
-        self.config.set("password", password)
-        self.config.save()
-        
-        if self.locker.lock(password):
-            # 停止热键监听，避免解锁后误触发
-            self.hotkey.stop()
-            self.root.withdraw()
-            self._create_blocker()
-            self._mouse_trap_loop()
-    
-    def _create_blocker(self):
-        """创建遮挡窗口"""
-        user32 = ctypes.windll.user32
-        
-        vx = user32.GetSystemMetrics(76)
-        vy = user32.GetSystemMetrics(77)
-        vw = user32.GetSystemMetrics(78)
-        vh = user32.GetSystemMetrics(79)
-        
-        self.blocker = tk.Toplevel(self.root)
-        self.blocker.geometry(f"{vw}x{vh}+{vx}+{vy}")
-        self.blocker.overrideredirect(True)
-        self.blocker.attributes("-topmost", True)
-        self.blocker.configure(bg="black", cursor="none")
-        self.blocker.attributes("-alpha", 0.01)
-        self.blocker.bind("<Key>", lambda e: "break")
-        self.blocker.focus_force()
-        
-        self._focus_loop()
-    
-    def _focus_loop(self):
-        """保持焦点循环"""
-        if self.locker.is_locked and hasattr(self, 'blocker') and self.blocker:
+    def on_locked(self):
+        """锁定：隐藏主窗口并创建遮挡窗口"""
+        self.root.withdraw()
+        self._layout_blockers()
+    
+    def _layout_blockers(self):
+        """
+        按显示器拓扑布置遮挡窗口
+        
+        虚拟屏幕空白区域较多时每个显示器一个窗口，否则一个窗口覆盖整个虚拟屏幕；
+        第一个窗口负责持有焦点
+        """
+        self._destroy_blockers()
+        
+        for rect in self.core.display.get().blocker_rects():
+            win = tk.Toplevel(self.root)
+            win.geometry(rect.geometry)
+            win.overrideredirect(True)
+            win.attributes("-topmost", True)
+            win.configure(bg="black", cursor="none")
+            win.attributes("-alpha", 0.01)
+            win.bind("<Key>", lambda e: "break")
+            self.blockers.append(win)
+        
+        self.blocker = self.blockers[0] if self.blockers else None
+        if self.blocker:
+            # 焦点丢失时立即抢回，轮询只作兜底
+            self.blocker.bind("<FocusOut>", lambda e: self.root.after_idle(self.core.enforcer.notify_focus_lost))
+    
+    def _destroy_blockers(self):
+        """销毁所有遮挡窗口"""
+        for win in self.blockers:
             try:
-                self.blocker.focus_force()
+                win.destroy()
             except:
                 pass
-            self.root.after(200, self._focus_loop)
+        self.blockers = []
+        self.blocker = None
     
-    def _mouse_trap_loop(self):
-        """鼠标困禁循环"""
-        if self.locker.is_locked:
-            self.locker.trap_mouse()
-            self.root.after(500, self._mouse_trap_loop)
+    def on_display_change(self):
+        """显示配置变化：重新布置遮挡窗口并抢回焦点"""
+        if self.blockers:
+            self._layout_blockers()
+            self.core.enforcer.notify_focus_lost()
     
-    def _on_unlock(self):
+    def on_unlocked(self):
         """解锁回调"""
-        if hasattr(self, 'blocker') and self.blocker:
-            try:
-                self.blocker.destroy()
-            except:
-                pass
-            self.blocker = None
-        
-        # 恢复热键监听
-        if self.config.get("hotkey_enabled"):
-            self.hotkey.start()
-        
-        logger.info("系统已解锁")
-    
-    def _on_hotkey_trigger(self):
-        """快捷键触发回调"""
-        if self.locker.is_locked:
-            return
-        
-        password = self.config.get("password")
-        self.root.after(0, lambda: self._lock_system(password))
+        self._destroy_blockers()
     
     # ==================== 设置相关 ====================
     
@@ -405,29 +355,31 @@ class ModernApp:
             autologon_enabled=self.config.get("autologon_enabled"),
             autologon_username=self.config.get("autologon_username"),
             autologon_domain=self.config.get("autologon_domain"),
-            startup_apps=self.config.get("startup_apps")
+            startup_apps=self.config.get("startup_apps"),
+            dark_mode=self.theme.mode == "dark"
         )
     
     def _save_hotkey_settings(self, enabled: bool, ctrl: bool, alt: bool, shift: bool, key: str):
         """保存快捷键设置"""
-        self.config.set("hotkey_enabled", enabled)
-        self.config.set("hotkey_ctrl", ctrl)
-        self.config.set("hotkey_alt", alt)
-        self.config.set("hotkey_shift", shift)
-        self.config.set("hotkey_key", key)
-        self.config.save()
-        
-        # 重新配置快捷键
-        self.hotkey.stop()
-        self.hotkey.configure(ctrl, alt, shift, key)
-        self.hotkey.enabled = enabled
-        self.hotkey.start()
-        
-        # 更新显示
-        self.pages["lock"].update_hotkey(self.config.get_hotkey_display())
-        
+        self.core.set_hotkey(enabled, ctrl, alt, shift, key)
         messagebox.showinfo("成功", f"快捷键已更新为：{self.config.get_hotkey_display()}", parent=self.root)
     
+    def _on_theme_change(self, dark: bool):
+        """深色模式开关回调"""
+        self._apply_theme("dark" if dark else "light")
+        self.config.set("theme", self.theme.mode)
+        self.config.save()
+    
+    def _apply_theme(self, mode: str):
+        """切换主题：只重新配置已登记且颜色变化的控件，不重建页面"""
+        started = time.perf_counter()
+        count = self.theme.set_mode(mode)
+        if count:
+            logger.info(
+                f"主题已切换为 {self.theme.mode}，更新 {count} 个控件，"
+                f"耗时 {(time.perf_counter() - started) * 1000:.1f}ms"
+            )
+    
     def _on_app_autostart_change(self, enabled: bool):
         """开机自启动开关回调"""
         def task():
@@ -450,7 +402,7 @@ class ModernApp:
         
         import threading
         threading.Thread(target=task, daemon=True).start()
-
+    
     def _save_autologon_settings(self, enabled: bool, username: str, password: str, domain: str):
         """保存自动登录设置"""
         if enabled:
@@ -487,23 +439,40 @@ class ModernApp:
         self.config.set("startup_apps", apps)
         self.config.save()
     
-    def _toggle_hotkey(self):
-        """切换快捷键状态"""
-        enabled = not self.config.get("hotkey_enabled")
-        self.config.set("hotkey_enabled", enabled)
-        self.config.save()
-        
-        self.hotkey.enabled = enabled
-        if enabled:
-            self.hotkey.start()
-        else:
-            self.hotkey.stop()
-        
-        logger.info(f"快捷键已{'启用' if enabled else '禁用'}")
+    def on_hotkey_changed(self):
+        """快捷键配置变化：更新锁定页面的显示"""
+        self.pages["lock"].update_hotkey(self.config.get_hotkey_display())
+    
+    def on_config_reloaded(self):
+        """配置文件已重新加载"""
+        self._apply_theme(self.config.get("theme"))
+    
+    # ==================== 前端接口 ====================
+    
+    def post(self, func, *args):
+        self.root.after(0, func, *args)
+    
+    def call_later(self, delay_ms: int, func, background: bool = False):
+        return self.scheduler.call_later(
+            delay_ms, func, priority=Priority.LOW if background else Priority.HIGH
+        )
+    
+    def cancel_call(self, handle):
+        self.scheduler.cancel(handle)
+    
+    def create_enforcement_backend(self, controller: GuardController) -> EnforcementBackend:
+        return BlockerBackend(self)
+    
+    def quit(self):
+        self._quit_app()
+    
+    def on_second_launch(self):
+        # 用户再次打开程序：显示已运行实例的窗口
+        self.show_window()
     
     # ==================== 窗口管理 ====================
     
-    def _show_window(self):
+    def show_window(self):
         """显示主窗口"""
         self.root.deiconify()
         self.root.lift()
@@ -511,7 +480,7 @@ class ModernApp:
     
     def _on_close(self):
         """窗口关闭事件"""
-        if self.locker.is_locked:
+        if self.core.locker.is_locked:
             return
         
         # 隐藏到托盘
@@ -519,7 +488,7 @@ class ModernApp:
     
     def _quit_app(self):
         """退出应用"""
-        if self.locker.is_locked:
+        if self.core.locker.is_locked:
             return
         
         self._cleanup()
@@ -527,21 +496,12 @@ class ModernApp:
     
     def _cleanup(self):
         """清理资源"""
-        logger.info("正在清理资源...")
-        
-        # 停止定时器
-        if self.timer.running:
-            self.timer.cancel("程序退出")
-        
-        # 解锁系统
-        if self.locker.is_locked:
-            self.locker.cleanup()
-        
-        # 停止快捷键
-        self.hotkey.stop()
+        # 退出菜单与 atexit 都会调用，只执行一次
+        atexit.unregister(self._cleanup)
+        self.core.shutdown()
         
-        # 停止托盘
-        self.tray.stop()
+        # 停止帧调度
+        self.scheduler.destroy()
         
         # 保存窗口位置
         try:
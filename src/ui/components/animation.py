@@ -0,0 +1,124 @@
+"""
+动画时钟组件
+所有动画控件共用一条 after 链，按固定帧率只驱动可见且正在播放的动画
+"""
+
+import tkinter as tk
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict
+from .scheduler import Priority, get_scheduler
+
+
+class FrameClock:
+    """
+    共享动画时钟
+    
+    没有活动动画时不调度任何 after；每帧依次调用已注册的回调，
+    回调抛出 TclError（控件已销毁）时自动移除
+    """
+    
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], Any],
+        cancel: Callable[[Any], None],
+        fps: int = 20
+    ):
+        """
+        :param schedule: 延迟调度函数 (毫秒, 回调) -> 句柄，如 FrameScheduler.at_priority(...)
+        :param cancel: 取消调度函数，如 FrameScheduler.cancel
+        :param fps: 帧率
+        """
+        self._schedule = schedule
+        self._cancel = cancel
+        self.interval = max(1, 1000 // fps)
+        self._callbacks: Dict[Callable[[], None], None] = {}
+        self._after_id = None
+        
+        # 统计
+        self.wakeups = 0
+        self.frames = 0
+    
+    def add(self, callback: Callable[[], None]):
+        """注册每帧回调（重复注册无效）"""
+        self._callbacks[callback] = None
+        if self._after_id is None:
+            self._after_id = self._schedule(self.interval, self._tick)
+    
+    def remove(self, callback: Callable[[], None]):
+        """移除回调；没有活动动画时停止调度"""
+        self._callbacks.pop(callback, None)
+        if not self._callbacks and self._after_id is not None:
+            self._cancel(self._after_id)
+            self._after_id = None
+    
+    @property
+    def active(self) -> int:
+        return len(self._callbacks)
+    
+    def _tick(self):
+        """一帧"""
+        self._after_id = None
+        self.wakeups += 1
+        
+        for callback in list(self._callbacks):
+            try:
+                callback()
+                self.frames += 1
+            except tk.TclError:
+                self._callbacks.pop(callback, None)
+        
+        if self._callbacks:
+            self._after_id = self._schedule(self.interval, self._tick)
+
+
+def get_frame_clock(widget: tk.Misc) -> FrameClock:
+    """获取控件所在窗口的共享动画时钟（经帧调度器以普通优先级调度）"""
+    root = widget._root()
+    clock = getattr(root, "_frame_clock", None)
+    if clock is None:
+        scheduler = get_scheduler(root)
+        clock = FrameClock(scheduler.at_priority(Priority.NORMAL), scheduler.cancel)
+        root._frame_clock = clock
+    return clock
+
+
+class Animated(ABC):
+    """
+    动画控件混入类
+    
+    start() 后只在控件映射（可见）期间由共享时钟驱动 _on_frame，
+    隐藏时自动暂停，重新显示后继续；重复 start() 不会叠加调度
+    """
+    
+    def _init_animation(self):
+        self._playing = False
+        self._clock = get_frame_clock(self)
+        self.bind("<Map>", self._on_map, add="+")
+        self.bind("<Unmap>", self._on_unmap, add="+")
+        self.bind("<Destroy>", self._on_unmap, add="+")
+    
+    def start(self):
+        """开始动画"""
+        self._playing = True
+        if self.winfo_ismapped():
+            self._clock.add(self._on_frame)
+    
+    def stop(self):
+        """停止动画"""
+        self._playing = False
+        self._clock.remove(self._on_frame)
+    
+    @property
+    def playing(self) -> bool:
+        return self._playing
+    
+    def _on_map(self, event=None):
+        if self._playing:
+            self._clock.add(self._on_frame)
+    
+    def _on_unmap(self, event=None):
+        self._clock.remove(self._on_frame)
+    
+    @abstractmethod
+    def _on_frame(self):
+        """每帧调用，由子类实现"""
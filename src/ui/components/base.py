@@ -16,6 +16,7 @@ class ModernFrame(tk.Frame):
         bg = kwargs.pop('bg', theme.bg)
         super().__init__(parent, bg=bg, **kwargs)
         self.theme = theme
+        theme.register(self, bg=bg)
 
 
 class ModernLabel(tk.Label):
@@ -35,14 +36,22 @@ class ModernLabel(tk.Label):
         
         fg = kwargs.pop('fg', fg_map.get(variant, theme.fg))
         bg = kwargs.pop('bg', theme.bg)
-        font = kwargs.pop('font', (theme.fonts.FAMILY, theme.fonts.BASE))
+        font = kwargs.pop('font', theme.font(theme.fonts.BASE))
         
         super().__init__(parent, fg=fg, bg=bg, font=font, **kwargs)
         self.theme = theme
+        theme.register(self, fg=fg, bg=bg)
 
 
-class ModernButton(tk.Frame):
-    """现代化按钮 - 简洁风格"""
+class ModernButton(tk.Label):
+    """
+    现代化按钮 - 简洁风格
+    
+    单个 Label 绘制背景、文字与边框（outline 变体用 highlightthickness 作 1px 边框）；
+    悬浮与点击通过所有按钮共用的 bindtag 处理，每个 Tk 解释器只注册一次
+    """
+    
+    BINDTAG = "ModernButton"
     
     def __init__(
         self,
@@ -55,8 +64,6 @@ class ModernButton(tk.Frame):
         height: int = 36,
         **kwargs
     ):
-        super().__init__(parent, bg=theme.bg, **kwargs)
-        
         self.theme = theme
         self.text = text
         self.command = command
@@ -68,8 +75,43 @@ class ModernButton(tk.Frame):
         # 获取颜色
         self._setup_colors()
         
-        # 创建按钮
-        self._create_button(width)
+        border = 1 if variant == "outline" else 0
+        super().__init__(
+            parent,
+            text=text,
+            font=theme.font(theme.fonts.BASE),
+            fg=self.fg_color,
+            bg=self.current_bg,
+            cursor="hand2",
+            padx=16,
+            pady=8,
+            bd=0,
+            highlightthickness=border,
+            highlightbackground=theme.border,
+            highlightcolor=theme.border,
+            **kwargs
+        )
+        self.label = self
+        
+        # 固定宽度（像素）：借助 1x1 透明图片让 width 以像素计
+        if width:
+            self._pixel = tk.PhotoImage(width=1, height=1)
+            super().configure(
+                image=self._pixel,
+                compound="center",
+                width=max(1, width - 32 - 2 * border)
+            )
+        
+        # 悬浮时需要重新着色的控件（预先确定，悬浮切换时不遍历子控件）
+        self._hover_targets = (self,)
+        
+        # 颜色随悬浮/启用状态变化，主题切换时整体重新着色
+        theme.register(self, on_change=ModernButton._on_theme_change)
+        
+        # 事件：插入共用的 bindtag，而不是逐个按钮绑定
+        self._install_class_bindings()
+        tags = self.bindtags()
+        self.bindtags(tags[:1] + (self.BINDTAG,) + tags[1:])
     
     def _setup_colors(self):
         """设置按钮颜色"""
@@ -91,126 +133,53 @@ class ModernButton(tk.Frame):
         )
         self.current_bg = self.bg_color
     
-    def _create_button(self, width):
-        """创建按钮"""
-        # 边框容器 (用于 outline 变体)
-        if self.variant == "outline":
-            self.border_frame = tk.Frame(self, bg=self.theme.border)
-            self.border_frame.pack(fill="both", expand=True)
-            container = self.border_frame
-            pad = 1
-        else:
-            container = self
-            pad = 0
-        
-        # 按钮主体
-        self.btn_bg = tk.Frame(container, bg=self.current_bg)
-        if pad:
-            self.btn_bg.pack(fill="both", expand=True, padx=pad, pady=pad)
-        else:
-            self.btn_bg.pack(fill="both", expand=True)
-        
-        # 内容
-        content_frame = tk.Frame(self.btn_bg, bg=self.current_bg)
-        content_frame.pack(expand=True)
-        
-        # 文字
-        self.label = tk.Label(
-            content_frame,
-            text=self.text,
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.BASE),
-            fg=self.fg_color,
-            bg=self.current_bg,
-            cursor="hand2"
+    def _on_theme_change(self):
+        """主题切换后按当前状态重新着色"""
+        self._setup_colors()
+        if self._hover:
+            self.current_bg = self.hover_color
+        super().configure(
+            fg=self.fg_color if self._enabled else self.theme.muted,
+            highlightbackground=self.theme.border,
+            highlightcolor=self.theme.border
         )
-        self.label.pack(pady=8, padx=16)
-        
-        # 设置宽度
-        if width:
-            self.configure(width=width)
-            self.btn_bg.configure(width=width - 2 if self.variant == "outline" else width)
-        
-        self.configure(height=self._height)
-        
-        # 绑定事件 - 使用统一的检测方法
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
-        
-        # 所有子组件都绑定点击事件
-        for widget in [self, self.btn_bg, content_frame, self.label]:
-            widget.bind("<Button-1>", self._on_click)
+        self._paint(self.current_bg)
     
-    def _on_enter(self, event):
-        """鼠标进入按钮区域"""
-        if not self._enabled:
+    def _install_class_bindings(self):
+        """为共用的 bindtag 注册事件（每个解释器一次）"""
+        root = self._root()
+        if getattr(root, "_modern_button_bound", False):
             return
-        # 取消任何待处理的离开检测
-        if hasattr(self, '_leave_after_id') and self._leave_after_id:
-            self.after_cancel(self._leave_after_id)
-            self._leave_after_id = None
-        
-        # 只有真正需要改变时才更新
-        if not self._hover:
+        root._modern_button_bound = True
+        
+        def dispatch(handler):
+            def callback(event):
+                widget = event.widget
+                if isinstance(widget, ModernButton):
+                    handler(widget, event)
+            return callback
+        
+        self.bind_class(self.BINDTAG, "<Enter>", dispatch(ModernButton._on_enter))
+        self.bind_class(self.BINDTAG, "<Leave>", dispatch(ModernButton._on_leave))
+        self.bind_class(self.BINDTAG, "<Button-1>", dispatch(ModernButton._on_click))
+    
+    def _on_enter(self, event):
+        """鼠标进入按钮"""
+        if self._enabled and not self._hover:
             self._hover = True
-            self._apply_hover_style()
+            self._paint(self.hover_color)
     
     def _on_leave(self, event):
-        """鼠标离开按钮区域"""
-        if not self._enabled:
-            return
-        # 使用延迟检测，避免在子组件间移动时抖动
-        if hasattr(self, '_leave_after_id') and self._leave_after_id:
-            self.after_cancel(self._leave_after_id)
-        self._leave_after_id = self.after(30, self._check_leave)
-    
-    def _check_leave(self):
-        """延迟检查是否真的离开了按钮"""
-        self._leave_after_id = None
-        if not self._enabled:
-            return
-        
-        # 检查鼠标是否真的离开了整个按钮区域
-        try:
-            x, y = self.winfo_pointerxy()
-            bx = self.winfo_rootx()
-            by = self.winfo_rooty()
-            bw = self.winfo_width()
-            bh = self.winfo_height()
-            
-            # 如果鼠标仍在按钮范围内，不处理
-            if bx <= x < bx + bw and by <= y < by + bh:
-                return
-        except:
-            pass
-        
-        # 只有真正需要改变时才更新
+        """鼠标离开按钮（按钮没有子控件，Leave 即真正离开，无需查询指针位置）"""
         if self._hover:
             self._hover = False
-            self._apply_normal_style()
+            self._paint(self.bg_color)
     
-    def _apply_hover_style(self):
-        """应用悬浮样式"""
-        self.current_bg = self.hover_color
-        self.btn_bg.configure(bg=self.current_bg)
-        for child in self.btn_bg.winfo_children():
-            try:
-                child.configure(bg=self.current_bg)
-                for subchild in child.winfo_children():
-                    subchild.configure(bg=self.current_bg)
-            except:
-                pass
-    
-    def _apply_normal_style(self):
-        """应用普通样式"""
-        self.current_bg = self.bg_color
-        self.btn_bg.configure(bg=self.current_bg)
-        for child in self.btn_bg.winfo_children():
-            try:
-                child.configure(bg=self.current_bg)
-                for subchild in child.winfo_children():
-                    subchild.configure(bg=self.current_bg)
-            except:
-                pass
+    def _paint(self, bg: str):
+        """更新背景色"""
+        self.current_bg = bg
+        for widget in self._hover_targets:
+            widget.configure(bg=bg)
     
     def _on_click(self, event):
         """点击事件"""
@@ -220,10 +189,10 @@ class ModernButton(tk.Frame):
     def set_enabled(self, enabled: bool):
         """设置启用状态"""
         self._enabled = enabled
-        if enabled:
-            self.label.configure(fg=self.fg_color)
-        else:
-            self.label.configure(fg=self.theme.muted)
+        if not enabled and self._hover:
+            self._hover = False
+            self._paint(self.bg_color)
+        super().configure(fg=self.fg_color if enabled else self.theme.muted)
     
     def configure(self, **kwargs):
         """配置按钮属性（兼容 state 选项）"""
@@ -235,7 +204,7 @@ class ModernButton(tk.Frame):
     def set_text(self, text: str):
         """设置按钮文字"""
         self.text = text
-        self.label.configure(text=text)
+        super().configure(text=text)
 
 
 class EyeIcon(tk.Canvas):
@@ -248,16 +217,17 @@ class EyeIcon(tk.Canvas):
         self.command = command
         self._size = size
         self._is_visible = False
+        theme.register(self, on_change=EyeIcon.draw, bg=bg)
         
         self.bind("<Button-1>", lambda e: command())
         self.bind("<Enter>", lambda e: self.configure(cursor="hand2"))
         self.bind("<Leave>", lambda e: self.configure(cursor=""))
         self.draw()
-
+    
     def set_state(self, is_visible: bool):
         self._is_visible = is_visible
         self.draw()
-
+    
     def draw(self):
         self.delete("all")
         w, h = self._size, self._size
@@ -279,7 +249,11 @@ class EyeIcon(tk.Canvas):
 
 
 class ModernEntry(tk.Frame):
-    """现代化输入框 - 简洁风格"""
+    """
+    现代化输入框 - 简洁风格
+    
+    外框 Frame 同时绘制边框（highlightthickness）与输入区背景，内部只有输入框（和密码切换图标）
+    """
     
     def __init__(
         self,
@@ -290,27 +264,33 @@ class ModernEntry(tk.Frame):
         width: int = 200,
         **kwargs
     ):
-        super().__init__(parent, bg=theme.bg, **kwargs)
+        super().__init__(
+            parent,
+            bg=theme.colors.input_bg,
+            highlightthickness=1,
+            highlightbackground=theme.border,
+            highlightcolor=theme.border,
+            **kwargs
+        )
         
         self.theme = theme
+        theme.register(
+            self,
+            bg=theme.colors.input_bg,
+            highlightbackground=theme.border,
+            highlightcolor=theme.border
+        )
         self.placeholder = placeholder
         self._show_char = show
         self._has_focus = False
         self._has_content = False
         self._is_visible = False # 密码是否可见
         
-        # 边框容器
-        self.border_frame = tk.Frame(self, bg=theme.border)
-        self.border_frame.pack(fill="both", expand=True)
-        
-        # 内部容器
-        self.inner = tk.Frame(self.border_frame, bg=theme.colors.input_bg)
-        self.inner.pack(fill="both", expand=True, padx=1, pady=1)
-        
         # 输入框
-        self.entry = tk.Entry(
-            self.inner,
-            font=(theme.fonts.FAMILY, theme.fonts.BASE),
+        self.entry = theme.create(
+            tk.Entry,
+            self,
+            font=theme.font(theme.fonts.BASE),
             fg=theme.fg,
             bg=theme.colors.input_bg,
             insertbackground=theme.fg,
@@ -323,7 +303,7 @@ class ModernEntry(tk.Frame):
         # 密码可见性切换按钮
         if show:
             self.eye_icon = EyeIcon(
-                self.inner,
+                self,
                 theme,
                 command=self._toggle_visibility,
                 bg=theme.colors.input_bg
@@ -343,12 +323,12 @@ class ModernEntry(tk.Frame):
         self._is_visible = not self._is_visible
         self.eye_icon.set_state(self._is_visible)
         self._update_show_char()
-        
+    
     def _update_show_char(self):
         """更新显示字符"""
         if not self._show_char:
             return
-            
+        
         if not self._has_content and not self._has_focus:
             # 显示占位符时，不隐藏
             self.entry.configure(show="")
@@ -365,25 +345,25 @@ class ModernEntry(tk.Frame):
             self.entry.delete(0, tk.END)
             self.entry.configure(show="") # 占位符始终可见
             self.entry.insert(0, self.placeholder)
-            self.entry.configure(fg=self.theme.muted)
+            self.theme.configure(self.entry, fg=self.theme.muted)
     
     def _hide_placeholder(self):
         """隐藏占位符"""
         if self.entry.get() == self.placeholder:
             self.entry.delete(0, tk.END)
-            self.entry.configure(fg=self.theme.fg)
+            self.theme.configure(self.entry, fg=self.theme.fg)
             self._update_show_char()
     
     def _on_focus_in(self, event):
         """获得焦点"""
         self._has_focus = True
-        self.border_frame.configure(bg=self.theme.colors.input_focus)
+        self.theme.configure(self, highlightbackground=self.theme.colors.input_focus)
         self._hide_placeholder()
     
     def _on_focus_out(self, event):
         """失去焦点"""
         self._has_focus = False
-        self.border_frame.configure(bg=self.theme.border)
+        self.theme.configure(self, highlightbackground=self.theme.border)
         self._has_content = bool(self.entry.get())
         if not self._has_content:
             self._show_placeholder()
@@ -410,7 +390,7 @@ class ModernEntry(tk.Frame):
         self.entry.delete(0, tk.END)
         if value:
             self._has_content = True
-            self.entry.configure(fg=self.theme.fg)
+            self.theme.configure(self.entry, fg=self.theme.fg)
             self._update_show_char()
             self.entry.insert(0, value)
         else:
@@ -426,7 +406,7 @@ class ModernEntry(tk.Frame):
         if index == 0 and not self._has_content:
             self._hide_placeholder()
         self._has_content = True
-        self.entry.configure(fg=self.theme.fg)
+        self.theme.configure(self.entry, fg=self.theme.fg)
         self._update_show_char()
         self.entry.insert(index, value)
     
@@ -450,26 +430,29 @@ class ModernCheckbox(tk.Frame):
         command: Callable = None,
         **kwargs
     ):
-        # 确定父组件的背景色
-        parent_bg = theme.bg
-        try:
-            parent_bg = parent.cget('bg')
-        except:
-            pass
+        # 确定父组件的背景色（优先取父组件登记的主题颜色，以便随主题切换）
+        parent_bg = theme.color_of(parent, 'bg')
+        if parent_bg is None:
+            try:
+                parent_bg = parent.cget('bg')
+            except:
+                parent_bg = theme.bg
         
         super().__init__(parent, bg=parent_bg, **kwargs)
         
         self.theme = theme
+        theme.register(self, bg=parent_bg)
         self.command = command
         self._value = tk.BooleanVar(value=value)
         self._parent_bg = parent_bg
         
         # 复选框 - selectcolor 使用白色背景确保可见
-        self.cb = tk.Checkbutton(
+        self.cb = theme.create(
+            tk.Checkbutton,
             self,
             text=text,
             variable=self._value,
-            font=(theme.fonts.FAMILY, theme.fonts.BASE),
+            font=theme.font(theme.fonts.BASE),
             fg=theme.fg,
             bg=parent_bg,
             activebackground=parent_bg,
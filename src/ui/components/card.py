@@ -8,7 +8,12 @@ from ..theme import Theme
 
 
 class Card(tk.Frame):
-    """现代化卡片组件 - 简洁边框风格"""
+    """
+    现代化卡片组件 - 简洁边框风格
+    
+    边框与背景由同一个 Frame 绘制（highlightthickness 作边框，padx/pady 作内边距），
+    卡片本身就是内容区域
+    """
     
     def __init__(
         self,
@@ -19,46 +24,43 @@ class Card(tk.Frame):
         padding: int = 24,
         **kwargs
     ):
-        super().__init__(parent, bg=theme.bg, **kwargs)
+        super().__init__(
+            parent,
+            bg=theme.card,
+            highlightthickness=1,
+            highlightbackground=theme.border,
+            highlightcolor=theme.border,
+            padx=padding,
+            pady=padding,
+            **kwargs
+        )
         self.theme = theme
-        
-        # 边框容器
-        self.border = tk.Frame(self, bg=theme.border)
-        self.border.pack(fill="both", expand=True)
-        
-        # 内容容器
-        self.container = tk.Frame(self.border, bg=theme.card)
-        self.container.pack(fill="both", expand=True, padx=1, pady=1)
-        
-        # 内边距
-        self.inner = tk.Frame(self.container, bg=theme.card)
-        self.inner.pack(fill="both", expand=True, padx=padding, pady=padding)
+        theme.register(self, bg=theme.card, highlightbackground=theme.border, highlightcolor=theme.border)
         
         # 标题区域
         if title:
-            header = tk.Frame(self.inner, bg=theme.card)
-            header.pack(fill="x", pady=(0, 16))
-            
-            tk.Label(
-                header,
+            title_label = theme.create(
+                tk.Label,
+                self,
                 text=title,
-                font=(theme.fonts.FAMILY, 14, "bold"),
+                font=theme.font(14, "bold"),
                 fg=theme.fg,
                 bg=theme.card
-            ).pack(anchor="w")
+            )
+            title_label.pack(anchor="w", pady=(0, 0 if description else 16))
             
             if description:
-                tk.Label(
-                    header,
+                theme.create(
+                    tk.Label,
+                    self,
                     text=description,
-                    font=(theme.fonts.FAMILY, 11),
+                    font=theme.font(11),
                     fg=theme.muted,
                     bg=theme.card
-                ).pack(anchor="w", pady=(4, 0))
+                ).pack(anchor="w", pady=(4, 16))
         
         # 内容区域
-        self.content = tk.Frame(self.inner, bg=theme.card)
-        self.content.pack(fill="both", expand=True)
+        self.content = self
     
     def get_content_frame(self) -> tk.Frame:
         """获取内容区域 Frame"""
@@ -78,20 +80,23 @@ class SectionHeader(tk.Frame):
     ):
         super().__init__(parent, bg=theme.bg, **kwargs)
         self.theme = theme
+        theme.register(self, bg=theme.bg)
         
-        tk.Label(
+        theme.create(
+            tk.Label,
             self,
             text=title,
-            font=(theme.fonts.FAMILY, 14, "bold"),
+            font=theme.font(14, "bold"),
             fg=theme.fg,
             bg=theme.bg
         ).pack(anchor="w")
         
         if description:
-            tk.Label(
+            theme.create(
+                tk.Label,
                 self,
                 text=description,
-                font=(theme.fonts.FAMILY, 11),
+                font=theme.font(11),
                 fg=theme.muted,
                 bg=theme.bg
             ).pack(anchor="w", pady=(2, 0))
@@ -102,6 +107,7 @@ class Separator(tk.Frame):
     
     def __init__(self, parent, theme: Theme, **kwargs):
         super().__init__(parent, bg=theme.border, height=1, **kwargs)
+        theme.register(self, bg=theme.border)
 
 
 class Badge(tk.Frame):
@@ -117,6 +123,7 @@ class Badge(tk.Frame):
     ):
         super().__init__(parent, bg=theme.bg, **kwargs)
         self.theme = theme
+        theme.register(self, bg=theme.bg)
         
         # 颜色映射
         color_map = {
@@ -130,10 +137,11 @@ class Badge(tk.Frame):
         bg_color, fg_color = color_map.get(variant, color_map["default"])
         
         # 标签
-        self.label = tk.Label(
+        self.label = theme.create(
+            tk.Label,
             self,
             text=text,
-            font=("Segoe UI", 9),
+            font=theme.font(9, family="Segoe UI"),
             fg=fg_color,
             bg=bg_color,
             padx=8,
@@ -156,6 +164,7 @@ class Alert(tk.Frame):
     ):
         super().__init__(parent, bg=theme.bg, **kwargs)
         self.theme = theme
+        theme.register(self, bg=theme.bg)
         
         # 颜色映射
         color_map = {
@@ -168,29 +177,31 @@ class Alert(tk.Frame):
         accent_color, bg_color = color_map.get(variant, color_map["info"])
         
         # 左侧强调条
-        accent = tk.Frame(self, bg=accent_color, width=4)
+        accent = theme.create(tk.Frame, self, bg=accent_color, width=4)
         accent.pack(side="left", fill="y")
         
         # 内容区域
-        content = tk.Frame(self, bg=bg_color)
+        content = theme.create(tk.Frame, self, bg=bg_color)
         content.pack(side="left", fill="both", expand=True)
         
-        inner = tk.Frame(content, bg=bg_color)
+        inner = theme.create(tk.Frame, content, bg=bg_color)
         inner.pack(fill="both", expand=True, padx=16, pady=12)
         
         if title:
-            tk.Label(
+            theme.create(
+                tk.Label,
                 inner,
                 text=title,
-                font=("Segoe UI Semibold", 10),
+                font=theme.font(10, family="Segoe UI Semibold"),
                 fg=theme.fg,
                 bg=bg_color
             ).pack(anchor="w")
         
-        tk.Label(
+        theme.create(
+            tk.Label,
             inner,
             text=message,
-            font=("Segoe UI", 10),
+            font=theme.font(10, family="Segoe UI"),
             fg=theme.fg2,
             bg=bg_color,
             wraplength=400,
@@ -6,6 +6,7 @@
 import tkinter as tk
 import math
 from typing import Optional
+from .animation import Animated
 from ..theme import Theme
 
 
@@ -42,6 +43,7 @@ class CircularProgress(tk.Canvas):
         self._text = ""
         self._subtext = ""
         self._bg_color = bg_color
+        theme.register(self, on_change=CircularProgress._draw, bg=bg_color)
         
         self._draw()
     
@@ -73,7 +75,7 @@ class CircularProgress(tk.Canvas):
                 self.create_text(
                     center, center - 10,
                     text=self._text,
-                    font=(self.theme.fonts.FAMILY, 36, "bold"),
+                    font=self.theme.font(36, "bold"),
                     fill=self.theme.fg
                 )
             else:
@@ -82,7 +84,7 @@ class CircularProgress(tk.Canvas):
                 self.create_text(
                     center, center - 10,
                     text=f"{percent}%",
-                    font=(self.theme.fonts.FAMILY, 32, "bold"),
+                    font=self.theme.font(32, "bold"),
                     fill=self.theme.fg
                 )
             
@@ -91,7 +93,7 @@ class CircularProgress(tk.Canvas):
                 self.create_text(
                     center, center + 32,
                     text=self._subtext,
-                    font=(self.theme.fonts.FAMILY, 12),
+                    font=self.theme.font(12),
                     fill=self.theme.muted
                 )
     
@@ -138,7 +140,7 @@ class CircularProgress(tk.Canvas):
     def configure_bg(self, bg: str):
         """配置背景色"""
         self._bg_color = bg
-        self.configure(bg=bg)
+        self.theme.configure(self, bg=bg)
         self._draw()
 
 
@@ -158,18 +160,19 @@ class LinearProgress(tk.Frame):
         super().__init__(parent, bg=theme.bg, **kwargs)
         
         self.theme = theme
+        theme.register(self, bg=theme.bg)
         self._value = value
         self._max_value = max_value
         self._width = width
         self._height = height
         
         # 背景轨道
-        self.track = tk.Frame(self, bg=theme.bg3, height=height)
+        self.track = theme.create(tk.Frame, self, bg=theme.bg3, height=height)
         self.track.pack(fill="x")
         self.track.pack_propagate(False)
         
         # 进度条
-        self.bar = tk.Frame(self.track, bg=theme.fg, height=height)
+        self.bar = theme.create(tk.Frame, self.track, bg=theme.fg, height=height)
         self.bar.place(x=0, y=0, relheight=1)
         
         self._update()
@@ -185,8 +188,11 @@ class LinearProgress(tk.Frame):
         self._update()
 
 
-class Spinner(tk.Canvas):
-    """加载动画"""
+class Spinner(Animated, tk.Canvas):
+    """加载动画（保留弧线图元，由共享动画时钟驱动，只修改起始角度）"""
+    
+    # 每帧旋转角度
+    STEP = 10
     
     def __init__(
         self,
@@ -208,42 +214,24 @@ class Spinner(tk.Canvas):
         self.theme = theme
         self._size = size
         self._angle = 0
-        self._running = False
-        
-        self._draw()
-    
-    def _draw(self):
-        """绘制加载动画"""
-        self.delete("all")
         
-        center = self._size // 2
-        radius = self._size // 2 - 3
-        
-        # 绘制弧线
-        self.create_arc(
+        self._arc = self.create_arc(
             3, 3,
-            self._size - 3, self._size - 3,
+            size - 3, size - 3,
             start=self._angle,
             extent=270,
-            outline=self.theme.fg,
+            outline=theme.fg,
             width=2,
             style="arc"
         )
+        theme.register(self, on_change=Spinner._on_theme_change, bg=bg_color)
+        self._init_animation()
     
-    def start(self):
-        """开始动画"""
-        self._running = True
-        self._animate()
-    
-    def stop(self):
-        """停止动画"""
-        self._running = False
+    def _on_theme_change(self):
+        """主题切换后更新弧线颜色"""
+        self.itemconfigure(self._arc, outline=self.theme.fg)
     
-    def _animate(self):
-        """动画循环"""
-        if not self._running:
-            return
-        
-        self._angle = (self._angle + 10) % 360
-        self._draw()
-        self.after(50, self._animate)
+    def _on_frame(self):
+        """旋转一帧"""
+        self._angle = (self._angle + self.STEP) % 360
+        self.itemconfigure(self._arc, start=self._angle)
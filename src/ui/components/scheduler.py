@@ -0,0 +1,261 @@
+"""
+界面帧调度器
+主线程上的定时任务共用一条 after 链，按优先级与每帧时间预算执行，低优先级任务移到空闲时执行
+"""
+
+import heapq
+import math
+import sys
+import time
+import tkinter as tk
+from collections import deque
+from typing import Callable, Deque, List, Tuple
+
+from ...core import metrics
+from ...utils.logger import get_logger
+
+logger = get_logger('scheduler')
+
+
+class Priority:
+    """任务优先级（数值越小越先执行）"""
+    HIGH = 0    # 锁定强制、倒计时：每帧必定执行
+    NORMAL = 1  # 动画、平滑滚动：帧预算用完后顺延到下一帧
+    LOW = 2     # 指标导出等后台任务：移到空闲回调中执行
+
+
+class _Task:
+    __slots__ = ("due", "func", "args", "priority", "cancelled", "deferred")
+    
+    def __init__(self, due: float, func: Callable, args: tuple, priority: int):
+        self.due = due
+        self.func = func
+        self.args = args
+        self.priority = priority
+        self.cancelled = False
+        self.deferred = False
+
+
+class FrameScheduler:
+    """
+    帧调度器
+    
+    任务按到期时间排队，只保留一个指向最早到期任务的 after；
+    到期时间相差不足半帧的任务合并在同一帧执行，帧内先执行高优先级任务，
+    普通任务超出 budget_ms 后顺延一帧（最多一次），低优先级任务交给 after_idle 分批执行。
+    每次唤醒记录实际时间晚于预期的部分（事件循环被阻塞的时长）。
+    只能在 Tk 主线程调用，其他线程仍应通过 root.after(0, ...) 投递
+    """
+    
+    def __init__(
+        self,
+        root: tk.Misc,
+        frame_ms: int = 16,
+        budget_ms: int = 8,
+        probe_ms: int = 0,
+        stall_ms: int = 250
+    ):
+        """
+        :param frame_ms: 帧间隔（毫秒）
+        :param budget_ms: 每帧（以及每次空闲回调）执行任务的时间预算（毫秒）
+        :param probe_ms: 没有任务时也至少每隔多久唤醒一次以探测循环延迟，0 为不探测
+        :param stall_ms: 延迟超过该值时记录警告日志
+        """
+        self.root = root
+        self.frame = frame_ms / 1000
+        self.budget = budget_ms / 1000
+        self.probe = probe_ms / 1000
+        self.stall = stall_ms / 1000
+        
+        self._heap: List[Tuple[float, int, _Task]] = []
+        self._seq = 0
+        self._idle: Deque[_Task] = deque()
+        self._after_id = None
+        self._idle_id = None
+        self._wake_at = 0.0
+        self._last_wake = time.perf_counter()
+        self._in_frame = False
+        
+        # 统计
+        self.frames = 0
+        self.tasks = 0
+        self.deferred = 0
+        self.idle_tasks = 0
+        self.overruns = 0
+        self.stalls = 0
+        self.last_lag = 0.0
+        
+        self.lag_histogram = metrics.histogram("loop_lag_seconds", "事件循环调度延迟（循环被阻塞的时长）")
+        self.frame_histogram = metrics.histogram("ui_frame_seconds", "界面调度器每帧执行任务的耗时")
+        metrics.counter("ui_tasks_total", "界面调度器执行的任务数", func=lambda: self.tasks)
+        metrics.counter("ui_tasks_deferred_total", "超出帧预算顺延的任务数", func=lambda: self.deferred)
+        metrics.counter("ui_idle_tasks_total", "在空闲回调中执行的低优先级任务数", func=lambda: self.idle_tasks)
+        metrics.counter("ui_frame_overruns_total", "执行耗时超出预算的帧数", func=lambda: self.overruns)
+        metrics.counter("ui_loop_stalls_total", "事件循环阻塞超过阈值的次数", func=lambda: self.stalls)
+    
+    # ==================== 接口 ====================
+    
+    def call_later(self, delay_ms: int, func: Callable, *args, priority: int = Priority.NORMAL) -> _Task:
+        """
+        延迟执行
+        
+        :param delay_ms: 延迟（毫秒）
+        :param priority: 优先级（Priority）
+        :return: 任务句柄，用于 cancel
+        """
+        task = _Task(time.perf_counter() + delay_ms / 1000, func, args, priority)
+        self._push(task)
+        self._arm()
+        return task
+    
+    def cancel(self, task: _Task):
+        """取消任务（已执行或已取消的任务忽略）"""
+        if task is not None:
+            task.cancelled = True
+    
+    def at_priority(self, priority: int) -> Callable[[int, Callable[[], None]], _Task]:
+        """固定优先级的调度函数 (毫秒, 回调) -> 句柄，可代替 root.after 注入其他模块"""
+        return lambda delay_ms, func: self.call_later(delay_ms, func, priority=priority)
+    
+    def set_probe(self, probe_ms: int):
+        """设置探测间隔（0 为不探测）"""
+        self.probe = probe_ms / 1000
+        # 从现在开始计时，否则创建后空闲的时间会被第一次探测记为循环延迟
+        self._last_wake = time.perf_counter()
+        self._arm()
+    
+    @property
+    def pending(self) -> int:
+        return sum(not task.cancelled for _, _, task in self._heap) + len(self._idle)
+    
+    def destroy(self):
+        """取消全部调度"""
+        for pending in (self._after_id, self._idle_id):
+            if pending is not None:
+                try:
+                    self.root.after_cancel(pending)
+                except tk.TclError:
+                    # 窗口已销毁
+                    pass
+        self._after_id = self._idle_id = None
+        self._heap.clear()
+        self._idle.clear()
+        self.probe = 0.0
+    
+    # ==================== 调度 ====================
+    
+    def _push(self, task: _Task):
+        self._seq += 1
+        heapq.heappush(self._heap, (task.due, self._seq, task))
+    
+    def _arm(self):
+        """让唯一的 after 指向最早到期的任务（或下一次探测）"""
+        if self._in_frame:
+            return
+        
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        
+        target = heap[0][0] if heap else math.inf
+        if self.probe:
+            target = min(target, self._last_wake + self.probe)
+        if target == math.inf:
+            return
+        if self._after_id is not None:
+            if self._wake_at <= target:
+                return
+            self.root.after_cancel(self._after_id)
+        
+        self._wake_at = target
+        delay = max(0, math.ceil((target - time.perf_counter()) * 1000))
+        self._after_id = self.root.after(delay, self._on_frame)
+    
+    def _on_frame(self):
+        """一帧：执行到期任务"""
+        self._after_id = None
+        now = time.perf_counter()
+        self._last_wake = now
+        self.frames += 1
+        self._record_lag(now - self._wake_at)
+        
+        # 取出本帧（含半帧内即将到期）的任务，按优先级、到期顺序执行
+        horizon = now + self.frame / 2
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= horizon:
+            entry = heapq.heappop(heap)
+            if not entry[2].cancelled:
+                due.append(entry)
+        due.sort(key=lambda entry: (entry[2].priority, entry[1]))
+        
+        deadline = now + self.budget
+        self._in_frame = True
+        try:
+            for _, _, task in due:
+                if task.cancelled:
+                    continue
+                if task.priority == Priority.LOW:
+                    self._idle.append(task)
+                elif task.priority == Priority.NORMAL and not task.deferred and time.perf_counter() >= deadline:
+                    # 只顺延一次，持续超载时也不会一直饿死
+                    task.deferred = True
+                    task.due = now + self.frame
+                    self._push(task)
+                    self.deferred += 1
+                else:
+                    self._run(task)
+        finally:
+            self._in_frame = False
+        
+        elapsed = time.perf_counter() - now
+        self.frame_histogram.observe(elapsed)
+        if elapsed > self.budget:
+            self.overruns += 1
+        
+        if self._idle and self._idle_id is None:
+            self._idle_id = self.root.after_idle(self._on_idle)
+        self._arm()
+    
+    def _on_idle(self):
+        """空闲时执行低优先级任务；超出预算时留到下一次空闲，期间先处理事件"""
+        self._idle_id = None
+        deadline = time.perf_counter() + self.budget
+        while self._idle:
+            task = self._idle.popleft()
+            if task.cancelled:
+                continue
+            self._run(task)
+            self.idle_tasks += 1
+            if time.perf_counter() >= deadline:
+                break
+        
+        if self._idle:
+            self._idle_id = self.root.after_idle(self._on_idle)
+    
+    def _run(self, task: _Task):
+        task.cancelled = True
+        self.tasks += 1
+        try:
+            task.func(*task.args)
+        except Exception:
+            # 与 after 回调一致：报告异常，不影响同一帧的其他任务
+            self.root.report_callback_exception(*sys.exc_info())
+    
+    def _record_lag(self, lag: float):
+        lag = max(0.0, lag)
+        self.last_lag = lag
+        self.lag_histogram.observe(lag)
+        if lag >= self.stall:
+            self.stalls += 1
+            logger.warning(f"界面事件循环阻塞 {lag * 1000:.0f} ms")
+
+
+def get_scheduler(widget: tk.Misc) -> FrameScheduler:
+    """获取控件所在窗口的帧调度器"""
+    root = widget._root()
+    scheduler = getattr(root, "_frame_scheduler", None)
+    if scheduler is None:
+        scheduler = FrameScheduler(root)
+        root._frame_scheduler = scheduler
+    return scheduler
@@ -5,24 +5,57 @@
 
 import tkinter as tk
 from ..theme import Theme
+from .wheel import WHEEL_DELTA, get_wheel_router
+from .scheduler import Priority, get_scheduler
 
 
 class ScrollableFrame(tk.Frame):
-    """可滚动的Frame容器"""
+    """
+    可滚动的Frame容器
     
-    def __init__(self, parent, theme: Theme, **kwargs):
+    内容与画布的 <Configure> 只记录新尺寸，合并到一次空闲时的布局：
+    宽度、滚动区域只在尺寸真正变化时设置，滚动条显示状态缓存，变化时才重新 pack。
+    滚轮由窗口级路由器分发，按像素滚动，smooth 时把每格的距离分摊到帧调度器的后续几帧
+    """
+    
+    # 滚轮每格滚动的像素数
+    WHEEL_PIXELS = 60
+    # 平滑滚动：帧间隔（毫秒）与每帧消化剩余距离的比例
+    SMOOTH_INTERVAL = 16
+    SMOOTH_FACTOR = 0.4
+    
+    def __init__(self, parent, theme: Theme, smooth: bool = True, **kwargs):
+        """
+        :param smooth: 滚轮平滑滚动
+        """
         super().__init__(parent, bg=theme.bg, **kwargs)
         
         self.theme = theme
+        theme.register(self, bg=theme.bg)
+        self.smooth = smooth
+        
+        # 由 <Configure> 事件记录的尺寸，以及上次布局已应用的值
+        self._content_size = (0, 0)
+        self._canvas_size = (0, 0)
+        self._applied_width = None
+        self._applied_region = None
+        self._overflow = False
+        self._layout_pending = None
+        self._pending_pixels = 0.0
+        self._smooth_task = None
+        self._scheduler = get_scheduler(self)
+        
+        # 统计
+        self.layouts = 0
         
-        # 创建Canvas
-        self.canvas = tk.Canvas(self, bg=theme.bg, highlightthickness=0)
+        # 创建Canvas（滚动单位为 1 像素）
+        self.canvas = theme.create(tk.Canvas, self, bg=theme.bg, highlightthickness=0, yscrollincrement=1)
         
         # 创建滚动条（仅在需要时显示）
         self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
         
         # 创建内部Frame
-        self.scrollable_frame = tk.Frame(self.canvas, bg=theme.bg)
+        self.scrollable_frame = theme.create(tk.Frame, self.canvas, bg=theme.bg)
         
         # 配置Canvas
         self.scrollable_frame.bind(
@@ -45,44 +78,97 @@ class ScrollableFrame(tk.Frame):
     
     def _on_frame_configure(self, event):
         """内容Frame尺寸变化"""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        self._update_scrollbar()
+        self._content_size = (event.width, event.height)
+        self._schedule_layout()
     
     def _on_canvas_configure(self, event):
-        """Canvas尺寸变化时调整内部Frame宽度"""
-        self.canvas.itemconfig(self.canvas_frame, width=event.width)
-        self._update_scrollbar()
+        """Canvas尺寸变化"""
+        self._canvas_size = (event.width, event.height)
+        self._schedule_layout()
     
     def _on_scroll(self, first, last):
-        """滚动回调"""
+        """滚动回调（只同步滚动条位置）"""
         self.scrollbar.set(first, last)
+    
+    def _schedule_layout(self):
+        """在空闲时执行一次布局，期间的多次尺寸变化只处理一次"""
+        if self._layout_pending is None:
+            self._layout_pending = self.after_idle(self._layout)
+    
+    def _layout(self):
+        """按最新尺寸调整内部Frame宽度、滚动区域与滚动条"""
+        self._layout_pending = None
+        self.layouts += 1
+        canvas_width, canvas_height = self._canvas_size
+        
+        # 内部Frame与Canvas同宽
+        if canvas_width != self._applied_width:
+            self.canvas.itemconfig(self.canvas_frame, width=canvas_width)
+            self._applied_width = canvas_width
+        
+        # 内部Frame位于 (0, 0)，滚动区域即其尺寸
+        region = (0, 0) + self._content_size
+        if region != self._applied_region:
+            self.canvas.configure(scrollregion=region)
+            self._applied_region = region
+        
         self._update_scrollbar()
     
     def _update_scrollbar(self):
-        """根据内容是否超出显示区域来显示/隐藏滚动条"""
-        if self.scrollable_frame.winfo_height() > self.canvas.winfo_height():
+        """根据内容是否超出显示区域来显示/隐藏滚动条（状态变化时才重新布局）"""
+        overflow = self._content_size[1] > self._canvas_size[1]
+        if overflow == self._overflow:
+            return
+        self._overflow = overflow
+        if overflow:
             self.scrollbar.pack(side="right", fill="y")
         else:
             self.scrollbar.pack_forget()
+            self.canvas.yview_moveto(0)
     
     def bind_mousewheel(self):
-        """绑定鼠标滚轮"""
-        self.canvas.bind("<Enter>", self._bind_mousewheel)
-        self.canvas.bind("<Leave>", self._unbind_mousewheel)
-    
-    def _bind_mousewheel(self, event):
-        """鼠标进入时绑定滚轮"""
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-    
-    def _unbind_mousewheel(self, event):
-        """鼠标离开时解绑滚轮"""
-        self.canvas.unbind_all("<MouseWheel>")
-    
-    def _on_mousewheel(self, event):
-        """鼠标滚轮滚动"""
-        # 只有当内容超出时才滚动
-        if self.scrollable_frame.winfo_height() > self.canvas.winfo_height():
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        """向窗口的滚轮路由器注册（指针位于本区域内任意控件上时生效）"""
+        self._wheel_router = get_wheel_router(self)
+        self._wheel_router.register(self, self._on_mousewheel)
+    
+    def _on_mousewheel(self, delta: int) -> bool:
+        """鼠标滚轮滚动；内容未超出时不处理，交给外层"""
+        if not self._overflow:
+            return False
+        pixels = -delta * self.WHEEL_PIXELS / WHEEL_DELTA
+        if not self.smooth:
+            self.canvas.yview_scroll(int(round(pixels)), "units")
+            return True
+        
+        # 反向滚动时丢弃未完成的距离；本帧立即滚动一部分，余下的在后续帧内完成
+        if self._pending_pixels * pixels < 0:
+            self._pending_pixels = 0.0
+        self._pending_pixels += pixels
+        self._scheduler.cancel(self._smooth_task)
+        self._smooth_step()
+        return True
+    
+    def _smooth_step(self):
+        """平滑滚动的一帧"""
+        self._smooth_task = None
+        pending = self._pending_pixels
+        if abs(pending) < 1:
+            self._pending_pixels = 0.0
+            return
+        step = int(pending * self.SMOOTH_FACTOR) or (1 if pending > 0 else -1)
+        self.canvas.yview_scroll(step, "units")
+        self._pending_pixels -= step
+        self._smooth_task = self._scheduler.call_later(
+            self.SMOOTH_INTERVAL, self._smooth_step, priority=Priority.NORMAL
+        )
+    
+    def destroy(self):
+        self._wheel_router.unregister(self)
+        if self._layout_pending is not None:
+            self.after_cancel(self._layout_pending)
+        self._scheduler.cancel(self._smooth_task)
+        self._layout_pending = self._smooth_task = None
+        super().destroy()
     
     def get_frame(self):
         """获取可滚动的内部Frame"""
@@ -4,7 +4,8 @@
 """
 
 import tkinter as tk
-from typing import List, Callable, Optional
+from typing import Any, Dict, List, Callable, Optional, Tuple
+from .wheel import WHEEL_DELTA, get_wheel_router
 from ..theme import Theme
 
 
@@ -18,7 +19,27 @@ class SidebarItem:
 
 
 class Sidebar(tk.Frame):
-    """现代化侧边栏 - 简洁风格"""
+    """
+    现代化侧边栏 - 简洁风格
+    
+    菜单项绘制在同一个 Canvas 上：每项一个背景矩形和两段文字，
+    只有背景矩形参与命中检测（文字为 disabled），悬浮与点击通过共用的 "item" 标签绑定一次；
+    悬浮只改一个矩形，切换选中只改新旧两项，菜单项增多不会增加控件或绑定
+    """
+    
+    # 菜单项尺寸（像素）
+    ITEM_HEIGHT = 38
+    ITEM_GAP = 4
+    ICON_X = 20
+    TEXT_X = 36
+    
+    # 简洁图标映射
+    ICONS = {
+        "timer": "⏱",      # 时钟
+        "lock": "🔒",       # 锁
+        "settings": "⚙",   # 齿轮
+        "about": "ℹ",      # 信息
+    }
     
     def __init__(
         self,
@@ -31,156 +52,202 @@ class Sidebar(tk.Frame):
     ):
         super().__init__(parent, bg=theme.bg, width=width, **kwargs)
         self.theme = theme
-        self.items = items
+        # 菜单项颜色随选中/悬浮状态变化，主题切换时整体重新着色
+        theme.register(self, on_change=Sidebar._on_theme_change, bg=theme.bg)
+        self.items: List[SidebarItem] = []
         self.on_select = on_select
         self.selected_id = items[0].id if items else None
-        self._buttons = {}
+        self.hover_id: Optional[str] = None
+        
+        # 菜单项 id -> (背景矩形, 图标, 文字) 的图元；背景矩形 -> 菜单项 id
+        self._entries: Dict[str, Tuple[int, int, int]] = {}
+        self._by_rect: Dict[int, str] = {}
+        self._menu_width = 0
+        self._menu_height = 0
+        self._content_height = 0
         
         self.pack_propagate(False)
         
         # Logo 区域
-        logo_frame = tk.Frame(self, bg=theme.bg)
+        logo_frame = theme.create(tk.Frame, self, bg=theme.bg)
         logo_frame.pack(fill="x", pady=(16, 12), padx=12)
         
         # Logo - 简洁的盾牌图标
-        logo_container = tk.Frame(logo_frame, bg=theme.bg)
+        logo_container = theme.create(tk.Frame, logo_frame, bg=theme.bg)
         logo_container.pack(anchor="w")
         
         # 使用简洁的文字 Logo
-        tk.Label(
+        theme.create(
+            tk.Label,
             logo_container,
             text="🛡",
-            font=(theme.fonts.FAMILY, 16),
+            font=theme.font(16),
             bg=theme.bg,
             fg=theme.colors.accent
         ).pack(side="left")
         
-        tk.Label(
+        theme.create(
+            tk.Label,
             logo_container,
             text="OfficeGuard",
-            font=(theme.fonts.FAMILY, 12, "bold"),
+            font=theme.font(12, "bold"),
             bg=theme.bg,
             fg=theme.fg
         ).pack(side="left", padx=(6, 0))
         
         # 分隔线
-        sep = tk.Frame(self, bg=theme.border, height=1)
+        sep = theme.create(tk.Frame, self, bg=theme.border, height=1)
         sep.pack(fill="x", padx=16, pady=(0, 16))
         
-        # 菜单项容器
-        menu_frame = tk.Frame(self, bg=theme.bg)
-        menu_frame.pack(fill="both", expand=True, padx=12)
+        # 菜单项画布
+        self.menu = theme.create(
+            tk.Canvas,
+            self,
+            bg=theme.bg,
+            height=0,
+            highlightthickness=0,
+            yscrollincrement=1
+        )
+        self.menu.pack(fill="both", expand=True, padx=12)
         
         for item in items:
-            self._create_menu_item(menu_frame, item)
+            self.add_item(item)
+        
+        self.menu.tag_bind("item", "<Enter>", self._on_item_enter)
+        self.menu.tag_bind("item", "<Leave>", self._on_item_leave)
+        self.menu.tag_bind("item", "<Button-1>", self._on_item_click)
+        self.menu.bind("<Configure>", self._on_menu_configure)
+        
+        # 菜单项超出高度时可用滚轮滚动
+        self._wheel_router = get_wheel_router(self)
+        self._wheel_router.register(self.menu, self._on_mousewheel)
         
         # 底部区域
-        footer = tk.Frame(self, bg=theme.bg)
+        footer = theme.create(tk.Frame, self, bg=theme.bg)
         footer.pack(fill="x", pady=16, padx=20)
         
         # 分隔线
-        sep2 = tk.Frame(self, bg=theme.border, height=1)
+        sep2 = theme.create(tk.Frame, self, bg=theme.border, height=1)
         sep2.pack(fill="x", padx=16, before=footer)
         
         # 版本号
-        tk.Label(
+        theme.create(
+            tk.Label,
             footer,
             text="v2.0.0",
-            font=(theme.fonts.FAMILY, 11),
+            font=theme.font(11),
             bg=theme.bg,
             fg=theme.muted
         ).pack(side="left", pady=(8, 0))
     
-    def _create_menu_item(self, parent, item: SidebarItem):
-        """创建菜单项 - 简洁风格"""
-        is_selected = item.id == self.selected_id
-        
-        # 根据状态设置颜色
-        if is_selected:
-            bg_color = self.theme.bg3
-            fg_color = self.theme.fg
-            font_weight = "bold"
-        else:
-            bg_color = self.theme.bg
-            fg_color = self.theme.muted
-            font_weight = "normal"
-        
-        # 按钮容器 - 添加圆角效果
-        btn_frame = tk.Frame(parent, bg=bg_color, cursor="hand2")
-        btn_frame.pack(fill="x", pady=2)
-        
-        # 内边距容器
-        inner = tk.Frame(btn_frame, bg=bg_color)
-        inner.pack(fill="x", padx=8, pady=8)
-        
-        # 简洁图标映射
-        icon_map = {
-            "timer": "⏱",      # 时钟
-            "lock": "🔒",       # 锁
-            "settings": "⚙",   # 齿轮
-            "about": "ℹ",      # 信息
-        }
-        
-        icon_text = icon_map.get(item.id, "•")
-        
-        # 图标
-        icon_label = tk.Label(
-            inner,
-            text=icon_text,
-            font=(self.theme.fonts.FAMILY, 12),
-            bg=bg_color,
-            fg=fg_color,
-            width=2
-        )
-        icon_label.pack(side="left")
+    # ==================== 菜单项 ====================
+    
+    def add_item(self, item: SidebarItem):
+        """在末尾添加菜单项"""
+        top = len(self.items) * (self.ITEM_HEIGHT + self.ITEM_GAP) + self.ITEM_GAP // 2
+        middle = top + self.ITEM_HEIGHT // 2
+        bg, fg, font = self._item_style(item.id)
+        tags = ("item", f"item:{item.id}")
         
-        # 文字
-        text_label = tk.Label(
-            inner,
+        rect = self.menu.create_rectangle(
+            0, top, self._menu_width, top + self.ITEM_HEIGHT,
+            fill=bg, outline="", tags=tags
+        )
+        icon = self.menu.create_text(
+            self.ICON_X, middle,
+            text=self.ICONS.get(item.id) or item.icon or "•",
+            font=self.theme.font(12),
+            fill=fg,
+            state="disabled",
+            tags=tags
+        )
+        text = self.menu.create_text(
+            self.TEXT_X, middle,
             text=item.text,
-            font=(self.theme.fonts.FAMILY, 12, font_weight),
-            bg=bg_color,
-            fg=fg_color
+            anchor="w",
+            font=font,
+            fill=fg,
+            state="disabled",
+            tags=tags
         )
-        text_label.pack(side="left", padx=(4, 0))
-        
-        # 存储引用
-        self._buttons[item.id] = {
-            'frame': btn_frame,
-            'inner': inner,
-            'icon': icon_label,
-            'text': text_label,
-            'item': item
-        }
-        
-        # 绑定点击事件
-        def on_click(e, item_id=item.id):
-            self.select(item_id)
         
-        for widget in [btn_frame, inner, icon_label, text_label]:
-            widget.bind("<Button-1>", on_click)
-            widget.bind("<Enter>", lambda e, iid=item.id: self._on_hover(iid, True))
-            widget.bind("<Leave>", lambda e, iid=item.id: self._on_hover(iid, False))
+        self.items.append(item)
+        self._entries[item.id] = (rect, icon, text)
+        self._by_rect[rect] = item.id
+        self._update_scrollregion()
     
-    def _on_hover(self, item_id, entering):
-        """鼠标悬停效果"""
+    def _item_style(self, item_id: str) -> Tuple[str, str, Any]:
+        """菜单项的 (背景色, 文字色, 字体)"""
         if item_id == self.selected_id:
+            return self.theme.bg3, self.theme.fg, self.theme.font(12, "bold")
+        bg = self.theme.bg2 if item_id == self.hover_id else self.theme.bg
+        return bg, self.theme.muted, self.theme.font(12)
+    
+    def _paint_item(self, item_id: str, background_only: bool = False):
+        """按当前状态重新着色一个菜单项"""
+        entry = self._entries.get(item_id)
+        if not entry:
             return
-        
-        btn_data = self._buttons.get(item_id)
-        if not btn_data:
+        rect, icon, text = entry
+        bg, fg, font = self._item_style(item_id)
+        self.menu.itemconfigure(rect, fill=bg)
+        if not background_only:
+            self.menu.itemconfigure(icon, fill=fg)
+            self.menu.itemconfigure(text, fill=fg, font=font)
+    
+    def _update_scrollregion(self):
+        height = len(self.items) * (self.ITEM_HEIGHT + self.ITEM_GAP)
+        self.menu.configure(scrollregion=(0, 0, self._menu_width, height))
+        self._content_height = height
+    
+    # ==================== 事件 ====================
+    
+    def _current_item(self) -> Optional[str]:
+        """指针下的菜单项（只有背景矩形可被命中）"""
+        found = self.menu.find_withtag("current")
+        return self._by_rect.get(found[0]) if found else None
+    
+    def _on_item_enter(self, event):
+        item_id = self._current_item()
+        if item_id is None:
             return
-        
-        if entering:
-            bg = self.theme.bg2
-        else:
-            bg = self.theme.bg
-        
-        # 更新背景色
-        btn_data['frame'].configure(bg=bg)
-        btn_data['inner'].configure(bg=bg)
-        btn_data['icon'].configure(bg=bg)
-        btn_data['text'].configure(bg=bg)
+        self.hover_id = item_id
+        self.menu.configure(cursor="hand2")
+        if item_id != self.selected_id:
+            self._paint_item(item_id, background_only=True)
+    
+    def _on_item_leave(self, event):
+        item_id, self.hover_id = self.hover_id, None
+        self.menu.configure(cursor="")
+        if item_id is not None and item_id != self.selected_id:
+            self._paint_item(item_id, background_only=True)
+    
+    def _on_item_click(self, event):
+        item_id = self._current_item()
+        if item_id is not None:
+            self.select(item_id)
+    
+    def _on_menu_configure(self, event):
+        """宽度变化时调整背景矩形（侧边栏宽度固定，通常只在首次布局时发生）"""
+        self._menu_height = event.height
+        if event.width == self._menu_width:
+            return
+        self._menu_width = event.width
+        for rect, _, _ in self._entries.values():
+            x1, y1, _, y2 = self.menu.coords(rect)
+            self.menu.coords(rect, x1, y1, event.width, y2)
+        self._update_scrollregion()
+    
+    def _on_mousewheel(self, delta: int) -> bool:
+        if self._content_height <= self._menu_height:
+            return False
+        self.menu.yview_scroll(int(-delta * self.ITEM_HEIGHT / WHEEL_DELTA), "units")
+        return True
+    
+    def _on_theme_change(self):
+        """主题切换后重新着色所有菜单项"""
+        for item_id in self._entries:
+            self._paint_item(item_id)
     
     def select(self, item_id: str):
         """选择菜单项"""
@@ -190,34 +257,15 @@ class Sidebar(tk.Frame):
         old_id = self.selected_id
         self.selected_id = item_id
         
-        # 更新旧选中项样式
-        if old_id and old_id in self._buttons:
-            self._update_item_style(old_id, False)
-        
-        # 更新新选中项样式
-        if item_id in self._buttons:
-            self._update_item_style(item_id, True)
+        # 只重绘新旧两项
+        if old_id is not None:
+            self._paint_item(old_id)
+        self._paint_item(item_id)
         
         # 触发回调
         if self.on_select:
             self.on_select(item_id)
     
-    def _update_item_style(self, item_id: str, is_selected: bool):
-        """更新菜单项样式"""
-        btn_data = self._buttons.get(item_id)
-        if not btn_data:
-            return
-        
-        if is_selected:
-            bg = self.theme.bg3
-            fg = self.theme.fg
-            font = (self.theme.fonts.FAMILY, 13, "bold")
-        else:
-            bg = self.theme.bg
-            fg = self.theme.muted
-            font = (self.theme.fonts.FAMILY, 13)
-        
-        btn_data['frame'].configure(bg=bg)
-        btn_data['inner'].configure(bg=bg)
-        btn_data['icon'].configure(bg=bg, fg=fg)
-        btn_data['text'].configure(bg=bg, fg=fg, font=font)
+    def destroy(self):
+        self._wheel_router.unregister(self.menu)
+        super().destroy()
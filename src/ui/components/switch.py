@@ -40,9 +40,9 @@ class Switch(tk.Canvas):
         self._state = "normal"
         
         # 颜色
-        self._on_color = theme.fg
-        self._off_color = theme.colors.border
         self._knob_color = "#ffffff"
+        self._setup_colors()
+        theme.register(self, on_change=Switch._on_theme_change, bg=bg_color)
         
         # 绘制
         self._draw()
@@ -51,7 +51,16 @@ class Switch(tk.Canvas):
         self.bind("<Button-1>", self._on_click)
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", lambda e: self.config(cursor=""))
-
+    
+    def _setup_colors(self):
+        self._on_color = self.theme.fg
+        self._off_color = self.theme.colors.border
+    
+    def _on_theme_change(self):
+        """主题切换后重绘"""
+        self._setup_colors()
+        self._draw()
+    
     def _on_enter(self, event):
         if self._state == "normal":
             self.config(cursor="hand2")
@@ -61,7 +70,7 @@ class Switch(tk.Canvas):
             self._state = kwargs.pop("state")
             self._draw()
         super().configure(**kwargs)
-        
+    
     def _draw(self):
         """绘制开关"""
         self.delete("all")
@@ -101,7 +110,7 @@ class Switch(tk.Canvas):
         """点击切换"""
         if self._state == "disabled":
             return
-            
+        
         self._value = not self._value
         self._draw()
         
@@ -136,24 +145,27 @@ class LabeledSwitch(tk.Frame):
         
         self.theme = theme
         self._command = command
+        theme.register(self, bg=theme.card)
         
         # 左侧文字
-        text_frame = tk.Frame(self, bg=theme.card)
+        text_frame = theme.create(tk.Frame, self, bg=theme.card)
         text_frame.pack(side="left", fill="x", expand=True)
         
-        tk.Label(
+        theme.create(
+            tk.Label,
             text_frame,
             text=text,
-            font=(theme.fonts.FAMILY, 13),
+            font=theme.font(13),
             fg=theme.fg,
             bg=theme.card
         ).pack(anchor="w")
         
         if description:
-            tk.Label(
+            theme.create(
+                tk.Label,
                 text_frame,
                 text=description,
-                font=(theme.fonts.FAMILY, 11),
+                font=theme.font(11),
                 fg=theme.muted,
                 bg=theme.card
             ).pack(anchor="w", pady=(2, 0))
@@ -0,0 +1,216 @@
+"""
+虚拟列表组件
+固定行高，只为可见区域创建行控件并循环复用；数据按键管理，增删改只更新受影响的行
+"""
+
+import tkinter as tk
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+from ..theme import Theme
+from .wheel import WHEEL_DELTA, get_wheel_router
+
+
+class VirtualRow(ABC):
+    """
+    虚拟列表的行（由使用方实现）
+    
+    widget 为放入列表的行控件；bind 把行绑定到一条数据，控件被复用时会以新数据再次调用
+    """
+    
+    widget: tk.Widget
+    
+    @abstractmethod
+    def bind(self, key: Hashable, item: Any):
+        """把行绑定到一条数据"""
+
+
+class VirtualList(tk.Frame):
+    """
+    虚拟列表
+    
+    行数超过 max_visible 时显示滚动条，按整行滚动；
+    每个行槽位记录已绑定的 (键, 版本)，渲染时只重新绑定发生变化的槽位
+    """
+    
+    def __init__(
+        self,
+        parent,
+        theme: Theme,
+        create_row: Callable[[tk.Widget], VirtualRow],
+        row_height: int = 32,
+        max_visible: int = 8,
+        empty_text: str = "",
+        **kwargs
+    ):
+        """
+        :param create_row: 行工厂，参数为行的父控件
+        :param row_height: 行高（像素）
+        :param max_visible: 最多同时显示的行数（即行控件池大小）
+        :param empty_text: 没有数据时显示的提示
+        """
+        bg = kwargs.pop('bg', theme.card)
+        super().__init__(parent, bg=bg, **kwargs)
+        self.theme = theme
+        theme.register(self, bg=bg)
+        self._create_row = create_row
+        self.row_height = row_height
+        self.max_visible = max_visible
+        
+        # 数据：有序键 + 键 -> (数据, 版本)
+        self._keys: List[Hashable] = []
+        self._items: Dict[Hashable, Tuple[Any, int]] = {}
+        self._first = 0
+        
+        # 行控件池与每个槽位当前绑定的 (键, 版本)
+        self._rows: List[VirtualRow] = []
+        self._bound: List[Tuple[Hashable, int]] = []
+        self._visible_slots = 0
+        self._scrollbar_shown = False
+        self._wheel_rest = 0.0
+        
+        # 统计
+        self.binds = 0
+        
+        self.body = theme.create(tk.Frame, self, bg=bg, height=row_height)
+        self.body.pack(side="left", fill="x", expand=True)
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        
+        self.empty_label = theme.create(
+            tk.Label,
+            self.body,
+            text=empty_text,
+            font=theme.font(theme.fonts.SM),
+            fg=theme.muted,
+            bg=bg,
+            anchor="w"
+        )
+        # 初始没有数据：_render 只在可见行数变化时调整布局，提示需在这里显示
+        self.empty_label.place(x=0, y=0, relwidth=1, height=row_height)
+        self._wheel_router = get_wheel_router(self)
+        self._wheel_router.register(self, self._on_mousewheel)
+        self._render()
+    
+    # ==================== 数据 ====================
+    
+    def set_items(self, items: List[Tuple[Hashable, Any]]):
+        """替换全部数据"""
+        self._keys = [key for key, _ in items]
+        self._items = {key: (item, 0) for key, item in items}
+        self._first = 0
+        self._bound = [None] * len(self._rows)
+        self._render()
+    
+    def append(self, key: Hashable, item: Any):
+        """在末尾添加一条（滚动到该行）"""
+        self._keys.append(key)
+        self._items[key] = (item, 0)
+        self._first = max(0, len(self._keys) - self.max_visible)
+        self._render()
+    
+    def remove(self, key: Hashable):
+        """删除一条"""
+        if key not in self._items:
+            return
+        self._keys.remove(key)
+        del self._items[key]
+        self._render()
+    
+    def refresh(self, key: Hashable, item: Any = None):
+        """数据内容变化：只重新绑定显示该条的行"""
+        if key not in self._items:
+            return
+        old, version = self._items[key]
+        self._items[key] = (old if item is None else item, version + 1)
+        self._render()
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    # ==================== 渲染 ====================
+    
+    def _render(self):
+        """按当前滚动位置把可见数据绑定到行控件"""
+        count = len(self._keys)
+        visible = min(count, self.max_visible)
+        self._first = max(0, min(self._first, count - visible))
+        
+        # 行控件池按需增长，最多 max_visible 个
+        while len(self._rows) < visible:
+            self._add_row()
+        
+        for slot in range(visible):
+            key = self._keys[self._first + slot]
+            item, version = self._items[key]
+            if self._bound[slot] != (key, version):
+                self._rows[slot].bind(key, item)
+                self._bound[slot] = (key, version)
+                self.binds += 1
+        
+        # 只在可见行数变化时调整布局
+        if visible != self._visible_slots:
+            for slot in range(visible, self._visible_slots):
+                self._rows[slot].widget.place_forget()
+                self._bound[slot] = None
+            for slot in range(self._visible_slots, visible):
+                self._rows[slot].widget.place(
+                    x=0, y=slot * self.row_height, relwidth=1, height=self.row_height
+                )
+            if visible == 0:
+                self.empty_label.place(x=0, y=0, relwidth=1, height=self.row_height)
+            elif self._visible_slots == 0:
+                self.empty_label.place_forget()
+            self.body.configure(height=max(visible, 1) * self.row_height)
+            self._visible_slots = visible
+        
+        self._update_scrollbar(count, visible)
+    
+    def _add_row(self):
+        row = self._create_row(self.body)
+        self._rows.append(row)
+        self._bound.append(None)
+    
+    def _update_scrollbar(self, count: int, visible: int):
+        need = count > visible
+        if need != self._scrollbar_shown:
+            if need:
+                self.scrollbar.pack(side="right", fill="y", before=self.body)
+            else:
+                self.scrollbar.pack_forget()
+            self._scrollbar_shown = need
+        if need:
+            self.scrollbar.set(self._first / count, (self._first + visible) / count)
+    
+    # ==================== 滚动 ====================
+    
+    def scroll_to(self, first: int):
+        """滚动到指定行"""
+        if first != self._first:
+            self._first = first
+            self._render()
+    
+    def _on_scrollbar(self, *args):
+        count = len(self._keys)
+        if args[0] == "moveto":
+            self.scroll_to(round(float(args[1]) * count))
+        elif args[0] == "scroll":
+            step = self.max_visible if args[2] == "pages" else 1
+            self.scroll_to(self._first + int(args[1]) * step)
+    
+    def _on_mousewheel(self, delta: int) -> bool:
+        """按行滚动；不可滚动或已到边界时不处理，交给外层滚动区域"""
+        count = len(self._keys)
+        if count <= self.max_visible:
+            return False
+        self._wheel_rest -= delta / WHEEL_DELTA
+        rows = int(self._wheel_rest)
+        self._wheel_rest -= rows
+        first = max(0, min(self._first + rows, count - self.max_visible))
+        if rows and first == self._first:
+            self._wheel_rest = 0.0
+            return False
+        self.scroll_to(first)
+        return True
+    
+    def destroy(self):
+        self._wheel_router.unregister(self)
+        super().destroy()
@@ -0,0 +1,82 @@
+"""
+鼠标滚轮路由
+每个窗口只安装一次全局滚轮绑定，按指针下的控件路径找到注册的滚动区域并分发
+"""
+
+import time
+import tkinter as tk
+from typing import Callable, Dict, Tuple
+
+# Windows 滚轮每格的 delta
+WHEEL_DELTA = 120
+
+WheelHandler = Callable[[int], bool]
+
+
+class WheelRouter:
+    """
+    滚轮路由器
+    
+    滚动区域以控件路径注册处理函数 handler(delta) -> 是否已处理；
+    事件按指针所在控件的路径从内向外依次尝试，未处理（如已滚到边界）时交给外层。
+    路径到处理链的解析结果按路径缓存，注册表变化时清空
+    """
+    
+    def __init__(self, root: tk.Misc):
+        self.root = root
+        self._targets: Dict[str, WheelHandler] = {}
+        self._chains: Dict[str, Tuple[WheelHandler, ...]] = {}
+        root.bind_all("<MouseWheel>", self._on_wheel, add="+")
+        
+        # 统计
+        self.events = 0
+        self.dispatch_seconds = 0.0
+    
+    def register(self, widget: tk.Misc, handler: WheelHandler):
+        """注册滚动区域（覆盖该控件及其所有子控件）"""
+        self._targets[str(widget)] = handler
+        self._chains.clear()
+    
+    def unregister(self, widget: tk.Misc):
+        """注销滚动区域"""
+        if self._targets.pop(str(widget), None) is not None:
+            self._chains.clear()
+    
+    def _chain(self, path: str) -> Tuple[WheelHandler, ...]:
+        """路径上由内向外的处理函数（只按路径字符串解析，不查询 Tk）"""
+        chain = self._chains.get(path)
+        if chain is None:
+            handlers = []
+            prefix = path
+            while prefix and prefix != ".":
+                handler = self._targets.get(prefix)
+                if handler is not None:
+                    handlers.append(handler)
+                prefix = prefix.rpartition(".")[0]
+            chain = tuple(handlers)
+            self._chains[path] = chain
+        return chain
+    
+    def _on_wheel(self, event):
+        start = time.perf_counter()
+        self.events += 1
+        
+        # 事件可能发给焦点控件，以指针实际所在的控件为准
+        path = self.root.tk.call("winfo", "containing", event.x_root, event.y_root)
+        path = str(path) if path else str(event.widget)
+        
+        for handler in self._chain(path):
+            if handler(event.delta):
+                break
+        
+        self.dispatch_seconds += time.perf_counter() - start
+
+
+def get_wheel_router(widget: tk.Misc) -> WheelRouter:
+    """获取控件所在窗口的滚轮路由器（首次调用时安装）"""
+    root = widget._root()
+    router = getattr(root, "_wheel_router", None)
+    if router is None:
+        router = WheelRouter(root)
+        root._wheel_router = router
+    return router
@@ -17,20 +17,22 @@ class AboutPage(tk.Frame):
     def __init__(self, parent, theme: Theme, **kwargs):
         super().__init__(parent, bg=theme.bg, **kwargs)
         self.theme = theme
+        theme.register(self, bg=theme.bg)
         
         self._create_ui()
     
     def _create_ui(self):
         """创建界面"""
         # 主容器
-        container = tk.Frame(self, bg=self.theme.bg)
+        container = self.theme.create(tk.Frame, self, bg=self.theme.bg)
         container.pack(fill="both", expand=True, padx=32, pady=24)
         
         # 页面标题
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             container,
             text="关于",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.XL3, "bold"),
+            font=self.theme.font(self.theme.fonts.XL3, "bold"),
             fg=self.theme.fg,
             bg=self.theme.bg
         ).pack(anchor="w", pady=(0, 24))
@@ -48,34 +50,37 @@ class AboutPage(tk.Frame):
         info_content = info_card.get_content_frame()
         
         # Logo 区域
-        logo_frame = tk.Frame(info_content, bg=self.theme.card)
+        logo_frame = self.theme.create(tk.Frame, info_content, bg=self.theme.card)
         logo_frame.pack(fill="x", pady=(0, 20))
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             logo_frame,
             text="🛡",
-            font=(self.theme.fonts.FAMILY, 40),
+            font=self.theme.font(40),
             bg=self.theme.card
         ).pack()
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             logo_frame,
             text="OfficeGuard",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.XL2, "bold"),
+            font=self.theme.font(self.theme.fonts.XL2, "bold"),
             fg=self.theme.fg,
             bg=self.theme.card
         ).pack(pady=(8, 4))
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             logo_frame,
             text="系统优化助手",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.muted,
             bg=self.theme.card
         ).pack()
         
         # 版本信息
-        version_frame = tk.Frame(info_content, bg=self.theme.card)
+        version_frame = self.theme.create(tk.Frame, info_content, bg=self.theme.card)
         version_frame.pack(fill="x")
         
         version_info = [
@@ -85,21 +90,23 @@ class AboutPage(tk.Frame):
         ]
         
         for label, value in version_info:
-            row = tk.Frame(version_frame, bg=self.theme.card)
+            row = self.theme.create(tk.Frame, version_frame, bg=self.theme.card)
             row.pack(fill="x", pady=4)
             
-            tk.Label(
+            self.theme.create(
+                tk.Label,
                 row,
                 text=label,
-                font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+                font=self.theme.font(self.theme.fonts.SM),
                 fg=self.theme.muted,
                 bg=self.theme.card
             ).pack(side="left")
             
-            tk.Label(
+            self.theme.create(
+                tk.Label,
                 row,
                 text=value,
-                font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+                font=self.theme.font(self.theme.fonts.SM),
                 fg=self.theme.fg,
                 bg=self.theme.card
             ).pack(side="right")
@@ -124,31 +131,34 @@ class AboutPage(tk.Frame):
         ]
         
         for icon, title, desc in features:
-            feat_row = tk.Frame(feature_content, bg=self.theme.card)
+            feat_row = self.theme.create(tk.Frame, feature_content, bg=self.theme.card)
             feat_row.pack(fill="x", pady=6)
             
-            tk.Label(
+            self.theme.create(
+                tk.Label,
                 feat_row,
                 text=icon,
-                font=(self.theme.fonts.FAMILY, 18),
+                font=self.theme.font(18),
                 bg=self.theme.card
             ).pack(side="left", padx=(0, 12))
             
-            text_frame = tk.Frame(feat_row, bg=self.theme.card)
+            text_frame = self.theme.create(tk.Frame, feat_row, bg=self.theme.card)
             text_frame.pack(side="left", fill="x", expand=True)
             
-            tk.Label(
+            self.theme.create(
+                tk.Label,
                 text_frame,
                 text=title,
-                font=(self.theme.fonts.FAMILY, self.theme.fonts.SM, "bold"),
+                font=self.theme.font(self.theme.fonts.SM, "bold"),
                 fg=self.theme.fg,
                 bg=self.theme.card
             ).pack(anchor="w")
             
-            tk.Label(
+            self.theme.create(
+                tk.Label,
                 text_frame,
                 text=desc,
-                font=(self.theme.fonts.FAMILY, self.theme.fonts.XS),
+                font=self.theme.font(self.theme.fonts.XS),
                 fg=self.theme.muted,
                 bg=self.theme.card
             ).pack(anchor="w")
@@ -159,18 +169,20 @@ class AboutPage(tk.Frame):
         
         copyright_content = copyright_card.get_content_frame()
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             copyright_content,
             text="© 2025 QingYang. All rights reserved.",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.XS),
+            font=self.theme.font(self.theme.fonts.XS),
             fg=self.theme.muted,
             bg=self.theme.card
         ).pack()
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             copyright_content,
             text="本软件仅供个人学习和使用",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.XS),
+            font=self.theme.font(self.theme.fonts.XS),
             fg=self.theme.muted,
             bg=self.theme.card
         ).pack(pady=(4, 0))
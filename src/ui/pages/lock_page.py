@@ -18,6 +18,7 @@ class LockPage(tk.Frame):
     def __init__(self, parent, theme: Theme, **kwargs):
         super().__init__(parent, bg=theme.bg, **kwargs)
         self.theme = theme
+        theme.register(self, bg=theme.bg)
         
         # 回调
         self._on_lock: Callable[[str], None] = None
@@ -31,14 +32,15 @@ class LockPage(tk.Frame):
     def _create_ui(self):
         """创建界面"""
         # 主容器
-        container = tk.Frame(self, bg=self.theme.bg)
+        container = self.theme.create(tk.Frame, self, bg=self.theme.bg)
         container.pack(fill="both", expand=True, padx=32, pady=24)
         
         # 页面标题
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             container,
             text="系统保护",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.XL3, "bold"),
+            font=self.theme.font(self.theme.fonts.XL3, "bold"),
             fg=self.theme.fg,
             bg=self.theme.bg
         ).pack(anchor="w", pady=(0, 24))
@@ -68,10 +70,11 @@ class LockPage(tk.Frame):
         ]
         
         for feat in features:
-            tk.Label(
+            self.theme.create(
+                tk.Label,
                 intro_content,
                 text=feat,
-                font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+                font=self.theme.font(self.theme.fonts.SM),
                 fg=self.theme.muted,
                 bg=self.theme.card
             ).pack(anchor="w", pady=2)
@@ -92,13 +95,14 @@ class LockPage(tk.Frame):
         action_content = action_card.get_content_frame()
         
         # 密码输入
-        password_frame = tk.Frame(action_content, bg=self.theme.card)
+        password_frame = self.theme.create(tk.Frame, action_content, bg=self.theme.card)
         password_frame.pack(fill="x", pady=(0, 16))
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             password_frame,
             text="解锁密码",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.fg,
             bg=self.theme.card
         ).pack(anchor="w", pady=(0, 8))
@@ -113,10 +117,11 @@ class LockPage(tk.Frame):
         self.password_entry.insert(0, "1234")
         
         # 提示
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             password_frame,
             text="输入正确密码后按回车即可解锁",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.XS),
+            font=self.theme.font(self.theme.fonts.XS),
             fg=self.theme.muted,
             bg=self.theme.card
         ).pack(anchor="w", pady=(8, 0))
@@ -7,13 +7,14 @@
 
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from typing import Callable, List, Dict
+from typing import Callable, List, Dict, Hashable
 from ..theme import Theme
 from ..components.base import ModernButton, ModernEntry, ModernCheckbox
 from ..components.card import Card, SectionHeader, Separator
 from ..components.switch import LabeledSwitch
 from ..components.scrollable import ScrollableFrame
 from ..components.progress import Spinner
+from ..components.virtual_list import VirtualList, VirtualRow
 
 
 class SettingsPage(tk.Frame):
@@ -22,14 +23,18 @@ class SettingsPage(tk.Frame):
     def __init__(self, parent, theme: Theme, **kwargs):
         super().__init__(parent, bg=theme.bg, **kwargs)
         self.theme = theme
+        theme.register(self, bg=theme.bg)
         
         # 回调
         self._on_save_hotkey: Callable = None
         self._on_save_autostart: Callable = None
         self._on_startup_apps_change: Callable = None
+        self._on_theme_change: Callable = None
         
-        # 数据
+        # 数据（列表按键引用每个软件，键在本页生命周期内不变）
         self._startup_apps: List[Dict] = []
+        self._apps_by_key: Dict[int, Dict] = {}
+        self._next_app_key = 0
         
         self._create_ui()
     
@@ -39,6 +44,7 @@ class SettingsPage(tk.Frame):
         on_app_autostart_change: Callable = None,
         on_save_autologon: Callable = None,
         on_startup_apps_change: Callable = None,
+        on_theme_change: Callable = None,
         **kwargs
     ):
         """设置回调函数"""
@@ -46,18 +52,20 @@ class SettingsPage(tk.Frame):
         self._on_app_autostart_change = on_app_autostart_change
         self._on_save_autologon = on_save_autologon
         self._on_startup_apps_change = on_startup_apps_change
+        self._on_theme_change = on_theme_change
     
     def _create_ui(self):
         """创建界面"""
         # 主容器
-        container = tk.Frame(self, bg=self.theme.bg)
+        container = self.theme.create(tk.Frame, self, bg=self.theme.bg)
         container.pack(fill="both", expand=True, padx=32, pady=24)
         
         # 页面标题
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             container,
             text="设置",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.XL3, "bold"),
+            font=self.theme.font(self.theme.fonts.XL3, "bold"),
             fg=self.theme.fg,
             bg=self.theme.bg
         ).pack(anchor="w", pady=(0, 24))
@@ -91,18 +99,19 @@ class SettingsPage(tk.Frame):
         self.hotkey_enabled.pack(fill="x", pady=(0, 12))
         
         # 快捷键组合
-        hotkey_combo_frame = tk.Frame(hotkey_content, bg=self.theme.card)
+        hotkey_combo_frame = self.theme.create(tk.Frame, hotkey_content, bg=self.theme.card)
         hotkey_combo_frame.pack(fill="x", pady=(0, 12))
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             hotkey_combo_frame,
             text="快捷键组合",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.fg,
             bg=self.theme.card
         ).pack(anchor="w", pady=(0, 8))
         
-        combo_row = tk.Frame(hotkey_combo_frame, bg=self.theme.card)
+        combo_row = self.theme.create(tk.Frame, hotkey_combo_frame, bg=self.theme.card)
         combo_row.pack(fill="x")
         
         self.hotkey_ctrl = ModernCheckbox(combo_row, self.theme, text="Ctrl")
@@ -114,10 +123,11 @@ class SettingsPage(tk.Frame):
         self.hotkey_shift = ModernCheckbox(combo_row, self.theme, text="Shift")
         self.hotkey_shift.pack(side="left", padx=(0, 16))
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             combo_row,
             text="+",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.muted,
             bg=self.theme.card
         ).pack(side="left", padx=(0, 8))
@@ -162,13 +172,14 @@ class SettingsPage(tk.Frame):
         self.autologon_enabled.pack(fill="x", pady=(0, 12))
         
         # 用户名
-        username_row = tk.Frame(autologon_content, bg=self.theme.card)
+        username_row = self.theme.create(tk.Frame, autologon_content, bg=self.theme.card)
         username_row.pack(fill="x", pady=(0, 8))
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             username_row,
             text="用户名",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.fg,
             bg=self.theme.card,
             width=10,
@@ -183,13 +194,14 @@ class SettingsPage(tk.Frame):
         self.autologon_username.pack(side="left", fill="x", expand=True)
         
         # 密码
-        password_row = tk.Frame(autologon_content, bg=self.theme.card)
+        password_row = self.theme.create(tk.Frame, autologon_content, bg=self.theme.card)
         password_row.pack(fill="x", pady=(0, 8))
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             password_row,
             text="密码",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.fg,
             bg=self.theme.card,
             width=10,
@@ -205,13 +217,14 @@ class SettingsPage(tk.Frame):
         self.autologon_password.pack(side="left", fill="x", expand=True)
         
         # 域名
-        domain_row = tk.Frame(autologon_content, bg=self.theme.card)
+        domain_row = self.theme.create(tk.Frame, autologon_content, bg=self.theme.card)
         domain_row.pack(fill="x", pady=(0, 12))
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             domain_row,
             text="域名",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.fg,
             bg=self.theme.card,
             width=10,
@@ -225,10 +238,11 @@ class SettingsPage(tk.Frame):
         )
         self.autologon_domain.pack(side="left", fill="x", expand=True)
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             autologon_content,
             text="提示：域名填 . 表示本机，留空则使用当前域",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.XS),
+            font=self.theme.font(self.theme.fonts.XS),
             fg=self.theme.muted,
             bg=self.theme.card
         ).pack(anchor="w", pady=(0, 8))
@@ -256,7 +270,7 @@ class SettingsPage(tk.Frame):
         ).pack(fill="x", pady=(0, 16))
         
         # 添加按钮
-        btn_row = tk.Frame(startup_content, bg=self.theme.card)
+        btn_row = self.theme.create(tk.Frame, startup_content, bg=self.theme.card)
         btn_row.pack(fill="x", pady=(0, 12))
         
         ModernButton(
@@ -267,9 +281,21 @@ class SettingsPage(tk.Frame):
             command=self._add_startup_app
         ).pack(side="left")
         
-        # 软件列表
-        self.apps_list_frame = tk.Frame(startup_content, bg=self.theme.card)
-        self.apps_list_frame.pack(fill="x")
+        # 软件列表（只为可见行创建控件）
+        self.apps_list = VirtualList(
+            startup_content,
+            self.theme,
+            create_row=lambda parent: _StartupAppRow(
+                parent,
+                self.theme,
+                on_toggle=self._toggle_startup_app,
+                on_delete=self._delete_startup_app
+            ),
+            row_height=32,
+            max_visible=8,
+            empty_text="暂无启动软件，点击上方按钮添加"
+        )
+        self.apps_list.pack(fill="x")
         
         # ========== 程序自启动 ==========
         autostart_card = Card(scroll_content, self.theme)
@@ -281,7 +307,7 @@ class SettingsPage(tk.Frame):
             autostart_content,
             self.theme,
             "程序设置",
-            "OfficeGuard 自身的启动设置"
+            "OfficeGuard 自身的启动与外观设置"
         ).pack(fill="x", pady=(0, 16))
         
         self.app_autostart = LabeledSwitch(
@@ -302,6 +328,15 @@ class SettingsPage(tk.Frame):
         )
         self.autostart_spinner.pack(side="right", padx=8)
         self.autostart_spinner.pack_forget()  # 默认隐藏
+        
+        self.dark_mode = LabeledSwitch(
+            autostart_content,
+            self.theme,
+            text="深色模式",
+            description="切换界面的浅色/深色外观",
+            command=self._on_dark_mode_switch
+        )
+        self.dark_mode.pack(fill="x", pady=(12, 0))
     
     def set_autostart_loading(self, loading: bool):
         """设置自启动加载状态"""
@@ -319,6 +354,11 @@ class SettingsPage(tk.Frame):
         if self._on_app_autostart_change:
             self._on_app_autostart_change(enabled)
     
+    def _on_dark_mode_switch(self, enabled: bool):
+        """深色模式开关切换"""
+        if self._on_theme_change:
+            self._on_theme_change(enabled)
+    
     def _save_hotkey(self):
         """保存快捷键设置"""
         if self._on_save_hotkey:
@@ -359,87 +399,46 @@ class SettingsPage(tk.Frame):
             }
             
             self._startup_apps.append(app)
-            self._refresh_apps_list()
-            
-            if self._on_startup_apps_change:
-                self._on_startup_apps_change(self._startup_apps)
+            self.apps_list.append(self._register_app(app), app)
+            self._notify_apps_change()
+    
+    def _register_app(self, app: Dict) -> int:
+        """为软件分配列表键"""
+        key = self._next_app_key
+        self._next_app_key += 1
+        self._apps_by_key[key] = app
+        return key
     
     def _refresh_apps_list(self):
-        """刷新软件列表显示"""
-        # 清空现有列表
-        for widget in self.apps_list_frame.winfo_children():
-            widget.destroy()
-        
-        if not self._startup_apps:
-            tk.Label(
-                self.apps_list_frame,
-                text="暂无启动软件，点击上方按钮添加",
-                font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
-                fg=self.theme.muted,
-                bg=self.theme.card
-            ).pack(anchor="w", pady=8)
+        """按当前数据重建列表数据（行控件复用）"""
+        self._apps_by_key.clear()
+        self.apps_list.set_items([(self._register_app(app), app) for app in self._startup_apps])
+    
+    def _toggle_startup_app(self, key: int, enabled: bool):
+        """启用/禁用软件"""
+        app = self._apps_by_key.get(key)
+        if app is None:
             return
-        
-        for i, app in enumerate(self._startup_apps):
-            self._create_app_row(i, app)
+        app["enabled"] = enabled
+        self.apps_list.refresh(key)
+        self._notify_apps_change()
     
-    def _create_app_row(self, index: int, app: Dict):
-        """创建软件行"""
-        row = tk.Frame(self.apps_list_frame, bg=self.theme.card)
-        row.pack(fill="x", pady=4)
-        
-        # 启用开关
-        enabled_var = tk.BooleanVar(value=app.get("enabled", True))
-        
-        def toggle_enabled():
-            app["enabled"] = enabled_var.get()
-            if self._on_startup_apps_change:
-                self._on_startup_apps_change(self._startup_apps)
-        
-        cb = tk.Checkbutton(
-            row,
-            variable=enabled_var,
-            command=toggle_enabled,
-            bg=self.theme.card,
-            activebackground=self.theme.card
-        )
-        cb.pack(side="left")
-        
-        # 软件名称
-        tk.Label(
-            row,
-            text=app.get("name", "未命名"),
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
-            fg=self.theme.fg if app.get("enabled", True) else self.theme.muted,
-            bg=self.theme.card
-        ).pack(side="left", padx=(4, 0))
-        
-        # 路径
-        tk.Label(
-            row,
-            text=f"({app.get('path', '')[:30]}...)" if len(app.get('path', '')) > 30 else f"({app.get('path', '')})",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.XS),
-            fg=self.theme.muted,
-            bg=self.theme.card
-        ).pack(side="left", padx=(8, 0))
-        
-        # 删除按钮
-        def delete_app():
-            self._startup_apps.pop(index)
-            self._refresh_apps_list()
-            if self._on_startup_apps_change:
-                self._on_startup_apps_change(self._startup_apps)
-        
-        del_btn = tk.Label(
-            row,
-            text="✕",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
-            fg=self.theme.colors.danger,
-            bg=self.theme.card,
-            cursor="hand2"
-        )
-        del_btn.pack(side="right")
-        del_btn.bind("<Button-1>", lambda e: delete_app())
+    def _delete_startup_app(self, key: int):
+        """删除软件"""
+        app = self._apps_by_key.pop(key, None)
+        if app is None:
+            return
+        # 按对象删除，内容相同的两项也不会删错
+        for i, item in enumerate(self._startup_apps):
+            if item is app:
+                del self._startup_apps[i]
+                break
+        self.apps_list.remove(key)
+        self._notify_apps_change()
+    
+    def _notify_apps_change(self):
+        if self._on_startup_apps_change:
+            self._on_startup_apps_change(self._startup_apps)
     
     def load_settings(
         self,
@@ -452,7 +451,8 @@ class SettingsPage(tk.Frame):
         autologon_enabled: bool = False,
         autologon_username: str = "",
         autologon_domain: str = ".",
-        startup_apps: list = None
+        startup_apps: list = None,
+        dark_mode: bool = False
     ):
         """加载设置数据"""
         # 快捷键设置
@@ -469,7 +469,89 @@ class SettingsPage(tk.Frame):
         
         # 程序自启
         self.app_autostart.set(autostart_enabled)
+        self.dark_mode.set(dark_mode)
         
         # 启动软件
         self._startup_apps = startup_apps or []
         self._refresh_apps_list()
+
+
+class _StartupAppRow(VirtualRow):
+    """启动软件列表的一行（被虚拟列表复用，绑定到不同软件时只更新文字与颜色）"""
+    
+    PATH_MAX = 30
+    
+    def __init__(
+        self,
+        parent,
+        theme: Theme,
+        on_toggle: Callable[[Hashable, bool], None],
+        on_delete: Callable[[Hashable], None]
+    ):
+        self.theme = theme
+        self.key = None
+        self._on_toggle = on_toggle
+        self._on_delete = on_delete
+        
+        self.widget = theme.create(tk.Frame, parent, bg=theme.card)
+        
+        # 启用开关
+        self.enabled_var = tk.BooleanVar(value=True)
+        theme.create(
+            tk.Checkbutton,
+            self.widget,
+            variable=self.enabled_var,
+            command=self._toggle,
+            bg=theme.card,
+            activebackground=theme.card
+        ).pack(side="left")
+        
+        # 软件名称
+        self.name_label = theme.create(
+            tk.Label,
+            self.widget,
+            font=theme.font(theme.fonts.SM),
+            fg=theme.fg,
+            bg=theme.card
+        )
+        self.name_label.pack(side="left", padx=(4, 0))
+        
+        # 路径
+        self.path_label = theme.create(
+            tk.Label,
+            self.widget,
+            font=theme.font(theme.fonts.XS),
+            fg=theme.muted,
+            bg=theme.card
+        )
+        self.path_label.pack(side="left", padx=(8, 0))
+        
+        # 删除按钮（删除时读取行当前绑定的键）
+        del_btn = theme.create(
+            tk.Label,
+            self.widget,
+            text="✕",
+            font=theme.font(theme.fonts.SM),
+            fg=theme.colors.danger,
+            bg=theme.card,
+            cursor="hand2"
+        )
+        del_btn.pack(side="right")
+        del_btn.bind("<Button-1>", lambda e: self._on_delete(self.key))
+    
+    def bind(self, key: Hashable, app: Dict):
+        self.key = key
+        enabled = app.get("enabled", True)
+        path = app.get("path", "")
+        self.enabled_var.set(enabled)
+        self.theme.configure(
+            self.name_label,
+            text=app.get("name", "未命名"),
+            fg=self.theme.fg if enabled else self.theme.muted
+        )
+        self.path_label.configure(
+            text=f"({path[:self.PATH_MAX]}...)" if len(path) > self.PATH_MAX else f"({path})"
+        )
+    
+    def _toggle(self):
+        self._on_toggle(self.key, self.enabled_var.get())
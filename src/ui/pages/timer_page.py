@@ -19,6 +19,7 @@ class TimerPage(tk.Frame):
     def __init__(self, parent, theme: Theme, **kwargs):
         super().__init__(parent, bg=theme.bg, **kwargs)
         self.theme = theme
+        theme.register(self, bg=theme.bg)
         
         self._on_start_shutdown: Callable[[float, int], None] = None
         self._on_start_sleep: Callable[[float, int], None] = None
@@ -40,38 +41,41 @@ class TimerPage(tk.Frame):
     
     def _create_ui(self):
         """创建界面"""
-        container = tk.Frame(self, bg=self.theme.bg)
+        container = self.theme.create(tk.Frame, self, bg=self.theme.bg)
         container.pack(fill="both", expand=True, padx=32, pady=24)
         
         # 页面标题
-        header = tk.Frame(container, bg=self.theme.bg)
+        header = self.theme.create(tk.Frame, container, bg=self.theme.bg)
         header.pack(fill="x", pady=(0, 20))
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             header,
             text="定时任务",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.XL3, "bold"),
+            font=self.theme.font(self.theme.fonts.XL3, "bold"),
             fg=self.theme.fg,
             bg=self.theme.bg
         ).pack(side="left")
         
         # 状态标签
-        self.status_frame = tk.Frame(header, bg=self.theme.bg)
+        self.status_frame = self.theme.create(tk.Frame, header, bg=self.theme.bg)
         self.status_frame.pack(side="right")
         
-        self.status_dot = tk.Label(
+        self.status_dot = self.theme.create(
+            tk.Label,
             self.status_frame,
             text="●",
-            font=(self.theme.fonts.FAMILY, 8),
+            font=self.theme.font(8),
             fg=self.theme.colors.success,
             bg=self.theme.bg
         )
         self.status_dot.pack(side="left", padx=(0, 4))
         
-        self.status_label = tk.Label(
+        self.status_label = self.theme.create(
+            tk.Label,
             self.status_frame,
             text="准备就绪",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.muted,
             bg=self.theme.bg
         )
@@ -84,11 +88,11 @@ class TimerPage(tk.Frame):
         scroll_content = scroll.get_frame()
         
         # 主内容区 - 两列布局
-        content = tk.Frame(scroll_content, bg=self.theme.bg)
+        content = self.theme.create(tk.Frame, scroll_content, bg=self.theme.bg)
         content.pack(fill="both", expand=True, padx=4)
         
         # 左侧 - 进度显示
-        left = tk.Frame(content, bg=self.theme.bg)
+        left = self.theme.create(tk.Frame, content, bg=self.theme.bg)
         left.pack(side="left", fill="both", expand=True, padx=(0, 16))
         
         # 进度卡片
@@ -107,30 +111,32 @@ class TimerPage(tk.Frame):
         self.progress.pack(expand=True, pady=16)
         
         # 剩余时间
-        self.time_label = tk.Label(
+        self.time_label = self.theme.create(
+            tk.Label,
             progress_content,
             text="--:--",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.XL4, "bold"),
+            font=self.theme.font(self.theme.fonts.XL4, "bold"),
             fg=self.theme.fg,
             bg=self.theme.card
         )
         self.time_label.pack(pady=(0, 4))
         
-        self.desc_label = tk.Label(
+        self.desc_label = self.theme.create(
+            tk.Label,
             progress_content,
             text="设置时间后点击开始",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.muted,
             bg=self.theme.card
         )
         self.desc_label.pack()
         
         # 右侧 - 设置面板
-        right = tk.Frame(content, bg=self.theme.bg)
+        right = self.theme.create(tk.Frame, content, bg=self.theme.bg)
         right.pack(side="right", fill="y")
         
         # 占位Frame用于固定宽度
-        tk.Frame(right, width=320, height=1, bg=self.theme.bg).pack()
+        self.theme.create(tk.Frame, right, width=320, height=1, bg=self.theme.bg).pack()
         
         # 时间设置卡片
         time_card = Card(right, self.theme)
@@ -141,18 +147,19 @@ class TimerPage(tk.Frame):
         SectionHeader(time_content, self.theme, "时间设置").pack(fill="x", pady=(0, 12))
         
         # 定时时间
-        time_row = tk.Frame(time_content, bg=self.theme.card)
+        time_row = self.theme.create(tk.Frame, time_content, bg=self.theme.card)
         time_row.pack(fill="x", pady=(0, 8))
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             time_row,
             text="定时时间",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.fg,
             bg=self.theme.card
         ).pack(side="left")
         
-        time_input = tk.Frame(time_row, bg=self.theme.card)
+        time_input = self.theme.create(tk.Frame, time_row, bg=self.theme.card)
         time_input.pack(side="right")
         
         self.time_entry = ModernEntry(
@@ -164,27 +171,29 @@ class TimerPage(tk.Frame):
         self.time_entry.pack(side="left")
         self.time_entry.insert(0, "60")
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             time_input,
             text="分钟",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.muted,
             bg=self.theme.card
         ).pack(side="left", padx=(6, 0))
         
         # 宽限期
-        grace_row = tk.Frame(time_content, bg=self.theme.card)
+        grace_row = self.theme.create(tk.Frame, time_content, bg=self.theme.card)
         grace_row.pack(fill="x")
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             grace_row,
             text="宽限期",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.fg,
             bg=self.theme.card
         ).pack(side="left")
         
-        grace_input = tk.Frame(grace_row, bg=self.theme.card)
+        grace_input = self.theme.create(tk.Frame, grace_row, bg=self.theme.card)
         grace_input.pack(side="right")
         
         self.grace_entry = ModernEntry(
@@ -196,10 +205,11 @@ class TimerPage(tk.Frame):
         self.grace_entry.pack(side="left")
         self.grace_entry.insert(0, "30")
         
-        tk.Label(
+        self.theme.create(
+            tk.Label,
             grace_input,
             text="秒",
-            font=(self.theme.fonts.FAMILY, self.theme.fonts.SM),
+            font=self.theme.font(self.theme.fonts.SM),
             fg=self.theme.muted,
             bg=self.theme.card
         ).pack(side="left", padx=(6, 0))
@@ -287,7 +297,7 @@ class TimerPage(tk.Frame):
             self.sleep_btn.configure(state="disabled")
             self.cancel_btn.configure(state="normal")
             
-            self.status_dot.configure(fg=self.theme.colors.warning)
+            self.theme.configure(self.status_dot, fg=self.theme.colors.warning)
             self.status_label.configure(text=f"正在运行 - {task_type}")
             
             if remaining is not None:
@@ -300,7 +310,7 @@ class TimerPage(tk.Frame):
             self.sleep_btn.configure(state="normal")
             self.cancel_btn.configure(state="disabled")
             
-            self.status_dot.configure(fg=self.theme.colors.success)
+            self.theme.configure(self.status_dot, fg=self.theme.colors.success)
             self.status_label.configure(text="准备就绪")
             
             self.time_label.configure(text="--:--")
@@ -314,10 +324,10 @@ class TimerPage(tk.Frame):
         mins = remaining // 60
         secs = remaining % 60
         self.time_label.configure(text=f"{mins:02d}:{secs:02d}")
-
+    
     def update_grace(self, remaining: int):
         """更新宽限期倒计时"""
-        self.status_dot.configure(fg=self.theme.colors.danger)
+        self.theme.configure(self.status_dot, fg=self.theme.colors.danger)
         self.status_label.configure(text="即将执行")
         
         self.time_label.configure(text=f"{remaining}s")
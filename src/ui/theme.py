@@ -3,8 +3,11 @@
 现代简洁风格 - 参考 shadcn/ui
 """
 
-from dataclasses import dataclass
-from typing import Dict
+import tkinter as tk
+import weakref
+from dataclasses import dataclass, fields
+from tkinter import font as tkfont
+from typing import Callable, Dict, Optional, Tuple
 
 
 @dataclass
@@ -147,30 +150,73 @@ DARK_THEME = ColorScheme(
 
 # 字体配置
 class Fonts:
-    """字体配置 - 根据 DPI 自动调整"""
+    """
+    字体配置 - 根据 DPI 自动调整
+    
+    font() 返回按 (字体, 字号, 粗细) 缓存的命名字体，控件引用字体名，Tk 不必逐个解析字体元组；
+    字号以像素设置并按 init_scale 得到的缩放因子换算，set_scale() 只需重新配置这些命名字体
+    """
     FAMILY = "Microsoft YaHei UI"  # 微软雅黑，Windows 上显示效果好
     FAMILY_MONO = "Consolas"
     
     # 获取 DPI 缩放因子
     _scale = 1.0
+    _root = None
+    _cache: Dict[Tuple[str, int, str], tkfont.Font] = {}
     
     @classmethod
     def init_scale(cls, root):
         """初始化 DPI 缩放因子"""
+        cls._root = root
         try:
             # 获取实际 DPI
             dpi = root.winfo_fpixels('1i')
-            cls._scale = dpi / 96.0  # 96 是标准 DPI
-            if cls._scale < 1.0:
-                cls._scale = 1.0
+            scale = dpi / 96.0  # 96 是标准 DPI
+            if scale < 1.0:
+                scale = 1.0
         except:
-            cls._scale = 1.0
+            scale = 1.0
+        cls.set_scale(scale)
+    
+    @classmethod
+    def set_scale(cls, scale: float):
+        """修改缩放因子，已创建的字体随之更新"""
+        cls._scale = scale
+        for (family, size, weight), font in cls._cache.items():
+            font.configure(size=cls._pixels(size))
     
     @classmethod
     def scaled(cls, size: int) -> int:
         """根据 DPI 缩放字体大小"""
         return int(size * cls._scale)
     
+    @classmethod
+    def _pixels(cls, size: int) -> int:
+        """磅值在当前缩放下的像素字号（Tk 中负数表示像素）"""
+        return -max(1, round(size * 96 / 72 * cls._scale))
+    
+    @classmethod
+    def font(cls, size: int, weight: str = "normal", family: str = None) -> tkfont.Font:
+        """
+        获取命名字体
+        
+        :param size: 字号（磅，按 96 DPI 计）
+        :param weight: normal 或 bold
+        :param family: 字体，默认 FAMILY
+        """
+        key = (family or cls.FAMILY, size, weight)
+        font = cls._cache.get(key)
+        if font is None:
+            font = tkfont.Font(
+                root=cls._root,
+                name=f"og-{key[0].replace(' ', '_')}-{size}-{weight}",
+                family=key[0],
+                size=cls._pixels(size),
+                weight=weight
+            )
+            cls._cache[key] = font
+        return font
+    
     # 字体大小 - 完整名称
     SIZE_XS = 9
     SIZE_SM = 10
@@ -192,8 +238,8 @@ class Fonts:
     XL4 = 24
     
     @classmethod
-    def get(cls, size: str = "base", weight: str = "normal"):
-        """获取字体元组"""
+    def get(cls, size: str = "base", weight: str = "normal") -> tkfont.Font:
+        """按尺寸名称获取命名字体"""
         size_map = {
             "xs": cls.SIZE_XS,
             "sm": cls.SIZE_SM,
@@ -204,55 +250,182 @@ class Fonts:
             "3xl": cls.SIZE_3XL,
             "4xl": cls.SIZE_4XL,
         }
-        font_size = size_map.get(size, cls.SIZE_BASE)
-        return (cls.FAMILY, font_size, weight) if weight != "normal" else (cls.FAMILY, font_size)
+        return cls.font(size_map.get(size, cls.SIZE_BASE), weight)
 
 
-class Theme:
-    """主题管理器"""
-    
-    def __init__(self, mode: str = "light"):
-        self.mode = mode
-        self.colors = LIGHT_THEME if mode == "light" else DARK_THEME
-        self.fonts = Fonts
-        
-    @property
-    def bg(self) -> str:
-        return self.colors.bg_primary
-    
-    @property
-    def bg2(self) -> str:
-        return self.colors.bg_secondary
-    
-    @property
-    def bg3(self) -> str:
-        return self.colors.bg_tertiary
-    
-    @property
-    def card(self) -> str:
-        return self.colors.bg_card
+class Token(str):
+    """带名称的颜色值：name 为 ColorScheme 字段名，样式注册表据此记录控件使用的主题颜色"""
     
-    @property
-    def fg(self) -> str:
-        return self.colors.text_primary
+    __slots__ = ("name",)
     
-    @property
-    def fg2(self) -> str:
-        return self.colors.text_secondary
+    def __new__(cls, value: str, name: str):
+        token = super().__new__(cls, value)
+        token.name = name
+        return token
+
+
+class StyleRegistry:
+    """
+    样式注册表
+    
+    控件登记各颜色选项使用的主题颜色名（值为 Token 的选项，普通颜色字符串视为固定颜色）；
+    切换主题时只对颜色确实变化的选项按控件批量 configure 一次。
+    有自绘内容或状态相关颜色的组件登记 on_change(widget)，在批量更新后自行重绘。
+    控件以弱引用登记，销毁后自动移除
+    """
+    
+    def __init__(self):
+        self._styles: "weakref.WeakKeyDictionary[tk.Misc, list]" = weakref.WeakKeyDictionary()
+        
+        # 统计
+        self.configures = 0
+        self.callbacks = 0
     
-    @property
-    def muted(self) -> str:
-        return self.colors.text_muted
+    def register(self, widget: tk.Misc, on_change: Callable[[tk.Misc], None] = None, **options):
+        """
+        登记控件的颜色选项
+        
+        :param on_change: 主题切换后调用（参数为控件本身，不要传绑定方法，以免控件无法释放）
+        :param options: 选项 -> 颜色；Token 值被跟踪，普通字符串取消对该选项的跟踪
+        """
+        entry = self._styles.get(widget)
+        if entry is None:
+            entry = self._styles[widget] = [{}, None]
+        tracked = entry[0]
+        for option, value in options.items():
+            if isinstance(value, Token):
+                tracked[option] = value.name
+            else:
+                tracked.pop(option, None)
+        if on_change is not None:
+            entry[1] = on_change
+    
+    def token_of(self, widget: tk.Misc, option: str) -> Optional[str]:
+        """控件某选项登记的颜色名"""
+        entry = self._styles.get(widget)
+        return entry[0].get(option) if entry else None
+    
+    def __len__(self) -> int:
+        return len(self._styles)
+    
+    def apply(self, old: Dict[str, str], new: Dict[str, str]) -> int:
+        """
+        按新旧颜色表更新登记的控件
+        
+        :return: 调用 configure 的控件数
+        """
+        changed = {name for name, value in new.items() if old.get(name) != value}
+        configured = 0
+        callbacks = []
+        
+        for widget, (tracked, on_change) in list(self._styles.items()):
+            options = {
+                option: new[name]
+                for option, name in tracked.items()
+                if name in changed
+            }
+            try:
+                if options:
+                    widget.configure(**options)
+                    configured += 1
+            except tk.TclError:
+                # 控件已销毁
+                self._styles.pop(widget, None)
+                continue
+            if on_change is not None:
+                callbacks.append((widget, on_change))
+        
+        for widget, on_change in callbacks:
+            try:
+                on_change(widget)
+            except tk.TclError:
+                self._styles.pop(widget, None)
+        
+        self.configures += configured
+        self.callbacks += len(callbacks)
+        return configured
+
+
+class Theme:
+    """
+    主题管理器
+    
+    颜色在切换配色时解析为 Token（常用的还有 bg、card、fg 等简写属性），读取时不再经过 colors；
+    通过 create/register 创建或登记的控件在 set_mode 时由样式注册表批量更新
+    """
+    
+    # 简写名称 -> ColorScheme 字段
+    TOKENS = {
+        "bg": "bg_primary",
+        "bg2": "bg_secondary",
+        "bg3": "bg_tertiary",
+        "card": "bg_card",
+        "fg": "text_primary",
+        "fg2": "text_secondary",
+        "muted": "text_muted",
+        "accent": "accent",
+        "border": "border",
+    }
     
-    @property
-    def accent(self) -> str:
-        return self.colors.accent
+    def __init__(self, mode: str = "light"):
+        self.mode = "dark" if mode == "dark" else "light"
+        self.fonts = Fonts
+        self.styles = StyleRegistry()
+        self._apply_colors(DARK_THEME if self.mode == "dark" else LIGHT_THEME)
     
-    @property
-    def border(self) -> str:
-        return self.colors.border
+    def _apply_colors(self, scheme: ColorScheme):
+        """切换配色并解析颜色表"""
+        self.tokens: Dict[str, Token] = {
+            f.name: Token(getattr(scheme, f.name), f.name) for f in fields(scheme)
+        }
+        self.colors = ColorScheme(**self.tokens)
+        for name, field in self.TOKENS.items():
+            setattr(self, name, self.tokens[field])
+    
+    def font(self, size: int, weight: str = "normal", family: str = None) -> tkfont.Font:
+        """获取命名字体（见 Fonts.font）"""
+        return Fonts.font(size, weight, family)
+    
+    # ==================== 样式注册 ====================
+    
+    def create(self, widget_class, master, **kwargs):
+        """创建控件并登记其中的主题颜色选项"""
+        widget = widget_class(master, **kwargs)
+        self.styles.register(widget, **kwargs)
+        return widget
+    
+    def register(self, widget, on_change: Callable = None, **options):
+        """登记已创建控件的主题颜色选项（见 StyleRegistry.register），返回控件"""
+        self.styles.register(widget, on_change, **options)
+        return widget
+    
+    def configure(self, widget, **options):
+        """修改控件颜色并同步登记"""
+        widget.configure(**options)
+        self.styles.register(widget, **options)
+    
+    def color_of(self, widget, option: str) -> Optional[Token]:
+        """控件某选项登记的主题颜色（未登记时为 None）"""
+        name = self.styles.token_of(widget, option)
+        return self.tokens[name] if name else None
+    
+    # ==================== 切换 ====================
+    
+    def set_mode(self, mode: str) -> int:
+        """
+        切换浅色/深色主题并更新已登记的控件
+        
+        :param mode: 'light' 或 'dark'
+        :return: 重新配置的控件数
+        """
+        mode = "dark" if mode == "dark" else "light"
+        if mode == self.mode:
+            return 0
+        old = self.tokens
+        self.mode = mode
+        self._apply_colors(DARK_THEME if mode == "dark" else LIGHT_THEME)
+        return self.styles.apply(old, self.tokens)
     
-    def toggle(self):
+    def toggle(self) -> int:
         """切换主题"""
-        self.mode = "dark" if self.mode == "light" else "light"
-        self.colors = LIGHT_THEME if self.mode == "light" else DARK_THEME
+        return self.set_mode("dark" if self.mode == "light" else "light")
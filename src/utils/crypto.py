@@ -10,9 +10,6 @@ from .logger import get_logger
 
 logger = get_logger('crypto')
 
-# Windows API
-kernel32 = ctypes.windll.kernel32
-
 
 class DATA_BLOB(ctypes.Structure):
     """DPAPI 数据结构"""
@@ -59,7 +56,7 @@ def encrypt_data(data_str: str) -> str | None:
             # 获取加密数据
             encrypted_bytes = ctypes.string_at(blob_out.pbData, blob_out.cbData)
             # 释放内存
-            kernel32.LocalFree(blob_out.pbData)
+            ctypes.windll.kernel32.LocalFree(blob_out.pbData)
             # Base64编码
             return base64.b64encode(encrypted_bytes).decode('ascii')
         else:
@@ -106,7 +103,7 @@ def decrypt_data(encrypted_str: str) -> str | None:
             # 获取解密数据
             decrypted_bytes = ctypes.string_at(blob_out.pbData, blob_out.cbData)
             # 释放内存
-            kernel32.LocalFree(blob_out.pbData)
+            ctypes.windll.kernel32.LocalFree(blob_out.pbData)
             # 转换为字符串
             return decrypted_bytes.decode('utf-8')
         else:
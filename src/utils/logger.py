@@ -1,26 +1,133 @@
 """
 日志模块
 配置并管理应用程序日志
+
+调用线程只把日志记录放入有界队列，由后台监听线程写文件和控制台，
+钩子回调、定时循环等线程不会被文件 I/O 阻塞
 """
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+import weakref
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict
 from .paths import get_log_dir, is_frozen
 
 # 全局 logger 实例
 _logger = None
 
+# 日志队列
+LOG_QUEUE_SIZE = 10000
+_queue_handler: "DroppingQueueHandler" = None
+_listener: "DroppingQueueListener" = None
+
+# 已创建的热路径 logger（日志级别变化时刷新）
+_hot_loggers = weakref.WeakSet()
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    有界队列处理器
+    
+    队列满时不阻塞调用线程：低于 WARNING 的记录直接丢弃，
+    WARNING 及以上挤掉队列中最旧的一条
+    """
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.enqueued = 0
+        self.dropped = 0
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+            return
+        except queue.Full:
+            pass
+        
+        if record.levelno >= logging.WARNING:
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+                self.enqueued += 1
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped += 1
+
+
+class DroppingQueueListener(QueueListener):
+    """队列监听器：出现丢弃时在日志中补一条说明"""
+    
+    def __init__(self, log_queue: queue.Queue, source: DroppingQueueHandler, *handlers):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self._source = source
+        self._reported = 0
+    
+    def handle(self, record: logging.LogRecord):
+        dropped = self._source.dropped
+        if dropped != self._reported:
+            notice = logging.LogRecord(
+                'OfficeGuard.logging', logging.WARNING, __file__, 0,
+                f"日志队列已满，丢弃了 {dropped - self._reported} 条日志", None, None
+            )
+            self._reported = dropped
+            super().handle(notice)
+        super().handle(record)
+    
+    def enqueue_sentinel(self):
+        # 队列满时 put_nowait 会抛出 queue.Full，退出时等待监听线程腾出位置
+        self.queue.put(self._sentinel)
+
+
+class HotPathLogger:
+    """
+    热路径 logger
+    
+    低于当前级别的方法直接绑定为空函数，调用时不做级别判断、不创建日志记录；
+    用于钩子、按键监听等对延迟敏感的线程
+    """
+    
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+        self.refresh()
+        _hot_loggers.add(self)
+    
+    def refresh(self):
+        """按 logger 当前级别重新绑定方法"""
+        for name, level in (
+            ("debug", logging.DEBUG),
+            ("info", logging.INFO),
+            ("warning", logging.WARNING),
+            ("error", logging.ERROR),
+        ):
+            method = getattr(self._logger, name) if self._logger.isEnabledFor(level) else _noop
+            setattr(self, name, method)
 
-def setup_logging() -> logging.Logger:
+
+def setup_logging(level: int = None) -> logging.Logger:
     """
     配置日志系统
     日志路径: C:\\Users\\{用户}\\AppData\\Local\\OfficeGuard\\logs\\guard.log
+    
+    :param level: 日志级别，默认读取环境变量 OFFICEGUARD_LOG_LEVEL，未设置时为 DEBUG
     """
-    global _logger
+    global _logger, _queue_handler, _listener
     
     if _logger is not None:
         return _logger
     
+    if level is None:
+        level = logging.getLevelName(os.environ.get("OFFICEGUARD_LOG_LEVEL", "DEBUG").upper())
+        if not isinstance(level, int):
+            level = logging.DEBUG
+    
     log_dir = get_log_dir()
     log_file = log_dir / 'guard.log'
     
@@ -48,11 +155,19 @@ def setup_logging() -> logging.Logger:
         console_handler.setLevel(logging.DEBUG)
         handlers.append(console_handler)
     
-    # 配置根logger
-    logging.basicConfig(
-        level=logging.DEBUG,
-        handlers=handlers
-    )
+    # 根 logger 只挂队列处理器，实际输出在监听线程中进行
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    _listener = DroppingQueueListener(log_queue, _queue_handler, *handlers)
+    _listener.start()
+    atexit.register(_listener.stop)  # 退出前写完队列中剩余的日志
+    
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_queue_handler)
+    
+    for hot_logger in list(_hot_loggers):
+        hot_logger.refresh()
     
     _logger = logging.getLogger('OfficeGuard')
     _logger.info("=" * 60)
@@ -75,3 +190,22 @@ def get_logger(name: str = None) -> logging.Logger:
     if name:
         return logging.getLogger(f'OfficeGuard.{name}')
     return _logger
+
+
+def get_hot_logger(name: str) -> HotPathLogger:
+    """
+    获取热路径 logger
+    :param name: logger名称
+    """
+    return HotPathLogger(get_logger(name))
+
+
+def get_logging_stats() -> Dict[str, int]:
+    """日志队列统计"""
+    if _queue_handler is None:
+        return {"log_enqueued": 0, "log_dropped": 0, "log_queue_size": 0}
+    return {
+        "log_enqueued": _queue_handler.enqueued,
+        "log_dropped": _queue_handler.dropped,
+        "log_queue_size": _queue_handler.queue.qsize(),
+    }
@@ -60,6 +60,20 @@ def get_log_dir() -> Path:
     return log_dir
 
 
+def get_cache_dir() -> Path:
+    """获取缓存目录"""
+    cache_dir = get_app_data_dir() / 'cache'
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_journal_dir() -> Path:
+    """获取事件日志目录"""
+    journal_dir = get_app_data_dir() / 'journal'
+    journal_dir.mkdir(parents=True, exist_ok=True)
+    return journal_dir
+
+
 def get_tools_dir() -> Path:
     """获取工具目录"""
     tools_dir = get_app_data_dir() / 'tools'
@@ -0,0 +1,21 @@
+"""
+测试公共配置
+
+测试在 Linux 上运行：应用数据目录指向临时目录，Windows API 由假后端代替
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# 日志、配置等写入临时目录，不影响本机的 OfficeGuard 数据
+os.environ["LOCALAPPDATA"] = tempfile.mkdtemp(prefix="officeguard-test-")
+
+# pystray 与 pynput 使用自带的无显示后端（子进程继承）
+os.environ.setdefault("PYSTRAY_BACKEND", "dummy")
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
@@ -0,0 +1,184 @@
+"""
+测试用假后端
+"""
+
+
+class SimulatedHookBackend:
+    """
+    模拟低级钩子
+    
+    系统输入总会推进最后输入时间；钩子只在已安装且未丢弃时收到事件。
+    unhook() 模拟系统静默移除钩子，drop/delay 模拟事件丢失与回调变慢
+    """
+    
+    def __init__(self, latency=None):
+        """
+        :param latency: 钩子回调耗时记录器（LatencyRecorder）
+        """
+        self.latency = latency
+        self.installed = True
+        self.events = 0
+        self.tick = 0
+        self.installs = 0
+        self.drop = 0
+        self.delay = 0.0
+    
+    def input(self, count: int = 1):
+        """产生 count 次系统输入"""
+        for _ in range(count):
+            self.tick += 1
+            if not self.installed:
+                continue
+            if self.drop:
+                self.drop -= 1
+                continue
+            self.events += 1
+            if self.latency is not None:
+                self.latency.record(self.delay)
+    
+    def unhook(self):
+        """系统静默移除钩子"""
+        self.installed = False
+    
+    def reinstall(self):
+        self.installed = True
+        self.installs += 1
+    
+    def get_event_count(self) -> int:
+        return self.events
+    
+    def get_last_input_tick(self) -> int:
+        return self.tick
+
+
+class FakeScheduler:
+    """
+    虚拟时钟上的延迟调度，接口与 root.after / after_cancel 相同
+    
+    advance() 推进时间并按到期顺序执行回调
+    """
+    
+    def __init__(self):
+        self.now = 0
+        self._seq = 0
+        self._pending = {}
+    
+    def schedule(self, ms: int, func):
+        self._seq += 1
+        self._pending[self._seq] = (self.now + ms, func)
+        return self._seq
+    
+    def cancel(self, handle):
+        self._pending.pop(handle, None)
+    
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+    
+    def run_next(self):
+        """推进到最早的回调并执行它"""
+        handle, (due, func) = min(self._pending.items(), key=lambda item: (item[1][0], item[0]))
+        del self._pending[handle]
+        self.now = due
+        func()
+    
+    def advance(self, ms: int):
+        """推进 ms 毫秒"""
+        end = self.now + ms
+        while self._pending:
+            handle, (due, func) = min(self._pending.items(), key=lambda item: (item[1][0], item[0]))
+            if due > end:
+                break
+            del self._pending[handle]
+            self.now = due
+            func()
+        self.now = end
+
+
+class FakeEnforcementBackend:
+    """锁定强制的假平台接口：记录每种系统调用的次数，状态由测试修改"""
+    
+    def __init__(self):
+        self.focused = True
+        self.trapped = True
+        self.signature = ("1920x1080",)
+        self.calls = {"has_focus": 0, "restore_focus": 0, "is_trapped": 0, "trap": 0, "display_signature": 0}
+    
+    def has_focus(self) -> bool:
+        self.calls["has_focus"] += 1
+        return self.focused
+    
+    def restore_focus(self):
+        self.calls["restore_focus"] += 1
+        self.focused = True
+    
+    def is_trapped(self) -> bool:
+        self.calls["is_trapped"] += 1
+        return self.trapped
+    
+    def trap(self):
+        self.calls["trap"] += 1
+        self.trapped = True
+    
+    def display_signature(self):
+        self.calls["display_signature"] += 1
+        return self.signature
+    
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+
+class FakeTopologyProvider:
+    """假显示器拓扑数据源：返回测试设置的显示器列表，并统计查询次数"""
+    
+    def __init__(self, *monitors):
+        self.monitors = list(monitors)
+        self.queries = 0
+    
+    def query(self):
+        from src.core.display import DisplayTopology, MonitorInfo
+        
+        self.queries += 1
+        left = min(m.left for m in self.monitors)
+        top = min(m.top for m in self.monitors)
+        right = max(m.right for m in self.monitors)
+        bottom = max(m.bottom for m in self.monitors)
+        return DisplayTopology(tuple(self.monitors), MonitorInfo(left, top, right, bottom))
+
+
+class FakeWinDLL:
+    """
+    假 ctypes.windll：任意 DLL 的任意函数都可调用并返回 0，调用记录在 calls 中
+    
+    GetLastInputInfo 把 last_input_tick 写入传入的结构体
+    """
+    
+    def __init__(self):
+        self.calls = []
+        self.last_input_tick = 0
+    
+    def __getattr__(self, dll: str):
+        if dll.startswith("_"):
+            raise AttributeError(dll)
+        return _FakeDLL(self, dll)
+
+
+class _FakeDLL:
+    def __init__(self, owner: FakeWinDLL, name: str):
+        self._owner = owner
+        self._name = name
+    
+    def __getattr__(self, func: str):
+        if func.startswith("_"):
+            raise AttributeError(func)
+        owner = self._owner
+        
+        def call(*args):
+            owner.calls.append((self._name, func))
+            if func == "GetLastInputInfo":
+                args[0]._obj.dwTime = owner.last_input_tick
+                return 1
+            return 0
+        
+        return call
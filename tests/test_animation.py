@@ -0,0 +1,143 @@
+"""共享动画时钟：after 链数量、隐藏时暂停与重复 start（假调度，不创建 Tk 窗口）"""
+
+import tkinter as tk
+
+import pytest
+
+from src.ui.components.animation import Animated, FrameClock
+from fakes import FakeScheduler
+
+
+class FakeRoot:
+    """只提供 get_frame_clock 读取的 _frame_clock"""
+    
+    def __init__(self, clock: FrameClock):
+        self._frame_clock = clock
+
+
+class Blinker(Animated):
+    """不依赖 Tk 的动画控件：映射状态由测试修改，事件按序列名分发"""
+    
+    def __init__(self, root: FakeRoot):
+        self._root_window = root
+        self.mapped = True
+        self.frames = 0
+        self.handlers = {}
+        self._init_animation()
+    
+    def _root(self):
+        return self._root_window
+    
+    def bind(self, sequence, func, add=None):
+        self.handlers.setdefault(sequence, []).append(func)
+    
+    def winfo_ismapped(self):
+        return self.mapped
+    
+    def fire(self, sequence):
+        if sequence == "<Map>":
+            self.mapped = True
+        elif sequence == "<Unmap>":
+            self.mapped = False
+        for func in self.handlers.get(sequence, ()):
+            func()
+    
+    def _on_frame(self):
+        self.frames += 1
+
+
+def make_clock(fps: int = 20):
+    scheduler = FakeScheduler()
+    clock = FrameClock(scheduler.schedule, scheduler.cancel, fps=fps)
+    return clock, scheduler
+
+
+def test_animated_requires_on_frame():
+    class Incomplete(Animated):
+        pass
+    
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_animations_share_one_chain():
+    clock, scheduler = make_clock(fps=20)
+    root = FakeRoot(clock)
+    spinners = [Blinker(root) for _ in range(5)]
+    for spinner in spinners:
+        spinner.start()
+    
+    assert scheduler.pending == 1
+    scheduler.advance(1000)
+    
+    assert clock.wakeups == 20
+    assert clock.frames == 100
+    assert all(spinner.frames == 20 for spinner in spinners)
+    assert scheduler.pending == 1
+
+
+def test_idle_clock_schedules_nothing():
+    clock, scheduler = make_clock()
+    spinner = Blinker(FakeRoot(clock))
+    spinner.start()
+    spinner.stop()
+    
+    assert scheduler.pending == 0
+    scheduler.advance(1000)
+    assert clock.wakeups == 0
+
+
+def test_unmapped_animation_pauses_and_resumes():
+    clock, scheduler = make_clock(fps=20)
+    spinner = Blinker(FakeRoot(clock))
+    spinner.start()
+    scheduler.advance(500)
+    assert spinner.frames == 10
+    
+    spinner.fire("<Unmap>")
+    assert scheduler.pending == 0
+    scheduler.advance(5000)
+    assert spinner.frames == 10
+    assert spinner.playing
+    
+    spinner.fire("<Map>")
+    scheduler.advance(500)
+    assert spinner.frames == 20
+
+
+def test_start_while_unmapped_waits_for_map():
+    clock, scheduler = make_clock()
+    spinner = Blinker(FakeRoot(clock))
+    spinner.mapped = False
+    spinner.start()
+    assert scheduler.pending == 0
+    
+    spinner.fire("<Map>")
+    assert clock.active == 1
+    assert scheduler.pending == 1
+
+
+def test_double_start_does_not_stack():
+    clock, scheduler = make_clock(fps=20)
+    spinner = Blinker(FakeRoot(clock))
+    spinner.start()
+    spinner.start()
+    spinner.fire("<Map>")
+    
+    assert clock.active == 1
+    assert scheduler.pending == 1
+    scheduler.advance(1000)
+    assert spinner.frames == 20
+
+
+def test_destroyed_widget_is_dropped():
+    clock, scheduler = make_clock()
+    
+    def dead():
+        raise tk.TclError('invalid command name ".!canvas"')
+    
+    clock.add(dead)
+    scheduler.advance(clock.interval)
+    
+    assert clock.active == 0
+    assert scheduler.pending == 0
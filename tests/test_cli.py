@@ -0,0 +1,100 @@
+"""命令行快速路径：不加载界面模块与重量级依赖，启动耗时在预算内"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.core.ipc import ControlServer, StatusCache
+from src.core.ipc_client import default_address
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 快速路径上不允许出现的模块
+FORBIDDEN = ("tkinter", "_tkinter", "src.ui", "pynput", "pystray", "PIL", "asyncio")
+
+# 从进入 main.py 到退出的耗时预算（不含解释器自身启动）
+STARTUP_BUDGET = 0.1
+
+# 在子进程中运行 main.py，退出时记录已加载的模块与耗时
+RUNNER = textwrap.dedent("""
+    import json, runpy, sys, time
+    start = time.perf_counter()
+    out = sys.argv[1]
+    sys.argv = ["main.py"] + sys.argv[2:]
+    code = 0
+    try:
+        runpy.run_path("main.py", run_name="__main__")
+    except SystemExit as e:
+        code = e.code
+    elapsed = time.perf_counter() - start
+    with open(out, "w") as f:
+        json.dump({"code": code, "elapsed": elapsed, "modules": sorted(sys.modules)}, f)
+""")
+
+
+def run_main(tmp_path, *argv):
+    out = tmp_path / "run.json"
+    proc = subprocess.run(
+        [sys.executable, "-c", RUNNER, str(out), *argv],
+        cwd=ROOT, capture_output=True, text=True, timeout=30, env=dict(os.environ)
+    )
+    result = json.loads(out.read_text())
+    result["stdout"] = proc.stdout
+    return result
+
+
+def loaded_forbidden(modules):
+    return [m for m in modules if any(m == f or m.startswith(f + ".") for f in FORBIDDEN)]
+
+
+@pytest.fixture
+def runtime_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def running_instance(runtime_dir):
+    status = StatusCache(mode="headless", locked=False, timer_running=False, hotkey_enabled=True)
+    server = ControlServer({"cancel_timer": lambda p: False}, status.get, address=default_address())
+    server.start()
+    yield server
+    server.stop()
+    server._thread.join(2)
+
+
+def test_status_without_instance_stays_off_ui_path(tmp_path, runtime_dir):
+    result = run_main(tmp_path, "status")
+    assert result["code"] == 1
+    assert loaded_forbidden(result["modules"]) == []
+
+
+def test_status_against_running_instance(tmp_path, running_instance):
+    result = run_main(tmp_path, "status", "--json")
+    assert result["code"] == 0
+    assert json.loads(result["stdout"])["mode"] == "headless"
+    assert loaded_forbidden(result["modules"]) == []
+
+
+def test_cancel_reports_refusal(tmp_path, running_instance):
+    result = run_main(tmp_path, "cancel")
+    assert result["code"] == 1
+    assert loaded_forbidden(result["modules"]) == []
+
+
+def test_history_reads_journal_without_ui(tmp_path, runtime_dir):
+    result = run_main(tmp_path, "history", "--json")
+    assert result["code"] == 0
+    assert json.loads(result["stdout"]) == []
+    assert loaded_forbidden(result["modules"]) == []
+
+
+def test_startup_budget(tmp_path, running_instance):
+    # 取多次中的最小值，排除测试机负载的干扰
+    best = min(run_main(tmp_path, "status")["elapsed"] for _ in range(3))
+    assert best < STARTUP_BUDGET
@@ -0,0 +1,78 @@
+"""配置：解锁码迁移只在必要时写盘，加载失败时绝不覆盖原文件"""
+
+import json
+
+from src.core.config import ConfigManager
+
+
+def test_missing_file_is_created_with_hash(tmp_path):
+    path = tmp_path / "config.json"
+    config = ConfigManager(path)
+    verifier = config.get_unlock_verifier()
+    assert path.exists()
+    assert verifier.verify(ConfigManager.DEFAULT_PASSWORD)
+    assert "password_hash" in path.read_text(encoding="utf-8")
+
+
+def test_legacy_password_is_migrated_and_removed(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"password": "2468", "timer_minutes": 30}), encoding="utf-8")
+    
+    verifier = ConfigManager(path).get_unlock_verifier()
+    assert verifier.verify("2468")
+    
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert "password" not in saved
+    assert saved["password_hash"]
+    assert saved["timer_minutes"] == 30
+    
+    # 再次启动直接使用摘要
+    assert ConfigManager(path).get_unlock_verifier().verify("2468")
+
+
+def test_undecryptable_file_is_never_overwritten(tmp_path):
+    path = tmp_path / "config.json"
+    original = "ENCRYPTED:bm90LWEtZHBhcGktYmxvYg=="
+    path.write_text(original, encoding="utf-8")
+    
+    config = ConfigManager(path)
+    assert config.load_failed
+    verifier = config.get_unlock_verifier()
+    assert verifier.verify(ConfigManager.DEFAULT_PASSWORD)
+    assert path.read_text(encoding="utf-8") == original
+
+
+def test_unparsable_file_is_never_overwritten(tmp_path):
+    path = tmp_path / "config.json"
+    original = '{"timer_minutes": 30,'
+    path.write_text(original, encoding="utf-8")
+    
+    ConfigManager(path).get_unlock_verifier()
+    assert path.read_text(encoding="utf-8") == original
+
+
+def test_existing_file_without_password_is_not_rewritten(tmp_path):
+    path = tmp_path / "config.json"
+    original = json.dumps({"timer_minutes": 30})
+    path.write_text(original, encoding="utf-8")
+    
+    ConfigManager(path).get_unlock_verifier()
+    assert path.read_text(encoding="utf-8") == original
+
+
+def test_remember_timer_keeps_three_most_recent(tmp_path):
+    config = ConfigManager(tmp_path / "config.json")
+    for minutes in (10, 20, 45, 90):
+        config.remember_timer("shutdown", minutes)
+    assert config.get("recent_timers") == [["shutdown", 90], ["shutdown", 45], ["shutdown", 20]]
+    
+    # 重复使用移到最前，不产生重复项
+    recent = config.remember_timer("shutdown", 20)
+    assert recent == [("shutdown", 20), ("shutdown", 90), ("shutdown", 45)]
+
+
+def test_remember_timer_skips_sleep_presets(tmp_path):
+    config = ConfigManager(tmp_path / "config.json")
+    assert config.remember_timer("sleep", 30) is None
+    assert config.get("recent_timers") == []
+    assert config.remember_timer("shutdown", 30) == [("shutdown", 30)]
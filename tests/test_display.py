@@ -0,0 +1,111 @@
+"""显示器拓扑缓存：通过假数据源验证失效时机与遮挡窗口布局"""
+
+import pytest
+
+from src.core.display import (
+    DisplayChangeListener, DisplayTopologyCache, MonitorInfo, TopologyProvider,
+    SPI_SETWORKAREA, WM_DISPLAYCHANGE, WM_DPICHANGED, WM_SETTINGCHANGE
+)
+from fakes import FakeTopologyProvider
+
+PRIMARY = MonitorInfo(0, 0, 1920, 1080, primary=True)
+
+
+class Provider(FakeTopologyProvider, TopologyProvider):
+    pass
+
+
+def make_cache(*monitors):
+    provider = Provider(*(monitors or (PRIMARY,)))
+    cache = DisplayTopologyCache(provider)
+    listener = DisplayChangeListener(cache.invalidate)
+    return cache, provider, listener
+
+
+def test_repeated_get_queries_once():
+    cache, provider, _ = make_cache()
+    first = cache.get()
+    for _ in range(100):
+        assert cache.get() is first
+    assert provider.queries == 1
+
+
+def test_display_change_message_invalidates_cache():
+    cache, provider, listener = make_cache()
+    cache.get()
+    
+    provider.monitors.append(MonitorInfo(1920, 0, 3840, 1080))
+    assert listener.handle_message(WM_DISPLAYCHANGE, 32)
+    assert cache.version == 1
+    
+    topology = cache.get()
+    assert provider.queries == 2
+    assert len(topology.monitors) == 2
+    assert topology.virtual.right == 3840
+
+
+def test_dpi_and_work_area_changes_invalidate_cache():
+    cache, provider, listener = make_cache()
+    cache.get()
+    assert listener.handle_message(WM_DPICHANGED, 0)
+    cache.get()
+    assert listener.handle_message(WM_SETTINGCHANGE, SPI_SETWORKAREA)
+    cache.get()
+    assert provider.queries == 3
+
+
+def test_unrelated_messages_keep_cache():
+    cache, provider, listener = make_cache()
+    cache.get()
+    assert not listener.handle_message(WM_SETTINGCHANGE, 0)
+    assert not listener.handle_message(0x0200, 0)
+    cache.get()
+    assert provider.queries == 1
+    assert cache.version == 0
+
+
+def test_callback_errors_are_contained():
+    def broken():
+        raise RuntimeError("boom")
+    
+    listener = DisplayChangeListener(broken)
+    assert listener.handle_message(WM_DISPLAYCHANGE, 0)
+
+
+def test_aligned_monitors_use_one_virtual_window():
+    cache, _, _ = make_cache(PRIMARY, MonitorInfo(1920, 0, 3840, 1080))
+    topology = cache.get()
+    assert topology.coverage == 1.0
+    assert topology.blocker_rects() == [topology.virtual]
+
+
+def test_low_coverage_switches_to_per_monitor_windows():
+    # 竖放的副屏在右侧：虚拟屏幕 3000x1920，显示器只覆盖约 65%
+    side = MonitorInfo(1920, 0, 3000, 1920)
+    cache, _, _ = make_cache(PRIMARY, side)
+    topology = cache.get()
+    assert topology.coverage < topology.PER_MONITOR_COVERAGE
+    assert topology.blocker_rects() == [PRIMARY, side]
+    assert [rect.geometry for rect in topology.blocker_rects()] == ["1920x1080+0+0", "1080x1920+1920+0"]
+
+
+def test_coverage_just_above_threshold_keeps_one_window():
+    # 1920x1080 + 1920x1200：覆盖约 95%
+    cache, _, _ = make_cache(PRIMARY, MonitorInfo(1920, 0, 3840, 1200))
+    topology = cache.get()
+    assert topology.coverage >= topology.PER_MONITOR_COVERAGE
+    assert len(topology.blocker_rects()) == 1
+
+
+def test_single_monitor_never_splits():
+    cache, _, _ = make_cache(MonitorInfo(0, 0, 1920, 1080, primary=True))
+    assert len(cache.get().blocker_rects()) == 1
+    assert cache.get().primary.center == (960, 540)
+
+
+def test_provider_without_query_fails_at_construction():
+    class Incomplete(TopologyProvider):
+        pass
+    
+    with pytest.raises(TypeError):
+        Incomplete()
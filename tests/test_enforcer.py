@@ -0,0 +1,113 @@
+"""锁定强制引擎：通过假平台接口统计唤醒次数与退避行为"""
+
+import pytest
+
+from src.core.enforcer import EnforcementBackend, LockEnforcer
+from fakes import FakeEnforcementBackend, FakeScheduler
+
+
+class Backend(FakeEnforcementBackend, EnforcementBackend):
+    pass
+
+
+def make_enforcer(**kwargs):
+    backend = Backend()
+    clock = FakeScheduler()
+    enforcer = LockEnforcer(backend, clock.schedule, clock.cancel, **kwargs)
+    return enforcer, backend, clock
+
+
+def intervals(enforcer, clock, polls):
+    """记录接下来 polls 次轮询各自使用的间隔"""
+    seen = []
+    for _ in range(polls):
+        seen.append(enforcer.interval)
+        clock.advance(enforcer.interval)
+    return seen
+
+
+def test_stable_state_backs_off_to_max_interval():
+    enforcer, backend, clock = make_enforcer(min_interval=200, max_interval=3000)
+    enforcer.start()
+    assert intervals(enforcer, clock, 7) == [200, 400, 800, 1600, 3000, 3000, 3000]
+    assert clock.pending == 1
+
+
+def test_wakeups_over_a_stable_night():
+    enforcer, backend, clock = make_enforcer()
+    enforcer.start()
+    clock.advance(8 * 3600 * 1000)
+    
+    # 退避后每 3 秒一次：约 9600 次唤醒；原 200/500 ms 双循环为 8 小时 201600 次
+    assert enforcer.wakeups <= 8 * 3600 // 3 + 5
+    # 稳定时每次唤醒只做 3 次查询，不抢焦点、不重设困禁
+    assert backend.calls["restore_focus"] == 1
+    assert backend.calls["trap"] == 1
+    assert backend.total_calls <= 3 * enforcer.wakeups + 3
+
+
+def test_focus_lost_notification_resets_interval():
+    enforcer, backend, clock = make_enforcer()
+    enforcer.start()
+    clock.advance(10000)
+    assert enforcer.interval == enforcer.max_interval
+    
+    backend.focused = False
+    enforcer.notify_focus_lost()
+    assert backend.focused
+    assert enforcer.interval == enforcer.min_interval
+    assert clock.pending == 1
+
+
+def test_poll_corrects_lost_focus_and_trap():
+    enforcer, backend, clock = make_enforcer()
+    enforcer.start()
+    clock.advance(10000)
+    restores, traps = backend.calls["restore_focus"], backend.calls["trap"]
+    
+    backend.focused = False
+    clock.run_next()
+    assert backend.calls["restore_focus"] == restores + 1
+    assert enforcer.interval == enforcer.min_interval
+    
+    clock.advance(10000)
+    backend.trapped = False
+    clock.run_next()
+    assert backend.trapped
+    assert backend.calls["trap"] > traps
+
+
+def test_display_change_is_detected_by_poll_and_notification():
+    enforcer, backend, clock = make_enforcer()
+    enforcer.start()
+    clock.advance(10000)
+    
+    backend.signature = ("1920x1080", "2560x1440")
+    clock.run_next()
+    assert enforcer.display_changes == 1
+    assert enforcer.interval == enforcer.min_interval
+    
+    enforcer.notify_display_change()
+    assert enforcer.display_changes == 2
+    assert clock.pending == 1
+
+
+def test_stop_cancels_polling():
+    enforcer, backend, clock = make_enforcer()
+    enforcer.start()
+    enforcer.stop()
+    assert clock.pending == 0
+    
+    wakeups = enforcer.wakeups
+    enforcer.notify_focus_lost()
+    clock.advance(60000)
+    assert enforcer.wakeups == wakeups
+
+
+def test_backend_missing_method_fails_at_construction():
+    class Incomplete(EnforcementBackend):
+        def has_focus(self):
+            return True
+    
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,178 @@
+"""单实例：文件锁 + 控制接口转发，用两个进程验证"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.core.instance import InstanceLock, forward_to_running
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 持有锁并接收转发参数的"已运行实例"
+HOLDER = textwrap.dedent("""
+    import json, sys, time
+    from src.core.instance import InstanceLock
+    from src.core.ipc import ControlServer
+    
+    name, address, out = sys.argv[1:4]
+    lock = InstanceLock(name)
+    if not lock.acquire():
+        print("busy", flush=True)
+        sys.exit(1)
+    
+    def forward(params):
+        with open(out, "w") as f:
+            json.dump(params["argv"], f)
+        return True
+    
+    server = ControlServer({"forward": forward}, dict, address=address)
+    server.start()
+    print("ready", flush=True)
+    sys.stdin.readline()
+""")
+
+
+@pytest.fixture
+def runtime_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def holder(runtime_dir):
+    address = str(runtime_dir / "ctl.sock")
+    out = runtime_dir / "forwarded.json"
+    proc = subprocess.Popen(
+        [sys.executable, "-c", HOLDER, "OfficeGuard-test", address, str(out)],
+        cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, env=dict(os.environ)
+    )
+    assert proc.stdout.readline().strip() == "ready"
+    yield proc, address, out
+    if proc.poll() is None:
+        proc.stdin.close()
+        proc.wait(5)
+
+
+def test_second_process_cannot_acquire(holder):
+    lock = InstanceLock("OfficeGuard-test")
+    assert not lock.acquire()
+    assert not lock.acquired
+
+
+def test_lock_file_records_holder_pid(holder, runtime_dir):
+    proc, _, _ = holder
+    assert (runtime_dir / "officeguard-test.lock").read_text() == str(proc.pid)
+
+
+def test_arguments_are_forwarded_to_running_instance(holder):
+    _, address, out = holder
+    argv = ["timer", "shutdown", "30"]
+    assert forward_to_running(argv, address=address)
+    assert json.loads(out.read_text()) == argv
+
+
+def test_lock_is_released_when_holder_exits(holder):
+    proc, _, _ = holder
+    proc.stdin.close()
+    proc.wait(5)
+    
+    lock = InstanceLock("OfficeGuard-test")
+    assert lock.acquire()
+    lock.release()
+
+
+def test_forward_fails_without_running_instance(runtime_dir):
+    assert not forward_to_running(["status"], address=str(runtime_dir / "missing.sock"), timeout=0.2)
+
+
+def test_acquire_is_reentrant_and_release_frees(runtime_dir):
+    first = InstanceLock("OfficeGuard-test")
+    assert first.acquire()
+    assert first.acquire()
+    
+    second = InstanceLock("OfficeGuard-test")
+    assert not second.acquire()
+    first.release()
+    assert second.acquire()
+    second.release()
+
+
+# 控制接口关闭（ipc_enabled = False）的已运行实例：真实的核心控制器，Windows API 用假实现
+DISABLED_HOLDER = textwrap.dedent("""
+    import ctypes, sys
+    sys.path.insert(0, "tests")
+    from fakes import FakeWinDLL
+    ctypes.windll = FakeWinDLL()
+    
+    from src.core.config import ConfigManager
+    from src.core.controller import ControllerFrontend, GuardController
+    from src.core.instance import InstanceLock
+    from src.core.service import HeadlessBackend
+    
+    class Frontend(ControllerFrontend):
+        def post(self, func, *args):
+            func(*args)
+        
+        def call_later(self, delay_ms, func, background=False):
+            return None
+        
+        def cancel_call(self, handle):
+            pass
+        
+        def create_enforcement_backend(self, controller):
+            return HeadlessBackend(controller)
+        
+        def quit(self):
+            pass
+        
+        def on_second_launch(self):
+            print("shown", flush=True)
+    
+    name, address = sys.argv[1:3]
+    lock = InstanceLock(name)
+    if not lock.acquire():
+        sys.exit(1)
+    
+    config = ConfigManager()
+    config.set("ipc_enabled", False)
+    core = GuardController(Frontend(), "headless", config)
+    core.control.address = address
+    core.control.start()
+    print("ready", flush=True)
+    sys.stdin.readline()
+    print(f"timer_running={core.timer.running}", flush=True)
+""")
+
+
+def test_ipc_disabled_holder_still_answers_second_launch(runtime_dir):
+    from src.core.ipc_client import send_command
+    
+    address = str(runtime_dir / "ctl.sock")
+    proc = subprocess.Popen(
+        [sys.executable, "-c", DISABLED_HOLDER, "OfficeGuard-test", address],
+        cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, env=dict(os.environ)
+    )
+    try:
+        assert proc.stdout.readline().strip() == "ready"
+        assert not InstanceLock("OfficeGuard-test").acquire()
+        
+        # 第二次启动：转发成功并显示已运行的实例，参数被忽略
+        assert forward_to_running(["--timer", "5"], address=address, timeout=1.0)
+        assert proc.stdout.readline().strip() == "shown"
+        
+        # 其余命令与状态查询仍然关闭
+        assert not send_command("status", address=address)["ok"]
+        assert not send_command("lock", address=address)["ok"]
+        
+        proc.stdin.close()
+        assert proc.stdout.readline().strip() == "timer_running=False"
+    finally:
+        proc.kill()
+        proc.wait(5)
@@ -0,0 +1,156 @@
+"""本地控制接口：Linux 上通过 Unix 域套接字端到端测试"""
+
+import io
+import math
+import os
+import socket
+import stat
+import threading
+import time
+
+import pytest
+
+from src.core import ipc_client
+from src.core.ipc import ControlServer, StatusCache, parse_timer_request
+from src.core.ipc_client import send_command
+
+
+@pytest.fixture
+def server(tmp_path):
+    calls = []
+    release = threading.Event()
+    
+    def start_timer(params):
+        calls.append(parse_timer_request(params))
+        return True
+    
+    def slow(params):
+        release.wait(5)
+        return "done"
+    
+    status = StatusCache(mode="test", timer_running=False)
+    server = ControlServer(
+        {"start_timer": start_timer, "slow": slow},
+        status.get,
+        address=str(tmp_path / "ctl.sock")
+    )
+    server.calls = calls
+    server.release = release
+    server.start()
+    yield server
+    release.set()
+    server.stop()
+    server._thread.join(2)
+
+
+def test_status_is_served_from_snapshot(server):
+    response = send_command("status", server.address)
+    assert response == {"ok": True, "data": {"mode": "test", "timer_running": False, "remaining_seconds": 0}}
+
+
+def test_metrics_command(server):
+    response = send_command("metrics", server.address)
+    assert response["ok"]
+    assert "officeguard_ipc_requests_total" in response["data"]
+
+
+def test_start_timer_is_dispatched(server):
+    response = send_command("start_timer", server.address, action="shutdown", minutes=45, grace=10)
+    assert response == {"ok": True, "data": True}
+    assert server.calls == [("shutdown", 45.0, 10)]
+
+
+@pytest.mark.parametrize("minutes", ["nan", "inf", "-inf", -5, 0, "abc"])
+def test_non_finite_minutes_are_rejected(server, minutes):
+    response = send_command("start_timer", server.address, minutes=minutes)
+    assert not response["ok"]
+    assert server.calls == []
+
+
+def test_unknown_and_malformed_requests(server):
+    assert send_command("nope", server.address) == {"ok": False, "error": "unknown command: nope"}
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(2)
+        sock.connect(server.address)
+        sock.sendall(b"not json\n")
+        assert sock.recv(4096) == b'{"ok":false,"error":"bad request"}\n'
+    assert server.errors == 2
+
+
+def test_socket_is_private_from_bind(server):
+    mode = stat.S_IMODE(os.stat(server.address).st_mode)
+    assert mode == 0o600
+
+
+def test_umask_is_restored(tmp_path):
+    old = os.umask(0o022)
+    try:
+        server = ControlServer({}, dict, address=str(tmp_path / "ctl.sock"))
+        server.start()
+        assert os.umask(0o022) == 0o022
+        server.stop()
+        server._thread.join(2)
+    finally:
+        os.umask(old)
+
+
+def test_socket_client_timeout(server):
+    start = time.perf_counter()
+    with pytest.raises(OSError):
+        send_command("slow", server.address, timeout=0.2)
+    assert time.perf_counter() - start < 2
+
+
+def test_stop_removes_socket(tmp_path):
+    server = ControlServer({}, dict, address=str(tmp_path / "ctl.sock"))
+    server.start()
+    assert os.path.exists(server.address)
+    server.stop()
+    server._thread.join(2)
+    assert not os.path.exists(server.address)
+
+
+def test_parse_timer_request():
+    assert parse_timer_request({"minutes": "30"}) == ("sleep", 30.0, None)
+    assert parse_timer_request({"action": "shutdown", "minutes": 1.5, "grace": 0}) == ("shutdown", 1.5, 0)
+    for bad in ({"minutes": math.nan}, {"minutes": math.inf}, {}, {"action": "reboot", "minutes": 5},
+                {"minutes": 5, "grace": "inf"}, {"minutes": 5, "grace": -1}):
+        with pytest.raises(ValueError):
+            parse_timer_request(bad)
+
+
+class _HangingPipe(io.RawIOBase):
+    """不会返回响应的管道"""
+    
+    def __init__(self):
+        self.closed_event = threading.Event()
+    
+    def write(self, data):
+        return len(data)
+    
+    def read(self, n=-1):
+        self.closed_event.wait(5)
+        return b""
+
+
+def test_pipe_client_honours_timeout(monkeypatch):
+    pipe = _HangingPipe()
+    monkeypatch.setattr(ipc_client.sys, "platform", "win32")
+    monkeypatch.setattr(ipc_client, "open", lambda *a, **k: pipe, raising=False)
+    
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        send_command("status", r"\\.\pipe\test", timeout=0.2)
+    assert time.perf_counter() - start < 1
+    pipe.closed_event.set()
+
+
+def test_pipe_client_reads_response(monkeypatch):
+    class Pipe(io.BytesIO):
+        def write(self, data):
+            return len(data)
+    
+    monkeypatch.setattr(ipc_client.sys, "platform", "win32")
+    monkeypatch.setattr(ipc_client, "open", lambda *a, **k: Pipe(b'{"ok":true,"data":1}\n'), raising=False)
+    assert send_command("status", r"\\.\pipe\test") == {"ok": True, "data": 1}
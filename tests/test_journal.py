@@ -0,0 +1,265 @@
+"""事件日志：跨天追加与查询、索引边界、异常退出后的修复、只读打开与保留期压缩"""
+
+import io
+import os
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.core import journal as journal_module
+from src.core.journal import EventJournal, EventType
+
+DAY = 86400
+
+
+def old_journal(tmp_path) -> EventJournal:
+    journal = EventJournal(tmp_path)
+    now = time.time()
+    for days_ago in (40, 39, 1, 0):
+        journal.append(EventType.LOCK, timestamp=now - days_ago * DAY)
+    return journal
+
+
+def fail_replace(monkeypatch, target):
+    """模拟 Windows 上其他进程映射着文件时 os.replace 失败"""
+    real_replace = os.replace
+    
+    def replace(src, dst):
+        if os.fspath(dst) == os.fspath(target):
+            raise PermissionError(13, "另一个程序正在使用此文件")
+        return real_replace(src, dst)
+    
+    monkeypatch.setattr(journal_module.os, "replace", replace)
+    return real_replace
+
+
+def test_retention_survives_locked_data_file(tmp_path, monkeypatch):
+    journal = old_journal(tmp_path)
+    real_replace = fail_replace(monkeypatch, journal.events_path)
+    
+    assert journal.apply_retention(30) == 0
+    assert len(journal) == 4
+    assert not list(tmp_path.glob("*.tmp"))
+    assert len(EventJournal(tmp_path).query()) == 4
+    
+    # 间隔未到时 append 不重试
+    journal.append(EventType.UNLOCK)
+    assert len(journal) == 5
+    
+    # 文件释放且间隔已到后，下一次 append 完成压缩
+    monkeypatch.setattr(journal_module.os, "replace", real_replace)
+    journal._retry_at = 0.0
+    journal.append(EventType.UNLOCK)
+    assert len(journal) == 4
+    assert journal._pending_compact is None
+    
+    reopened = EventJournal(tmp_path)
+    assert len(reopened) == 4
+    assert reopened.query(start=time.time() - 2 * DAY) == journal.query(start=time.time() - 2 * DAY)
+
+
+def test_index_replace_failure_rewrites_in_place(tmp_path, monkeypatch):
+    journal = old_journal(tmp_path)
+    fail_replace(monkeypatch, journal.index_path)
+    
+    assert journal.apply_retention(30) == 2
+    reopened = EventJournal(tmp_path)
+    assert len(reopened) == 2
+    assert reopened._days == journal._days
+    assert reopened._starts == journal._starts
+
+
+# ==================== 追加与查询 ====================
+
+def midnight(days_ago: int) -> float:
+    """本地时间 days_ago 天前的零点"""
+    day = date.today() - timedelta(days=days_ago)
+    return datetime.combine(day, datetime.min.time()).timestamp()
+
+
+def day_journal(path) -> EventJournal:
+    """三天的记录，其中两条紧贴零点两侧"""
+    journal = EventJournal(path)
+    journal.append(EventType.APP_START, timestamp=midnight(2) + 10 * 3600)
+    journal.append(EventType.LOCK, timestamp=midnight(1) - 1)
+    journal.append(EventType.UNLOCK, timestamp=midnight(1))
+    journal.append(EventType.TIMER_START, 1800, timestamp=midnight(1) + 12 * 3600)
+    journal.append(EventType.SHUTDOWN, timestamp=midnight(0) + 60)
+    return journal
+
+
+def types_of(events) -> list:
+    return [event.type for event in events]
+
+
+def test_query_across_day_boundaries(tmp_path):
+    journal = day_journal(tmp_path)
+    assert len(journal) == 5
+    assert journal._starts == [0, 2, 4]
+    
+    assert types_of(journal.query(start=midnight(1))) == [EventType.UNLOCK, EventType.TIMER_START, EventType.SHUTDOWN]
+    assert types_of(journal.query(end=midnight(1))) == [EventType.APP_START, EventType.LOCK]
+    assert types_of(journal.query(start=midnight(1) - 1, end=midnight(1) + 1)) == [EventType.LOCK, EventType.UNLOCK]
+    assert journal.query(start=midnight(1), end=midnight(1)) == []
+    
+    assert types_of(journal.query(types=[EventType.LOCK, EventType.SHUTDOWN])) == [EventType.LOCK, EventType.SHUTDOWN]
+    assert types_of(journal.query(limit=2)) == [EventType.TIMER_START, EventType.SHUTDOWN]
+    assert journal.query(types=[EventType.TIMER_START])[0].value == 1800
+
+
+def test_first_record_bounds(tmp_path):
+    journal = day_journal(tmp_path)
+    
+    # 早于第一天、等于某天、晚于最后一天
+    assert journal._first_record(midnight(10)) == 0
+    assert journal._first_record(midnight(2)) == 0
+    assert journal._first_record(midnight(1) + 3600) == 2
+    assert journal._first_record(midnight(0)) == 4
+    assert journal._first_record(midnight(-3)) == 5
+    
+    # 结束边界：该天之后第一条记录
+    assert journal._first_record(midnight(2), after=True) == 2
+    assert journal._first_record(midnight(0), after=True) == 5
+    assert journal._first_record(midnight(10), after=True) == 0
+
+
+def test_first_record_skips_days_without_records(tmp_path):
+    journal = EventJournal(tmp_path)
+    journal.append(EventType.LOCK, timestamp=midnight(5) + 3600)
+    journal.append(EventType.UNLOCK, timestamp=midnight(1) + 3600)
+    
+    assert journal._first_record(midnight(3)) == 1
+    assert journal._first_record(midnight(3), after=True) == 1
+    assert types_of(journal.query(start=midnight(3))) == [EventType.UNLOCK]
+
+
+def test_clock_rollback_stays_in_latest_day(tmp_path):
+    journal = EventJournal(tmp_path)
+    journal.append(EventType.LOCK, timestamp=midnight(0) + 3600)
+    journal.append(EventType.UNLOCK, timestamp=midnight(1) + 3600)
+    
+    assert journal._days == [date.today().toordinal()]
+    assert len(EventJournal(tmp_path).query()) == 2
+
+
+# ==================== 异常退出与索引 ====================
+
+def test_partial_record_is_truncated(tmp_path):
+    day_journal(tmp_path)
+    events_path = tmp_path / journal_module.EVENTS_FILE
+    with open(events_path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    
+    journal = EventJournal(tmp_path)
+    assert len(journal) == 5
+    assert events_path.stat().st_size == 5 * journal_module.RECORD.size
+    
+    # 截断后继续追加的记录完整可读
+    journal.append(EventType.LOCK, timestamp=midnight(0) + 120)
+    assert types_of(EventJournal(tmp_path).query(start=midnight(0))) == [EventType.SHUTDOWN, EventType.LOCK]
+
+
+def test_stale_index_is_rebuilt(tmp_path):
+    day_journal(tmp_path)
+    index_path = tmp_path / journal_module.INDEX_FILE
+    # 索引比数据多一项（写完索引后、写数据前退出）
+    with open(index_path, "ab") as f:
+        f.write(journal_module.INDEX_ENTRY.pack(date.today().toordinal() + 1, 5))
+    
+    journal = EventJournal(tmp_path)
+    assert journal._starts == [0, 2, 4]
+    assert index_path.read_bytes() == b"".join(
+        journal_module.INDEX_ENTRY.pack(day, start) for day, start in zip(journal._days, journal._starts)
+    )
+
+
+def test_missing_index_is_rebuilt(tmp_path):
+    day_journal(tmp_path)
+    (tmp_path / journal_module.INDEX_FILE).unlink()
+    
+    journal = EventJournal(tmp_path)
+    assert journal._starts == [0, 2, 4]
+    assert types_of(journal.query(start=midnight(0))) == [EventType.SHUTDOWN]
+
+
+def test_index_missing_latest_day_is_rebuilt(tmp_path):
+    day_journal(tmp_path)
+    index_path = tmp_path / journal_module.INDEX_FILE
+    # 当天第一条记录已写入数据文件，索引项未写入
+    index_path.write_bytes(index_path.read_bytes()[:-journal_module.INDEX_ENTRY.size])
+    
+    assert types_of(EventJournal(tmp_path, read_only=True).query(start=midnight(0))) == [EventType.SHUTDOWN]
+    journal = EventJournal(tmp_path)
+    assert journal._starts == [0, 2, 4]
+
+
+# ==================== 只读打开 ====================
+
+def test_read_only_never_writes(tmp_path):
+    day_journal(tmp_path)
+    events_path = tmp_path / journal_module.EVENTS_FILE
+    index_path = tmp_path / journal_module.INDEX_FILE
+    with open(events_path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    index_path.write_bytes(journal_module.INDEX_ENTRY.pack(date.today().toordinal() + 1, 9))
+    events_before, index_before = events_path.read_bytes(), index_path.read_bytes()
+    
+    journal = EventJournal(tmp_path, read_only=True)
+    
+    # 半条记录被忽略，索引在内存中重建
+    assert len(journal) == 5
+    assert journal._starts == [0, 2, 4]
+    assert types_of(journal.query(start=midnight(1))) == [EventType.UNLOCK, EventType.TIMER_START, EventType.SHUTDOWN]
+    assert events_path.read_bytes() == events_before
+    assert index_path.read_bytes() == index_before
+
+
+def test_read_only_rejects_writes(tmp_path):
+    day_journal(tmp_path)
+    journal = EventJournal(tmp_path, read_only=True)
+    
+    with pytest.raises(io.UnsupportedOperation):
+        journal.append(EventType.LOCK)
+    with pytest.raises(io.UnsupportedOperation):
+        journal.compact(retain_days=0)
+    assert len(EventJournal(tmp_path)) == 5
+
+
+def test_read_only_missing_directory(tmp_path):
+    journal = EventJournal(tmp_path / "missing", read_only=True)
+    assert len(journal) == 0
+    assert journal.query() == []
+    assert not (tmp_path / "missing").exists()
+
+
+# ==================== 保留期 ====================
+
+def test_retention_drops_old_days(tmp_path):
+    journal = old_journal(tmp_path)
+    
+    assert journal.apply_retention(30) == 2
+    assert len(journal) == 2
+    assert journal._starts == [0, 1]
+    assert all(event.timestamp > time.time() - 2 * DAY for event in EventJournal(tmp_path).query())
+
+
+def test_retention_without_old_records_is_free(tmp_path, monkeypatch):
+    journal = day_journal(tmp_path)
+    
+    def no_compact(*args, **kwargs):
+        raise AssertionError("不应压缩")
+    
+    monkeypatch.setattr(journal, "compact", no_compact)
+    assert journal.apply_retention(30) == 0
+    assert journal.apply_retention(0) == 0
+    assert EventJournal(tmp_path / "empty").apply_retention(30) == 0
+
+
+def test_compact_drops_types(tmp_path):
+    journal = day_journal(tmp_path)
+    
+    assert journal.compact(drop_types=[EventType.LOCK, EventType.UNLOCK]) == 2
+    assert types_of(journal.query()) == [EventType.APP_START, EventType.TIMER_START, EventType.SHUTDOWN]
+    assert journal._starts == [0, 1, 2]
+    assert journal.compact(drop_types=[EventType.LOCK]) == 0
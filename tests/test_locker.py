@@ -0,0 +1,132 @@
+"""系统锁定器：在假 Windows API 上构造、检查看门狗数据源与键盘钩子回调"""
+
+import ctypes
+
+import pytest
+
+from src.core import locker as locker_module
+from src.core.display import DisplayTopologyCache, MonitorInfo, TopologyProvider
+from src.core.locker import KBDLLHOOKSTRUCT, LASTINPUTINFO, SystemLocker
+from src.core.verifier import UnlockVerifier
+from fakes import FakeTopologyProvider, FakeWinDLL
+
+
+class Provider(FakeTopologyProvider, TopologyProvider):
+    pass
+
+
+@pytest.fixture
+def windll(monkeypatch):
+    fake = FakeWinDLL()
+    monkeypatch.setattr(ctypes, "windll", fake, raising=False)
+    return fake
+
+
+def test_construct(windll):
+    locker = SystemLocker()
+    assert not locker.is_locked
+    assert locker._last_input.cbSize == ctypes.sizeof(LASTINPUTINFO)
+    assert locker.get_metrics()["locked"] == 0
+
+
+def test_last_input_tick_feeds_watchdog(windll):
+    locker = SystemLocker()
+    windll.last_input_tick = 123456
+    assert locker._get_last_input_tick() == 123456
+    assert locker.watchdog._get_last_input_tick() == 123456
+
+
+def test_trap_rect_follows_topology_cache(windll):
+    provider = Provider(MonitorInfo(0, 0, 1920, 1080, primary=True))
+    display = DisplayTopologyCache(provider)
+    locker = SystemLocker(display=display)
+    locker.is_locked = True
+    
+    locker.trap_mouse()
+    locker.trap_mouse()
+    assert provider.queries == 1
+    assert (locker._trap_rect.left, locker._trap_rect.top) == (960, 540)
+    
+    provider.monitors = [MonitorInfo(0, 0, 2560, 1440, primary=True)]
+    display.invalidate()
+    locker.trap_mouse()
+    assert (locker._trap_rect.left, locker._trap_rect.top) == (1280, 720)
+    assert windll.calls.count(("user32", "ClipCursor")) == 3
+
+
+# ==================== 键盘钩子热路径 ====================
+
+WM_KEYDOWN = 0x0100
+WM_KEYUP = 0x0101
+VK_A = 0x41
+VK_NUMPAD0 = 0x60
+
+
+class RecordingVerifier(UnlockVerifier):
+    """记录收到的数字"""
+    
+    def feed(self, digit: int) -> bool:
+        self.fed.append(digit)
+        return super().feed(digit)
+
+
+def key(vk: int) -> KBDLLHOOKSTRUCT:
+    return KBDLLHOOKSTRUCT(vkCode=vk)
+
+
+@pytest.fixture
+def hooked(windll):
+    """已锁定并安装了钩子回调的锁定器（假 API 下安装返回失败，但回调已创建）"""
+    locker = SystemLocker()
+    base = UnlockVerifier.from_code("2468")
+    verifier = RecordingVerifier(base.salt, base.length, base.digest)
+    verifier.fed = []
+    locker._verifier = verifier
+    locker.is_locked = True
+    locker._install_hooks()
+    
+    def press(vk: int, message: int = WM_KEYDOWN, code: int = 0) -> int:
+        event = key(vk)
+        return locker.kb_proc_ref(code, message, ctypes.addressof(event))
+    
+    return locker, verifier, press
+
+
+def test_digits_reach_verifier(hooked):
+    locker, verifier, press = hooked
+    for vk in (0x31, 0x39, VK_NUMPAD0 + 7):
+        assert press(vk) == 1
+    assert verifier.fed == [1, 9, 7]
+    assert locker.is_locked
+
+
+def test_non_digit_keys_are_blocked_without_feeding(hooked):
+    locker, verifier, press = hooked
+    assert press(VK_A) == 1
+    assert verifier.fed == []
+    
+    # 按键抬起与 nCode != 0 交给系统，不计入耗时
+    count = locker.latency.count
+    assert press(0x31, message=WM_KEYUP) == 0
+    assert press(0x31, code=-1) == 0
+    assert verifier.fed == []
+    assert locker.latency.count == count
+    assert locker.hook_events == 3
+
+
+def test_unlock_code_unlocks(hooked):
+    locker, verifier, press = hooked
+    for vk in (0x39, 0x32, 0x34, 0x36, 0x38):
+        press(vk)
+    assert not locker.is_locked
+
+
+def test_latency_recorder_and_histogram_fed(hooked):
+    locker, _, press = hooked
+    histogram = locker_module._hook_latency
+    before = histogram.count
+    for vk in (0x31, VK_A, 0x32):
+        press(vk)
+    assert locker.latency.count == 3
+    assert histogram.count == before + 3
+    assert 0 < locker.latency.max < 0.1
@@ -0,0 +1,65 @@
+"""日志队列：丢弃策略、退出时队列已满、热路径 logger"""
+
+import logging
+import queue
+
+from src.utils.logger import DroppingQueueHandler, DroppingQueueListener, HotPathLogger
+
+
+def record(level, msg="x"):
+    return logging.LogRecord("test", level, __file__, 0, msg, None, None)
+
+
+def test_full_queue_drops_below_warning():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    for _ in range(3):
+        handler.enqueue(record(logging.INFO))
+    assert handler.enqueued == 2
+    assert handler.dropped == 1
+
+
+def test_warning_evicts_oldest_record():
+    log_queue = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue)
+    handler.enqueue(record(logging.INFO, "old"))
+    handler.enqueue(record(logging.INFO, "newer"))
+    handler.enqueue(record(logging.ERROR, "error"))
+    
+    assert [log_queue.get_nowait().msg for _ in range(2)] == ["newer", "error"]
+    assert handler.dropped == 1
+
+
+class Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+    
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_listener_reports_drops_and_stops_on_full_queue():
+    log_queue = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue)
+    sink = Collect()
+    listener = DroppingQueueListener(log_queue, handler, sink)
+    for i in range(5):
+        handler.enqueue(record(logging.INFO, f"m{i}"))
+    
+    # 队列已满时启动并立即停止：不能抛出 queue.Full，剩余记录全部写出
+    listener.start()
+    listener.stop()
+    assert sink.messages[0].startswith("日志队列已满")
+    assert sink.messages[1:] == ["m0", "m1"]
+
+
+def test_hot_path_logger_binds_noop_below_level():
+    logger = logging.getLogger("test.hot")
+    logger.setLevel(logging.WARNING)
+    hot = HotPathLogger(logger)
+    assert hot.info is not logger.info
+    assert hot.warning == logger.warning
+    
+    logger.setLevel(logging.DEBUG)
+    hot.refresh()
+    assert hot.info == logger.info
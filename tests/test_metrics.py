@@ -0,0 +1,188 @@
+"""运行指标：直方图分桶、Prometheus 文本导出、注册冲突与循环延迟探测"""
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import metrics as metrics_module
+from src.core.metrics import Histogram, LoopLagMonitor, MetricsRegistry
+from fakes import FakeScheduler
+
+
+def sample_lines(registry: MetricsRegistry) -> list:
+    return [line for line in registry.render().splitlines() if not line.startswith("#")]
+
+
+def test_histogram_bucket_edges_are_inclusive():
+    histogram = Histogram("latency_seconds", buckets=(0.1, 0.5, 1.0))
+    for value in (0.05, 0.1, 0.1000001, 0.5, 1.0, 2.0, 30.0):
+        histogram.observe(value)
+    
+    # le 为上界（含）：恰好等于边界的值计入该桶
+    assert histogram.counts == [2, 2, 1, 2]
+    assert histogram.count == 7
+    assert histogram.sum == pytest.approx(33.7500001)
+
+
+def test_histogram_samples_are_cumulative_with_inf_sum_and_count():
+    histogram = Histogram("latency_seconds", labels=(("hook", "kb"),), buckets=(0.5, 0.1))
+    for value in (0.05, 0.3, 0.3, 9.0):
+        histogram.observe(value)
+    
+    assert histogram.samples() == [
+        ("latency_seconds_bucket", '{hook="kb",le="0.1"}', 1),
+        ("latency_seconds_bucket", '{hook="kb",le="0.5"}', 3),
+        ("latency_seconds_bucket", '{hook="kb",le="+Inf"}', 4),
+        ("latency_seconds_sum", '{hook="kb"}', pytest.approx(9.65)),
+        ("latency_seconds_count", '{hook="kb"}', 4),
+    ]
+
+
+def test_histogram_timing_context(monkeypatch):
+    now = [10.0]
+    monkeypatch.setattr(metrics_module, "time", SimpleNamespace(perf_counter=lambda: now[0]))
+    histogram = Histogram("step_seconds", buckets=(0.01, 1.0))
+    with histogram.time():
+        now[0] += 0.25
+    
+    assert histogram.counts == [0, 1, 0]
+    assert histogram.sum == pytest.approx(0.25)
+
+
+def test_render_groups_labels_under_one_header():
+    registry = MetricsRegistry(namespace="og")
+    registry.counter("locks_total", "锁定次数", labels={"source": "hotkey"}).inc()
+    registry.gauge("timer_seconds", "倒计时剩余").set(90)
+    registry.counter("locks_total", "锁定次数", labels={"source": "tray"}).inc(2)
+    
+    text = registry.render()
+    assert text.count("# HELP og_locks_total") == 1
+    assert text.count("# TYPE og_locks_total counter") == 1
+    assert text.splitlines() == [
+        "# HELP og_locks_total 锁定次数",
+        "# TYPE og_locks_total counter",
+        'og_locks_total{source="hotkey"} 1',
+        'og_locks_total{source="tray"} 2',
+        "# HELP og_timer_seconds 倒计时剩余",
+        "# TYPE og_timer_seconds gauge",
+        "og_timer_seconds 90",
+    ]
+    assert text.endswith("\n")
+
+
+def test_render_escapes_labels_and_help():
+    registry = MetricsRegistry(namespace="")
+    registry.gauge("info", 'a\\b\nc', labels={"path": 'C:\\a "b"\n'}).set(1.5)
+    
+    assert registry.render().splitlines() == [
+        "# HELP info a\\\\b\\nc",
+        "# TYPE info gauge",
+        'info{path="C:\\\\a \\"b\\"\\n"} 1.5',
+    ]
+
+
+def test_same_name_and_labels_returns_existing_metric():
+    registry = MetricsRegistry()
+    first = registry.counter("events_total", labels={"a": "1", "b": "2"})
+    again = registry.counter("events_total", labels={"b": "2", "a": "1"})
+    
+    assert again is first
+    assert registry.counter("events_total", labels={"a": "2"}) is not first
+
+
+def test_type_conflict_raises():
+    registry = MetricsRegistry()
+    registry.counter("queue_size")
+    
+    with pytest.raises(ValueError):
+        registry.gauge("queue_size")
+    with pytest.raises(ValueError):
+        registry.histogram("queue_size")
+    # 不同标签视为不同指标，不冲突
+    registry.gauge("queue_size", labels={"queue": "log"})
+
+
+def test_reregistration_swaps_func():
+    registry = MetricsRegistry(namespace="")
+    old = SimpleNamespace(tasks=3)
+    new = SimpleNamespace(tasks=7)
+    counter = registry.counter("tasks_total", func=lambda: old.tasks)
+    
+    # 重新创建的对象（如新的调度器）注册同名指标后导出新对象的值
+    assert registry.counter("tasks_total", func=lambda: new.tasks) is counter
+    assert sample_lines(registry) == ["tasks_total 7"]
+    
+    # 不带 func 获取时保留原来的 func
+    registry.counter("tasks_total")
+    assert counter.get() == 7
+
+
+def test_failing_func_exports_nan():
+    registry = MetricsRegistry(namespace="")
+    registry.gauge("broken", func=lambda: 1 / 0)
+    
+    assert sample_lines(registry) == ["broken nan"]
+    assert math.isnan(registry.gauge("broken").get())
+
+
+def test_write_replaces_file(tmp_path):
+    registry = MetricsRegistry(namespace="")
+    registry.counter("starts_total").inc()
+    path = tmp_path / "metrics" / "officeguard.prom"
+    
+    registry.write(path)
+    registry.counter("starts_total").inc()
+    registry.write(path)
+    
+    assert "starts_total 2" in path.read_text(encoding="utf-8")
+    assert [p.name for p in path.parent.iterdir()] == ["officeguard.prom"]
+
+
+# ==================== 循环延迟探测 ====================
+
+@pytest.fixture
+def loop(monkeypatch):
+    """虚拟时钟上的事件循环：scheduler.now 为毫秒，blocked 模拟循环被阻塞的时长"""
+    scheduler = FakeScheduler()
+    loop = SimpleNamespace(scheduler=scheduler, blocked=0)
+    monkeypatch.setattr(
+        metrics_module,
+        "time",
+        SimpleNamespace(perf_counter=lambda: (scheduler.now + loop.blocked) / 1000)
+    )
+    return loop
+
+
+def test_loop_lag_monitor_records_lag(loop):
+    histogram = Histogram("loop_lag_seconds", buckets=(0.01, 0.1, 1.0))
+    monitor = LoopLagMonitor(loop.scheduler.schedule, loop.scheduler.cancel, histogram, interval_ms=1000)
+    monitor.start()
+    
+    loop.scheduler.advance(3000)
+    assert histogram.count == 3
+    assert monitor.last_lag == 0.0
+    
+    # 下一次探测前循环被阻塞 250 ms
+    loop.blocked = 250
+    loop.scheduler.advance(1000)
+    assert monitor.last_lag == pytest.approx(0.25)
+    assert histogram.counts == [3, 0, 1, 0]
+    
+    # 之后从实际触发时刻重新计时
+    loop.scheduler.advance(1000)
+    assert monitor.last_lag == pytest.approx(0.0)
+
+
+def test_loop_lag_monitor_restart_and_stop(loop):
+    histogram = Histogram("loop_lag_seconds")
+    monitor = LoopLagMonitor(loop.scheduler.schedule, loop.scheduler.cancel, histogram, interval_ms=500)
+    monitor.start()
+    monitor.start()
+    assert loop.scheduler.pending == 1
+    
+    monitor.stop()
+    monitor.stop()
+    assert loop.scheduler.pending == 0
+    loop.scheduler.advance(5000)
+    assert histogram.count == 0
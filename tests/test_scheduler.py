@@ -0,0 +1,215 @@
+"""界面帧调度器：帧内优先级、顺延与空闲执行、取消以及循环延迟记录（虚拟时钟上的假根窗口）"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.ui.components import scheduler as scheduler_module
+from src.ui.components.scheduler import FrameScheduler, Priority
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def spend(self, ms: float):
+        """任务执行耗时"""
+        self.now += ms / 1000
+
+
+class FakeRoot:
+    """
+    root.after / after_idle 的虚拟时钟实现
+    
+    run() 按 Tcl 事件循环的顺序执行：到期的定时器，然后本轮的空闲回调；
+    block() 模拟事件循环被阻塞，之后到期的定时器晚于预期执行
+    """
+    
+    def __init__(self, clock: Clock):
+        self.clock = clock
+        self.timers = {}
+        self.idle = []
+        self.afters = 0
+        self.errors = []
+        self._seq = 0
+    
+    def after(self, ms, func):
+        self._seq += 1
+        self.afters += 1
+        self.timers[self._seq] = (self.clock.now + ms / 1000, func)
+        return self._seq
+    
+    def after_idle(self, func):
+        self.idle.append(func)
+        return "idle"
+    
+    def after_cancel(self, handle):
+        self.timers.pop(handle, None)
+    
+    def report_callback_exception(self, exc, val, tb):
+        self.errors.append(val)
+    
+    def block(self, ms: float):
+        self.clock.spend(ms)
+    
+    def run(self, ms: float):
+        """运行事件循环 ms 毫秒"""
+        end = self.clock.now + ms / 1000
+        while True:
+            due = [(when, handle) for handle, (when, _) in self.timers.items() if when <= end]
+            if not due:
+                break
+            when, handle = min(due)
+            self.clock.now = max(self.clock.now, when)
+            _, func = self.timers.pop(handle)
+            func()
+            idle, self.idle = self.idle, []
+            for func in idle:
+                func()
+        self.clock.now = max(self.clock.now, end)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(scheduler_module, "time", SimpleNamespace(perf_counter=clock))
+    return clock
+
+
+@pytest.fixture
+def root(clock):
+    return FakeRoot(clock)
+
+
+def test_frame_runs_high_before_normal_and_low_in_idle(root, clock):
+    scheduler = FrameScheduler(root)
+    order = []
+    frames = []
+    scheduler.call_later(10, lambda: order.append("low"), priority=Priority.LOW)
+    scheduler.call_later(10, lambda: order.append("normal-1"), priority=Priority.NORMAL)
+    scheduler.call_later(12, lambda: order.append("high"), priority=Priority.HIGH)
+    scheduler.call_later(14, lambda: (order.append("normal-2"), frames.append(scheduler.frames)))
+    
+    assert root.afters == 1
+    root.run(50)
+    
+    # 到期时间相差不足半帧的任务在同一帧执行
+    assert order == ["high", "normal-1", "normal-2", "low"]
+    assert frames == [1]
+    assert scheduler.tasks == 4
+    assert scheduler.idle_tasks == 1
+
+
+def test_single_after_points_at_earliest_task(root):
+    scheduler = FrameScheduler(root)
+    scheduler.call_later(500, lambda: None)
+    scheduler.call_later(100, lambda: None)
+    scheduler.call_later(300, lambda: None)
+    
+    # 更早的任务替换 after，更晚的任务不改动
+    assert root.afters == 2
+    assert len(root.timers) == 1
+    assert min(when for when, _ in root.timers.values()) == pytest.approx(100.1)
+
+
+def test_normal_task_is_deferred_only_once(root, clock):
+    scheduler = FrameScheduler(root, frame_ms=16, budget_ms=8)
+    ran_at = []
+    
+    def heavy():
+        # 每帧都超出预算的高优先级任务
+        clock.spend(10)
+        scheduler.call_later(16, heavy, priority=Priority.HIGH)
+    
+    scheduler.call_later(16, heavy, priority=Priority.HIGH)
+    scheduler.call_later(16, lambda: ran_at.append(scheduler.frames))
+    root.run(100)
+    
+    # 第一帧超出预算后顺延，第二帧即使仍然超载也执行
+    assert ran_at == [2]
+    assert scheduler.deferred == 1
+    assert scheduler.overruns >= 2
+
+
+def test_low_priority_runs_in_idle_batches(root, clock):
+    scheduler = FrameScheduler(root, budget_ms=8)
+    ran = []
+    for i in range(3):
+        scheduler.call_later(0, lambda i=i: (clock.spend(5), ran.append(i)), priority=Priority.LOW)
+    
+    root.run(0)
+    
+    # 第二个任务后超出空闲预算，剩下的留到下一次空闲回调
+    assert ran == [0, 1]
+    assert len(root.idle) == 1
+    root.idle.pop()()
+    assert ran == [0, 1, 2]
+    assert scheduler.idle_tasks == 3
+    assert root.idle == []
+
+
+def test_cancelled_tasks_do_not_run(root):
+    scheduler = FrameScheduler(root)
+    ran = []
+    normal = scheduler.call_later(10, lambda: ran.append("normal"))
+    low = scheduler.call_later(10, lambda: ran.append("low"), priority=Priority.LOW)
+    scheduler.call_later(10, lambda: scheduler.cancel(low), priority=Priority.HIGH)
+    scheduler.cancel(normal)
+    scheduler.cancel(None)
+    
+    root.run(50)
+    
+    assert ran == []
+    assert scheduler.pending == 0
+    assert scheduler.tasks == 1
+
+
+def test_failing_task_is_reported_and_frame_continues(root):
+    scheduler = FrameScheduler(root)
+    ran = []
+    scheduler.call_later(10, lambda: 1 / 0, priority=Priority.HIGH)
+    scheduler.call_later(10, lambda: ran.append("after"))
+    
+    root.run(50)
+    
+    assert ran == ["after"]
+    assert [type(error) for error in root.errors] == [ZeroDivisionError]
+
+
+def test_lag_and_stall_are_recorded(root, clock):
+    scheduler = FrameScheduler(root, stall_ms=250)
+    count = scheduler.lag_histogram.count
+    scheduler.call_later(100, lambda: None)
+    
+    # 定时器到期前事件循环被阻塞 400 ms
+    root.block(400)
+    root.run(0)
+    
+    assert scheduler.last_lag == pytest.approx(0.3)
+    assert scheduler.stalls == 1
+    assert scheduler.lag_histogram.count == count + 1
+    
+    scheduler.call_later(100, lambda: None)
+    root.run(200)
+    assert scheduler.last_lag == pytest.approx(0.0)
+    assert scheduler.stalls == 1
+
+
+def test_probe_wakes_without_tasks(root):
+    scheduler = FrameScheduler(root)
+    root.run(5000)
+    assert scheduler.frames == 0
+    
+    # 从开启探测时计时：之前的空闲时间不算作延迟
+    scheduler.set_probe(1000)
+    root.run(5000)
+    assert scheduler.frames == 5
+    assert scheduler.stalls == 0
+    
+    scheduler.destroy()
+    root.run(5000)
+    assert scheduler.frames == 5
+    assert root.timers == {}
@@ -0,0 +1,117 @@
+"""样式注册表：只更新颜色变化的选项，已销毁的控件在切换时移除（假控件，不创建 Tk 窗口）"""
+
+import gc
+import tkinter as tk
+
+from src.ui.theme import DARK_THEME, StyleRegistry, Theme, Token
+
+
+class FakeWidget:
+    """记录 configure 调用；dead 后与已销毁的 Tk 控件一样抛出 TclError"""
+    
+    def __init__(self, **options):
+        self.options = dict(options)
+        self.calls = []
+        self.dead = False
+    
+    def configure(self, **options):
+        if self.dead:
+            raise tk.TclError('invalid command name ".!label"')
+        self.calls.append(options)
+        self.options.update(options)
+
+
+OLD = {"bg_primary": "#ffffff", "text_primary": "#09090b", "border": "#e4e4e7"}
+NEW = {"bg_primary": "#09090b", "text_primary": "#fafafa", "border": "#e4e4e7"}
+
+
+def token(name: str, table=OLD) -> Token:
+    return Token(table[name], name)
+
+
+def test_only_changed_tokens_are_configured():
+    styles = StyleRegistry()
+    both = FakeWidget()
+    styles.register(both, bg=token("bg_primary"), fg=token("text_primary"), highlightbackground=token("border"))
+    border_only = FakeWidget()
+    styles.register(border_only, highlightbackground=token("border"))
+    
+    assert styles.apply(OLD, NEW) == 1
+    assert both.calls == [{"bg": "#09090b", "fg": "#fafafa"}]
+    assert border_only.calls == []
+    assert styles.configures == 1
+
+
+def test_plain_color_stops_tracking_option():
+    styles = StyleRegistry()
+    widget = FakeWidget()
+    styles.register(widget, bg=token("bg_primary"), fg=token("text_primary"))
+    styles.register(widget, fg="#ff0000")
+    
+    assert styles.token_of(widget, "fg") is None
+    styles.apply(OLD, NEW)
+    assert widget.calls == [{"bg": "#09090b"}]
+
+
+def test_on_change_runs_after_batch_even_without_tracked_options():
+    styles = StyleRegistry()
+    order = []
+    painted = FakeWidget()
+    styles.register(painted, on_change=lambda widget: order.append(("redraw", widget.options.get("bg"))))
+    colored = FakeWidget()
+    styles.register(colored, on_change=lambda widget: order.append(("redraw", widget.options["bg"])), bg=token("bg_primary"))
+    
+    styles.apply(OLD, NEW)
+    assert order == [("redraw", None), ("redraw", "#09090b")]
+    assert styles.callbacks == 2
+
+
+def test_destroyed_widget_is_dropped_on_configure():
+    styles = StyleRegistry()
+    alive, dead = FakeWidget(), FakeWidget()
+    redraws = []
+    styles.register(alive, bg=token("bg_primary"))
+    styles.register(dead, on_change=redraws.append, bg=token("bg_primary"))
+    dead.dead = True
+    
+    assert styles.apply(OLD, NEW) == 1
+    assert len(styles) == 1
+    assert redraws == []
+    
+    # 再次切换时不再访问已移除的控件
+    assert styles.apply(NEW, OLD) == 1
+    assert alive.calls[-1] == {"bg": "#ffffff"}
+
+
+def test_destroyed_widget_is_dropped_on_callback():
+    styles = StyleRegistry()
+    widget = FakeWidget()
+    
+    def redraw(widget):
+        raise tk.TclError('invalid command name ".!canvas"')
+    
+    styles.register(widget, on_change=redraw)
+    styles.apply(OLD, NEW)
+    assert len(styles) == 0
+
+
+def test_collected_widget_leaves_registry():
+    styles = StyleRegistry()
+    widget = FakeWidget()
+    styles.register(widget, bg=token("bg_primary"))
+    del widget
+    gc.collect()
+    
+    assert len(styles) == 0
+    assert styles.apply(OLD, NEW) == 0
+
+
+def test_theme_set_mode_reconfigures_registered_widgets():
+    theme = Theme("light")
+    widget = theme.register(FakeWidget(), bg=theme.bg, fg=theme.colors.success)
+    
+    assert theme.set_mode("light") == 0
+    assert theme.set_mode("dark") == 1
+    assert widget.calls == [{"bg": DARK_THEME.bg_primary}]
+    assert theme.color_of(widget, "bg") == DARK_THEME.bg_primary
+    assert theme.bg.name == "bg_primary"
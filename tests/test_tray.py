@@ -0,0 +1,172 @@
+"""系统托盘：菜单只在状态变化时重建，倒计时文字按粒度节流，菜单回调不在托盘线程修改状态（替身图标）"""
+
+import threading
+
+import pytest
+
+from src.core import tray as tray_module
+from src.core.tray import TRAY_TITLE, TrayManager
+from src.core.tray_icons import TrayState
+
+
+class StubIcon:
+    """记录对 pystray.Icon 的调用；run 立即返回"""
+    
+    def __init__(self, name, icon, title, menu):
+        self.name = name
+        self.menu = menu
+        self._icon = icon
+        self._title = title
+        self.icons = []
+        self.titles = []
+        self.menu_updates = 0
+    
+    @property
+    def icon(self):
+        return self._icon
+    
+    @icon.setter
+    def icon(self, image):
+        self._icon = image
+        self.icons.append(image)
+    
+    @property
+    def title(self):
+        return self._title
+    
+    @title.setter
+    def title(self, text):
+        self._title = text
+        self.titles.append(text)
+    
+    def update_menu(self):
+        self.menu_updates += 1
+    
+    def run(self):
+        pass
+    
+    def stop(self):
+        pass
+    
+    def click(self, text: str):
+        """与 pystray 在托盘线程中点击菜单项相同"""
+        for item in self.menu.items:
+            if item.text.startswith(text):
+                return item(self)
+        raise KeyError(text)
+
+
+@pytest.fixture
+def tray(monkeypatch):
+    monkeypatch.setattr(tray_module.pystray, "Icon", StubIcon)
+    tray = TrayManager()
+    yield tray
+    tray.stop()
+
+
+def test_menu_rebuilt_only_on_state_change(tray):
+    tray.set_recent_timers([("sleep", 45)])
+    tray.start(hotkey_enabled=True)
+    icon = tray.icon
+    assert tray.menu_builds == 1
+    
+    # 与当前菜单相同的状态不重建
+    tray.set_state(TrayState.IDLE)
+    tray.update_hotkey_status(True)
+    tray.set_recent_timers([("sleep", 45)])
+    assert tray.menu_builds == 1
+    assert icon.menu_updates == 0
+    
+    tray.set_state(TrayState.TIMER)
+    assert tray.menu_builds == 2
+    assert not next(item for item in icon.menu.items if item.text == "定时睡眠").enabled
+    
+    tray.set_recent_timers([("shutdown", 90), ("sleep", 45)])
+    tray.update_hotkey_status(False)
+    assert tray.menu_builds == 4
+    assert icon.menu_updates == 3
+    assert any(item.text == "快捷键: ✗ 关闭" for item in icon.menu.items)
+    
+    # 状态切回已构建过的组合同样只构建一次
+    tray.update_hotkey_status(True)
+    tray.update_hotkey_status(True)
+    assert tray.menu_builds == 5
+
+
+def test_toggle_click_only_forwards_to_callback(tray):
+    calls = []
+    tray.set_callbacks(on_toggle_hotkey=lambda: calls.append(threading.current_thread()))
+    tray.start(hotkey_enabled=True)
+    icon = tray.icon
+    
+    # 在托盘线程点击：只转发，菜单与状态保持不变
+    clicker = threading.Thread(target=icon.click, args=("快捷键",))
+    clicker.start()
+    clicker.join()
+    assert calls == [clicker]
+    assert tray.hotkey_enabled is True
+    assert tray.menu_builds == 1
+    
+    # 调用方在主线程切换后写回
+    tray.update_hotkey_status(False)
+    assert tray.hotkey_enabled is False
+    assert tray.menu_builds == 2
+    assert icon.menu_updates == 1
+
+
+def test_toggle_click_without_callback_is_ignored(tray):
+    tray.start(hotkey_enabled=True)
+    tray.icon.click("快捷键")
+    assert tray.hotkey_enabled is True
+    assert tray.menu_builds == 1
+
+
+def test_countdown_updates_only_when_text_changes(tray):
+    tray.start()
+    icon = tray.icon
+    
+    # 10 分钟以上按分钟更新
+    for remaining in (700, 699.5, 690, 661):
+        tray.update_countdown(remaining, label="睡眠")
+    assert tray.countdown_updates == 1
+    assert icon.titles == [f"{TRAY_TITLE}\n睡眠 剩余约 12 分钟"]
+    
+    # 最后 10 分钟按 10 秒更新
+    for remaining in (75, 70.5, 65, 61):
+        tray.update_countdown(remaining)
+    assert tray.countdown_updates == 3
+    assert icon.titles[-1] == f"{TRAY_TITLE}\n剩余 1:10"
+    
+    # 最后 1 分钟按秒更新
+    for remaining in (60, 59.2, 59.0, 58.7):
+        tray.update_countdown(remaining)
+    assert tray.countdown_updates == 5
+    assert icon.titles[-1] == f"{TRAY_TITLE}\n剩余 59 秒"
+    assert icon.icons == []
+    assert tray.menu_builds == 1
+
+
+def test_countdown_badge_and_clear(tray):
+    tray.show_badge = True
+    tray.start()
+    icon = tray.icon
+    idle = icon.icon
+    
+    tray.update_countdown(30, grace=True)
+    tray.update_countdown(29.5, grace=True)
+    tray.update_countdown(29, grace=True)
+    assert len(icon.icons) == 2
+    assert icon.title == f"{TRAY_TITLE}\n缓冲期剩余 29 秒，移动鼠标可取消"
+    
+    tray.clear_countdown()
+    assert icon.title == TRAY_TITLE
+    assert icon.icon is idle
+    
+    # 已清除时不再调用 pystray
+    titles, icons = len(icon.titles), len(icon.icons)
+    tray.clear_countdown()
+    assert (len(icon.titles), len(icon.icons)) == (titles, icons)
+    
+    # 清除后同样的文字重新显示
+    tray.update_countdown(29, grace=True)
+    assert icon.title == f"{TRAY_TITLE}\n缓冲期剩余 29 秒，移动鼠标可取消"
@@ -0,0 +1,73 @@
+"""解锁码校验：正确性与按键耗时不随解锁码长度增长"""
+
+import random
+import time
+
+import pytest
+
+from src.core.verifier import UnlockVerifier, is_valid_code
+
+
+def feed_all(verifier, digits):
+    return [verifier.feed(int(d)) for d in digits]
+
+
+def test_matches_code_at_end_of_any_input():
+    verifier = UnlockVerifier.from_code("2580")
+    results = feed_all(verifier, "9912580")
+    assert results == [False] * 6 + [True]
+
+
+def test_overlapping_prefix():
+    verifier = UnlockVerifier.from_code("1112")
+    assert feed_all(verifier, "11112")[-1]
+
+
+def test_leading_zeros_are_significant():
+    verifier = UnlockVerifier.from_code("007")
+    assert not feed_all(verifier, "07")[-1]
+    verifier.reset()
+    assert feed_all(verifier, "007")[-1]
+
+
+def test_record_round_trip_and_verify():
+    verifier = UnlockVerifier.from_code("13579")
+    restored = UnlockVerifier.from_record(verifier.to_record())
+    assert restored.verify("13579")
+    assert not restored.verify("13578")
+    assert "13579" not in verifier.to_record()
+    assert feed_all(restored, "13579")[-1]
+
+
+def test_same_code_gets_different_salt():
+    assert UnlockVerifier.from_code("1234").to_record() != UnlockVerifier.from_code("1234").to_record()
+
+
+def test_is_valid_code():
+    assert is_valid_code("000")
+    assert not is_valid_code("12")
+    assert not is_valid_code("12a4")
+    assert not is_valid_code("١٢٣")
+    with pytest.raises(ValueError):
+        UnlockVerifier.from_code("abc")
+
+
+def per_key_seconds(code: str, keys: int = 20000) -> float:
+    """每次按键的最短平均耗时（取多轮最小值以排除调度噪声）"""
+    verifier = UnlockVerifier.from_code(code)
+    digits = [random.randrange(10) for _ in range(keys)]
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for digit in digits:
+            verifier.feed(digit)
+        best = min(best, time.perf_counter() - start)
+    return best / keys
+
+
+def test_per_key_cost_does_not_depend_on_code_length():
+    random.seed(0)
+    short = per_key_seconds("1234")
+    long = per_key_seconds("".join(random.choice("0123456789") for _ in range(4096)))
+    # O(1) 滚动哈希：长度增加 1000 倍，单键耗时应基本不变（留出噪声余量）
+    assert long < short * 2
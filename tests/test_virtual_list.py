@@ -0,0 +1,179 @@
+"""虚拟列表：行控件池大小、增删改时的重新绑定范围以及设置页的软件列表（stubtk 替身上的真实控件）"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks import stubtk
+
+
+@pytest.fixture
+def ui():
+    """在替身上导入界面模块并创建根窗口"""
+    with stubtk.installed() as tk:
+        from src.ui.components.virtual_list import VirtualList, VirtualRow
+        from src.ui.pages import settings_page
+        from src.ui.theme import Theme
+        
+        root = tk.Tk()
+        yield SimpleNamespace(
+            tk=tk,
+            root=root,
+            theme=Theme("light"),
+            VirtualList=VirtualList,
+            VirtualRow=VirtualRow,
+            settings_page=settings_page
+        )
+        root.destroy()
+
+
+@pytest.fixture
+def make_list(ui):
+    """创建虚拟列表，返回 (列表, 已创建的行)"""
+    
+    class CountingRow(ui.VirtualRow):
+        def __init__(self, parent):
+            self.widget = ui.tk.Frame(parent)
+            self.bound = []
+        
+        def bind(self, key, item):
+            self.bound.append((key, item))
+    
+    def make(max_visible: int = 4):
+        rows = []
+        
+        def create_row(parent):
+            rows.append(CountingRow(parent))
+            return rows[-1]
+        
+        vlist = ui.VirtualList(ui.root, ui.theme, create_row, max_visible=max_visible, empty_text="空")
+        vlist.pack(fill="x")
+        return vlist, rows
+    
+    return make
+
+
+def shown(rows) -> list:
+    """当前显示的行（按槽位顺序）绑定的键"""
+    return [row.bound[-1][0] for row in rows if row.widget.winfo_ismapped()]
+
+
+def rebinds(rows, action) -> list:
+    """执行 action，返回被重新绑定的槽位"""
+    before = [len(row.bound) for row in rows]
+    action()
+    before += [0] * (len(rows) - len(before))
+    return [slot for slot, row in enumerate(rows) if len(row.bound) != before[slot]]
+
+
+def find(widget, **options):
+    """在控件树中查找选项匹配的控件"""
+    for child in widget.winfo_children():
+        if all(child.cget(name) == value for name, value in options.items()):
+            return child
+        found = find(child, **options)
+        if found is not None:
+            return found
+    return None
+
+
+def test_row_requires_bind(ui):
+    class Incomplete(ui.VirtualRow):
+        pass
+    
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_pool_stays_at_max_visible(make_list):
+    vlist, rows = make_list(max_visible=4)
+    assert rows == []
+    assert vlist.empty_label.winfo_ismapped()
+    
+    vlist.set_items([(i, f"app{i}") for i in range(100)])
+    assert len(rows) == 4
+    assert vlist.binds == 4
+    assert shown(rows) == [0, 1, 2, 3]
+    assert not vlist.empty_label.winfo_ismapped()
+    assert vlist.scrollbar.winfo_ismapped()
+    
+    # 拖动滚动条与按页滚动复用同一组行
+    scroll = vlist.scrollbar.cget("command")
+    scroll("moveto", "0.5")
+    assert shown(rows) == [50, 51, 52, 53]
+    assert vlist.scrollbar.get() == (0.5, 0.54)
+    scroll("scroll", "1", "pages")
+    assert shown(rows) == [54, 55, 56, 57]
+    
+    for i in range(100, 120):
+        vlist.append(i, f"app{i}")
+    assert len(rows) == 4
+    assert len(vlist) == 120
+    assert shown(rows) == [116, 117, 118, 119]
+    
+    vlist.set_items([])
+    assert len(rows) == 4
+    assert shown(rows) == []
+    assert vlist.empty_label.winfo_ismapped()
+    assert not vlist.scrollbar.winfo_ismapped()
+
+
+def test_changes_rebind_only_affected_slots(make_list):
+    vlist, rows = make_list(max_visible=4)
+    vlist.set_items([(i, f"app{i}") for i in range(3)])
+    
+    # 开关状态变化：只重新绑定该行
+    assert rebinds(rows, lambda: vlist.refresh(1, "app1-off")) == [1]
+    assert rows[1].bound[-1] == (1, "app1-off")
+    
+    # 未滚动时追加：只绑定新槽位
+    assert rebinds(rows, lambda: vlist.append(3, "app3")) == [3]
+    
+    # 删除中间一行：之后的槽位上移，之前的不动
+    assert rebinds(rows, lambda: vlist.remove(1)) == [1, 2]
+    assert shown(rows) == [0, 2, 3]
+    
+    # 不可见的数据变化不触发绑定
+    vlist.set_items([(i, f"app{i}") for i in range(10)])
+    assert rebinds(rows, lambda: vlist.refresh(8, "app8-off")) == []
+    assert rebinds(rows, lambda: vlist.remove(9)) == []
+    assert rebinds(rows, lambda: vlist.remove(42)) == []
+
+
+def test_settings_page_add_toggle_remove(ui, monkeypatch):
+    page = ui.settings_page.SettingsPage(ui.root, ui.theme)
+    page.pack(fill="both", expand=True)
+    changes = []
+    page.set_callbacks(on_startup_apps_change=lambda apps: changes.append([app["name"] for app in apps]))
+    apps = [{"name": f"app{i}.exe", "path": f"C:/apps/app{i}.exe", "enabled": True} for i in range(3)]
+    page.load_settings(startup_apps=apps)
+    
+    apps_list = page.apps_list
+    rows = [row for row in apps_list.body.winfo_children() if row.winfo_ismapped()]
+    assert len(rows) == 3
+    binds = apps_list.binds
+    
+    # 点击开关：只重新绑定该行，名称变为次要颜色
+    checkbox = next(child for child in rows[1].winfo_children() if child.winfo_class() == "Checkbutton")
+    checkbox.invoke()
+    assert apps[1]["enabled"] is False
+    assert apps_list.binds == binds + 1
+    assert find(rows[1], text="app1.exe").cget("fg") == ui.theme.muted
+    assert changes == [["app0.exe", "app1.exe", "app2.exe"]]
+    
+    # 点击删除：之后的行上移
+    find(rows[0], text="✕").event_generate("<Button-1>")
+    assert [app["name"] for app in apps] == ["app1.exe", "app2.exe"]
+    assert len(apps_list) == 2
+    assert find(rows[0], text="app1.exe") is not None
+    assert not rows[2].winfo_ismapped()
+    
+    # 添加按钮：复用被隐藏的行
+    monkeypatch.setattr(ui.settings_page.filedialog, "askopenfilename", lambda **kwargs: "C:/tools/new.exe")
+    children = len(apps_list.body.winfo_children())
+    find(page, text="➕ 添加软件").event_generate("<Button-1>")
+    assert [app["name"] for app in apps] == ["app1.exe", "app2.exe", "new.exe"]
+    assert rows[2].winfo_ismapped()
+    assert find(rows[2], text="new.exe") is not None
+    assert len(apps_list.body.winfo_children()) == children
+    assert changes[-1] == ["app1.exe", "app2.exe", "new.exe"]
@@ -0,0 +1,141 @@
+"""钩子看门狗：通过模拟钩子后端验证心跳丢失检测与重装"""
+
+import threading
+import time
+
+from src.core.watchdog import HookWatchdog, LatencyRecorder
+from fakes import SimulatedHookBackend
+
+
+def make_watchdog(**kwargs):
+    latency = LatencyRecorder()
+    backend = SimulatedHookBackend(latency)
+    watchdog = HookWatchdog(
+        get_event_count=backend.get_event_count,
+        get_last_input_tick=backend.get_last_input_tick,
+        reinstall=backend.reinstall,
+        latency=latency,
+        **kwargs
+    )
+    return watchdog, backend
+
+
+def run_checks(watchdog, backend, rounds, inputs=1):
+    """每个检测周期产生 inputs 次输入后检测一次"""
+    count, tick = backend.get_event_count(), backend.get_last_input_tick()
+    for _ in range(rounds):
+        backend.input(inputs)
+        count, tick = watchdog.check(count, tick)
+
+
+def test_idle_system_is_not_a_miss():
+    watchdog, backend = make_watchdog()
+    count, tick = 0, 0
+    for _ in range(5):
+        count, tick = watchdog.check(count, tick)
+    assert watchdog.hook_losses == 0
+    assert backend.installs == 0
+
+
+def test_hook_loss_reinstalls_after_miss_limit():
+    watchdog, backend = make_watchdog(miss_limit=2)
+    run_checks(watchdog, backend, 3)
+    backend.unhook()
+    
+    count, tick = backend.get_event_count(), backend.get_last_input_tick()
+    backend.input()
+    count, tick = watchdog.check(count, tick)
+    assert backend.installs == 0
+    
+    backend.input()
+    watchdog.check(count, tick)
+    assert backend.installs == 1
+    assert backend.installed
+    assert watchdog.hook_losses == 1
+    assert watchdog.reinstalls == 1
+
+
+def test_events_after_reinstall_reset_misses():
+    watchdog, backend = make_watchdog(miss_limit=2)
+    backend.unhook()
+    run_checks(watchdog, backend, 2)
+    assert backend.installs == 1
+    
+    # 重装后钩子正常收到事件，不应再次重装
+    run_checks(watchdog, backend, 10)
+    assert backend.installs == 1
+    assert watchdog.misses == 0
+
+
+def test_isolated_drop_is_tolerated():
+    watchdog, backend = make_watchdog(miss_limit=2)
+    backend.drop = 1
+    run_checks(watchdog, backend, 1)
+    assert watchdog.misses == 1
+    
+    run_checks(watchdog, backend, 5)
+    assert watchdog.misses == 0
+    assert backend.installs == 0
+
+
+def test_failed_reinstall_is_not_counted():
+    watchdog, backend = make_watchdog(miss_limit=1)
+    
+    def broken():
+        raise OSError("SetWindowsHookEx failed")
+    
+    watchdog._reinstall = broken
+    backend.unhook()
+    run_checks(watchdog, backend, 1)
+    assert watchdog.hook_losses == 1
+    assert watchdog.reinstalls == 0
+
+
+def test_delayed_callbacks_raise_percentiles_and_warn_once():
+    watchdog, backend = make_watchdog(slow_threshold_ms=50)
+    backend.delay = 0.001
+    run_checks(watchdog, backend, 1, inputs=100)
+    assert not watchdog._slow_warned
+    
+    backend.delay = 0.2
+    run_checks(watchdog, backend, 1, inputs=100)
+    assert watchdog._slow_warned
+    
+    data = watchdog.metrics()
+    assert data["callback_p99_ms"] >= 50
+    assert data["callback_max_ms"] == 200
+    assert data["hook_events"] == 200
+
+
+def test_watchdog_thread_reinstalls_within_bound():
+    interval, miss_limit = 0.02, 2
+    watchdog, backend = make_watchdog(interval=interval, miss_limit=miss_limit)
+    reinstalled = threading.Event()
+    
+    def reinstall():
+        backend.reinstall()
+        reinstalled.set()
+    
+    watchdog._reinstall = reinstall
+    watchdog.start()
+    try:
+        backend.unhook()
+        lost_at = time.perf_counter()
+        while not reinstalled.is_set() and time.perf_counter() - lost_at < 2:
+            backend.input()
+            time.sleep(interval / 4)
+        elapsed = time.perf_counter() - lost_at
+    finally:
+        watchdog.stop()
+    
+    assert reinstalled.is_set()
+    # 上限为 interval * miss_limit，加一个周期的对齐误差与调度余量
+    assert elapsed < interval * (miss_limit + 1) + 0.1
+
+
+def test_latency_percentiles_use_ring_buffer():
+    latency = LatencyRecorder(capacity=4)
+    for ms in (1, 2, 3, 4, 100, 100, 100, 100):
+        latency.record(ms / 1000)
+    assert latency.percentiles(50)["p50"] == 100
+    assert latency.max == 0.1